@@ -4,49 +4,61 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections import deque
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import asc, desc, func
+from sqlalchemy import func
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_member
 from app.core.time import utcnow
+from app.db.counts import ESTIMATED_COUNT
+from app.db.keyset import (
+    STREAM_BATCH_LIMIT,
+    KeysetCursor,
+    KeysetOrder,
+    after_cursor,
+    keyset_order,
+)
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.replicas import get_read_session, read_session, request_actor_key
+from app.db.session import get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead, ActivityTaskCommentFeedItemRead
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultEstimatedCountKeysetPage
 from app.services.organizations import (
     OrganizationContext,
+    accessible_board_ids_statement,
     get_active_membership,
-    list_accessible_board_ids,
 )
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
 
-    from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    from app.schemas.pagination import KeysetPage
 
 router = APIRouter(prefix="/activity", tags=["activity"])
 
-SSE_SEEN_MAX = 2000
 STREAM_POLL_SECONDS = 2
 TASK_COMMENT_ROW_LEN = 4
 SESSION_DEP = Depends(get_session)
+READ_SESSION_DEP = Depends(get_read_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_ID_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
+# Newest-first listing key shared by the activity and task-comment pages.
+ACTIVITY_LIST_ORDER = KeysetOrder.desc(col(ActivityEvent.created_at), col(ActivityEvent.id))
 
 
 def _parse_since(value: str | None) -> datetime | None:
@@ -143,9 +155,10 @@ def _coerce_task_comment_rows(
 
 async def _fetch_task_comment_events(
     session: AsyncSession,
-    since: datetime,
+    cursor: KeysetCursor,
     *,
     board_id: UUID | None = None,
+    board_ids: SelectOfScalar[UUID] | None = None,
 ) -> Sequence[tuple[ActivityEvent, Task, Board, Agent | None]]:
     statement = (
         select(ActivityEvent, Task, Board, Agent)
@@ -153,20 +166,45 @@ async def _fetch_task_comment_events(
         .join(Board, col(Task.board_id) == col(Board.id))
         .outerjoin(Agent, col(ActivityEvent.agent_id) == col(Agent.id))
         .where(col(ActivityEvent.event_type) == "task.comment")
-        .where(col(ActivityEvent.created_at) >= since)
+        .where(
+            after_cursor(
+                cursor,
+                at_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+            ),
+        )
         .where(func.length(func.trim(col(ActivityEvent.message))) > 0)
-        .order_by(asc(col(ActivityEvent.created_at)))
+        .order_by(
+            *keyset_order(
+                at_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+            ),
+        )
+        .limit(STREAM_BATCH_LIMIT)
     )
     if board_id is not None:
         statement = statement.where(col(Task.board_id) == board_id)
+    if board_ids is not None:
+        statement = statement.where(col(Task.board_id).in_(board_ids))
     return _coerce_task_comment_rows(list(await session.exec(statement)))
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[ActivityEventRead])
+async def _require_readable_board(
+    session: AsyncSession,
+    accessible_board_ids: SelectOfScalar[UUID],
+    *,
+    board_id: UUID,
+) -> None:
+    allowed = (await session.exec(accessible_board_ids.where(col(Board.id) == board_id))).first()
+    if allowed is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+@router.get("", response_model=DefaultEstimatedCountKeysetPage[ActivityEventRead])
 async def list_activity(
-    session: AsyncSession = SESSION_DEP,
     actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[ActivityEventRead]:
+    session: AsyncSession = READ_SESSION_DEP,
+) -> KeysetPage[ActivityEventRead]:
     """List activity events visible to the calling actor."""
     statement = select(ActivityEvent)
     if actor.actor_type == "agent" and actor.agent:
@@ -175,27 +213,29 @@ async def list_activity(
         member = await get_active_membership(session, actor.user)
         if member is None:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-        board_ids = await list_accessible_board_ids(session, member=member, write=False)
-        if not board_ids:
-            statement = statement.where(col(ActivityEvent.id).is_(None))
-        else:
-            statement = statement.join(
-                Task,
-                col(ActivityEvent.task_id) == col(Task.id),
-            ).where(col(Task.board_id).in_(board_ids))
-    statement = statement.order_by(desc(col(ActivityEvent.created_at)))
-    return await paginate(session, statement)
+        statement = statement.join(
+            Task,
+            col(ActivityEvent.task_id) == col(Task.id),
+        ).where(
+            col(Task.board_id).in_(accessible_board_ids_statement(member, write=False)),
+        )
+    return await paginate(
+        session,
+        statement,
+        count=ESTIMATED_COUNT,
+        keyset=ACTIVITY_LIST_ORDER,
+    )
 
 
 @router.get(
     "/task-comments",
-    response_model=DefaultLimitOffsetPage[ActivityTaskCommentFeedItemRead],
+    response_model=DefaultEstimatedCountKeysetPage[ActivityTaskCommentFeedItemRead],
 )
 async def list_task_comment_feed(
     board_id: UUID | None = BOARD_ID_QUERY,
-    session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
-) -> LimitOffsetPage[ActivityTaskCommentFeedItemRead]:
+    session: AsyncSession = READ_SESSION_DEP,
+) -> KeysetPage[ActivityTaskCommentFeedItemRead]:
     """List task-comment feed items for accessible boards."""
     statement = (
         select(ActivityEvent, Task, Board, Agent)
@@ -204,23 +244,25 @@ async def list_task_comment_feed(
         .outerjoin(Agent, col(ActivityEvent.agent_id) == col(Agent.id))
         .where(col(ActivityEvent.event_type) == "task.comment")
         .where(func.length(func.trim(col(ActivityEvent.message))) > 0)
-        .order_by(desc(col(ActivityEvent.created_at)))
     )
-    board_ids = await list_accessible_board_ids(session, member=ctx.member, write=False)
+    accessible_board_ids = accessible_board_ids_statement(ctx.member, write=False)
     if board_id is not None:
-        if board_id not in set(board_ids):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+        await _require_readable_board(session, accessible_board_ids, board_id=board_id)
         statement = statement.where(col(Task.board_id) == board_id)
-    elif board_ids:
-        statement = statement.where(col(Task.board_id).in_(board_ids))
     else:
-        statement = statement.where(col(Task.id).is_(None))
+        statement = statement.where(col(Task.board_id).in_(accessible_board_ids))
 
     def _transform(items: Sequence[Any]) -> Sequence[Any]:
         rows = _coerce_task_comment_rows(items)
         return [_feed_item(event, task, board, agent) for event, task, board, agent in rows]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        count=ESTIMATED_COUNT,
+        keyset=ACTIVITY_LIST_ORDER,
+    )
 
 
 @router.get("/task-comments/stream")
@@ -233,44 +275,25 @@ async def stream_task_comment_feed(
 ) -> EventSourceResponse:
     """Stream task-comment events for accessible boards."""
     since_dt = _parse_since(since) or utcnow()
-    board_ids = await list_accessible_board_ids(
-        db_session,
-        member=ctx.member,
-        write=False,
-    )
-    allowed_ids = set(board_ids)
-    if board_id is not None and board_id not in allowed_ids:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    seen_ids: set[UUID] = set()
-    seen_queue: deque[UUID] = deque()
+    accessible_board_ids = accessible_board_ids_statement(ctx.member, write=False)
+    if board_id is not None:
+        await _require_readable_board(db_session, accessible_board_ids, board_id=board_id)
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        last_seen = since_dt
+        actor_key = request_actor_key(request)
+        cursor = KeysetCursor(at=since_dt)
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as stream_session:
-                if board_id is not None:
-                    rows = await _fetch_task_comment_events(
-                        stream_session,
-                        last_seen,
-                        board_id=board_id,
-                    )
-                elif allowed_ids:
-                    rows = await _fetch_task_comment_events(stream_session, last_seen)
-                    rows = [row for row in rows if row[1].board_id in allowed_ids]
-                else:
-                    rows = []
+            async with read_session(actor_key) as stream_session:
+                rows = await _fetch_task_comment_events(
+                    stream_session,
+                    cursor,
+                    board_id=board_id,
+                    board_ids=accessible_board_ids,
+                )
             for event, task, board, agent in rows:
-                event_id = event.id
-                if event_id in seen_ids:
-                    continue
-                seen_ids.add(event_id)
-                seen_queue.append(event_id)
-                if len(seen_queue) > SSE_SEEN_MAX:
-                    oldest = seen_queue.popleft()
-                    seen_ids.discard(oldest)
-                last_seen = max(event.created_at, last_seen)
+                cursor = cursor.advance(event.created_at, event.id)
                 payload = {
                     "comment": _feed_item(
                         event,
@@ -280,6 +303,7 @@ async def stream_task_comment_feed(
                     ).model_dump(mode="json"),
                 }
                 yield {"event": "comment", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+            if len(rows) < STREAM_BATCH_LIMIT:
+                await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
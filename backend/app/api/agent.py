@@ -22,7 +22,6 @@ from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.tags import Tag
-from app.models.task_dependencies import TaskDependency
 from app.models.tasks import Task
 from app.schemas.agents import (
     AgentCreate,
@@ -45,19 +44,25 @@ from app.schemas.gateway_coordination import (
     GatewayMainAskUserResponse,
 )
 from app.schemas.health import AgentHealthStatusResponse
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import (
+    DefaultEstimatedCountKeysetPage,
+    DefaultKeysetPage,
+    DefaultLimitOffsetPage,
+)
 from app.schemas.tags import TagRef
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
-from app.services.activity_log import record_activity
+from app.schemas.tasks import (
+    TaskBulkCreate,
+    TaskBulkRead,
+    TaskBulkUpdate,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.openclaw.coordination_service import GatewayCoordinationService
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning_db import AgentLifecycleService
-from app.services.tags import replace_tags, validate_tag_ids
-from app.services.task_dependencies import (
-    blocked_by_dependency_ids,
-    dependency_status_by_id,
-    validate_dependency_update,
-)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -68,6 +73,7 @@ if TYPE_CHECKING:
     from app.models.activity_events import ActivityEvent
     from app.models.board_memory import BoardMemory
     from app.models.board_onboarding import BoardOnboardingSession
+    from app.schemas.pagination import KeysetPage
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 SESSION_DEP = Depends(get_session)
@@ -77,6 +83,14 @@ TASK_DEP = Depends(get_task_or_404)
 BOARD_ID_QUERY = Query(default=None)
 TASK_STATUS_QUERY = Query(default=None, alias="status")
 IS_CHAT_QUERY = Query(default=None)
+MEMORY_TAGS_QUERY = Query(
+    default=None,
+    description="Only entries carrying every one of these tags.",
+)
+MEMORY_ANY_TAGS_QUERY = Query(
+    default=None,
+    description="Only entries carrying at least one of these tags.",
+)
 APPROVAL_STATUS_QUERY = Query(default=None, alias="status")
 
 AGENT_LEAD_TAGS = cast("list[str | Enum]", ["agent-lead"])
@@ -109,17 +123,20 @@ class AgentTaskListFilters(SQLModel):
     status_filter: str | None = None
     assigned_agent_id: UUID | None = None
     unassigned: bool | None = None
+    unblocked: bool | None = None
 
 
 def _task_list_filters(
     status_filter: str | None = TASK_STATUS_QUERY,
     assigned_agent_id: UUID | None = None,
     unassigned: bool | None = None,
+    unblocked: bool | None = None,
 ) -> AgentTaskListFilters:
     return AgentTaskListFilters(
         status_filter=status_filter,
         assigned_agent_id=assigned_agent_id,
         unassigned=unassigned,
+        unblocked=unblocked,
     )
 
 
@@ -475,7 +492,7 @@ async def list_agents(
 
 @router.get(
     "/boards/{board_id}/tasks",
-    response_model=DefaultLimitOffsetPage[TaskRead],
+    response_model=DefaultKeysetPage[TaskRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_task_discovery",
@@ -506,18 +523,19 @@ async def list_tasks(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[TaskRead]:
+) -> KeysetPage[TaskRead]:
     """List tasks on a board with status/assignment filters.
 
     Common patterns:
     - worker: fetch assigned inbox/in-progress tasks
-    - lead: fetch unassigned inbox tasks for delegation
+    - lead: fetch unassigned, unblocked inbox tasks for delegation
     """
     _guard_board_access(agent_ctx, board)
     return await tasks_api.list_tasks(
         status_filter=filters.status_filter,
         assigned_agent_id=filters.assigned_agent_id,
         unassigned=filters.unassigned,
+        unblocked=filters.unblocked,
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
@@ -660,105 +678,123 @@ async def create_task(
     """
     _guard_board_access(agent_ctx, board)
     _require_board_lead(agent_ctx)
-    data = payload.model_dump(
-        exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"},
-    )
-    depends_on_task_ids = list(payload.depends_on_task_ids)
-    tag_ids = list(payload.tag_ids)
-    custom_field_values = dict(payload.custom_field_values)
-
-    task = Task.model_validate(data)
-    task.board_id = board.id
-    task.auto_created = True
-    task.auto_reason = f"lead_agent:{agent_ctx.agent.id}"
-
-    normalized_deps = await validate_dependency_update(
+    (task,) = await tasks_api.stage_task_creates(
         session,
-        board_id=board.id,
-        task_id=task.id,
-        depends_on_task_ids=depends_on_task_ids,
+        board=board,
+        payloads=[payload],
+        lead=agent_ctx.agent,
     )
-    normalized_tag_ids = await validate_tag_ids(
+    await session.commit()
+    await session.refresh(task)
+    await tasks_api.send_task_notifications(
         session,
-        organization_id=board.organization_id,
-        tag_ids=tag_ids,
+        board=board,
+        notifications=await tasks_api.task_create_notifications(
+            session,
+            board=board,
+            tasks=[task],
+            notify_lead=False,
+        ),
     )
-    dep_status = await dependency_status_by_id(
+    return await tasks_api._task_read_response(
         session,
+        task=task,
         board_id=board.id,
-        dependency_ids=normalized_deps,
-    )
-    blocked_by = blocked_by_dependency_ids(
-        dependency_ids=normalized_deps,
-        status_by_id=dep_status,
     )
 
-    if blocked_by and (task.assigned_agent_id is not None or task.status != "inbox"):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "message": "Task is blocked by incomplete dependencies.",
-                "blocked_by_task_ids": [str(value) for value in blocked_by],
-            },
-        )
-    if task.assigned_agent_id:
-        agent = await Agent.objects.by_id(task.assigned_agent_id).first(session)
-        if agent is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-        if agent.is_board_lead:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Board leads cannot assign tasks to themselves.",
-            )
-        if agent.board_id and agent.board_id != board.id:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT)
-    session.add(task)
-    # Ensure the task exists in the DB before inserting dependency rows.
-    await session.flush()
-    await tasks_api._set_task_custom_field_values_for_create(
-        session,
-        board_id=board.id,
-        task_id=task.id,
-        custom_field_values=custom_field_values,
-    )
-    for dep_id in normalized_deps:
-        session.add(
-            TaskDependency(
-                board_id=board.id,
-                task_id=task.id,
-                depends_on_task_id=dep_id,
-            ),
-        )
-    await replace_tags(
+
+@router.post(
+    "/boards/{board_id}/tasks/bulk",
+    response_model=TaskBulkRead,
+    tags=AGENT_LEAD_TAGS,
+    summary="Create several tasks as board lead",
+    description=(
+        "Create up to 100 tasks in one transaction. Items are validated together and a "
+        "single invalid item rejects the batch. Each assignee gets one combined notification."
+    ),
+    operation_id="agent_lead_bulk_create_tasks",
+    responses={
+        200: {"description": "Tasks created and persisted, in request order"},
+        403: {"model": LLMErrorResponse, "description": "Caller is not board lead"},
+        404: {"model": LLMErrorResponse, "description": "Assigned target agent does not exist"},
+        409: {
+            "model": LLMErrorResponse,
+            "description": "Dependency or assignment validation failed",
+        },
+        422: {"model": LLMErrorResponse, "description": "Payload validation failed"},
+    },
+)
+async def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    board: Board = BOARD_DEP,
+    session: AsyncSession = SESSION_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> TaskBulkRead:
+    """Create several tasks as the board lead in one request.
+
+    Prefer this over repeated single creates when planning a backlog.
+    """
+    _guard_board_access(agent_ctx, board)
+    _require_board_lead(agent_ctx)
+    tasks = await tasks_api.stage_task_creates(
         session,
-        task_id=task.id,
-        tag_ids=normalized_tag_ids,
+        board=board,
+        payloads=payload.items,
+        lead=agent_ctx.agent,
     )
     await session.commit()
-    await session.refresh(task)
-    record_activity(
+    await tasks_api.send_task_notifications(
         session,
-        event_type="task.created",
-        task_id=task.id,
-        message=f"Task created by lead: {task.title}.",
-        agent_id=agent_ctx.agent.id,
-    )
-    await session.commit()
-    if task.assigned_agent_id:
-        assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
+        board=board,
+        notifications=await tasks_api.task_create_notifications(
             session,
-        )
-        if assigned_agent:
-            await tasks_api.notify_agent_on_task_assign(
-                session=session,
-                board=board,
-                task=task,
-                agent=assigned_agent,
-            )
-    return await tasks_api._task_read_response(
-        session,
-        task=task,
-        board_id=board.id,
+            board=board,
+            tasks=tasks,
+            notify_lead=False,
+        ),
+    )
+    return TaskBulkRead(
+        items=await tasks_api._task_read_page(session=session, board_id=board.id, tasks=tasks),
+    )
+
+
+@router.patch(
+    "/boards/{board_id}/tasks/bulk",
+    response_model=TaskBulkRead,
+    tags=AGENT_BOARD_TAGS,
+    openapi_extra=_agent_board_openapi_hints(
+        intent="agent_task_bulk_update",
+        when_to_use=[
+            "Several tasks on the board need status or ownership changes at once.",
+            "Lead re-assigns a batch of tasks for load balancing.",
+        ],
+        routing_examples=[
+            {
+                "input": {
+                    "intent": "lead reassigns a dozen tasks to new owners",
+                    "required_privilege": "board_lead",
+                },
+                "decision": "agent_task_bulk_update",
+            },
+        ],
+    ),
+)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    board: Board = BOARD_DEP,
+    session: AsyncSession = SESSION_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> TaskBulkRead:
+    """Update several tasks in one transaction.
+
+    Each item takes the same fields as a single task update plus its `id`.
+    """
+    _guard_board_access(agent_ctx, board)
+    return await tasks_api.bulk_update_tasks(
+        payload=payload,
+        board=board,
+        session=session,
+        actor=_actor(agent_ctx),
     )
 
 
@@ -932,7 +968,7 @@ async def create_task_comment(
 
 @router.get(
     "/boards/{board_id}/memory",
-    response_model=DefaultLimitOffsetPage[BoardMemoryRead],
+    response_model=DefaultEstimatedCountKeysetPage[BoardMemoryRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_memory_discovery",
@@ -953,17 +989,22 @@ async def create_task_comment(
 )
 async def list_board_memory(
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = MEMORY_TAGS_QUERY,
+    any_tags: list[str] | None = MEMORY_ANY_TAGS_QUERY,
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
-    """List board memory with optional chat filtering.
+) -> KeysetPage[BoardMemoryRead]:
+    """List board memory with optional chat and tag filtering.
 
-    Use `is_chat=false` for durable context and `is_chat=true` for board chat.
+    Use `is_chat=false` for durable context and `is_chat=true` for board chat. Use
+    `tags=payload:<id>` to fetch the memory recorded for one webhook payload.
     """
     _guard_board_access(agent_ctx, board)
     return await board_memory_api.list_board_memory(
         is_chat=is_chat,
+        tags=tags,
+        any_tags=any_tags,
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import asc, func, or_
+from sqlalchemy import func
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
@@ -22,8 +22,10 @@ from app.api.deps import (
 )
 from app.core.logging import get_logger
 from app.core.time import utcnow
+from app.db.keyset import STREAM_BATCH_LIMIT, KeysetCursor, after_cursor, keyset_order
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.replicas import read_session, request_actor_key
+from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.tasks import Task
@@ -44,6 +46,7 @@ if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
@@ -278,20 +281,22 @@ async def _notify_lead_on_approval_resolution(
     await session.commit()
 
 
+def _approval_updated_at_column() -> ColumnElement[datetime]:
+    # SQL mirror of `_approval_updated_at`; backed by a matching expression index.
+    return func.coalesce(col(Approval.resolved_at), col(Approval.created_at))
+
+
 async def _fetch_approval_events(
     session: AsyncSession,
     board_id: UUID,
-    since: datetime,
+    cursor: KeysetCursor,
 ) -> list[Approval]:
+    updated_at = _approval_updated_at_column()
     statement = (
         Approval.objects.filter_by(board_id=board_id)
-        .filter(
-            or_(
-                col(Approval.created_at) >= since,
-                col(Approval.resolved_at) >= since,
-            ),
-        )
-        .order_by(asc(col(Approval.created_at)))
+        .filter(after_cursor(cursor, at_column=updated_at, id_column=col(Approval.id)))
+        .order_by(*keyset_order(at_column=updated_at, id_column=col(Approval.id)))
+        .limit(STREAM_BATCH_LIMIT)
     )
     return await statement.all(session)
 
@@ -330,15 +335,15 @@ async def stream_approvals(
 ) -> EventSourceResponse:
     """Stream approval updates for a board using server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        actor_key = request_actor_key(request)
+        cursor = KeysetCursor(at=since_dt)
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
+            async with read_session(actor_key) as session:
+                approvals = await _fetch_approval_events(session, board.id, cursor)
                 approval_reads = await _approval_reads(session, approvals)
                 pending_approvals_count = int(
                     (
@@ -360,8 +365,7 @@ async def stream_approvals(
                     task_ids=task_ids,
                 )
             for approval, approval_read in zip(approvals, approval_reads, strict=True):
-                updated_at = _approval_updated_at(approval)
-                last_seen = max(updated_at, last_seen)
+                cursor = cursor.advance(_approval_updated_at(approval), approval.id)
                 payload: dict[str, object] = {
                     "approval": _serialize_approval(approval_read),
                     "pending_approvals_count": pending_approvals_count,
@@ -381,7 +385,8 @@ async def stream_approvals(
                 elif task_counts:
                     payload["task_counts"] = task_counts
                 yield {"event": "approval", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+            if len(approvals) < STREAM_BATCH_LIMIT:
+                await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
 
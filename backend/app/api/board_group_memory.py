@@ -24,8 +24,11 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
+from app.db.json_tags import tags_filter
+from app.db.keyset import STREAM_BATCH_LIMIT, KeysetCursor, after_cursor, keyset_order
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.replicas import read_session, request_actor_key
+from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
@@ -36,8 +39,8 @@ from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.organizations import (
+    has_access_to_any_board,
     is_org_admin,
-    list_accessible_board_ids,
     member_all_boards_read,
     member_all_boards_write,
 )
@@ -68,6 +71,11 @@ BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 ACTOR_DEP = Depends(require_admin_or_agent)
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+TAGS_QUERY = Query(default=None, description="Only entries carrying every one of these tags.")
+ANY_TAGS_QUERY = Query(
+    default=None,
+    description="Only entries carrying at least one of these tags.",
+)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
 
@@ -139,8 +147,10 @@ def _serialize_memory(memory: BoardGroupMemory) -> dict[str, object]:
 async def _fetch_memory_events(
     session: AsyncSession,
     board_group_id: UUID,
-    since: datetime,
+    cursor: KeysetCursor,
     is_chat: bool | None = None,
+    tags: list[str] | None = None,
+    any_tags: list[str] | None = None,
 ) -> list[BoardGroupMemory]:
     statement = (
         BoardGroupMemory.objects.filter_by(board_group_id=board_group_id)
@@ -150,8 +160,29 @@ async def _fetch_memory_events(
     )
     if is_chat is not None:
         statement = statement.filter(col(BoardGroupMemory.is_chat) == is_chat)
-    statement = statement.filter(col(BoardGroupMemory.created_at) >= since).order_by(
-        col(BoardGroupMemory.created_at),
+    tag_filter = await tags_filter(
+        session,
+        col(BoardGroupMemory.tags),
+        all_of=tags,
+        any_of=any_tags,
+    )
+    if tag_filter is not None:
+        statement = statement.filter(tag_filter)
+    statement = (
+        statement.filter(
+            after_cursor(
+                cursor,
+                at_column=col(BoardGroupMemory.created_at),
+                id_column=col(BoardGroupMemory.id),
+            ),
+        )
+        .order_by(
+            *keyset_order(
+                at_column=col(BoardGroupMemory.created_at),
+                id_column=col(BoardGroupMemory.id),
+            ),
+        )
+        .limit(STREAM_BATCH_LIMIT)
     )
     return await statement.all(session)
 
@@ -185,12 +216,12 @@ async def _require_group_access(
             return group
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
-    allowed_ids = await list_accessible_board_ids(
+    if not await has_access_to_any_board(
         session,
         member=ctx.member,
+        board_ids=board_ids,
         write=write,
-    )
-    if not set(board_ids).intersection(set(allowed_ids)):
+    ):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     return group
 
@@ -353,6 +384,8 @@ async def list_board_group_memory(
     group_id: UUID,
     *,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
 ) -> LimitOffsetPage[BoardGroupMemoryRead]:
@@ -366,6 +399,14 @@ async def list_board_group_memory(
     )
     if is_chat is not None:
         statement = statement.filter(col(BoardGroupMemory.is_chat) == is_chat)
+    tag_filter = await tags_filter(
+        session,
+        col(BoardGroupMemory.tags),
+        all_of=tags,
+        any_of=any_tags,
+    )
+    if tag_filter is not None:
+        statement = statement.filter(tag_filter)
     statement = statement.order_by(col(BoardGroupMemory.created_at).desc())
     return await paginate(session, statement.statement)
 
@@ -377,28 +418,33 @@ async def stream_board_group_memory(
     *,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
 ) -> EventSourceResponse:
     """Stream memory entries for a board group via server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        actor_key = request_actor_key(request)
+        cursor = KeysetCursor(at=since_dt)
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as s:
+            async with read_session(actor_key) as s:
                 memories = await _fetch_memory_events(
                     s,
                     group.id,
-                    last_seen,
+                    cursor,
                     is_chat=is_chat,
+                    tags=tags,
+                    any_tags=any_tags,
                 )
             for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
+                cursor = cursor.advance(memory.created_at, memory.id)
                 payload = {"memory": _serialize_memory(memory)}
                 yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+            if len(memories) < STREAM_BATCH_LIMIT:
+                await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -474,6 +520,8 @@ async def create_board_group_memory(
 async def list_board_group_memory_for_board(
     *,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
 ) -> LimitOffsetPage[BoardGroupMemoryRead]:
@@ -493,6 +541,14 @@ async def list_board_group_memory_for_board(
     )
     if is_chat is not None:
         queryset = queryset.filter(col(BoardGroupMemory.is_chat) == is_chat)
+    tag_filter = await tags_filter(
+        session,
+        col(BoardGroupMemory.tags),
+        all_of=tags,
+        any_of=any_tags,
+    )
+    if tag_filter is not None:
+        queryset = queryset.filter(tag_filter)
     queryset = queryset.order_by(col(BoardGroupMemory.created_at).desc())
     return await paginate(session, queryset.statement)
 
@@ -528,32 +584,37 @@ async def stream_board_group_memory_for_board(
     board: Board = BOARD_READ_DEP,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
 ) -> EventSourceResponse:
     """Stream linked-group memory via SSE for near-real-time coordination."""
     group_id = board.board_group_id
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        actor_key = request_actor_key(request)
+        cursor = KeysetCursor(at=since_dt)
         while True:
             if await request.is_disconnected():
                 break
             if group_id is None:
                 await asyncio.sleep(2)
                 continue
-            async with async_session_maker() as session:
+            async with read_session(actor_key) as session:
                 memories = await _fetch_memory_events(
                     session,
                     group_id,
-                    last_seen,
+                    cursor,
                     is_chat=is_chat,
+                    tags=tags,
+                    any_tags=any_tags,
                 )
             for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
+                cursor = cursor.advance(memory.created_at, memory.id)
                 payload = {"memory": _serialize_memory(memory)}
                 yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+            if len(memories) < STREAM_BATCH_LIMIT:
+                await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
 
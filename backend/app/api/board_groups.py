@@ -36,6 +36,7 @@ from app.services.organizations import (
     OrganizationContext,
     board_access_filter,
     get_member,
+    has_access_to_any_board,
     is_org_admin,
     list_accessible_board_ids,
     member_all_boards_read,
@@ -86,8 +87,12 @@ async def _require_group_access(
             return group
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
-    allowed_ids = await list_accessible_board_ids(session, member=member, write=write)
-    if not set(board_ids).intersection(set(allowed_ids)):
+    if not await has_access_to_any_board(
+        session,
+        member=member,
+        board_ids=board_ids,
+        write=write,
+    ):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     return group
 
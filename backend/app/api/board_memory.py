@@ -21,12 +21,22 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
+from app.db.counts import CountStrategy, count_scope, invalidate_count_scope
+from app.db.json_tags import tags_filter
+from app.db.keyset import (
+    STREAM_BATCH_LIMIT,
+    KeysetCursor,
+    KeysetOrder,
+    after_cursor,
+    keyset_order,
+)
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.replicas import read_session, request_actor_key
+from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultEstimatedCountKeysetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -34,21 +44,27 @@ from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConf
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
+    from app.schemas.pagination import KeysetPage
 
 router = APIRouter(prefix="/boards/{board_id}/memory", tags=["board-memory"])
 MAX_SNIPPET_LENGTH = 800
 STREAM_POLL_SECONDS = 2
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
+TAGS_QUERY = Query(default=None, description="Only entries carrying every one of these tags.")
+ANY_TAGS_QUERY = Query(
+    default=None,
+    description="Only entries carrying at least one of these tags.",
+)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
+BOARD_MEMORY_LIST_ORDER = KeysetOrder.desc(col(BoardMemory.created_at), col(BoardMemory.id))
 
 
 def _parse_since(value: str | None) -> datetime | None:
@@ -77,8 +93,10 @@ def _serialize_memory(memory: BoardMemory) -> dict[str, object]:
 async def _fetch_memory_events(
     session: AsyncSession,
     board_id: UUID,
-    since: datetime,
+    cursor: KeysetCursor,
     is_chat: bool | None = None,
+    tags: list[str] | None = None,
+    any_tags: list[str] | None = None,
 ) -> list[BoardMemory]:
     statement = (
         BoardMemory.objects.filter_by(board_id=board_id)
@@ -88,8 +106,24 @@ async def _fetch_memory_events(
     )
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
-    statement = statement.filter(col(BoardMemory.created_at) >= since).order_by(
-        col(BoardMemory.created_at),
+    tag_filter = await tags_filter(session, col(BoardMemory.tags), all_of=tags, any_of=any_tags)
+    if tag_filter is not None:
+        statement = statement.filter(tag_filter)
+    statement = (
+        statement.filter(
+            after_cursor(
+                cursor,
+                at_column=col(BoardMemory.created_at),
+                id_column=col(BoardMemory.id),
+            ),
+        )
+        .order_by(
+            *keyset_order(
+                at_column=col(BoardMemory.created_at),
+                id_column=col(BoardMemory.id),
+            ),
+        )
+        .limit(STREAM_BATCH_LIMIT)
     )
     return await statement.all(session)
 
@@ -216,15 +250,17 @@ async def _notify_chat_targets(
             continue
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
+@router.get("", response_model=DefaultEstimatedCountKeysetPage[BoardMemoryRead])
 async def list_board_memory(
     *,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
-    """List board memory entries, optionally filtering chat entries."""
+) -> KeysetPage[BoardMemoryRead]:
+    """List board memory entries, optionally filtering chat entries and tags."""
     statement = (
         BoardMemory.objects.filter_by(board_id=board.id)
         # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
@@ -233,8 +269,15 @@ async def list_board_memory(
     )
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
-    statement = statement.order_by(col(BoardMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    tag_filter = await tags_filter(session, col(BoardMemory.tags), all_of=tags, any_of=any_tags)
+    if tag_filter is not None:
+        statement = statement.filter(tag_filter)
+    return await paginate(
+        session,
+        statement.statement,
+        count=CountStrategy.cached(count_scope("board_memory", board.id)),
+        keyset=BOARD_MEMORY_LIST_ORDER,
+    )
 
 
 @router.get("/stream")
@@ -245,28 +288,33 @@ async def stream_board_memory(
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
+    tags: list[str] | None = TAGS_QUERY,
+    any_tags: list[str] | None = ANY_TAGS_QUERY,
 ) -> EventSourceResponse:
     """Stream board memory events over server-sent events."""
     since_dt = _parse_since(since) or utcnow()
-    last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        nonlocal last_seen
+        actor_key = request_actor_key(request)
+        cursor = KeysetCursor(at=since_dt)
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
+            async with read_session(actor_key) as session:
                 memories = await _fetch_memory_events(
                     session,
                     board.id,
-                    last_seen,
+                    cursor,
                     is_chat=is_chat,
+                    tags=tags,
+                    any_tags=any_tags,
                 )
             for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
+                cursor = cursor.advance(memory.created_at, memory.id)
                 payload = {"memory": _serialize_memory(memory)}
                 yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+            if len(memories) < STREAM_BATCH_LIMIT:
+                await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -295,6 +343,7 @@ async def create_board_memory(
     )
     session.add(memory)
     await session.commit()
+    invalidate_count_scope(count_scope("board_memory", board.id))
     await session.refresh(memory)
     if is_chat:
         await _notify_chat_targets(
@@ -14,6 +14,7 @@ from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db import crud
+from app.db.counts import count_scope, invalidate_count_scope
 from app.db.pagination import paginate
 from app.db.session import get_session
 from app.models.agents import Agent
@@ -482,6 +483,7 @@ async def ingest_board_webhook(
     )
     session.add(memory)
     await session.commit()
+    invalidate_count_scope(count_scope("board_memory", board.id))
     logger.info(
         "webhook.ingest.persisted",
         extra={
@@ -8,7 +8,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Literal, cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func
 from sqlmodel import col, select
 
@@ -23,6 +23,7 @@ from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
+from app.db.replicas import get_read_session
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_groups import BoardGroup
@@ -31,11 +32,23 @@ from app.models.gateways import Gateway
 from app.schemas.boards import BoardCreate, BoardRead, BoardUpdate
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
-from app.schemas.view_models import BoardGroupSnapshot, BoardSnapshot
+from app.schemas.tasks import TaskStatus
+from app.schemas.view_models import (
+    BoardGroupSnapshot,
+    BoardSnapshot,
+    BoardSnapshotSection,
+    BoardSnapshotTaskPage,
+)
 from app.services.activity_log import record_activity
 from app.services.board_group_snapshot import build_board_group_snapshot
 from app.services.board_lifecycle import delete_board as delete_board_service
-from app.services.board_snapshot import build_board_snapshot
+from app.services.board_snapshot import (
+    ALL_SNAPSHOT_SECTIONS,
+    SnapshotOptions,
+    build_task_column_page,
+    cached_board_snapshot,
+    etag_matches,
+)
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
@@ -49,6 +62,7 @@ router = APIRouter(prefix="/boards", tags=["boards"])
 logger = get_logger(__name__)
 
 SESSION_DEP = Depends(get_session)
+READ_SESSION_DEP = Depends(get_read_session)
 ORG_ADMIN_DEP = Depends(require_org_admin)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_USER_READ_DEP = Depends(get_board_for_user_read)
@@ -59,6 +73,12 @@ BOARD_GROUP_ID_QUERY = Query(default=None)
 INCLUDE_SELF_QUERY = Query(default=False)
 INCLUDE_DONE_QUERY = Query(default=False)
 PER_BOARD_TASK_LIMIT_QUERY = Query(default=5, ge=0, le=100)
+SNAPSHOT_SECTIONS_QUERY = Query(default=None)
+TASKS_PER_STATUS_QUERY = Query(default=None, ge=1, le=500)
+SNAPSHOT_INCLUDE_DONE_QUERY = Query(default=True)
+TASK_COLUMN_STATUS_QUERY = Query(alias="status")
+TASK_COLUMN_LIMIT_QUERY = Query(default=50, ge=1, le=500)
+TASK_COLUMN_CURSOR_QUERY = Query(default=None)
 AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
 _ERR_GATEWAY_MAIN_AGENT_REQUIRED = (
     "gateway must have a gateway main agent before boards can be created or updated"
@@ -494,13 +514,68 @@ def get_board(
     return board
 
 
-@router.get("/{board_id}/snapshot", response_model=BoardSnapshot)
+@router.get(
+    "/{board_id}/snapshot",
+    response_model=BoardSnapshot,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Snapshot unchanged"}},
+)
 async def get_board_snapshot(
+    request: Request,
+    *,
+    sections: list[BoardSnapshotSection] | None = SNAPSHOT_SECTIONS_QUERY,
+    tasks_per_status: int | None = TASKS_PER_STATUS_QUERY,
+    include_done: bool = SNAPSHOT_INCLUDE_DONE_QUERY,
     board: Board = BOARD_ACTOR_READ_DEP,
-    session: AsyncSession = SESSION_DEP,
-) -> BoardSnapshot:
-    """Get a board snapshot view model."""
-    return await build_board_snapshot(session, board)
+    session: AsyncSession = READ_SESSION_DEP,
+) -> Response:
+    """Get a board snapshot view model.
+
+    Without query parameters every section is returned with all tasks. `sections` limits
+    the response to the listed parts; `tasks_per_status` and `include_done=false` return
+    only the head of each status column, with per-column totals and cursors in
+    `task_columns` for `/snapshot/tasks`.
+
+    Responses carry an `ETag`; send it back in `If-None-Match` to get `304` while the
+    snapshot is unchanged.
+    """
+    options = SnapshotOptions(
+        sections=frozenset(sections) if sections else ALL_SNAPSHOT_SECTIONS,
+        tasks_per_status=tasks_per_status,
+        include_done=include_done,
+    )
+    snapshot = await cached_board_snapshot(session, board, options)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get("/{board_id}/snapshot/tasks", response_model=BoardSnapshotTaskPage)
+async def get_board_snapshot_tasks(
+    *,
+    task_status: TaskStatus = TASK_COLUMN_STATUS_QUERY,
+    limit: int = TASK_COLUMN_LIMIT_QUERY,
+    cursor: str | None = TASK_COLUMN_CURSOR_QUERY,
+    board: Board = BOARD_ACTOR_READ_DEP,
+    session: AsyncSession = READ_SESSION_DEP,
+) -> BoardSnapshotTaskPage:
+    """Load the next page of one snapshot status column.
+
+    Pass a column's `next_cursor` from the snapshot (or a previous page) as `cursor`.
+    """
+    try:
+        return await build_task_column_page(
+            session,
+            board,
+            status=task_status,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Invalid cursor.",
+        ) from exc
 
 
 @router.get(
@@ -514,7 +589,7 @@ async def get_board_group_snapshot(
     include_done: bool = INCLUDE_DONE_QUERY,
     per_board_task_limit: int = PER_BOARD_TASK_LIMIT_QUERY,
     board: Board = BOARD_ACTOR_READ_DEP,
-    session: AsyncSession = SESSION_DEP,
+    session: AsyncSession = READ_SESSION_DEP,
 ) -> BoardGroupSnapshot:
     """Get a grouped snapshot across related boards.
 
@@ -28,13 +28,13 @@ from app.core.agent_auth import AgentAuthContext, get_agent_auth_context_optiona
 from app.core.auth import AuthContext, get_auth_context, get_auth_context_optional
 from app.db.session import get_session
 from app.models.boards import Board
-from app.models.organizations import Organization
 from app.models.tasks import Task
 from app.services.admin_access import require_admin
 from app.services.organizations import (
     OrganizationContext,
     ensure_member_for_user,
     get_active_membership,
+    get_member_organization,
     is_org_admin,
     require_board_access,
 )
@@ -57,6 +57,13 @@ def require_admin_auth(auth: AuthContext = AUTH_DEP) -> AuthContext:
     return auth
 
 
+def require_super_admin(auth: AuthContext = AUTH_DEP) -> AuthContext:
+    """Require a platform super-admin user (process-wide operational data)."""
+    if auth.actor_type != "user" or auth.user is None or not auth.user.is_super_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    return auth
+
+
 @dataclass
 class ActorContext:
     """Authenticated actor context for user or agent callers."""
@@ -94,9 +101,7 @@ async def require_org_member(
         member = await ensure_member_for_user(session, auth.user)
     if member is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    organization = await Organization.objects.by_id(member.organization_id).first(
-        session,
-    )
+    organization = await get_member_organization(session, member)
     if organization is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     return OrganizationContext(organization=organization, member=member)
@@ -119,7 +124,7 @@ async def get_board_or_404(
     session: AsyncSession = SESSION_DEP,
 ) -> Board:
     """Load a board by id or raise HTTP 404."""
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.load(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return board
@@ -131,7 +136,7 @@ async def get_board_for_actor_read(
     actor: ActorContext = ACTOR_DEP,
 ) -> Board:
     """Load a board and enforce actor read access."""
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.load(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if actor.actor_type == "agent":
@@ -150,7 +155,7 @@ async def get_board_for_actor_write(
     actor: ActorContext = ACTOR_DEP,
 ) -> Board:
     """Load a board and enforce actor write access."""
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.load(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if actor.actor_type == "agent":
@@ -169,7 +174,7 @@ async def get_board_for_user_read(
     auth: AuthContext = AUTH_DEP,
 ) -> Board:
     """Load a board and enforce authenticated-user read access."""
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.load(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if auth.user is None:
@@ -184,7 +189,7 @@ async def get_board_for_user_write(
     auth: AuthContext = AUTH_DEP,
 ) -> Board:
     """Load a board and enforce authenticated-user write access."""
-    board = await Board.objects.by_id(board_id).first(session)
+    board = await Board.objects.load(session, board_id)
     if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if auth.user is None:
@@ -202,7 +207,7 @@ async def get_task_or_404(
     session: AsyncSession = SESSION_DEP,
 ) -> Task:
     """Load a task for a board or raise HTTP 404."""
-    task = await Task.objects.by_id(task_id).first(session)
+    task = await Task.objects.load(session, task_id)
     if task is None or task.board_id != board.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return task
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlmodel import col
 
 from app.api.deps import require_org_admin
+from app.core.agent_tokens import forget_verified_agent_tokens
 from app.core.auth import AuthContext, get_auth_context
 from app.db import crud
 from app.db.pagination import paginate
@@ -199,6 +200,7 @@ async def delete_gateway(
     if main_agent is not None:
         await service.clear_agent_foreign_keys(agent_id=main_agent.id)
         await session.delete(main_agent)
+        forget_verified_agent_tokens(main_agent.id)
 
     duplicate_main_agents = await Agent.objects.filter_by(
         gateway_id=gateway.id,
@@ -209,6 +211,7 @@ async def delete_gateway(
             continue
         await service.clear_agent_foreign_keys(agent_id=agent.id)
         await session.delete(agent)
+        forget_verified_agent_tokens(agent.id)
 
     # NOTE: The migration declares `ondelete="CASCADE"` for gateway_installed_skills.gateway_id,
     # but some backends/test environments (e.g. SQLite without FK pragma) may not
@@ -1,24 +1,36 @@
-"""Dashboard metric aggregation endpoints."""
+"""Dashboard metric aggregation endpoints.
+
+Series and error-rate KPIs are read from the hourly rollup tables maintained by
+`app.db.metric_rollups`, so every range costs a few grouped reads of at most one row per
+board-hour instead of scans of `tasks` and `activity_events`. The median cycle time is
+computed exactly over review transitions in `task_status_transitions`.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import DateTime, case
-from sqlalchemy import cast as sql_cast
 from sqlalchemy import func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import require_org_member
+from app.api.deps import require_org_member, require_super_admin
+from app.core.auth import AuthContext
+from app.core.config import settings
 from app.core.time import utcnow
-from app.db.session import get_session
-from app.models.activity_events import ActivityEvent
+from app.core.ttl_cache import TTLCache
+from app.db.concurrency import gather_reads
+from app.db.metric_rollups import hour_bucket
+from app.db.pool_telemetry import pool_telemetry
+from app.db.replicas import get_read_session
 from app.models.agents import Agent
+from app.models.board_metrics import BoardHourlyMetrics
 from app.models.boards import Board
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.metrics import (
     DashboardBucketKey,
@@ -31,18 +43,25 @@ from app.schemas.metrics import (
     DashboardWipPoint,
     DashboardWipRangeSeries,
     DashboardWipSeriesSet,
+    DatabasePoolMetrics,
 )
 from app.services.organizations import OrganizationContext, list_accessible_board_ids
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
-ERROR_EVENT_PATTERN = "%failed"
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession)
 RANGE_QUERY = Query(default="24h")
 BOARD_ID_QUERY = Query(default=None)
 GROUP_ID_QUERY = Query(default=None)
-SESSION_DEP = Depends(get_session)
+READ_SESSION_DEP = Depends(get_read_session)
 ORG_MEMBER_DEP = Depends(require_org_member)
+SUPER_ADMIN_DEP = Depends(require_super_admin)
+
+DashboardCacheKey = tuple[UUID, frozenset[UUID], DashboardRangeKey, datetime]
+dashboard_metrics_cache: TTLCache[DashboardCacheKey, DashboardMetrics] = TTLCache(
+    ttl_seconds=settings.dashboard_metrics_cache_ttl_seconds,
+    max_entries=settings.dashboard_metrics_cache_max_entries,
+)
 
 
 @dataclass(frozen=True)
@@ -161,139 +180,104 @@ def _wip_series_from_mapping(
     )
 
 
-async def _query_throughput(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    statement = (
-        select(bucket_col, func.count())
-        .where(col(Task.status) == "review")
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
+@dataclass(frozen=True)
+class RollupBucket:
+    """Summed hourly rollup counters for one dashboard bucket."""
+
+    tasks_created: int = 0
+    moved_to_in_progress: int = 0
+    moved_to_review: int = 0
+    moved_to_done: int = 0
+    cycle_time_count: int = 0
+    cycle_time_hours_sum: float = 0.0
+    events_total: int = 0
+    events_failed: int = 0
+
+    @property
+    def cycle_time_hours(self) -> float:
+        """Average cycle time in hours, or 0 without samples."""
+        if self.cycle_time_count <= 0:
+            return 0.0
+        return self.cycle_time_hours_sum / self.cycle_time_count
+
+    @property
+    def error_rate_pct(self) -> float:
+        """Share of activity events that were failures, as a percentage."""
+        if self.events_total <= 0:
+            return 0.0
+        return (self.events_failed / self.events_total) * 100
+
+
+_ROLLUP_FIELDS = tuple(item.name for item in fields(RollupBucket))
+_ROLLUP_COUNT_FIELDS = tuple(name for name in _ROLLUP_FIELDS if name != "cycle_time_hours_sum")
+
+
+def _sum_buckets(buckets: Iterable[RollupBucket]) -> RollupBucket:
+    items = list(buckets)
+    return RollupBucket(
+        **{name: sum(getattr(bucket, name) for bucket in items) for name in _ROLLUP_FIELDS},
     )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1]) for row in results}
-    return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_cycle_time(
+async def _query_rollups(
     session: AsyncSession,
     range_spec: RangeSpec,
     board_ids: list[UUID],
-) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("bucket")
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
-    statement = (
-        select(bucket_col, func.avg(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
+) -> dict[datetime, RollupBucket]:
+    """Return hourly rollups of `board_ids` summed into the buckets of `range_spec`."""
     if not board_ids:
-        return _series_from_mapping(range_spec, {})
+        return {}
+    bucket_col = func.date_trunc(range_spec.bucket, BoardHourlyMetrics.bucket_start).label(
+        "bucket",
+    )
     statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
+        select(
+            bucket_col,
+            *(func.sum(getattr(BoardHourlyMetrics, name)) for name in _ROLLUP_FIELDS),
+        )
+        .where(col(BoardHourlyMetrics.board_id).in_(board_ids))
+        .where(col(BoardHourlyMetrics.bucket_start) >= hour_bucket(range_spec.start))
+        .where(col(BoardHourlyMetrics.bucket_start) <= range_spec.end)
+        .group_by(bucket_col)
+        .order_by(bucket_col)
     )
-    results = (await session.exec(statement)).all()
-    mapping = {row[0]: float(row[1] or 0) for row in results}
-    return _series_from_mapping(range_spec, mapping)
+    rollups: dict[datetime, RollupBucket] = {}
+    for bucket, *totals in (await session.exec(statement)).all():
+        values = dict(zip(_ROLLUP_FIELDS, totals, strict=True))
+        rollups[bucket] = RollupBucket(
+            **{name: int(values[name] or 0) for name in _ROLLUP_COUNT_FIELDS},
+            cycle_time_hours_sum=float(values["cycle_time_hours_sum"] or 0),
+        )
+    return rollups
 
 
-async def _query_error_rate(
-    session: AsyncSession,
+def _rollup_series(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    rollups: dict[datetime, RollupBucket],
+    value: Callable[[RollupBucket], float],
 ) -> DashboardRangeSeries:
-    bucket_col = func.date_trunc(
-        range_spec.bucket,
-        ActivityEvent.created_at,
-    ).label("bucket")
-    error_case = case(
-        (
-            col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
-            1,
-        ),
-        else_=0,
-    )
-    statement = (
-        select(bucket_col, func.sum(error_case), func.count())
-        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
+    return _series_from_mapping(
+        range_spec,
+        {bucket: value(totals) for bucket, totals in rollups.items()},
     )
-    if not board_ids:
-        return _series_from_mapping(range_spec, {})
-    statement = (
-        statement.where(col(Task.board_id).in_(board_ids)).group_by(bucket_col).order_by(bucket_col)
-    )
-    results = (await session.exec(statement)).all()
-    mapping: dict[datetime, float] = {}
-    for bucket, errors, total in results:
-        total_count = float(total or 0)
-        error_count = float(errors or 0)
-        rate = (error_count / total_count) * 100 if total_count > 0 else 0.0
-        mapping[bucket] = rate
-    return _series_from_mapping(range_spec, mapping)
 
 
-async def _query_wip(
-    session: AsyncSession,
+def _rollup_wip_series(
     range_spec: RangeSpec,
-    board_ids: list[UUID],
+    rollups: dict[datetime, RollupBucket],
 ) -> DashboardWipRangeSeries:
-    if not board_ids:
-        return _wip_series_from_mapping(range_spec, {})
-
-    inbox_bucket_col = func.date_trunc(range_spec.bucket, Task.created_at).label("inbox_bucket")
-    inbox_statement = (
-        select(inbox_bucket_col, func.count())
-        .where(col(Task.status) == "inbox")
-        .where(col(Task.created_at) >= range_spec.start)
-        .where(col(Task.created_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(inbox_bucket_col)
-        .order_by(inbox_bucket_col)
+    return _wip_series_from_mapping(
+        range_spec,
+        {
+            bucket: {
+                "inbox": totals.tasks_created,
+                "in_progress": totals.moved_to_in_progress,
+                "review": totals.moved_to_review,
+                "done": totals.moved_to_done,
+            }
+            for bucket, totals in rollups.items()
+        },
     )
-    inbox_results = (await session.exec(inbox_statement)).all()
-
-    status_bucket_col = func.date_trunc(range_spec.bucket, Task.updated_at).label("status_bucket")
-    progress_case = case((col(Task.status) == "in_progress", 1), else_=0)
-    review_case = case((col(Task.status) == "review", 1), else_=0)
-    done_case = case((col(Task.status) == "done", 1), else_=0)
-    status_statement = (
-        select(
-            status_bucket_col,
-            func.sum(progress_case),
-            func.sum(review_case),
-            func.sum(done_case),
-        )
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-        .where(col(Task.board_id).in_(board_ids))
-        .group_by(status_bucket_col)
-        .order_by(status_bucket_col)
-    )
-    status_results = (await session.exec(status_statement)).all()
-
-    mapping: dict[datetime, dict[str, int]] = {}
-    for bucket, inbox in inbox_results:
-        values = mapping.setdefault(bucket, {})
-        values["inbox"] = int(inbox or 0)
-    for bucket, in_progress, review, done in status_results:
-        values = mapping.setdefault(bucket, {})
-        values["in_progress"] = int(in_progress or 0)
-        values["review"] = int(review or 0)
-        values["done"] = int(done or 0)
-    return _wip_series_from_mapping(range_spec, mapping)
 
 
 async def _median_cycle_time_for_range(
@@ -301,56 +285,19 @@ async def _median_cycle_time_for_range(
     range_spec: RangeSpec,
     board_ids: list[UUID],
 ) -> float | None:
-    in_progress = sql_cast(Task.in_progress_at, DateTime)
-    duration_hours = func.extract("epoch", Task.updated_at - in_progress) / 3600.0
-    statement = (
-        select(func.percentile_cont(0.5).within_group(duration_hours))
-        .where(col(Task.status) == "review")
-        .where(col(Task.in_progress_at).is_not(None))
-        .where(col(Task.updated_at) >= range_spec.start)
-        .where(col(Task.updated_at) <= range_spec.end)
-    )
     if not board_ids:
         return None
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    value = (await session.exec(statement)).one_or_none()
-    if value is None:
-        return None
-    if isinstance(value, tuple):
-        value = value[0]
-    if value is None:
-        return None
-    return float(value)
-
-
-async def _error_rate_kpi(
-    session: AsyncSession,
-    range_spec: RangeSpec,
-    board_ids: list[UUID],
-) -> float:
-    error_case = case(
-        (
-            col(ActivityEvent.event_type).like(ERROR_EVENT_PATTERN),
-            1,
-        ),
-        else_=0,
-    )
+    cycle_time = col(TaskStatusTransition.cycle_time_hours)
     statement = (
-        select(func.sum(error_case), func.count())
-        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.created_at) >= range_spec.start)
-        .where(col(ActivityEvent.created_at) <= range_spec.end)
+        select(func.percentile_cont(0.5).within_group(cycle_time))
+        .where(col(TaskStatusTransition.board_id).in_(board_ids))
+        .where(col(TaskStatusTransition.to_status) == "review")
+        .where(col(TaskStatusTransition.at) >= range_spec.start)
+        .where(col(TaskStatusTransition.at) <= range_spec.end)
+        .where(cycle_time.is_not(None))
     )
-    if not board_ids:
-        return 0.0
-    statement = statement.where(col(Task.board_id).in_(board_ids))
-    result = (await session.exec(statement)).one_or_none()
-    if result is None:
-        return 0.0
-    errors, total = result
-    total_count = float(total or 0)
-    error_count = float(errors or 0)
-    return (error_count / total_count) * 100 if total_count > 0 else 0.0
+    value = (await session.exec(statement)).one_or_none()
+    return None if value is None else float(value)
 
 
 async def _active_agents(
@@ -424,10 +371,14 @@ async def dashboard_metrics(
     range_key: DashboardRangeKey = RANGE_QUERY,
     board_id: UUID | None = BOARD_ID_QUERY,
     group_id: UUID | None = GROUP_ID_QUERY,
-    session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
+    session: AsyncSession = READ_SESSION_DEP,
 ) -> DashboardMetrics:
-    """Return dashboard KPIs and time-series data for accessible boards."""
+    """Return dashboard KPIs and time-series data for accessible boards.
+
+    Results are cached briefly per organization, board set, range and current hour, and
+    identical concurrent requests share one computation.
+    """
     primary = _resolve_range(range_key)
     comparison = _comparison_range(primary)
     board_ids = await _resolve_dashboard_board_ids(
@@ -437,40 +388,58 @@ async def dashboard_metrics(
         group_id=group_id,
     )
 
-    throughput_primary = await _query_throughput(session, primary, board_ids)
-    throughput_comparison = await _query_throughput(session, comparison, board_ids)
-    throughput = DashboardSeriesSet(
-        primary=throughput_primary,
-        comparison=throughput_comparison,
+    cache_key = (
+        ctx.member.organization_id,
+        frozenset(board_ids),
+        range_key,
+        hour_bucket(primary.end),
     )
-    cycle_time_primary = await _query_cycle_time(session, primary, board_ids)
-    cycle_time_comparison = await _query_cycle_time(session, comparison, board_ids)
-    cycle_time = DashboardSeriesSet(
-        primary=cycle_time_primary,
-        comparison=cycle_time_comparison,
+    return await dashboard_metrics_cache.get_or_compute(
+        cache_key,
+        lambda: _compute_dashboard_metrics(session, primary, comparison, board_ids),
     )
-    error_rate_primary = await _query_error_rate(session, primary, board_ids)
-    error_rate_comparison = await _query_error_rate(session, comparison, board_ids)
-    error_rate = DashboardSeriesSet(
-        primary=error_rate_primary,
-        comparison=error_rate_comparison,
+
+
+async def _compute_dashboard_metrics(
+    session: AsyncSession,
+    primary: RangeSpec,
+    comparison: RangeSpec,
+    board_ids: list[UUID],
+) -> DashboardMetrics:
+    (
+        primary_rollups,
+        comparison_rollups,
+        median_cycle_time,
+        active_agents,
+        tasks_in_progress,
+    ) = await gather_reads(
+        session,
+        lambda forked: _query_rollups(forked, primary, board_ids),
+        lambda forked: _query_rollups(forked, comparison, board_ids),
+        lambda forked: _median_cycle_time_for_range(forked, primary, board_ids),
+        lambda forked: _active_agents(forked, primary, board_ids),
+        lambda forked: _tasks_in_progress(forked, primary, board_ids),
     )
-    wip_primary = await _query_wip(session, primary, board_ids)
-    wip_comparison = await _query_wip(session, comparison, board_ids)
+
+    def _series_set(value: Callable[[RollupBucket], float]) -> DashboardSeriesSet:
+        return DashboardSeriesSet(
+            primary=_rollup_series(primary, primary_rollups, value),
+            comparison=_rollup_series(comparison, comparison_rollups, value),
+        )
+
+    throughput = _series_set(lambda totals: totals.moved_to_review)
+    cycle_time = _series_set(lambda totals: totals.cycle_time_hours)
+    error_rate = _series_set(lambda totals: totals.error_rate_pct)
     wip = DashboardWipSeriesSet(
-        primary=wip_primary,
-        comparison=wip_comparison,
+        primary=_rollup_wip_series(primary, primary_rollups),
+        comparison=_rollup_wip_series(comparison, comparison_rollups),
     )
 
     kpis = DashboardKpis(
-        active_agents=await _active_agents(session, primary, board_ids),
-        tasks_in_progress=await _tasks_in_progress(session, primary, board_ids),
-        error_rate_pct=await _error_rate_kpi(session, primary, board_ids),
-        median_cycle_time_hours_7d=await _median_cycle_time_for_range(
-            session,
-            primary,
-            board_ids,
-        ),
+        active_agents=active_agents,
+        tasks_in_progress=tasks_in_progress,
+        error_rate_pct=_sum_buckets(primary_rollups.values()).error_rate_pct,
+        median_cycle_time_hours_7d=median_cycle_time,
     )
 
     return DashboardMetrics(
@@ -482,3 +451,15 @@ async def dashboard_metrics(
         error_rate=error_rate,
         wip=wip,
     )
+
+
+@router.get("/db-pools", response_model=DatabasePoolMetrics)
+async def database_pool_metrics(
+    _auth: AuthContext = SUPER_ADMIN_DEP,
+) -> DatabasePoolMetrics:
+    """Return connection pool usage for the engines of the API process serving this call.
+
+    Pool counters cover every tenant served by the process, so only platform super-admins
+    may read them.
+    """
+    return DatabasePoolMetrics(pools=[telemetry.snapshot() for telemetry in pool_telemetry()])
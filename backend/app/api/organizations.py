@@ -23,7 +23,9 @@ from app.models.approvals import Approval
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
 from app.models.board_memory import BoardMemory
+from app.models.board_metrics import BoardHourlyMetrics
 from app.models.board_onboarding import BoardOnboardingSession
+from app.models.board_versions import BoardVersion
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
@@ -35,6 +37,7 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
@@ -272,6 +275,24 @@ async def delete_my_org(
         col(TaskFingerprint.board_id).in_(board_ids),
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        BoardHourlyMetrics,
+        col(BoardHourlyMetrics.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        BoardVersion,
+        col(BoardVersion.board_id).in_(board_ids),
+        commit=False,
+    )
     await crud.delete_where(
         session,
         ApprovalTaskLink,
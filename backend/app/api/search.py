@@ -0,0 +1,102 @@
+"""Full-text search endpoints scoped to a board, a board group or an organization."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import col
+
+from app.api.deps import get_board_for_actor_read, require_org_member
+from app.db.pagination import paginate
+from app.db.session import get_session
+from app.models.board_groups import BoardGroup
+from app.models.boards import Board
+from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.search import SearchHit, SearchKind
+from app.services import search
+from app.services.organizations import OrganizationContext, accessible_board_ids_statement
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.search import BoardIds
+
+router = APIRouter(tags=["search"])
+SESSION_DEP = Depends(get_session)
+ORG_MEMBER_DEP = Depends(require_org_member)
+BOARD_READ_DEP = Depends(get_board_for_actor_read)
+SEARCH_QUERY = Query(
+    min_length=1,
+    max_length=200,
+    description="Keywords; quoted phrases, `or` and `-term` are supported on PostgreSQL.",
+)
+KIND_QUERY = Query(default=None, description="Limit hits to these kinds (repeatable).")
+AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
+_RUNTIME_TYPE_REFERENCES = (UUID,)
+
+
+async def _search_page(
+    session: AsyncSession,
+    *,
+    text: str,
+    board_ids: BoardIds,
+    kinds: list[SearchKind] | None,
+) -> LimitOffsetPage[SearchHit]:
+    query = await search.prepare_query(session, text)
+    statement = search.search_statement(query, board_ids=board_ids, kinds=kinds)
+
+    async def _transform(rows: Sequence[Any]) -> Sequence[Any]:
+        return await search.hits_for_rows(session, query, rows)
+
+    return await paginate(session, statement, transformer=_transform)
+
+
+@router.get(
+    "/boards/{board_id}/search",
+    response_model=DefaultLimitOffsetPage[SearchHit],
+    tags=AGENT_BOARD_ROLE_TAGS,
+)
+async def search_board(
+    q: str = SEARCH_QUERY,
+    kind: list[SearchKind] | None = KIND_QUERY,
+    board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
+) -> LimitOffsetPage[SearchHit]:
+    """Search a board's tasks, task comments and memory, best matches first."""
+    return await _search_page(session, text=q, board_ids=[board.id], kinds=kind)
+
+
+@router.get("/board-groups/{group_id}/search", response_model=DefaultLimitOffsetPage[SearchHit])
+async def search_board_group(
+    group_id: UUID,
+    q: str = SEARCH_QUERY,
+    kind: list[SearchKind] | None = KIND_QUERY,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_MEMBER_DEP,
+) -> LimitOffsetPage[SearchHit]:
+    """Search every board in a group that the caller can read."""
+    group = await BoardGroup.objects.by_id(group_id).first(session)
+    if group is None or group.organization_id != ctx.organization.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    board_ids = accessible_board_ids_statement(ctx.member, write=False).where(
+        col(Board.board_group_id) == group.id,
+    )
+    return await _search_page(session, text=q, board_ids=board_ids, kinds=kind)
+
+
+@router.get("/organizations/me/search", response_model=DefaultLimitOffsetPage[SearchHit])
+async def search_organization(
+    q: str = SEARCH_QUERY,
+    kind: list[SearchKind] | None = KIND_QUERY,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_MEMBER_DEP,
+) -> LimitOffsetPage[SearchHit]:
+    """Search every board in the active organization that the caller can read."""
+    board_ids = accessible_board_ids_statement(ctx.member, write=False)
+    return await _search_page(session, text=q, board_ids=board_ids, kinds=kind)
@@ -14,11 +14,12 @@ from urllib.parse import unquote, urlparse
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import func, or_
-from sqlmodel import col, select
+from sqlalchemy import case, func
+from sqlmodel import col
 
 from app.api.deps import require_org_admin
 from app.core.time import utcnow
+from app.db.counts import CountStrategy, count_rows, count_scope, invalidate_count_scope
 from app.db.session import get_session
 from app.models.gateways import Gateway
 from app.models.skills import GatewayInstalledSkill, MarketplaceSkill, SkillPack
@@ -42,6 +43,7 @@ from app.services.openclaw.shared import GatewayAgentIdentity
 from app.services.organizations import OrganizationContext
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/skills", tags=["skills"])
@@ -936,6 +938,28 @@ def _apply_pack_candidate_updates(
     return changed
 
 
+def _marketplace_filter_key(value: str | None) -> str | None:
+    normalized = (value or "").strip().lower()
+    if not normalized:
+        return None
+    return "" if normalized == "uncategorized" else normalized
+
+
+def _marketplace_relevance_order(search: str) -> list[ColumnElement[int]]:
+    """Rank exact name matches, then name prefixes, then name substrings, then the rest."""
+    if not search:
+        return []
+    name = func.lower(col(MarketplaceSkill.name))
+    return [
+        case(
+            (name == search, 0),
+            (name.startswith(search, autoescape=True), 1),
+            (name.contains(search, autoescape=True), 2),
+            else_=3,
+        ),
+    ]
+
+
 @router.get("/marketplace", response_model=list[MarketplaceSkillCardRead])
 async def list_marketplace_skills(
     response: Response,
@@ -953,34 +977,14 @@ async def list_marketplace_skills(
     gateway = await _require_gateway_for_org(gateway_id=gateway_id, session=session, ctx=ctx)
     skills_query = MarketplaceSkill.objects.filter_by(organization_id=ctx.organization.id)
 
-    normalized_category = (category or "").strip().lower()
-    if normalized_category:
-        if normalized_category == "uncategorized":
-            skills_query = skills_query.filter(
-                or_(
-                    col(MarketplaceSkill.category).is_(None),
-                    func.trim(col(MarketplaceSkill.category)) == "",
-                ),
-            )
-        else:
-            skills_query = skills_query.filter(
-                func.lower(func.trim(col(MarketplaceSkill.category))) == normalized_category,
-            )
+    # The generated keys are already trimmed and lower-cased; "" means uncategorized.
+    category_key = _marketplace_filter_key(category)
+    if category_key is not None:
+        skills_query = skills_query.filter(col(MarketplaceSkill.category_key) == category_key)
 
-    normalized_risk = (risk or "").strip().lower()
-    if normalized_risk:
-        if normalized_risk == "uncategorized":
-            skills_query = skills_query.filter(
-                or_(
-                    col(MarketplaceSkill.risk).is_(None),
-                    func.trim(col(MarketplaceSkill.risk)) == "",
-                ),
-            )
-        else:
-            skills_query = skills_query.filter(
-                func.lower(func.trim(func.coalesce(col(MarketplaceSkill.risk), "")))
-                == normalized_risk,
-            )
+    risk_key = _marketplace_filter_key(risk)
+    if risk_key is not None:
+        skills_query = skills_query.filter(col(MarketplaceSkill.risk_key) == risk_key)
 
     if pack_id is not None:
         pack = await _require_skill_pack_for_org(pack_id=pack_id, session=session, ctx=ctx)
@@ -989,29 +993,29 @@ async def list_marketplace_skills(
             col(MarketplaceSkill.source_url).ilike(f"{normalized_pack_source}%"),
         )
 
-    normalized_search = (search or "").strip()
+    normalized_search = (search or "").strip().lower()
     if normalized_search:
-        search_like = f"%{normalized_search}%"
         skills_query = skills_query.filter(
-            or_(
-                col(MarketplaceSkill.name).ilike(search_like),
-                col(MarketplaceSkill.description).ilike(search_like),
-                col(MarketplaceSkill.category).ilike(search_like),
-                col(MarketplaceSkill.risk).ilike(search_like),
-                col(MarketplaceSkill.source).ilike(search_like),
-            ),
+            col(MarketplaceSkill.search_text).contains(normalized_search, autoescape=True),
         )
 
     if limit is not None:
-        count_statement = select(func.count()).select_from(
-            skills_query.statement.order_by(None).subquery()
+        counted = await count_rows(
+            session,
+            skills_query.statement,
+            CountStrategy.cached(count_scope("marketplace_skills", ctx.organization.id)),
         )
-        total_count = int((await session.exec(count_statement)).one() or 0)
-        response.headers["X-Total-Count"] = str(total_count)
+        response.headers["X-Total-Count"] = str(counted.total)
+        if counted.approximate:
+            response.headers["X-Total-Count-Approximate"] = "true"
         response.headers["X-Limit"] = str(limit)
         response.headers["X-Offset"] = str(offset)
 
-    ordered_query = skills_query.order_by(col(MarketplaceSkill.created_at).desc())
+    ordered_query = skills_query.order_by(
+        *_marketplace_relevance_order(normalized_search),
+        col(MarketplaceSkill.created_at).desc(),
+        col(MarketplaceSkill.id).desc(),
+    )
     if limit is not None:
         ordered_query = ordered_query.offset(offset).limit(limit)
     skills = await ordered_query.all(session)
@@ -1048,6 +1052,7 @@ async def create_marketplace_skill(
             existing.updated_at = utcnow()
             session.add(existing)
             await session.commit()
+            invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
             await session.refresh(existing)
         existing.metadata_ = existing.metadata_ or {}
         return existing
@@ -1061,6 +1066,7 @@ async def create_marketplace_skill(
     )
     session.add(skill)
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
     await session.refresh(skill)
     skill.metadata_ = skill.metadata_ or {}
     return skill
@@ -1079,6 +1085,7 @@ async def delete_marketplace_skill(
         await session.delete(installation)
     await session.delete(skill)
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
     return OkResponse()
 
 
@@ -1193,6 +1200,7 @@ async def create_skill_pack(
             existing.updated_at = utcnow()
             session.add(existing)
             await session.commit()
+            invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
             await session.refresh(existing)
         count_by_repo = await _load_pack_skill_count_by_repo(
             session=session,
@@ -1210,6 +1218,7 @@ async def create_skill_pack(
     )
     session.add(pack)
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
     await session.refresh(pack)
     count_by_repo = await _load_pack_skill_count_by_repo(
         session=session,
@@ -1251,6 +1260,7 @@ async def update_skill_pack(
     pack.updated_at = utcnow()
     session.add(pack)
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
     await session.refresh(pack)
     count_by_repo = await _load_pack_skill_count_by_repo(
         session=session,
@@ -1269,6 +1279,7 @@ async def delete_skill_pack(
     pack = await _require_skill_pack_for_org(pack_id=pack_id, session=session, ctx=ctx)
     await session.delete(pack)
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
     return OkResponse()
 
 
@@ -1328,6 +1339,7 @@ async def sync_skill_pack(
             updated += 1
 
     await session.commit()
+    invalidate_count_scope(count_scope("marketplace_skills", ctx.organization.id))
 
     return SkillPackSyncResponse(
         pack_id=pack.id,
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
@@ -18,6 +17,7 @@ from sse_starlette.sse import EventSourceResponse
 from app.api.deps import (
     ActorContext,
     get_board_for_actor_read,
+    get_board_for_actor_write,
     get_board_for_user_write,
     get_task_or_404,
     require_admin_auth,
@@ -25,8 +25,16 @@ from app.api.deps import (
 )
 from app.core.time import utcnow
 from app.db import crud
+from app.db.keyset import (
+    STREAM_BATCH_LIMIT,
+    KeysetCursor,
+    KeysetOrder,
+    after_cursor,
+    keyset_order,
+)
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.replicas import read_session, request_actor_key
+from app.db.session import get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
@@ -40,17 +48,27 @@ from app.models.task_custom_fields import (
 )
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead
 from app.schemas.common import OkResponse
 from app.schemas.errors import BlockedTaskError
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import DefaultKeysetPage, DefaultLimitOffsetPage
 from app.schemas.task_custom_fields import (
     TaskCustomFieldType,
     TaskCustomFieldValues,
     validate_custom_field_value,
 )
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkCreate,
+    TaskBulkRead,
+    TaskBulkUpdate,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.activity_log import record_activity
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
@@ -72,9 +90,13 @@ from app.services.task_dependencies import (
     dependency_ids_by_task_id,
     dependency_status_by_id,
     dependent_task_ids,
+    refresh_blocked_by,
     replace_task_dependencies,
-    validate_dependency_update,
+    set_blocked_by,
+    stored_blocked_by_ids,
+    validate_dependency_updates,
 )
+from app.services.task_status_transitions import record_status_transition
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -85,6 +107,7 @@ if TYPE_CHECKING:
 
     from app.core.auth import AuthContext
     from app.models.users import User
+    from app.schemas.pagination import KeysetPage
 
 router = APIRouter(prefix="/boards/{board_id}/tasks", tags=["tasks"])
 
@@ -95,15 +118,16 @@ TASK_EVENT_TYPES = {
     "task.status_changed",
     "task.comment",
 }
-SSE_SEEN_MAX = 2000
 TASK_SNIPPET_MAX_LEN = 500
 TASK_SNIPPET_TRUNCATED_LEN = 497
 TASK_EVENT_ROW_LEN = 2
+TASK_LIST_ORDER = KeysetOrder.desc(col(Task.created_at), col(Task.id))
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
 ACTOR_DEP = Depends(require_admin_or_agent)
 SINCE_QUERY = Query(default=None)
 STATUS_QUERY = Query(default=None, alias="status")
 BOARD_WRITE_DEP = Depends(get_board_for_user_write)
+BOARD_ACTOR_WRITE_DEP = Depends(get_board_for_actor_write)
 SESSION_DEP = Depends(get_session)
 ADMIN_AUTH_DEP = Depends(require_admin_auth)
 TASK_DEP = Depends(get_task_or_404)
@@ -498,6 +522,7 @@ async def _reconcile_dependents_for_dependency_toggle(
                 or dependent.in_progress_at is not None
             )
             if should_reset:
+                previous_dependent_status = dependent.status
                 dependent.status = "inbox"
                 dependent.assigned_agent_id = None
                 dependent.in_progress_at = None
@@ -512,6 +537,12 @@ async def _reconcile_dependents_for_dependency_toggle(
                     ),
                     agent_id=actor_agent_id,
                 )
+                record_status_transition(
+                    session,
+                    task=dependent,
+                    from_status=previous_dependent_status,
+                    agent_id=actor_agent_id,
+                )
             else:
                 record_activity(
                     session,
@@ -528,25 +559,33 @@ async def _reconcile_dependents_for_dependency_toggle(
                 message=f"Dependency completion changed: {dependency_task.title}.",
                 agent_id=actor_agent_id,
             )
+    await refresh_blocked_by(session, board_id=board_id, tasks=dependents)
 
 
 async def _fetch_task_events(
     session: AsyncSession,
     board_id: UUID,
-    since: datetime,
+    cursor: KeysetCursor,
 ) -> list[tuple[ActivityEvent, Task | None]]:
-    task_ids = list(
-        await session.exec(select(Task.id).where(col(Task.board_id) == board_id)),
-    )
-    if not task_ids:
-        return []
     statement = (
         select(ActivityEvent, Task)
-        .outerjoin(Task, col(ActivityEvent.task_id) == col(Task.id))
-        .where(col(ActivityEvent.task_id).in_(task_ids))
+        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
+        .where(col(Task.board_id) == board_id)
         .where(col(ActivityEvent.event_type).in_(TASK_EVENT_TYPES))
-        .where(col(ActivityEvent.created_at) >= since)
-        .order_by(asc(col(ActivityEvent.created_at)))
+        .where(
+            after_cursor(
+                cursor,
+                at_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+            ),
+        )
+        .order_by(
+            *keyset_order(
+                at_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+            ),
+        )
+        .limit(STREAM_BATCH_LIMIT)
     )
     result = await session.execute(statement)
     return _coerce_task_event_rows(list(result.tuples().all()))
@@ -589,7 +628,7 @@ async def _send_agent_task_message(
     )
 
 
-def _assignment_notification_message(*, board: Board, task: Task, agent: Agent) -> str:
+def _task_details(*, board: Board, task: Task) -> str:
     description = _truncate_snippet(task.description or "")
     details = [
         f"Board: {board.name}",
@@ -599,15 +638,20 @@ def _assignment_notification_message(*, board: Board, task: Task, agent: Agent)
     ]
     if description:
         details.append(f"Description: {description}")
+    return "\n".join(details)
+
+
+def _assignment_notification_message(*, board: Board, task: Task, agent: Agent) -> str:
+    details = _task_details(board=board, task=task)
     if task.status == "review" and agent.is_board_lead:
         action = (
             "Take action: review the deliverables now. "
             "Approve by moving to done or return to inbox with clear feedback."
         )
-        return "TASK READY FOR LEAD REVIEW\n" + "\n".join(details) + f"\n\n{action}"
+        return "TASK READY FOR LEAD REVIEW\n" + details + f"\n\n{action}"
     return (
         "TASK ASSIGNED\n"
-        + "\n".join(details)
+        + details
         + ("\n\nTake action: open the task and begin work. " "Post updates as task comments.")
     )
 
@@ -618,15 +662,6 @@ def _rework_notification_message(
     task: Task,
     feedback: str | None,
 ) -> str:
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
     requested_changes = (
         _truncate_snippet(feedback)
         if feedback and feedback.strip()
@@ -634,7 +669,7 @@ def _rework_notification_message(
     )
     return (
         "CHANGES REQUESTED\n"
-        + "\n".join(details)
+        + _task_details(board=board, task=task)
         + "\n\nRequested changes:\n"
         + requested_changes
         + "\n\nTake action: address the requested changes, then move the task back to review."
@@ -658,96 +693,161 @@ async def _latest_task_comment_by_agent(
     return (await session.exec(statement)).first()
 
 
-async def _notify_agent_on_task_assign(
-    *,
+@dataclass(frozen=True, slots=True)
+class _TaskNotification:
+    """A task message bound for one agent, with the activity events that log its outcome."""
+
+    agent: Agent
+    task: Task
+    message: str
+    sent_event_type: str
+    sent_message: str
+    failed_event_type: str
+    failed_label: str
+    # Lead-channel messages are sent under the "Lead Agent" name.
+    lead_channel: bool = False
+
+
+def _assignment_notification(*, board: Board, task: Task, agent: Agent) -> _TaskNotification:
+    return _TaskNotification(
+        agent=agent,
+        task=task,
+        message=_assignment_notification_message(board=board, task=task, agent=agent),
+        sent_event_type="task.assignee_notified",
+        sent_message=f"Agent notified for assignment: {agent.name}.",
+        failed_event_type="task.assignee_notify_failed",
+        failed_label="Assignee notify failed",
+    )
+
+
+async def _rework_notification(
     session: AsyncSession,
+    *,
     board: Board,
     task: Task,
     agent: Agent,
+    lead: Agent,
+) -> _TaskNotification:
+    feedback = await _latest_task_comment_by_agent(
+        session,
+        task_id=task.id,
+        agent_id=lead.id,
+    )
+    return _TaskNotification(
+        agent=agent,
+        task=task,
+        message=_rework_notification_message(board=board, task=task, feedback=feedback),
+        sent_event_type="task.rework_notified",
+        sent_message=f"Assignee notified about requested changes: {agent.name}.",
+        failed_event_type="task.rework_notify_failed",
+        failed_label="Rework notify failed",
+    )
+
+
+def _lead_created_notification(*, board: Board, task: Task, lead: Agent) -> _TaskNotification:
+    return _TaskNotification(
+        agent=lead,
+        task=task,
+        message=(
+            "NEW TASK ADDED\n"
+            + _task_details(board=board, task=task)
+            + "\n\nTake action: triage, assign, or plan next steps."
+        ),
+        sent_event_type="task.lead_notified",
+        sent_message=f"Lead agent notified for task: {task.title}.",
+        failed_event_type="task.lead_notify_failed",
+        failed_label="Lead notify failed",
+        lead_channel=True,
+    )
+
+
+def _lead_unassigned_notification(*, board: Board, task: Task, lead: Agent) -> _TaskNotification:
+    return _TaskNotification(
+        agent=lead,
+        task=task,
+        message=(
+            "TASK BACK IN INBOX\n"
+            + _task_details(board=board, task=task)
+            + "\n\nTake action: assign a new owner or adjust the plan."
+        ),
+        sent_event_type="task.lead_unassigned_notified",
+        sent_message=f"Lead notified task returned to inbox: {task.title}.",
+        failed_event_type="task.lead_unassigned_notify_failed",
+        failed_label="Lead notify failed",
+        lead_channel=True,
+    )
+
+
+def _grouped_notification_message(notifications: Sequence[_TaskNotification]) -> str:
+    if len(notifications) == 1:
+        return notifications[0].message
+    return f"TASK UPDATES ({len(notifications)})\n\n" + "\n\n---\n\n".join(
+        notification.message for notification in notifications
+    )
+
+
+async def _send_task_notifications(
+    session: AsyncSession,
+    *,
+    board: Board,
+    notifications: Sequence[_TaskNotification],
 ) -> None:
-    if not agent.openclaw_session_id:
+    """Send one gateway message per agent covering all of its notifications, then commit.
+
+    Each task still gets its own notified/failed activity event.
+    """
+    deliverable = [item for item in notifications if item.agent.openclaw_session_id]
+    if not deliverable:
         return
     dispatch = GatewayDispatchService(session)
     config = await dispatch.optional_gateway_config_for_board(board)
     if config is None:
         return
-    message = _assignment_notification_message(board=board, task=task, agent=agent)
-    error = await _send_agent_task_message(
-        dispatch=dispatch,
-        session_key=agent.openclaw_session_id,
-        config=config,
-        agent_name=agent.name,
-        message=message,
-    )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.assignee_notified",
-            message=f"Agent notified for assignment: {agent.name}.",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.assignee_notify_failed",
-            message=f"Assignee notify failed: {error}",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
+    groups: dict[tuple[UUID, bool], list[_TaskNotification]] = {}
+    for item in deliverable:
+        groups.setdefault((item.agent.id, item.lead_channel), []).append(item)
+    for group in groups.values():
+        agent = group[0].agent
+        session_key = agent.openclaw_session_id or ""
+        message = _grouped_notification_message(group)
+        if group[0].lead_channel:
+            error = await _send_lead_task_message(
+                dispatch=dispatch,
+                session_key=session_key,
+                config=config,
+                message=message,
+            )
+        else:
+            error = await _send_agent_task_message(
+                dispatch=dispatch,
+                session_key=session_key,
+                config=config,
+                agent_name=agent.name,
+                message=message,
+            )
+        for item in group:
+            record_activity(
+                session,
+                event_type=item.sent_event_type if error is None else item.failed_event_type,
+                message=item.sent_message if error is None else f"{item.failed_label}: {error}",
+                agent_id=agent.id,
+                task_id=item.task.id,
+            )
+    await session.commit()
 
 
-async def _notify_agent_on_task_rework(
+async def _notify_agent_on_task_assign(
     *,
     session: AsyncSession,
     board: Board,
     task: Task,
     agent: Agent,
-    lead: Agent,
 ) -> None:
-    if not agent.openclaw_session_id:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
-    feedback = await _latest_task_comment_by_agent(
+    await _send_task_notifications(
         session,
-        task_id=task.id,
-        agent_id=lead.id,
-    )
-    message = _rework_notification_message(
         board=board,
-        task=task,
-        feedback=feedback,
+        notifications=[_assignment_notification(board=board, task=task, agent=agent)],
     )
-    error = await _send_agent_task_message(
-        dispatch=dispatch,
-        session_key=agent.openclaw_session_id,
-        config=config,
-        agent_name=agent.name,
-        message=message,
-    )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.rework_notified",
-            message=f"Assignee notified about requested changes: {agent.name}.",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.rework_notify_failed",
-            message=f"Rework notify failed: {error}",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
 
 
 async def notify_agent_on_task_assign(
@@ -766,118 +866,25 @@ async def notify_agent_on_task_assign(
     )
 
 
-async def _notify_lead_on_task_create(
-    *,
-    session: AsyncSession,
-    board: Board,
-    task: Task,
-) -> None:
-    lead = (
-        await Agent.objects.filter_by(board_id=board.id)
-        .filter(col(Agent.is_board_lead).is_(True))
-        .first(session)
-    )
-    if lead is None or not lead.openclaw_session_id:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
-    message = (
-        "NEW TASK ADDED\n"
-        + "\n".join(details)
-        + "\n\nTake action: triage, assign, or plan next steps."
-    )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
-        session_key=lead.openclaw_session_id,
-        config=config,
-        message=message,
-    )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_notified",
-            message=f"Lead agent notified for task: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
+async def _board_lead(session: AsyncSession, board_id: UUID | None) -> Agent | None:
+    leads = await Agent.objects.load_related(session, board_id=board_id, is_board_lead=True)
+    return leads[0] if leads else None
 
 
-async def _notify_lead_on_task_unassigned(
+async def _notify_lead_on_task_create(
     *,
     session: AsyncSession,
     board: Board,
     task: Task,
 ) -> None:
-    lead = (
-        await Agent.objects.filter_by(board_id=board.id)
-        .filter(col(Agent.is_board_lead).is_(True))
-        .first(session)
-    )
-    if lead is None or not lead.openclaw_session_id:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
+    lead = await _board_lead(session, board.id)
+    if lead is None:
         return
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
-    message = (
-        "TASK BACK IN INBOX\n"
-        + "\n".join(details)
-        + "\n\nTake action: assign a new owner or adjust the plan."
-    )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
-        session_key=lead.openclaw_session_id,
-        config=config,
-        message=message,
+    await _send_task_notifications(
+        session,
+        board=board,
+        notifications=[_lead_created_notification(board=board, task=task, lead=lead)],
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notified",
-            message=f"Lead notified task returned to inbox: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
 
 
 def _status_values(status_filter: str | None) -> list[str]:
@@ -1019,11 +1026,13 @@ async def _set_task_custom_field_values_for_create(
     board_id: UUID,
     task_id: UUID,
     custom_field_values: TaskCustomFieldValues,
+    definitions_by_key: dict[str, _BoardCustomFieldDefinition] | None = None,
 ) -> None:
-    definitions_by_key = await _organization_custom_field_definitions_for_board(
-        session,
-        board_id=board_id,
-    )
+    if definitions_by_key is None:
+        definitions_by_key = await _organization_custom_field_definitions_for_board(
+            session,
+            board_id=board_id,
+        )
     _reject_unknown_custom_field_keys(
         custom_field_values=custom_field_values,
         definitions_by_key=definitions_by_key,
@@ -1173,6 +1182,7 @@ def _task_list_statement(
     status_filter: str | None,
     assigned_agent_id: UUID | None,
     unassigned: bool | None,
+    unblocked: bool | None = None,
 ) -> SelectOfScalar[Task]:
     statement = select(Task).where(Task.board_id == board_id)
     statuses = _status_values(status_filter)
@@ -1182,7 +1192,17 @@ def _task_list_statement(
         statement = statement.where(col(Task.assigned_agent_id) == assigned_agent_id)
     if unassigned:
         statement = statement.where(col(Task.assigned_agent_id).is_(None))
-    return statement.order_by(col(Task.created_at).desc())
+    # Done tasks never count as blocked, matching `TaskRead.is_blocked`.
+    if unblocked is True:
+        statement = statement.where(
+            or_(col(Task.blocked_by_count) == 0, col(Task.status) == "done"),
+        )
+    elif unblocked is False:
+        statement = statement.where(
+            col(Task.blocked_by_count) > 0,
+            col(Task.status) != "done",
+        )
+    return statement
 
 
 async def _task_read_page(
@@ -1204,14 +1224,6 @@ async def _task_read_page(
         board_id=board_id,
         task_ids=task_ids,
     )
-    dep_ids: list[UUID] = []
-    for value in deps_map.values():
-        dep_ids.extend(value)
-    dep_status = await dependency_status_by_id(
-        session,
-        board_id=board_id,
-        dependency_ids=list({*dep_ids}),
-    )
     custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
         session,
         board_id=board_id,
@@ -1222,12 +1234,7 @@ async def _task_read_page(
     for task in tasks:
         tag_state = tag_state_by_task_id.get(task.id, TagState())
         dep_list = deps_map.get(task.id, [])
-        blocked_by = blocked_by_dependency_ids(
-            dependency_ids=dep_list,
-            status_by_id=dep_status,
-        )
-        if task.status == "done":
-            blocked_by = []
+        blocked_by = stored_blocked_by_ids(task)
         output.append(
             TaskRead.model_validate(task, from_attributes=True).model_copy(
                 update={
@@ -1250,7 +1257,6 @@ async def _stream_task_state(
     rows: list[tuple[ActivityEvent, Task | None]],
 ) -> tuple[
     dict[UUID, list[UUID]],
-    dict[UUID, str],
     dict[UUID, TagState],
     dict[UUID, TaskCustomFieldValues],
 ]:
@@ -1258,7 +1264,7 @@ async def _stream_task_state(
         task.id for event, task in rows if task is not None and event.event_type != "task.comment"
     ]
     if not task_ids:
-        return {}, {}, {}, {}
+        return {}, {}, {}
 
     tag_state_by_task_id = await load_tag_state(
         session,
@@ -1269,23 +1275,12 @@ async def _stream_task_state(
         board_id=board_id,
         task_ids=list({*task_ids}),
     )
-    dep_ids: list[UUID] = []
-    for value in deps_map.values():
-        dep_ids.extend(value)
     custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
         session,
         board_id=board_id,
         task_ids=list({*task_ids}),
     )
-    if not dep_ids:
-        return deps_map, {}, tag_state_by_task_id, custom_field_values_by_task_id
-
-    dep_status = await dependency_status_by_id(
-        session,
-        board_id=board_id,
-        dependency_ids=list({*dep_ids}),
-    )
-    return deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id
+    return deps_map, tag_state_by_task_id, custom_field_values_by_task_id
 
 
 def _task_event_payload(
@@ -1293,7 +1288,6 @@ def _task_event_payload(
     task: Task | None,
     *,
     deps_map: dict[UUID, list[UUID]],
-    dep_status: dict[UUID, str],
     tag_state_by_task_id: dict[UUID, TagState],
     custom_field_values_by_task_id: dict[UUID, TaskCustomFieldValues] | None = None,
 ) -> dict[str, object]:
@@ -1311,12 +1305,7 @@ def _task_event_payload(
 
     tag_state = tag_state_by_task_id.get(task.id, TagState())
     dep_list = deps_map.get(task.id, [])
-    blocked_by = blocked_by_dependency_ids(
-        dependency_ids=dep_list,
-        status_by_id=dep_status,
-    )
-    if task.status == "done":
-        blocked_by = []
+    blocked_by = stored_blocked_by_ids(task)
     payload["task"] = (
         TaskRead.model_validate(task, from_attributes=True)
         .model_copy(
@@ -1343,17 +1332,16 @@ async def _task_event_generator(
     board_id: UUID,
     since_dt: datetime,
 ) -> AsyncIterator[dict[str, str]]:
-    last_seen = since_dt
-    seen_ids: set[UUID] = set()
-    seen_queue: deque[UUID] = deque()
+    actor_key = request_actor_key(request)
+    cursor = KeysetCursor(at=since_dt)
 
     while True:
         if await request.is_disconnected():
             break
 
-        async with async_session_maker() as session:
-            rows = await _fetch_task_events(session, board_id, last_seen)
-            deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
+        async with read_session(actor_key) as session:
+            rows = await _fetch_task_events(session, board_id, cursor)
+            deps_map, tag_state_by_task_id, custom_field_values_by_task_id = (
                 await _stream_task_state(
                     session,
                     board_id=board_id,
@@ -1362,25 +1350,17 @@ async def _task_event_generator(
             )
 
         for event, task in rows:
-            if event.id in seen_ids:
-                continue
-            seen_ids.add(event.id)
-            seen_queue.append(event.id)
-            if len(seen_queue) > SSE_SEEN_MAX:
-                oldest = seen_queue.popleft()
-                seen_ids.discard(oldest)
-            last_seen = max(event.created_at, last_seen)
-
+            cursor = cursor.advance(event.created_at, event.id)
             payload = _task_event_payload(
                 event,
                 task,
                 deps_map=deps_map,
-                dep_status=dep_status,
                 tag_state_by_task_id=tag_state_by_task_id,
                 custom_field_values_by_task_id=custom_field_values_by_task_id,
             )
             yield {"event": "task", "data": json.dumps(payload)}
-        await asyncio.sleep(2)
+        if len(rows) < STREAM_BATCH_LIMIT:
+            await asyncio.sleep(2)
 
 
 @router.get("/stream")
@@ -1402,21 +1382,23 @@ async def stream_tasks(
     )
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[TaskRead])
+@router.get("", response_model=DefaultKeysetPage[TaskRead])
 async def list_tasks(
     status_filter: str | None = STATUS_QUERY,
     assigned_agent_id: UUID | None = None,
     unassigned: bool | None = None,
+    unblocked: bool | None = None,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[TaskRead]:
-    """List board tasks with optional status and assignment filters."""
+) -> KeysetPage[TaskRead]:
+    """List board tasks with optional status, assignment and blocked-state filters."""
     statement = _task_list_statement(
         board_id=board.id,
         status_filter=status_filter,
         assigned_agent_id=assigned_agent_id,
         unassigned=unassigned,
+        unblocked=unblocked,
     )
 
     async def _transform(items: Sequence[object]) -> Sequence[object]:
@@ -1427,93 +1409,189 @@ async def list_tasks(
             tasks=tasks,
         )
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(session, statement, transformer=_transform, keyset=TASK_LIST_ORDER)
 
 
-@router.post("", response_model=TaskRead, responses={409: {"model": BlockedTaskError}})
-async def create_task(
-    payload: TaskCreate,
-    board: Board = BOARD_WRITE_DEP,
-    session: AsyncSession = SESSION_DEP,
-    auth: AuthContext = ADMIN_AUTH_DEP,
-) -> TaskRead:
-    """Create a task and initialize dependency rows."""
-    data = payload.model_dump(exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"})
-    depends_on_task_ids = list(payload.depends_on_task_ids)
-    tag_ids = list(payload.tag_ids)
-    custom_field_values = dict(payload.custom_field_values)
+async def _validate_lead_assignees(
+    session: AsyncSession,
+    *,
+    board: Board,
+    tasks: Sequence[Task],
+) -> None:
+    agents = await Agent.objects.load_many(
+        session,
+        {task.assigned_agent_id for task in tasks if task.assigned_agent_id is not None},
+    )
+    for task in tasks:
+        if task.assigned_agent_id is None:
+            continue
+        agent = agents.get(task.assigned_agent_id)
+        if agent is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        if agent.is_board_lead:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Board leads cannot assign tasks to themselves.",
+            )
+        if agent.board_id and agent.board_id != board.id:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
-    task = Task.model_validate(data)
-    task.board_id = board.id
-    if task.created_by_user_id is None and auth.user is not None:
-        task.created_by_user_id = auth.user.id
 
-    normalized_deps = await validate_dependency_update(
+async def stage_task_creates(
+    session: AsyncSession,
+    *,
+    board: Board,
+    payloads: Sequence[TaskCreate],
+    created_by_user_id: UUID | None = None,
+    lead: Agent | None = None,
+) -> list[Task]:
+    """Validate and add new tasks with their dependencies, tags and custom fields.
+
+    Dependencies, tags, custom-field definitions and (for `lead`) assignees are checked
+    once for the whole batch, so any invalid item rejects every item. Nothing is committed.
+    """
+    tasks: list[Task] = []
+    for payload in payloads:
+        task = Task.model_validate(
+            payload.model_dump(exclude={"depends_on_task_ids", "tag_ids", "custom_field_values"}),
+        )
+        task.board_id = board.id
+        if lead is not None:
+            task.auto_created = True
+            task.auto_reason = f"lead_agent:{lead.id}"
+        elif task.created_by_user_id is None:
+            task.created_by_user_id = created_by_user_id
+        tasks.append(task)
+
+    deps_by_task_id = await validate_dependency_updates(
         session,
         board_id=board.id,
-        task_id=task.id,
-        depends_on_task_ids=depends_on_task_ids,
+        updates={
+            task.id: payload.depends_on_task_ids
+            for task, payload in zip(tasks, payloads, strict=True)
+        },
     )
-    normalized_tag_ids = await validate_tag_ids(
+    await validate_tag_ids(
         session,
         organization_id=board.organization_id,
-        tag_ids=tag_ids,
+        tag_ids=[tag_id for payload in payloads for tag_id in payload.tag_ids],
     )
     dep_status = await dependency_status_by_id(
         session,
         board_id=board.id,
-        dependency_ids=normalized_deps,
-    )
-    blocked_by = blocked_by_dependency_ids(
-        dependency_ids=normalized_deps,
-        status_by_id=dep_status,
+        dependency_ids=list({dep_id for dep_ids in deps_by_task_id.values() for dep_id in dep_ids}),
     )
-    if blocked_by and (task.assigned_agent_id is not None or task.status != "inbox"):
-        raise _blocked_task_error(blocked_by)
-    session.add(task)
-    # Ensure the task exists in the DB before inserting dependency rows.
+    for task in tasks:
+        blocked_by = blocked_by_dependency_ids(
+            dependency_ids=deps_by_task_id[task.id],
+            status_by_id=dep_status,
+        )
+        if blocked_by and (task.assigned_agent_id is not None or task.status != "inbox"):
+            raise _blocked_task_error(blocked_by)
+        set_blocked_by(task, blocked_by)
+    if lead is not None:
+        await _validate_lead_assignees(session, board=board, tasks=tasks)
+
+    session.add_all(tasks)
+    # Ensure the tasks exist in the DB before inserting dependent rows.
     await session.flush()
-    await _set_task_custom_field_values_for_create(
+    definitions_by_key = await _organization_custom_field_definitions_for_board(
         session,
         board_id=board.id,
-        task_id=task.id,
-        custom_field_values=custom_field_values,
     )
-    for dep_id in normalized_deps:
-        session.add(
-            TaskDependency(
-                board_id=board.id,
-                task_id=task.id,
-                depends_on_task_id=dep_id,
+    for task, payload in zip(tasks, payloads, strict=True):
+        await _set_task_custom_field_values_for_create(
+            session,
+            board_id=board.id,
+            task_id=task.id,
+            custom_field_values=dict(payload.custom_field_values),
+            definitions_by_key=definitions_by_key,
+        )
+        for dep_id in deps_by_task_id[task.id]:
+            session.add(
+                TaskDependency(
+                    board_id=board.id,
+                    task_id=task.id,
+                    depends_on_task_id=dep_id,
+                ),
+            )
+        for tag_id in dict.fromkeys(payload.tag_ids):
+            session.add(TagAssignment(task_id=task.id, tag_id=tag_id))
+        record_activity(
+            session,
+            event_type="task.created",
+            task_id=task.id,
+            message=(
+                f"Task created by lead: {task.title}."
+                if lead is not None
+                else f"Task created: {task.title}."
             ),
+            agent_id=lead.id if lead is not None else None,
         )
-    await replace_tags(
+    return tasks
+
+
+async def task_create_notifications(
+    session: AsyncSession,
+    *,
+    board: Board,
+    tasks: Sequence[Task],
+    notify_lead: bool,
+) -> list[_TaskNotification]:
+    """Build the new-task notice for the board lead and assignment notices for assignees."""
+    notifications: list[_TaskNotification] = []
+    lead = await _board_lead(session, board.id) if notify_lead else None
+    if lead is not None:
+        notifications.extend(
+            _lead_created_notification(board=board, task=task, lead=lead) for task in tasks
+        )
+    assignees = await Agent.objects.load_many(
         session,
-        task_id=task.id,
-        tag_ids=normalized_tag_ids,
+        {task.assigned_agent_id for task in tasks if task.assigned_agent_id is not None},
     )
-    await session.commit()
-    await session.refresh(task)
+    for task in tasks:
+        agent = assignees.get(task.assigned_agent_id) if task.assigned_agent_id else None
+        if agent is not None:
+            notifications.append(_assignment_notification(board=board, task=task, agent=agent))
+    return notifications
 
-    record_activity(
+
+async def send_task_notifications(
+    session: AsyncSession,
+    *,
+    board: Board,
+    notifications: Sequence[_TaskNotification],
+) -> None:
+    """Send task notifications grouped into one gateway message per agent."""
+    await _send_task_notifications(session, board=board, notifications=notifications)
+
+
+@router.post("", response_model=TaskRead, responses={409: {"model": BlockedTaskError}})
+async def create_task(
+    payload: TaskCreate,
+    board: Board = BOARD_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = ADMIN_AUTH_DEP,
+) -> TaskRead:
+    """Create a task and initialize dependency rows."""
+    (task,) = await stage_task_creates(
         session,
-        event_type="task.created",
-        task_id=task.id,
-        message=f"Task created: {task.title}.",
+        board=board,
+        payloads=[payload],
+        created_by_user_id=auth.user.id if auth.user is not None else None,
     )
     await session.commit()
-    await _notify_lead_on_task_create(session=session, board=board, task=task)
-    if task.assigned_agent_id:
-        assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
+    await session.refresh(task)
+    await _send_task_notifications(
+        session,
+        board=board,
+        notifications=await task_create_notifications(
             session,
-        )
-        if assigned_agent:
-            await _notify_agent_on_task_assign(
-                session=session,
-                board=board,
-                task=task,
-                agent=assigned_agent,
-            )
+            board=board,
+            tasks=[task],
+            notify_lead=True,
+        ),
+    )
     return await _task_read_response(
         session,
         task=task,
@@ -1521,6 +1599,100 @@ async def create_task(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkRead,
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    board: Board = BOARD_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = ADMIN_AUTH_DEP,
+) -> TaskBulkRead:
+    """Create up to 100 tasks in one transaction.
+
+    Every item is validated before anything is written; one invalid item rejects the
+    batch. The board lead and each assignee get a single combined notification.
+    """
+    tasks = await stage_task_creates(
+        session,
+        board=board,
+        payloads=payload.items,
+        created_by_user_id=auth.user.id if auth.user is not None else None,
+    )
+    await session.commit()
+    await _send_task_notifications(
+        session,
+        board=board,
+        notifications=await task_create_notifications(
+            session,
+            board=board,
+            tasks=tasks,
+            notify_lead=True,
+        ),
+    )
+    return TaskBulkRead(
+        items=await _task_read_page(session=session, board_id=board.id, tasks=tasks)
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkRead,
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    board: Board = BOARD_ACTOR_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    actor: ActorContext = ACTOR_DEP,
+) -> TaskBulkRead:
+    """Apply up to 100 task updates in one transaction, in request order.
+
+    Each item follows the same rules as a single task update for the calling actor; one
+    rejected item rejects the batch. Notifications are grouped into one message per agent.
+    """
+    task_ids = [item.id for item in payload.items]
+    if len(set(task_ids)) != len(task_ids):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Each task may appear only once per bulk update.",
+        )
+    tasks_by_id = {
+        task.id: task
+        for task in await Task.objects.filter_by(board_id=board.id)
+        .filter(col(Task.id).in_(task_ids))
+        .all(session)
+    }
+    missing = [task_id for task_id in task_ids if task_id not in tasks_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "One or more tasks were not found on this board.",
+                "missing_task_ids": [str(task_id) for task_id in missing],
+            },
+        )
+    updates = [
+        _task_update_input(item, task=tasks_by_id[item.id], actor=actor, board_id=board.id)
+        for item in payload.items
+    ]
+    for update in updates:
+        await _stage_task_update(session, update=update)
+    await session.commit()
+    notifications: list[_TaskNotification] = []
+    for update in updates:
+        notifications.extend(
+            await _task_update_notifications(session, update=update, board=board),
+        )
+    await _send_task_notifications(session, board=board, notifications=notifications)
+    tasks = [update.task for update in updates]
+    return TaskBulkRead(
+        items=await _task_read_page(session=session, board_id=board.id, tasks=tasks)
+    )
+
+
 @router.patch(
     "/{task_id}",
     response_model=TaskRead,
@@ -1545,48 +1717,21 @@ async def update_task(
             board_id=board_id,
             user=actor.user,
         )
-    previous_status = task.status
-    previous_assigned = task.assigned_agent_id
-    updates = payload.model_dump(exclude_unset=True)
-    comment = payload.comment if "comment" in payload.model_fields_set else None
-    depends_on_task_ids = (
-        payload.depends_on_task_ids if "depends_on_task_ids" in payload.model_fields_set else None
-    )
-    tag_ids = payload.tag_ids if "tag_ids" in payload.model_fields_set else None
-    custom_field_values = (
-        payload.custom_field_values if "custom_field_values" in payload.model_fields_set else None
-    )
-    custom_field_values_set = "custom_field_values" in payload.model_fields_set
-    updates.pop("comment", None)
-    updates.pop("depends_on_task_ids", None)
-    updates.pop("tag_ids", None)
-    updates.pop("custom_field_values", None)
-    requested_status = payload.status if "status" in payload.model_fields_set else None
-    update = _TaskUpdateInput(
+    update = _task_update_input(payload, task=task, actor=actor, board_id=board_id)
+    await _stage_task_update(session, update=update)
+    await session.commit()
+    await session.refresh(task)
+    board = await Board.objects.by_id(board_id).first(session)
+    if board is not None:
+        await _send_task_notifications(
+            session,
+            board=board,
+            notifications=await _task_update_notifications(session, update=update, board=board),
+        )
+    return await _task_read_response(
+        session,
         task=task,
-        actor=actor,
         board_id=board_id,
-        previous_status=previous_status,
-        previous_assigned=previous_assigned,
-        previous_in_progress_at=task.in_progress_at,
-        status_requested=(requested_status is not None and requested_status != previous_status),
-        updates=updates,
-        comment=comment,
-        depends_on_task_ids=depends_on_task_ids,
-        tag_ids=tag_ids,
-        custom_field_values=custom_field_values or {},
-        custom_field_values_set=custom_field_values_set,
-    )
-    if actor.actor_type == "agent" and actor.agent and actor.agent.is_board_lead:
-        return await _apply_lead_task_update(session, update=update)
-
-    if actor.actor_type == "agent":
-        await _apply_non_lead_agent_task_rules(session, update=update)
-    else:
-        await _apply_admin_task_rules(session, update=update)
-    return await _finalize_updated_task(
-        session,
-        update=update,
     )
 
 
@@ -1608,6 +1753,12 @@ async def delete_task_and_related_records(
         col(TaskFingerprint.task_id) == task.id,
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.task_id) == task.id,
+        commit=False,
+    )
 
     primary_approvals = list(
         await Approval.objects.filter(col(Approval.task_id) == task.id).all(session),
@@ -1628,6 +1779,24 @@ async def delete_task_and_related_records(
                 session.add(approval)
                 continue
             await session.delete(approval)
+    if task.board_id is not None and task.status != "done":
+        # The task stops blocking its dependents once its edges are gone.
+        blocked_dependents = await session.exec(
+            select(Task)
+            .where(col(Task.board_id) == task.board_id)
+            .where(
+                col(Task.id).in_(
+                    select(col(TaskDependency.task_id)).where(
+                        col(TaskDependency.depends_on_task_id) == task.id,
+                    ),
+                ),
+            ),
+        )
+        for dependent in blocked_dependents:
+            set_blocked_by(
+                dependent,
+                [UUID(value) for value in dependent.blocked_by_task_ids if value != str(task.id)],
+            )
     await crud.delete_where(
         session,
         TaskDependency,
@@ -1744,13 +1913,11 @@ async def _comment_targets(
     mention_names = extract_mentions(message)
     targets: dict[UUID, Agent] = {}
     if mention_names and task.board_id:
-        for agent in await Agent.objects.filter_by(board_id=task.board_id).all(session):
+        for agent in await Agent.objects.load_related(session, board_id=task.board_id):
             if matches_agent_mention(agent, mention_names):
                 targets[agent.id] = agent
     if not mention_names and task.assigned_agent_id:
-        assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
-            session,
-        )
+        assigned_agent = await Agent.objects.load(session, task.assigned_agent_id)
         if assigned_agent:
             targets[assigned_agent.id] = assigned_agent
 
@@ -1837,6 +2004,40 @@ class _TaskUpdateInput:
     normalized_tag_ids: list[UUID] | None = None
 
 
+def _task_update_input(
+    payload: TaskUpdate,
+    *,
+    task: Task,
+    actor: ActorContext,
+    board_id: UUID,
+) -> _TaskUpdateInput:
+    fields_set = payload.model_fields_set
+    requested_status = payload.status if "status" in fields_set else None
+    return _TaskUpdateInput(
+        task=task,
+        actor=actor,
+        board_id=board_id,
+        previous_status=task.status,
+        previous_assigned=task.assigned_agent_id,
+        previous_in_progress_at=task.in_progress_at,
+        status_requested=(requested_status is not None and requested_status != task.status),
+        updates=payload.model_dump(
+            exclude_unset=True,
+            # `id` only appears on bulk items and names the task, not a change to it.
+            exclude={"id", "comment", "depends_on_task_ids", "tag_ids", "custom_field_values"},
+        ),
+        comment=payload.comment if "comment" in fields_set else None,
+        depends_on_task_ids=(
+            payload.depends_on_task_ids if "depends_on_task_ids" in fields_set else None
+        ),
+        tag_ids=payload.tag_ids if "tag_ids" in fields_set else None,
+        custom_field_values=(
+            (payload.custom_field_values or {}) if "custom_field_values" in fields_set else {}
+        ),
+        custom_field_values_set="custom_field_values" in fields_set,
+    )
+
+
 def _required_status_value(value: object) -> str:
     if isinstance(value, str):
         return value
@@ -1908,18 +2109,12 @@ async def _task_read_response(
         task.id,
         TagState(),
     )
-    blocked_ids = await _task_blocked_ids(
-        session,
-        board_id=board_id,
-        dep_ids=dep_ids,
-    )
+    blocked_ids = stored_blocked_by_ids(task)
     custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
         session,
         board_id=board_id,
         task_ids=[task.id],
     )
-    if task.status == "done":
-        blocked_ids = []
     return TaskRead.model_validate(task, from_attributes=True).model_copy(
         update={
             "depends_on_task_ids": dep_ids,
@@ -2023,6 +2218,7 @@ async def _lead_effective_dependencies(
         board_id=update.board_id,
         dep_ids=effective_deps,
     )
+    set_blocked_by(update.task, blocked_by)
     return effective_deps, blocked_by
 
 
@@ -2055,7 +2251,7 @@ async def _lead_apply_assignment(
     if not assigned_id:
         update.task.assigned_agent_id = None
         return
-    agent = await Agent.objects.by_id(assigned_id).first(session)
+    agent = await Agent.objects.load(session, assigned_id)
     if agent is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     if agent.is_board_lead:
@@ -2076,18 +2272,20 @@ async def _last_worker_who_moved_task_to_review(
     lead_agent_id: UUID,
 ) -> UUID | None:
     statement = (
-        select(col(ActivityEvent.agent_id))
-        .where(col(ActivityEvent.task_id) == task_id)
-        .where(col(ActivityEvent.event_type) == "task.status_changed")
-        .where(col(ActivityEvent.message).like("Task moved to review:%"))
-        .where(col(ActivityEvent.agent_id).is_not(None))
-        .order_by(desc(col(ActivityEvent.created_at)))
-    )
-    candidate_ids = list(await session.exec(statement))
+        select(col(TaskStatusTransition.agent_id))
+        .where(col(TaskStatusTransition.task_id) == task_id)
+        .where(col(TaskStatusTransition.to_status) == "review")
+        .where(col(TaskStatusTransition.agent_id).is_not(None))
+        .order_by(desc(col(TaskStatusTransition.at)))
+    )
+    candidate_ids = [
+        candidate_id
+        for candidate_id in await session.exec(statement)
+        if candidate_id is not None and candidate_id != lead_agent_id
+    ]
+    candidates = await Agent.objects.load_many(session, candidate_ids)
     for candidate_id in candidate_ids:
-        if candidate_id is None or candidate_id == lead_agent_id:
-            continue
-        candidate = await Agent.objects.by_id(candidate_id).first(session)
+        candidate = candidates.get(candidate_id)
         if candidate is None:
             continue
         if candidate.board_id != board_id or candidate.is_board_lead:
@@ -2140,55 +2338,46 @@ def _task_event_details(task: Task, previous_status: str) -> tuple[str, str]:
     return "task.updated", f"Task updated: {task.title}."
 
 
-async def _lead_notify_new_assignee(
+async def _lead_assignee_notifications(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> None:
+    board: Board,
+) -> list[_TaskNotification]:
     if (
         not update.task.assigned_agent_id
         or update.task.assigned_agent_id == update.previous_assigned
     ):
-        return
-    assigned_agent = await Agent.objects.by_id(update.task.assigned_agent_id).first(
-        session,
-    )
+        return []
+    assigned_agent = await Agent.objects.load(session, update.task.assigned_agent_id)
     if assigned_agent is None:
-        return
-    board = (
-        await Board.objects.by_id(update.task.board_id).first(session)
-        if update.task.board_id
-        else None
-    )
-    if board:
-        if (
-            update.previous_status == "review"
-            and update.task.status == "inbox"
-            and update.actor.actor_type == "agent"
-            and update.actor.agent
-            and update.actor.agent.is_board_lead
-        ):
-            await _notify_agent_on_task_rework(
-                session=session,
+        return []
+    if (
+        update.previous_status == "review"
+        and update.task.status == "inbox"
+        and update.actor.actor_type == "agent"
+        and update.actor.agent
+        and update.actor.agent.is_board_lead
+    ):
+        if not assigned_agent.openclaw_session_id:
+            return []
+        return [
+            await _rework_notification(
+                session,
                 board=board,
                 task=update.task,
                 agent=assigned_agent,
                 lead=update.actor.agent,
-            )
-            return
-        await _notify_agent_on_task_assign(
-            session=session,
-            board=board,
-            task=update.task,
-            agent=assigned_agent,
-        )
+            ),
+        ]
+    return [_assignment_notification(board=board, task=update.task, agent=assigned_agent)]
 
 
-async def _apply_lead_task_update(
+async def _stage_lead_task_update(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> TaskRead:
+) -> None:
     if update.actor.actor_type != "agent" or update.actor.agent is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     _validate_lead_update_request(update)
@@ -2259,6 +2448,12 @@ async def _apply_lead_task_update(
         message=message,
         agent_id=update.actor.agent.id,
     )
+    record_status_transition(
+        session,
+        task=update.task,
+        from_status=update.previous_status,
+        agent_id=update.actor.agent.id,
+    )
     await _reconcile_dependents_for_dependency_toggle(
         session,
         board_id=update.board_id,
@@ -2266,14 +2461,6 @@ async def _apply_lead_task_update(
         previous_status=update.previous_status,
         actor_agent_id=update.actor.agent.id,
     )
-    await session.commit()
-    await session.refresh(update.task)
-    await _lead_notify_new_assignee(session, update=update)
-    return await _task_read_response(
-        session,
-        task=update.task,
-        board_id=update.board_id,
-    )
 
 
 async def _apply_non_lead_agent_task_rules(
@@ -2396,6 +2583,7 @@ async def _apply_admin_task_rules(
         board_id=update.board_id,
         dep_ids=effective_deps,
     )
+    set_blocked_by(update.task, blocked_ids)
     target_status = _required_status_value(
         update.updates.get("status", update.task.status),
     )
@@ -2425,7 +2613,7 @@ async def _apply_admin_task_rules(
         update.updates.get("assigned_agent_id"),
     )
     if assigned_agent_id:
-        agent = await Agent.objects.by_id(assigned_agent_id).first(session)
+        agent = await Agent.objects.load(session, assigned_agent_id)
         if agent is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
         if agent.board_id and update.task.board_id and agent.board_id != update.task.board_id:
@@ -2450,7 +2638,6 @@ async def _record_task_comment_from_update(
         ),
     )
     session.add(event)
-    await session.commit()
 
 
 async def _record_task_update_activity(
@@ -2471,6 +2658,13 @@ async def _record_task_update_activity(
         message=message,
         agent_id=actor_agent_id,
     )
+    record_status_transition(
+        session,
+        task=update.task,
+        from_status=update.previous_status,
+        agent_id=actor_agent_id,
+        in_progress_since=update.task.previous_in_progress_at or update.previous_in_progress_at,
+    )
     await _reconcile_dependents_for_dependency_toggle(
         session,
         board_id=update.board_id,
@@ -2478,7 +2672,6 @@ async def _record_task_update_activity(
         previous_status=update.previous_status,
         actor_agent_id=actor_agent_id,
     )
-    await session.commit()
 
 
 async def _assign_review_task_to_lead(
@@ -2488,53 +2681,38 @@ async def _assign_review_task_to_lead(
 ) -> None:
     if update.task.status != "review" or update.previous_status == "review":
         return
-    lead = (
-        await Agent.objects.filter_by(board_id=update.board_id)
-        .filter(col(Agent.is_board_lead).is_(True))
-        .first(session)
-    )
+    lead = await _board_lead(session, update.board_id)
     if lead is None:
         return
     update.task.assigned_agent_id = lead.id
 
 
-async def _notify_task_update_assignment_changes(
+async def _assignment_change_notifications(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> None:
+    board: Board,
+) -> list[_TaskNotification]:
+    notifications: list[_TaskNotification] = []
     if (
         update.task.status == "inbox"
         and update.task.assigned_agent_id is None
         and (update.previous_status != "inbox" or update.previous_assigned is not None)
     ):
-        board = (
-            await Board.objects.by_id(update.task.board_id).first(session)
-            if update.task.board_id
-            else None
-        )
-        if board:
-            await _notify_lead_on_task_unassigned(
-                session=session,
-                board=board,
-                task=update.task,
+        lead = await _board_lead(session, board.id)
+        if lead is not None:
+            notifications.append(
+                _lead_unassigned_notification(board=board, task=update.task, lead=lead),
             )
 
     if (
         not update.task.assigned_agent_id
         or update.task.assigned_agent_id == update.previous_assigned
     ):
-        return
-    assigned_agent = await Agent.objects.by_id(update.task.assigned_agent_id).first(
-        session,
-    )
+        return notifications
+    assigned_agent = await Agent.objects.load(session, update.task.assigned_agent_id)
     if assigned_agent is None:
-        return
-    board = (
-        await Board.objects.by_id(update.task.board_id).first(session)
-        if update.task.board_id
-        else None
-    )
+        return notifications
     if (
         update.previous_status == "review"
         and update.task.status == "inbox"
@@ -2542,35 +2720,34 @@ async def _notify_task_update_assignment_changes(
         and update.actor.agent
         and update.actor.agent.is_board_lead
     ):
-        if board:
-            await _notify_agent_on_task_rework(
-                session=session,
-                board=board,
-                task=update.task,
-                agent=assigned_agent,
-                lead=update.actor.agent,
+        if assigned_agent.openclaw_session_id:
+            notifications.append(
+                await _rework_notification(
+                    session,
+                    board=board,
+                    task=update.task,
+                    agent=assigned_agent,
+                    lead=update.actor.agent,
+                ),
             )
-        return
+        return notifications
     if (
         update.actor.actor_type == "agent"
         and update.actor.agent
         and update.task.assigned_agent_id == update.actor.agent.id
     ):
-        return
-    if board:
-        await _notify_agent_on_task_assign(
-            session=session,
-            board=board,
-            task=update.task,
-            agent=assigned_agent,
-        )
+        return notifications
+    notifications.append(
+        _assignment_notification(board=board, task=update.task, agent=assigned_agent),
+    )
+    return notifications
 
 
-async def _finalize_updated_task(
+async def _stage_updated_task(
     session: AsyncSession,
     *,
     update: _TaskUpdateInput,
-) -> TaskRead:
+) -> None:
     for key, value in update.updates.items():
         setattr(update.task, key, value)
     await _require_no_pending_approval_for_status_change_when_enabled(
@@ -2643,19 +2820,45 @@ async def _finalize_updated_task(
         )
 
     session.add(update.task)
-    await session.commit()
-    await session.refresh(update.task)
     await _record_task_comment_from_update(session, update=update)
     await _record_task_update_activity(session, update=update)
-    await _notify_task_update_assignment_changes(session, update=update)
 
-    return await _task_read_response(
-        session,
-        task=update.task,
-        board_id=update.board_id,
+
+def _is_lead_update(update: _TaskUpdateInput) -> bool:
+    return bool(
+        update.actor.actor_type == "agent"
+        and update.actor.agent
+        and update.actor.agent.is_board_lead,
     )
 
 
+async def _stage_task_update(
+    session: AsyncSession,
+    *,
+    update: _TaskUpdateInput,
+) -> None:
+    """Validate and apply one task update, with its activity rows, without committing."""
+    if _is_lead_update(update):
+        await _stage_lead_task_update(session, update=update)
+        return
+    if update.actor.actor_type == "agent":
+        await _apply_non_lead_agent_task_rules(session, update=update)
+    else:
+        await _apply_admin_task_rules(session, update=update)
+    await _stage_updated_task(session, update=update)
+
+
+async def _task_update_notifications(
+    session: AsyncSession,
+    *,
+    update: _TaskUpdateInput,
+    board: Board,
+) -> list[_TaskNotification]:
+    if _is_lead_update(update):
+        return await _lead_assignee_notifications(session, update=update, board=board)
+    return await _assignment_change_notifications(session, update=update, board=board)
+
+
 @router.post("/{task_id}/comments", response_model=TaskCommentRead)
 async def create_task_comment(
     payload: TaskCommentCreate,
@@ -18,7 +18,9 @@ from app.models.approvals import Approval
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
 from app.models.board_memory import BoardMemory
+from app.models.board_metrics import BoardHourlyMetrics
 from app.models.board_onboarding import BoardOnboardingSession
+from app.models.board_versions import BoardVersion
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.models.organization_board_access import OrganizationBoardAccess
@@ -28,6 +30,7 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
@@ -84,6 +87,24 @@ async def _delete_organization_tree(
         col(TaskFingerprint.board_id).in_(board_ids),
         commit=False,
     )
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        BoardHourlyMetrics,
+        col(BoardHourlyMetrics.board_id).in_(board_ids),
+        commit=False,
+    )
+    await crud.delete_where(
+        session,
+        BoardVersion,
+        col(BoardVersion.board_id).in_(board_ids),
+        commit=False,
+    )
     await crud.delete_where(
         session,
         ApprovalTaskLink,
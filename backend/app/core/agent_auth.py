@@ -7,7 +7,7 @@ Key ideas:
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
-  interval and we avoid touching it for safe/read-only HTTP methods.
+  interval, and touches that change nothing else are batched by the presence store.
 
 This is intentionally separate from user authentication (Clerk/local bearer token)
 so we can evolve agent policy independently.
@@ -15,16 +15,32 @@ so we can evolve agent policy independently.
 
 from __future__ import annotations
 
+import asyncio
+import math
+import time
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Literal
+from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException, Request, status
+from sqlalchemy import func
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col, select
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_tokens import (
+    agent_token_fingerprint,
+    is_legacy_agent_token,
+    verified_agent_tokens,
+    verify_agent_token,
+)
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
+from app.core.ttl_cache import TTLCache
+from app.db import crud
+from app.db.agent_presence import agent_presence
+from app.db.replicas import note_request_actor
 from app.db.session import get_session
 from app.models.agents import Agent
 
@@ -35,7 +51,10 @@ logger = get_logger(__name__)
 
 _LAST_SEEN_TOUCH_INTERVAL = timedelta(seconds=30)
 _SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Statuses a touch leaves unchanged ("online" stays, the others are never overwritten).
+_PRESENCE_ONLY_STATUSES = frozenset({"online", "updating", "deleting"})
 SESSION_DEP = Depends(get_session)
+_LEGACY_SCAN_WINDOW_SECONDS = 60.0
 
 
 @dataclass
@@ -47,15 +66,166 @@ class AgentAuthContext:
 
 
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
-    agents = list(
+    fingerprint = agent_token_fingerprint(token)
+    agent = (
         await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
+            select(Agent).where(col(Agent.agent_token_fingerprint) == fingerprint),
+        )
+    ).first()
+    if agent is not None:
+        return agent if await _verify_candidate(agent, token, fingerprint) else None
+    if not is_legacy_agent_token(token):
+        return None
+    return await _migrate_legacy_token(session, token, fingerprint)
+
+
+async def _verify_candidate(agent: Agent, token: str, fingerprint: str) -> bool:
+    """Check `token` against the agent's stored hash, skipping PBKDF2 when cached."""
+    stored_hash = agent.agent_token_hash
+    if not stored_hash:
+        return False
+    if verified_agent_tokens.get(fingerprint) == (agent.id, stored_hash):
+        return True
+    # PBKDF2 takes tens of milliseconds; keep it off the event loop.
+    if not await asyncio.to_thread(verify_agent_token, token, stored_hash):
+        return False
+    verified_agent_tokens.set(fingerprint, (agent.id, stored_hash))
+    return True
+
+
+class _LegacyScanBudget:
+    """Per-process allowance of unmatched legacy-token scans in a fixed one-minute window."""
+
+    def __init__(self, per_minute: int) -> None:
+        self._per_minute = per_minute
+        self._window_started = -_LEGACY_SCAN_WINDOW_SECONDS
+        self._used = 0
+
+    def _roll(self) -> float:
+        now = time.monotonic()
+        if now - self._window_started >= _LEGACY_SCAN_WINDOW_SECONDS:
+            self._window_started = now
+            self._used = 0
+        return now
+
+    def retry_after(self) -> int | None:
+        """Return seconds until the window resets when exhausted, else `None`."""
+        now = self._roll()
+        if self._used < self._per_minute:
+            return None
+        return max(math.ceil(self._window_started + _LEGACY_SCAN_WINDOW_SECONDS - now), 1)
+
+    def charge(self) -> None:
+        """Count one scan that matched no agent."""
+        self._roll()
+        self._used += 1
+
+
+_legacy_scan_budget = _LegacyScanBudget(settings.agent_legacy_token_scans_per_minute)
+# One scan at a time per process, so PBKDF2 work never exceeds one page of threads.
+_legacy_scan_lock = asyncio.Lock()
+# Fingerprints of legacy-style tokens that a complete scan matched to no agent; retries
+# skip the scan.
+_rejected_legacy_tokens: TTLCache[str, bool] = TTLCache(
+    ttl_seconds=settings.agent_token_cache_ttl_seconds,
+    max_entries=settings.agent_token_cache_max_entries,
+)
+
+
+async def _migrate_legacy_token(
+    session: AsyncSession,
+    token: str,
+    fingerprint: str,
+) -> Agent | None:
+    """Match a pre-fingerprint token by scanning and store its fingerprint on success.
+
+    Every agent that has not authenticated since fingerprints were introduced is checked,
+    `agent_legacy_token_scan_limit` per page with a page verified concurrently, so a valid
+    token always migrates on its next use. Only scans that match nothing count against
+    `agent_legacy_token_scans_per_minute`; once that is used up, legacy tokens get 429 with
+    `Retry-After` rather than 401, since they could not be checked. Agents that never check
+    in are expired by `expire_legacy_agent_tokens`, so the scan shrinks to nothing.
+    """
+    if _rejected_legacy_tokens.get(fingerprint):
+        return None
+    retry_after = _legacy_scan_budget.retry_after()
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many legacy agent token checks; retry later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    async with _legacy_scan_lock:
+        after: UUID | None = None
+        while True:
+            statement = (
+                select(Agent)
+                .where(col(Agent.agent_token_hash).is_not(None))
+                .where(col(Agent.agent_token_fingerprint).is_(None))
+            )
+            if after is not None:
+                statement = statement.where(col(Agent.id) > after)
+            page = list(
+                await session.exec(
+                    statement.order_by(col(Agent.id)).limit(settings.agent_legacy_token_scan_limit),
+                ),
+            )
+            matches = await asyncio.gather(
+                *(_verify_candidate(agent, token, fingerprint) for agent in page),
+            )
+            for agent, matched in zip(page, matches, strict=True):
+                if matched:
+                    agent.agent_token_fingerprint = fingerprint
+                    session.add(agent)
+                    await session.commit()
+                    logger.info("agent auth token fingerprint migrated agent_id=%s", agent.id)
+                    return agent
+            if len(page) < settings.agent_legacy_token_scan_limit:
+                break
+            after = page[-1].id
+    # The scan covered every unmigrated agent, so the token cannot match until re-keyed.
+    _legacy_scan_budget.charge()
+    _rejected_legacy_tokens.set(fingerprint, True)
+    return None
+
+
+async def expire_legacy_agent_tokens(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    after_days: int,
+) -> list[UUID]:
+    """Clear legacy tokens of agents that have not authenticated for `after_days` days.
+
+    These agents still hold an unprefixed token with no fingerprint, so they can only be
+    found by the legacy scan. Once expired they must be re-keyed (for example by a gateway
+    template sync with `rotate_tokens`), after which every agent has a fingerprint and the
+    legacy scan has nothing left to check. Returns the ids of the expired agents.
+    """
+    if after_days <= 0:
+        return []
+    cutoff = now - timedelta(days=after_days)
+    agent_ids = list(
+        await session.exec(
+            select(col(Agent.id))
+            .where(col(Agent.agent_token_hash).is_not(None))
+            .where(col(Agent.agent_token_fingerprint).is_(None))
+            .where(func.coalesce(col(Agent.last_seen_at), col(Agent.created_at)) < cutoff),
         ),
     )
-    for agent in agents:
-        if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
-            return agent
-    return None
+    if not agent_ids:
+        return []
+    await crud.update_where(
+        session,
+        Agent,
+        col(Agent.id).in_(agent_ids),
+        col(Agent.agent_token_fingerprint).is_(None),
+        updates={"agent_token_hash": None},
+        commit=True,
+    )
+    for agent_id in agent_ids:
+        logger.warning("agent auth legacy token expired agent_id=%s", agent_id)
+    return agent_ids
 
 
 def _resolve_agent_token(
@@ -93,6 +263,12 @@ async def _touch_agent_presence(
     if agent.last_seen_at is not None and now - agent.last_seen_at < _LAST_SEEN_TOUCH_INTERVAL:
         return
 
+    if agent_presence.enabled and agent.status in _PRESENCE_ONLY_STATUSES:
+        # Nothing but the timestamp changes; let the presence store batch the write.
+        agent_presence.record(agent.id, now)
+        set_committed_value(agent, "last_seen_at", now)
+        return
+
     agent.last_seen_at = now
     agent.updated_at = now
     if agent.status not in {"updating", "deleting"}:
@@ -134,6 +310,7 @@ async def get_agent_auth_context(
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
     await _touch_agent_presence(request, session, agent)
+    note_request_actor(request, "agent", agent.id)
     return AgentAuthContext(actor_type="agent", agent=agent)
 
 
@@ -175,4 +352,5 @@ async def get_agent_auth_context_optional(
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
     await _touch_agent_presence(request, session, agent)
+    note_request_actor(request, "agent", agent.id)
     return AgentAuthContext(actor_type="agent", agent=agent)
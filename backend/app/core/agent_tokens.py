@@ -1,4 +1,20 @@
-"""Token generation and verification helpers for agent authentication."""
+"""Token generation and verification helpers for agent authentication.
+
+Tokens are stored as salted PBKDF2 hashes, which cannot be looked up by value. Each agent
+therefore also stores an HMAC fingerprint of its token in an indexed column, so
+authentication finds the single candidate agent by fingerprint and runs PBKDF2 once.
+Tokens carry 256 random bits, so the fingerprint reveals nothing a brute force could use.
+
+Tokens minted before fingerprints existed have no prefix; they are matched by a capped,
+rate-limited scan of agents without a fingerprint and gain one on first successful use.
+Agents that never check in have their legacy token expired and must be re-keyed (see
+`app.core.agent_auth.expire_legacy_agent_tokens`).
+
+Successful verifications are remembered per process in `verified_agent_tokens`, keyed by
+fingerprint, so repeat requests skip PBKDF2. An entry only vouches for the exact stored
+hash it was verified against: callers still load the agent row, so rotated tokens and
+deleted agents stop matching even before their entries are discarded.
+"""
 
 from __future__ import annotations
 
@@ -6,14 +22,36 @@ import base64
 import hashlib
 import hmac
 import secrets
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
 
 ITERATIONS = 200_000
 SALT_BYTES = 16
+TOKEN_PREFIX = "mca_"
+_FINGERPRINT_KEY = b"mission-control:agent-token-fingerprint:v1"
+
+# Fingerprint -> (agent id, stored hash) of tokens that passed PBKDF2 verification.
+verified_agent_tokens: TTLCache[str, tuple[UUID, str]] = TTLCache(
+    ttl_seconds=settings.agent_token_cache_ttl_seconds,
+    max_entries=settings.agent_token_cache_max_entries,
+)
 
 
 def generate_agent_token() -> str:
     """Generate a new URL-safe random token for an agent."""
-    return secrets.token_urlsafe(32)
+    return f"{TOKEN_PREFIX}{secrets.token_urlsafe(32)}"
+
+
+def is_legacy_agent_token(token: str) -> bool:
+    """Whether `token` predates fingerprinted tokens (and may lack a stored fingerprint)."""
+    return not token.startswith(TOKEN_PREFIX)
+
+
+def agent_token_fingerprint(token: str) -> str:
+    """Return the indexed lookup fingerprint for a plaintext token."""
+    return hmac.new(_FINGERPRINT_KEY, token.encode("utf-8"), hashlib.sha256).hexdigest()
 
 
 def _b64encode(value: bytes) -> str:
@@ -53,3 +91,8 @@ def verify_agent_token(token: str, stored_hash: str) -> bool:
         iterations_int,
     )
     return hmac.compare_digest(candidate, expected_digest)
+
+
+def forget_verified_agent_tokens(agent_id: UUID) -> None:
+    """Drop cached verifications for an agent whose token was rotated or that was deleted."""
+    verified_agent_tokens.discard_values(lambda entry: entry[0] == agent_id)
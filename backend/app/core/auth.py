@@ -17,25 +17,30 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from hmac import compare_digest
+from http.cookies import CookieError, SimpleCookie
 from typing import TYPE_CHECKING, Literal
 
 import httpx
 from clerk_backend_api import Clerk
 from clerk_backend_api.models.clerkerrors import ClerkErrors
 from clerk_backend_api.models.sdkerror import SDKError
-from clerk_backend_api.security.types import AuthenticateRequestOptions, AuthStatus, RequestState
+from clerk_backend_api.security.types import AuthErrorReason, AuthStatus, RequestState
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ValidationError
-from starlette.concurrency import run_in_threadpool
+from sqlmodel import col, select
 
 from app.core.auth_mode import AuthMode
+from app.core.clerk_jwt import ClerkTokenError, verify_session_token
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
 from app.db import crud
-from app.db.session import get_session
+from app.db.replicas import note_request_actor
+from app.db.session import async_session_maker, get_session
 from app.models.users import User
 
 if TYPE_CHECKING:
@@ -49,6 +54,13 @@ SESSION_DEP = Depends(get_session)
 LOCAL_AUTH_USER_ID = "local-auth-user"
 LOCAL_AUTH_EMAIL = "admin@home.local"
 LOCAL_AUTH_NAME = "Local User"
+# Clerk user ids whose profile was refreshed recently; throttles background refreshes.
+_profile_refresh_attempts: TTLCache[str, bool] = TTLCache(
+    ttl_seconds=settings.clerk_profile_refresh_interval_seconds,
+    max_entries=4096,
+)
+# Strong references so in-flight refresh tasks are not garbage collected.
+_profile_refresh_tasks: set[asyncio.Task[None]] = set()
 
 
 class ClerkTokenPayload(BaseModel):
@@ -214,25 +226,41 @@ def _normalize_clerk_server_url(raw: str) -> str | None:
     return server_url
 
 
-def _make_authenticate_request_options() -> AuthenticateRequestOptions:
-    # Follow the clerk-backend-api documented flow: authenticate_request() with a secret key.
-    return AuthenticateRequestOptions(
-        secret_key=settings.clerk_secret_key.strip(),
-        clock_skew_in_ms=int(settings.clerk_leeway * 1000),
-        accepts_token=["session_token"],
-    )
+def _extract_session_token(request: Request) -> str | None:
+    """Return the Clerk session token from the bearer header or the `__session` cookie."""
+    token = _extract_bearer_token(request.headers.get("Authorization"))
+    if token is not None:
+        return token
+    cookie_header = request.headers.get("cookie")
+    if not cookie_header:
+        return None
+    try:
+        cookies = SimpleCookie(cookie_header)
+    except CookieError:
+        return None
+    for name, morsel in cookies.items():
+        if name.startswith("__session") and morsel.value:
+            return morsel.value
+    return None
 
 
 async def _authenticate_clerk_request(request: Request) -> RequestState:
-    # The SDK docs use httpx.Request as the request object; build one from the ASGI request.
-    httpx_request = httpx.Request(
-        request.method,
-        str(request.url),
-        headers=dict(request.headers),
-    )
-    options = _make_authenticate_request_options()
-    sdk = Clerk(bearer_auth=options.secret_key or "")
-    return await run_in_threadpool(sdk.authenticate_request, httpx_request, options)
+    # Session tokens are verified locally against Clerk's cached JWKS (see
+    # `app.core.clerk_jwt`) instead of calling the SDK in a threadpool per request.
+    token = _extract_session_token(request)
+    if token is None:
+        return RequestState(
+            status=AuthStatus.SIGNED_OUT,
+            reason=AuthErrorReason.SESSION_TOKEN_MISSING,
+        )
+    if not settings.clerk_secret_key.strip() and not settings.clerk_jwt_key.strip():
+        return RequestState(status=AuthStatus.SIGNED_OUT, reason=AuthErrorReason.SECRET_KEY_MISSING)
+    try:
+        claims = await verify_session_token(token)
+    except ClerkTokenError as exc:
+        logger.debug("auth.clerk.token.rejected reason=%s", exc.reason.value[0])
+        return RequestState(status=AuthStatus.SIGNED_OUT, reason=exc.reason, token=token)
+    return RequestState(status=AuthStatus.SIGNED_IN, token=token, payload=claims)
 
 
 async def _fetch_clerk_profile(clerk_user_id: str) -> tuple[str | None, str | None]:
@@ -345,6 +373,53 @@ async def delete_clerk_user(clerk_user_id: str) -> None:
         ) from exc
 
 
+def _apply_profile(user: User, *, email: str | None, name: str | None) -> bool:
+    """Copy profile fields onto `user`; returns whether anything changed."""
+    changed = False
+    if email and user.email != email:
+        user.email = email
+        changed = True
+    if not user.name and name:
+        user.name = name
+        changed = True
+    return changed
+
+
+async def _refresh_clerk_profile(clerk_user_id: str) -> None:
+    clerk_user_id_log = clerk_user_id[-6:] if clerk_user_id else ""
+    email, name = await _fetch_clerk_profile(clerk_user_id)
+    if not email and not name:
+        return
+    async with async_session_maker() as session:
+        user = (
+            await session.exec(select(User).where(col(User.clerk_user_id) == clerk_user_id))
+        ).first()
+        if user is None or not _apply_profile(user, email=email, name=name):
+            return
+        session.add(user)
+        await session.commit()
+    logger.info("auth.user.profile_refreshed clerk_user_id=%s", clerk_user_id_log)
+
+
+def _log_profile_refresh_failure(task: asyncio.Task[None]) -> None:
+    _profile_refresh_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "auth.user.profile_refresh_failed error_type=%s",
+            task.exception().__class__.__name__,
+        )
+
+
+def _schedule_profile_refresh(clerk_user_id: str) -> None:
+    """Refresh a user's Clerk profile in the background, at most once per interval."""
+    if _profile_refresh_attempts.get(clerk_user_id):
+        return
+    _profile_refresh_attempts.set(clerk_user_id, True)
+    task = asyncio.create_task(_refresh_clerk_profile(clerk_user_id))
+    _profile_refresh_tasks.add(task)
+    task.add_done_callback(_log_profile_refresh_failure)
+
+
 async def _get_or_sync_user(
     session: AsyncSession,
     *,
@@ -367,22 +442,19 @@ async def _get_or_sync_user(
 
     profile_email: str | None = None
     profile_name: str | None = None
-    # Avoid a network roundtrip to Clerk on every request once core profile
-    # fields are present in our DB.
-    should_fetch_profile = created or not user.email or not user.name
-    if should_fetch_profile:
+    # First sign-in needs the profile inline: invite matching keys on the email address.
+    # Afterwards missing fields are filled by a throttled background refresh so requests
+    # never wait on the Clerk API.
+    if created:
         profile_email, profile_name = await _fetch_clerk_profile(clerk_user_id)
+    elif not user.email or not user.name:
+        _schedule_profile_refresh(clerk_user_id)
 
-    email = profile_email or claim_email
-    name = profile_name or claim_name
-
-    changed = False
-    if email and user.email != email:
-        user.email = email
-        changed = True
-    if not user.name and name:
-        user.name = name
-        changed = True
+    changed = _apply_profile(
+        user,
+        email=profile_email or claim_email,
+        name=profile_name or claim_name,
+    )
     if changed:
         session.add(user)
         await session.commit()
@@ -391,13 +463,13 @@ async def _get_or_sync_user(
             "auth.user.sync clerk_user_id=%s updated=%s fetched_profile=%s",
             clerk_user_id_log,
             changed,
-            should_fetch_profile,
+            created,
         )
     else:
         logger.debug(
             "auth.user.sync.noop clerk_user_id=%s fetched_profile=%s",
             clerk_user_id_log,
-            should_fetch_profile,
+            created,
         )
     if not user.email:
         logger.warning(
@@ -453,6 +525,7 @@ async def _resolve_local_auth_context(
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
         return None
     user = await _get_or_create_local_user(session)
+    note_request_actor(request, "user", user.id)
     return AuthContext(actor_type="user", user=user)
 
 
@@ -496,6 +569,7 @@ async def get_auth_context(
     from app.services.organizations import ensure_member_for_user
 
     await ensure_member_for_user(session, user)
+    note_request_actor(request, "user", user.id)
 
     return AuthContext(
         actor_type="user",
@@ -538,6 +612,7 @@ async def get_auth_context_optional(
     from app.services.organizations import ensure_member_for_user
 
     await ensure_member_for_user(session, user)
+    note_request_actor(request, "user", user.id)
 
     return AuthContext(
         actor_type="user",
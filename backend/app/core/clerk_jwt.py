@@ -0,0 +1,177 @@
+"""Local verification of Clerk session JWTs.
+
+Clerk session tokens are short-lived RS256 JWTs signed with the instance's keys. Instead
+of handing every request to the Clerk SDK (a threadpool hop, plus a JWKS fetch whenever
+its own cache expires), the signing keys are fetched once from Clerk's JWKS endpoint,
+kept in memory and refreshed periodically, or immediately when a token names an unknown
+key id (key rotation). `CLERK_JWT_KEY` (the instance PEM public key) skips the network
+entirely.
+
+Verified claims are cached per token until the token expires, so repeated requests with
+the same session token skip signature verification as well.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+import jwt
+from clerk_backend_api.security.types import TokenVerificationErrorReason
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
+
+logger = get_logger(__name__)
+_ALGORITHMS = ["RS256"]
+# A token naming an unknown key id triggers a refetch at most this often.
+_UNKNOWN_KID_REFETCH_SECONDS = 30.0
+
+
+class ClerkTokenError(Exception):
+    """Raised when a session token cannot be verified."""
+
+    def __init__(self, reason: TokenVerificationErrorReason) -> None:
+        super().__init__(reason.value[0])
+        self.reason = reason
+
+
+JWKSFetcher = Callable[[], Awaitable[dict[str, Any]]]
+
+
+class ClerkJWKS:
+    """Signing keys by key id, refreshed every `refresh_seconds`."""
+
+    def __init__(self, *, fetch: JWKSFetcher, refresh_seconds: float) -> None:
+        self._fetch = fetch
+        self._refresh_seconds = refresh_seconds
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def clear(self) -> None:
+        """Forget every key so the next lookup refetches."""
+        self._keys = {}
+        self._fetched_at = None
+
+    def _age(self) -> float:
+        if self._fetched_at is None:
+            return float("inf")
+        return time.monotonic() - self._fetched_at
+
+    async def key_for(self, kid: str) -> jwt.PyJWK:
+        """Return the signing key named `kid`, refetching when stale or unknown."""
+        if self._age() >= self._refresh_seconds or (
+            kid not in self._keys and self._age() >= _UNKNOWN_KID_REFETCH_SECONDS
+        ):
+            await self._refresh(kid)
+        key = self._keys.get(kid)
+        if key is None:
+            raise ClerkTokenError(TokenVerificationErrorReason.JWK_KID_MISMATCH)
+        return key
+
+    async def _refresh(self, kid: str) -> None:
+        async with self._lock:
+            # Another request may have refreshed while this one waited for the lock.
+            if self._age() < _UNKNOWN_KID_REFETCH_SECONDS and (
+                kid in self._keys or self._age() < self._refresh_seconds
+            ):
+                return
+            try:
+                document = await self._fetch()
+            except (httpx.HTTPError, ValueError) as exc:
+                logger.warning("auth.clerk.jwks.fetch_failed error=%s", exc.__class__.__name__)
+                if not self._keys:
+                    raise ClerkTokenError(TokenVerificationErrorReason.JWK_FAILED_TO_LOAD) from exc
+                # Keep serving the previous keys and retry after the unknown-kid backoff.
+                self._fetched_at = (
+                    time.monotonic() - self._refresh_seconds + _UNKNOWN_KID_REFETCH_SECONDS
+                )
+                return
+            keys: dict[str, jwt.PyJWK] = {}
+            for entry in document.get("keys", []):
+                if not isinstance(entry, dict) or not entry.get("kid"):
+                    continue
+                try:
+                    keys[str(entry["kid"])] = jwt.PyJWK(entry, algorithm="RS256")
+                except jwt.PyJWKError:
+                    continue
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+            logger.info("auth.clerk.jwks.refreshed keys=%s", len(keys))
+
+
+async def _fetch_clerk_jwks() -> dict[str, Any]:
+    server_url = settings.clerk_api_url.strip().rstrip("/")
+    if not server_url.endswith("/v1"):
+        server_url = f"{server_url}/v1"
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        response = await client.get(
+            f"{server_url}/jwks",
+            headers={"Authorization": f"Bearer {settings.clerk_secret_key.strip()}"},
+        )
+        response.raise_for_status()
+        document = response.json()
+    if not isinstance(document, dict):
+        raise ValueError("JWKS response is not an object")
+    return document
+
+
+clerk_jwks = ClerkJWKS(
+    fetch=_fetch_clerk_jwks,
+    refresh_seconds=settings.clerk_jwks_refresh_seconds,
+)
+# sha256(token) -> verified claims; entries are also dropped once the token expires.
+verified_claims: TTLCache[str, dict[str, Any]] = TTLCache(
+    ttl_seconds=settings.clerk_claims_cache_ttl_seconds,
+    max_entries=settings.clerk_claims_cache_max_entries,
+)
+
+
+async def _signing_key(token: str, jwks: ClerkJWKS) -> jwt.PyJWK | str:
+    pem = settings.clerk_jwt_key.strip()
+    if pem:
+        return pem
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except jwt.InvalidTokenError as exc:
+        raise ClerkTokenError(TokenVerificationErrorReason.TOKEN_INVALID) from exc
+    if not isinstance(kid, str) or not kid:
+        raise ClerkTokenError(TokenVerificationErrorReason.JWK_KID_MISMATCH)
+    return await jwks.key_for(kid)
+
+
+async def verify_session_token(token: str, *, jwks: ClerkJWKS = clerk_jwks) -> dict[str, Any]:
+    """Return the claims of a valid Clerk session token or raise `ClerkTokenError`."""
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cached = verified_claims.get(cache_key)
+    if cached is not None and float(cached["exp"]) > time.time():
+        return cached
+    key = await _signing_key(token, jwks)
+    try:
+        claims: dict[str, Any] = jwt.decode(
+            token,
+            key,
+            algorithms=_ALGORITHMS,
+            leeway=settings.clerk_leeway,
+            options={
+                "require": ["exp", "sub"],
+                "verify_aud": False,
+                "verify_iat": settings.clerk_verify_iat,
+            },
+        )
+    except jwt.ExpiredSignatureError as exc:
+        raise ClerkTokenError(TokenVerificationErrorReason.TOKEN_EXPIRED) from exc
+    except jwt.ImmatureSignatureError as exc:
+        raise ClerkTokenError(TokenVerificationErrorReason.TOKEN_NOT_ACTIVE_YET) from exc
+    except jwt.InvalidSignatureError as exc:
+        raise ClerkTokenError(TokenVerificationErrorReason.TOKEN_INVALID_SIGNATURE) from exc
+    except jwt.InvalidTokenError as exc:
+        raise ClerkTokenError(TokenVerificationErrorReason.TOKEN_INVALID) from exc
+    verified_claims.set(cache_key, claims)
+    return claims
@@ -41,6 +41,7 @@ from app.core.logging import (
     set_request_id,
     set_request_route_context,
 )
+from app.db.query_stats import QueryStats, track_queries
 
 if TYPE_CHECKING:  # pragma: no cover
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -124,13 +125,19 @@ class RequestIdMiddleware:
                             "http.request.slow",
                             extra={
                                 **extra,
+                                **query_stats.summary(),
                                 "slow_threshold_ms": self._slow_request_ms,
                             },
                         )
+                    _log_query_stats(method, path, query_stats)
+                # The request's own work is done; stop counting before a streaming body
+                # starts polling under the same context.
+                query_stats.close()
             await send(message)
 
         try:
-            await self._app(scope, receive, send_with_request_id)
+            with track_queries() as query_stats:
+                await self._app(scope, receive, send_with_request_id)
         finally:
             if should_log and status_code is None:
                 logger.warning(
@@ -164,6 +171,34 @@ class RequestIdMiddleware:
         return request_id
 
 
+def _log_query_stats(method: str, path: str, stats: QueryStats) -> None:
+    # The collector is closed once the response starts, so statements run by a streaming
+    # body are neither included here nor held to the budget.
+    suspects = stats.n_plus_one_suspects()
+    if suspects:
+        statement, repeat_count = suspects[0]
+        logger.warning(
+            "db.request.n_plus_one",
+            extra={
+                "method": method,
+                "path": path,
+                "db_query_count": stats.query_count,
+                "repeat_count": repeat_count,
+                "statement": statement,
+            },
+        )
+    if stats.over_budget:
+        logger.warning(
+            "db.request.query_budget_exceeded",
+            extra={
+                "method": method,
+                "path": path,
+                "db_query_count": stats.query_count,
+                "query_budget": stats.budget,
+            },
+        )
+
+
 def install_error_handling(app: FastAPI) -> None:
     """Install middleware and exception handlers on the FastAPI app."""
     # Important: add request-id middleware last so it's the outermost middleware.
@@ -0,0 +1,120 @@
+"""Small per-process TTL cache with single-flight computation.
+
+Entries expire `ttl_seconds` after they are stored and the oldest entries are evicted once
+`max_entries` is reached. `get_or_compute` lets concurrent callers asking for the same
+missing key share one computation instead of each running it. A TTL of 0 disables caching.
+`None` is treated as a miss, so do not cache `None` values.
+
+`SingleFlight` is the shared building block for caches whose hit test depends on more than
+the key (a minimum version, a fingerprint): they keep entries in a `TTLCache` and pass
+their own lookup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K]):
+    """Run at most one computation per key at a time for callers that miss a lookup."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Future[None]] = {}
+
+    async def run(
+        self,
+        key: K,
+        lookup: Callable[[], V | None],
+        compute: Callable[[], Awaitable[V]],
+    ) -> V:
+        """Return `lookup()` when it finds a value, otherwise `compute()` once per key.
+
+        `compute` must store its result where `lookup` finds it: concurrent callers wait
+        for the running computation and then look up again.
+        """
+        while (value := lookup()) is None:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._run(key, compute)
+            # Another caller is computing this key; wait for it and re-check. If that
+            # computation failed, the next waiter computes instead.
+            await asyncio.shield(inflight)
+        return value
+
+    async def _run(self, key: K, compute: Callable[[], Awaitable[V]]) -> V:
+        done = asyncio.get_running_loop().create_future()
+        self._inflight[key] = done
+        try:
+            return await compute()
+        finally:
+            del self._inflight[key]
+            done.set_result(None)
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: dict[K, tuple[float, V]] = {}
+        self._computations: SingleFlight[K] = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are kept at all."""
+        return self._ttl_seconds > 0
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for `key`, or `None` when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self._ttl_seconds:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store `value` under `key`, evicting the oldest entries past the size cap."""
+        if not self.enabled:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+    def discard(self, key: K) -> None:
+        """Forget `key` if present."""
+        self._entries.pop(key, None)
+
+    def discard_values(self, predicate: Callable[[V], bool]) -> None:
+        """Forget every entry whose value matches `predicate` (scans all entries)."""
+        for key in [key for key, (_at, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    async def get_or_compute(self, key: K, compute: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for `key`, computing it once for concurrent misses."""
+        if not self.enabled:
+            return await compute()
+        return await self._computations.run(
+            key,
+            lambda: self.get(key),
+            lambda: self._compute(key, compute),
+        )
+
+    async def _compute(self, key: K, compute: Callable[[], Awaitable[V]]) -> V:
+        value = await compute()
+        self.set(key, value)
+        return value
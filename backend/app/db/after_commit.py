@@ -0,0 +1,102 @@
+"""Run derived writes in their own transaction once the ORM transaction commits.
+
+Counters derived from ORM writes (board snapshot versions, dashboard metric rollups) used
+to be written from flush hooks inside the writer's transaction. That held a lock on the
+shared counter row until commit, serializing every writer on a board and letting
+multi-board transactions deadlock. Work queued here runs after the session has committed
+and released its connection, in a short transaction of its own, so those locks last one
+statement and are never held while the writer does anything else.
+
+Queued work is dropped when the transaction rolls back. It is also lost if the process
+dies between the commit and the follow-up write, so consumers must tolerate a missed
+update (caches expire on a TTL; rollups can be rebuilt from their source rows).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, TypeVar, cast
+
+from sqlalchemy import Connection, event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.orm import SessionTransaction
+
+_QUEUED_INFO_KEY = "after_commit_queued"
+_COMMITTED_INFO_KEY = "after_commit_committed"
+
+logger = get_logger(__name__)
+
+
+class AfterCommitWork(Protocol):
+    """Deferred write run with a connection in its own transaction."""
+
+    def __call__(self, connection: Connection) -> None:
+        """Write the accumulated changes."""
+
+
+WorkT = TypeVar("WorkT", bound=AfterCommitWork)
+
+
+def queued_after_commit(session: Session, key: str, factory: Callable[[], WorkT]) -> WorkT:
+    """Return the work queued under `key` for this transaction, queueing `factory()` if none.
+
+    Hooks that fire on every flush add to the returned object, so each transaction runs
+    one accumulated write per key.
+    """
+    queued: dict[str, AfterCommitWork] = session.info.setdefault(_QUEUED_INFO_KEY, {})
+    work = queued.get(key)
+    if work is None:
+        work = queued[key] = factory()
+    return cast("WorkT", work)
+
+
+def _mark_committed(session: Session) -> None:
+    # Savepoint releases also fire `after_commit`; only the outermost commit counts.
+    if session.in_nested_transaction():
+        return
+    queued = session.info.pop(_QUEUED_INFO_KEY, None)
+    if queued:
+        session.info.setdefault(_COMMITTED_INFO_KEY, {}).update(queued)
+
+
+def _run_committed(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None:
+        return
+    # A rolled-back transaction never reached `_mark_committed`; drop its work.
+    session.info.pop(_QUEUED_INFO_KEY, None)
+    committed: dict[str, AfterCommitWork] = session.info.pop(
+        _COMMITTED_INFO_KEY,
+        {},
+    )
+    if not committed:
+        return
+    bind = session.get_bind()
+    try:
+        if isinstance(bind, Connection):
+            # Sessions joined to an outer connection stay inside its transaction.
+            for work in committed.values():
+                work(bind)
+            return
+        with bind.begin() as connection:
+            for work in committed.values():
+                work(connection)
+    except SQLAlchemyError as exc:
+        # The writer's transaction has already committed; report rather than fail it.
+        logger.warning(
+            "db.after_commit.failed",
+            extra={"work": sorted(committed), "error": str(exc)},
+        )
+
+
+def install_after_commit_hooks() -> None:
+    """Register the session hooks that run queued work (idempotent)."""
+    if event.contains(Session, "after_commit", _mark_committed):
+        return
+    event.listen(Session, "after_commit", _mark_committed)
+    event.listen(Session, "after_transaction_end", _run_committed)
@@ -0,0 +1,169 @@
+"""Coalesced agent presence writes.
+
+Heartbeats and authenticated agent requests used to update `agents.last_seen_at` in their
+own transaction, so hundreds of agents produced a steady stream of tiny writes. Routine
+check-ins that change nothing but the timestamp are now recorded here and written in one
+batched `UPDATE` every `agent_presence_flush_interval_seconds`. Check-ins that change
+status or lifecycle state still write through immediately.
+
+Each process buffers its own check-ins. When `agent_presence_redis_url` is set, processes
+push their buffers into a shared Redis hash and whichever process takes the short flush
+lock writes the merged batch, so the database sees one batch per interval regardless of
+how many API processes run. Redis failures fall back to writing the local buffer.
+
+Flushes are Core statements: they bypass ORM hooks, so they neither bump board versions
+nor count as activity. Each flush sets `updated_at` to the time of the flush, not the
+buffered check-in time: agent change streams key on `(updated_at, id)`, and a cursor that
+has already moved past a buffered check-in would otherwise never see the row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+from uuid import UUID
+
+import redis
+import redis.asyncio as redis_asyncio
+from sqlalchemy import bindparam, or_, update
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.models.agents import Agent
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+_REDIS_HASH_KEY = "mission_control:agent_presence"
+_REDIS_LOCK_KEY = "mission_control:agent_presence:flush_lock"
+
+
+class AgentPresenceStore:
+    """Buffer of agent check-in times waiting to be written to `agents`."""
+
+    def __init__(self, *, flush_interval_seconds: float, redis_url: str = "") -> None:
+        self._flush_interval_seconds = flush_interval_seconds
+        self._redis_url = redis_url
+        self._pending: dict[UUID, datetime] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        self._redis: redis_asyncio.Redis | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether check-ins are buffered; when `False` callers write through."""
+        return self._flush_interval_seconds > 0
+
+    def record(self, agent_id: UUID, seen_at: datetime) -> None:
+        """Remember that `agent_id` checked in at `seen_at`."""
+        current = self._pending.get(agent_id)
+        if current is None or seen_at > current:
+            self._pending[agent_id] = seen_at
+
+    def clear(self) -> None:
+        """Drop every buffered check-in."""
+        self._pending.clear()
+
+    def _drain(self) -> dict[UUID, datetime]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def _redis_client(self) -> redis_asyncio.Redis:
+        # One pooled client per store, reused by every flush on this event loop.
+        if self._redis is None:
+            self._redis = redis_asyncio.Redis.from_url(self._redis_url)
+        return self._redis
+
+    async def _exchange_via_redis(
+        self,
+        pending: dict[UUID, datetime],
+    ) -> dict[UUID, datetime]:
+        """Publish local check-ins and, if this process wins the lock, take the merged set."""
+        client = self._redis_client()
+        if pending:
+            await client.hset(
+                _REDIS_HASH_KEY,
+                mapping={str(agent_id): seen.isoformat() for agent_id, seen in pending.items()},
+            )
+        lock_ms = max(1, int(self._flush_interval_seconds * 1000))
+        if not await client.set(_REDIS_LOCK_KEY, "1", nx=True, px=lock_ms):
+            return {}
+        async with client.pipeline(transaction=True) as pipeline:
+            pipeline.hgetall(_REDIS_HASH_KEY)
+            pipeline.delete(_REDIS_HASH_KEY)
+            raw, _deleted = await pipeline.execute()
+        merged: dict[UUID, datetime] = {}
+        for key, value in cast(dict[bytes, bytes], raw).items():
+            merged[UUID(key.decode())] = datetime.fromisoformat(value.decode())
+        return merged
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Write buffered check-ins in one batch; returns the number of agents sent.
+
+        Presence is best-effort: a batch that fails to write is dropped, and the agent's
+        next check-in restores it.
+        """
+        batch = self._drain()
+        if self._redis_url:
+            try:
+                batch = await self._exchange_via_redis(batch)
+            except redis.RedisError:
+                logger.warning(
+                    "agent_presence.redis_unavailable",
+                    extra={"agents": len(batch)},
+                )
+        if not batch:
+            return 0
+        table = cast("Table", Agent.__table__)  # type: ignore[attr-defined]
+        statement = (
+            update(table).where(table.c.id == bindparam("agent_id"))
+            # Never move presence backwards past a newer write-through check-in.
+            .where(or_(table.c.last_seen_at.is_(None), table.c.last_seen_at < bindparam("seen")))
+            # Stamp the write time so change-stream cursors past `seen` still pick it up.
+            .values(last_seen_at=bindparam("seen"), updated_at=utcnow())
+        )
+        connection = await session.connection()
+        await connection.execute(
+            statement,
+            [{"agent_id": agent_id, "seen": seen} for agent_id, seen in sorted(batch.items())],
+        )
+        await session.commit()
+        return len(batch)
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            try:
+                async with async_session_maker() as session:
+                    await self.flush(session)
+            except Exception:
+                logger.exception("agent_presence.flush_failed")
+
+    def start(self) -> None:
+        """Start the periodic flusher on the running event loop (idempotent)."""
+        if self.enabled and self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        async with async_session_maker() as session:
+            await self.flush(session)
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+agent_presence = AgentPresenceStore(
+    flush_interval_seconds=settings.agent_presence_flush_interval_seconds,
+    redis_url=settings.agent_presence_redis_url,
+)
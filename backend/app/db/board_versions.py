@@ -0,0 +1,224 @@
+"""Board version counters bumped after commits that change rows shown in board snapshots.
+
+Every transaction that inserts, deletes or changes a task, approval, agent, board memory
+row, task dependency, tag, tag assignment, approval-task link or task custom-field value
+increments the affected boards' rows in `board_versions` once it commits. Rows keyed by
+task are mapped to the task's board and tags to every board of their organization when
+the bump runs. Snapshot caches compare that counter instead of rebuilding on every read,
+and because it lives in the database the invalidation is shared by every process.
+
+The counter has its own table and is bumped through `app.db.after_commit`, outside the
+writer's transaction: neither the `boards` row nor the counter row stays locked while a
+writer works, and the bump runs after the change is visible, so a reader that sees the
+new version also sees the change. Versions are read on replicas together with the
+snapshot they key.
+
+Bulk `DELETE`/`UPDATE` statements bypass the ORM and do not bump the counter; helpers that
+replace rows in bulk call `mark_tasks_changed`. A bump is lost if the process dies right
+after committing, so caches built on it should still expire on a TTL.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+from sqlalchemy import event, literal, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_state
+from sqlmodel import SQLModel, col, select
+
+from app.db.after_commit import install_after_commit_hooks, queued_after_commit
+from app.models.agents import Agent
+from app.models.approval_task_links import ApprovalTaskLink
+from app.models.approvals import Approval
+from app.models.board_memory import BoardMemory
+from app.models.board_versions import BoardVersion
+from app.models.boards import Board
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.task_custom_fields import TaskCustomFieldValue
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy import ColumnElement, Connection
+    from sqlalchemy.orm import UOWTransaction
+    from sqlalchemy.sql.base import Executable
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+_AFTER_COMMIT_KEY = "board_versions"
+
+# Changes limited to these columns do not bump the version. Presence touches update an
+# agent's `last_seen_at` on nearly every agent request; snapshot caches expire on a short
+# TTL instead so those timestamps stay roughly current without constant invalidation.
+_IGNORED_COLUMNS: dict[type[SQLModel], frozenset[str]] = {
+    Task: frozenset(),
+    Approval: frozenset(),
+    Agent: frozenset({"last_seen_at", "updated_at"}),
+    BoardMemory: frozenset(),
+    TaskDependency: frozenset(),
+    Board: frozenset({"updated_at"}),
+    Tag: frozenset({"updated_at"}),
+    TagAssignment: frozenset(),
+    ApprovalTaskLink: frozenset(),
+    TaskCustomFieldValue: frozenset(),
+}
+
+_Scope = Literal["board", "task", "organization"]
+_Change = Literal["new", "deleted", "dirty"]
+# Column naming the rows a change affects, and what kind of id that column holds.
+_BOARD_LINKS: dict[type[SQLModel], tuple[str, _Scope]] = {
+    Board: ("id", "board"),
+    Tag: ("organization_id", "organization"),
+    TagAssignment: ("task_id", "task"),
+    ApprovalTaskLink: ("task_id", "task"),
+    TaskCustomFieldValue: ("task_id", "task"),
+}
+
+
+def _changed_columns(obj: SQLModel) -> set[str]:
+    changed: set[str] = set()
+    for attr in instance_state(obj).attrs:
+        history = attr.history
+        if history.added and list(history.added) != list(history.deleted):
+            changed.add(attr.key)
+    return changed
+
+
+def _touched_ids(obj: SQLModel, change: _Change) -> tuple[_Scope, set[UUID]]:
+    key, scope = _BOARD_LINKS.get(type(obj), ("board_id", "board"))
+    ignored = _IGNORED_COLUMNS.get(type(obj))
+    if ignored is None:
+        return scope, set()
+    if isinstance(obj, Board) and change != "dirty":
+        # New boards have no version row yet and deleted boards have nothing to bump.
+        return scope, set()
+    if isinstance(obj, Tag) and change == "new":
+        # A new tag is on no task yet.
+        return scope, set()
+    ids: set[UUID] = set()
+    if change == "dirty":
+        if not _changed_columns(obj) - ignored:
+            return scope, set()
+        ids = {
+            value for value in instance_state(obj).attrs[key].history.deleted if value is not None
+        }
+    value = getattr(obj, key)
+    if value is not None:
+        ids.add(value)
+    return scope, ids
+
+
+class _PendingBump:
+    """Boards whose version is bumped once the transaction commits."""
+
+    def __init__(self) -> None:
+        self.board_ids: set[UUID] = set()
+        self.task_ids: set[UUID] = set()
+        self.organization_ids: set[UUID] = set()
+
+    def add(self, scope: _Scope, ids: set[UUID]) -> None:
+        if scope == "board":
+            self.board_ids |= ids
+        elif scope == "task":
+            self.task_ids |= ids
+        else:
+            self.organization_ids |= ids
+
+    def __call__(self, connection: Connection) -> None:
+        connection.execute(
+            _bump_statement(
+                connection.dialect.name,
+                board_ids=self.board_ids,
+                task_ids=self.task_ids,
+                organization_ids=self.organization_ids,
+            ),
+        )
+
+
+def _collect_touched_boards(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: object,
+) -> None:
+    changes: tuple[tuple[_Change, Iterable[SQLModel]], ...] = (
+        ("new", session.new),
+        ("deleted", session.deleted),
+        ("dirty", session.dirty),
+    )
+    pending: _PendingBump | None = None
+    for change, objs in changes:
+        for obj in objs:
+            scope, ids = _touched_ids(obj, change)
+            if ids:
+                pending = pending or queued_after_commit(session, _AFTER_COMMIT_KEY, _PendingBump)
+                pending.add(scope, ids)
+
+
+def mark_tasks_changed(session: AsyncSession, task_ids: Iterable[UUID]) -> None:
+    """Bump the boards of `task_ids` after commit, for bulk statements the ORM cannot see."""
+    ids = set(task_ids)
+    if ids:
+        queued_after_commit(session.sync_session, _AFTER_COMMIT_KEY, _PendingBump).add("task", ids)
+
+
+def _bump_statement(
+    dialect_name: str,
+    *,
+    board_ids: Iterable[UUID] = (),
+    task_ids: Iterable[UUID] = (),
+    organization_ids: Iterable[UUID] = (),
+) -> Executable:
+    # Selecting from `boards` skips boards deleted in the same transaction; sorted ids keep
+    # row-lock order stable across concurrent multi-board bumps.
+    criteria: list[ColumnElement[bool]] = []
+    if board_ids:
+        criteria.append(col(Board.id).in_(sorted(board_ids)))
+    if task_ids:
+        criteria.append(
+            col(Board.id).in_(
+                select(col(Task.board_id)).where(col(Task.id).in_(sorted(task_ids))),
+            ),
+        )
+    if organization_ids:
+        criteria.append(col(Board.organization_id).in_(sorted(organization_ids)))
+    dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    statement = dialect_insert(BoardVersion).from_select(
+        ["board_id", "version"],
+        select(col(Board.id), literal(1)).where(or_(*criteria)).order_by(col(Board.id)),
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["board_id"],
+        set_={"version": col(BoardVersion.version) + 1},
+    )
+
+
+async def board_versions(session: AsyncSession, board_ids: Iterable[UUID]) -> dict[UUID, int]:
+    """Return the current version of each board; boards never bumped are at version 0."""
+    ids = list(board_ids)
+    versions = dict.fromkeys(ids, 0)
+    if ids:
+        rows = await session.exec(
+            select(col(BoardVersion.board_id), col(BoardVersion.version)).where(
+                col(BoardVersion.board_id).in_(ids),
+            ),
+        )
+        versions.update(dict(rows.all()))
+    return versions
+
+
+async def board_version(session: AsyncSession, board_id: UUID) -> int:
+    """Return the current version of one board."""
+    return (await board_versions(session, [board_id]))[board_id]
+
+
+def install_board_version_tracking() -> None:
+    """Register the flush hook on every ORM session (idempotent)."""
+    install_after_commit_hooks()
+    if event.contains(Session, "before_flush", _collect_touched_boards):
+        return
+    event.listen(Session, "before_flush", _collect_touched_boards)
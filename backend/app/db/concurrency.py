@@ -0,0 +1,95 @@
+"""Run independent read queries concurrently on separate pooled connections.
+
+One `AsyncSession` owns a single connection and cannot run statements concurrently, so
+builders that issue several independent reads pay for each round trip in turn.
+`gather_reads` forks a short-lived session per call, bound to the same engine (primary or
+replica) as the caller's session, and awaits them together.
+
+Each fork checks out its own connection, so results come from separate transactions and
+may observe slightly different points in time; only use it for read-only dashboards that
+tolerate that. When the engine cannot hand out independent connections (for example an
+in-memory SQLite `StaticPool`) the calls run one after another on the caller's session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+D = TypeVar("D")
+E = TypeVar("E")
+
+
+def _concurrent_engine(session: AsyncSession) -> AsyncEngine | None:
+    bind = session.bind
+    if isinstance(bind, AsyncEngine) and isinstance(bind.sync_engine.pool, QueuePool):
+        return bind
+    return None
+
+
+@overload
+async def gather_reads(
+    session: AsyncSession,
+    first: Callable[[AsyncSession], Awaitable[A]],
+    second: Callable[[AsyncSession], Awaitable[B]],
+    /,
+) -> tuple[A, B]: ...
+
+
+@overload
+async def gather_reads(
+    session: AsyncSession,
+    first: Callable[[AsyncSession], Awaitable[A]],
+    second: Callable[[AsyncSession], Awaitable[B]],
+    third: Callable[[AsyncSession], Awaitable[C]],
+    /,
+) -> tuple[A, B, C]: ...
+
+
+@overload
+async def gather_reads(
+    session: AsyncSession,
+    first: Callable[[AsyncSession], Awaitable[A]],
+    second: Callable[[AsyncSession], Awaitable[B]],
+    third: Callable[[AsyncSession], Awaitable[C]],
+    fourth: Callable[[AsyncSession], Awaitable[D]],
+    /,
+) -> tuple[A, B, C, D]: ...
+
+
+@overload
+async def gather_reads(
+    session: AsyncSession,
+    first: Callable[[AsyncSession], Awaitable[A]],
+    second: Callable[[AsyncSession], Awaitable[B]],
+    third: Callable[[AsyncSession], Awaitable[C]],
+    fourth: Callable[[AsyncSession], Awaitable[D]],
+    fifth: Callable[[AsyncSession], Awaitable[E]],
+    /,
+) -> tuple[A, B, C, D, E]: ...
+
+
+async def gather_reads(
+    session: AsyncSession,
+    *calls: Callable[[AsyncSession], Awaitable[Any]],
+) -> tuple[Any, ...]:
+    """Await each read call with its own session and return results in call order."""
+    engine = _concurrent_engine(session)
+    if engine is None:
+        return tuple([await call(session) for call in calls])
+
+    async def _run(call: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with AsyncSession(engine, expire_on_commit=False) as forked:
+            return await call(forked)
+
+    return tuple(await asyncio.gather(*(_run(call) for call in calls)))
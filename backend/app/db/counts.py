@@ -0,0 +1,162 @@
+"""Count strategies for paginated list totals.
+
+An exact `COUNT(*)` over the filtered query is the default, but on large append-heavy
+tables it can cost more than fetching the page. Endpoints pick a `CountStrategy`:
+
+- `exact`: always count.
+- `estimate`: use the Postgres planner's row estimate, falling back to an exact count for
+  small results (and on databases without `EXPLAIN (FORMAT JSON)`).
+- `cached`: count exactly, then reuse the result for `ttl_seconds` within this process
+  until a write to the strategy's scope calls `invalidate_count_scope`.
+- `none`: never compute a total.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import func
+from sqlmodel import select
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import Select, SelectOfScalar
+
+CountMode = Literal["exact", "estimate", "cached", "none"]
+
+# Planner estimates at or below this many rows are replaced with an exact count: small
+# results are cheap to count and users notice when short lists show approximate totals.
+ESTIMATE_EXACT_THRESHOLD = 10_000
+COUNT_CACHE_TTL_SECONDS = 30.0
+COUNT_CACHE_MAX_ENTRIES = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class CountStrategy:
+    """How a paginated list computes its `total`."""
+
+    mode: CountMode = "exact"
+    # Cache scope invalidated by writes (see `count_scope`); `cached` only.
+    scope: str | None = None
+    ttl_seconds: float = COUNT_CACHE_TTL_SECONDS
+    exact_below: int = ESTIMATE_EXACT_THRESHOLD
+
+    @classmethod
+    def cached(cls, scope: str, *, ttl_seconds: float = COUNT_CACHE_TTL_SECONDS) -> CountStrategy:
+        """Build a cached strategy bound to a write-invalidated scope."""
+        return cls(mode="cached", scope=scope, ttl_seconds=ttl_seconds)
+
+
+EXACT_COUNT = CountStrategy()
+ESTIMATED_COUNT = CountStrategy(mode="estimate")
+NO_COUNT = CountStrategy(mode="none")
+
+
+@dataclass(frozen=True, slots=True)
+class CountResult:
+    """Total row count plus whether it may differ from an exact count."""
+
+    total: int | None
+    approximate: bool = False
+
+
+_scope_generations: dict[str, int] = {}
+_cached_counts: dict[tuple[str, int, str], tuple[float, int]] = {}
+
+
+def count_scope(table: str, owner_id: object) -> str:
+    """Return the cache scope for rows of `table` owned by `owner_id` (board, org, ...)."""
+    return f"{table}:{owner_id}"
+
+
+def invalidate_count_scope(scope: str) -> None:
+    """Drop cached totals for `scope`; call after committing writes that change its rows."""
+    _scope_generations[scope] = _scope_generations.get(scope, 0) + 1
+
+
+def clear_count_cache() -> None:
+    """Forget every cached total (used by tests)."""
+    _scope_generations.clear()
+    _cached_counts.clear()
+
+
+async def count_rows(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    strategy: CountStrategy = EXACT_COUNT,
+) -> CountResult:
+    """Return the total for `statement` using `strategy`."""
+    if strategy.mode == "none":
+        return CountResult(total=None)
+    if strategy.mode == "estimate":
+        estimate = await _planner_estimate(session, statement)
+        if estimate is not None and estimate > strategy.exact_below:
+            return CountResult(total=estimate, approximate=True)
+    if strategy.mode == "cached" and strategy.scope is not None:
+        return await _cached_count(session, statement, strategy, scope=strategy.scope)
+    return CountResult(total=await _exact_count(session, statement))
+
+
+async def _exact_count(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+) -> int:
+    count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+    return int((await session.exec(count_statement)).one() or 0)
+
+
+async def _cached_count(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    strategy: CountStrategy,
+    *,
+    scope: str,
+) -> CountResult:
+    # Capture the generation before counting so an invalidation that lands mid-count
+    # leaves this result under a key no later reader will use.
+    generation = _scope_generations.get(scope, 0)
+    compiled = statement.order_by(None).compile()
+    key = (scope, generation, f"{compiled}|{sorted(compiled.params.items(), key=repr)!r}")
+    now = time.monotonic()
+    cached = _cached_counts.get(key)
+    if cached is not None and cached[0] > now:
+        # Writes from other processes are only bounded by the TTL, so flag reuse.
+        return CountResult(total=cached[1], approximate=True)
+    total = await _exact_count(session, statement)
+    if len(_cached_counts) >= COUNT_CACHE_MAX_ENTRIES:
+        _prune_cached_counts(now)
+    _cached_counts[key] = (now + strategy.ttl_seconds, total)
+    return CountResult(total=total)
+
+
+def _prune_cached_counts(now: float) -> None:
+    for key in [key for key, (expires_at, _) in _cached_counts.items() if expires_at <= now]:
+        del _cached_counts[key]
+    while len(_cached_counts) >= COUNT_CACHE_MAX_ENTRIES:
+        del _cached_counts[next(iter(_cached_counts))]
+
+
+async def _planner_estimate(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+) -> int | None:
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+    compiled = statement.order_by(None).compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    # EXPLAIN plans the same statement the page query runs, so it fails only where the
+    # page query itself would.
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        compiled.params,
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,69 @@
+"""Tag filters over JSON string-list columns such as memory `tags`.
+
+On PostgreSQL tag columns are `jsonb` with a `jsonb_path_ops` GIN index, and every filter
+is built from the containment operator (`tags @> '["a"]'`) that the index serves. SQLite
+has no containment operator, so there each tag becomes an `EXISTS` over `json_each`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import JSON, and_, exists, literal, or_
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Mapped
+    from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Column type for tag lists: `jsonb` on PostgreSQL so the GIN index applies, JSON elsewhere.
+TAGS_JSON_TYPE = JSON().with_variant(JSONB(), "postgresql")
+
+
+def normalize_tags(tags: Iterable[str] | None) -> list[str]:
+    """Strip tags and drop blanks and duplicates, keeping first-seen order."""
+    return list(dict.fromkeys(tag.strip() for tag in tags or () if tag.strip()))
+
+
+def _has_tags(
+    column: Mapped[Any] | ColumnElement[Any], tags: list[str], *, postgres: bool
+) -> ColumnElement[bool]:
+    if postgres:
+        return column.op("@>")(literal(tags, JSONB))
+    clauses = []
+    for tag in tags:
+        entries = func.json_each(column).table_valued("value")
+        clauses.append(
+            exists(sa_select(literal(1)).select_from(entries).where(entries.c.value == tag))
+        )
+    return and_(*clauses)
+
+
+async def tags_filter(
+    session: AsyncSession,
+    column: Mapped[Any] | ColumnElement[Any],
+    *,
+    all_of: Iterable[str] | None = None,
+    any_of: Iterable[str] | None = None,
+) -> ColumnElement[bool] | None:
+    """Return a filter requiring every tag in `all_of` and at least one in `any_of`.
+
+    Returns `None` when neither list names a tag, so callers can skip the filter.
+    """
+    required = normalize_tags(all_of)
+    alternatives = normalize_tags(any_of)
+    if not required and not alternatives:
+        return None
+    connection = await session.connection()
+    postgres = connection.dialect.name == "postgresql"
+    clauses: list[ColumnElement[bool]] = []
+    if required:
+        clauses.append(_has_tags(column, required, postgres=postgres))
+    if alternatives:
+        clauses.append(or_(*(_has_tags(column, [tag], postgres=postgres) for tag in alternatives)))
+    return and_(*clauses)
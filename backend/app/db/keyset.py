@@ -0,0 +1,174 @@
+"""Keyset (seek) cursor helpers for stream pollers and cursor-paginated list queries."""
+
+from __future__ import annotations
+
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
+
+from sqlalchemy import asc, desc, literal, tuple_
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.orm import InstrumentedAttribute, Mapped
+    from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+    from sqlmodel.sql.expression import Select, SelectOfScalar
+
+StatementT = TypeVar("StatementT", bound="Select[Any] | SelectOfScalar[Any]")
+
+# Upper bound on rows returned per stream poll. A full batch signals a backlog, so stream
+# generators re-poll immediately instead of sleeping.
+STREAM_BATCH_LIMIT = 200
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Position in a result set ordered by `(at, id)`.
+
+    A cursor without an `id` is a bare starting instant (for example the `since` query
+    parameter) and matches rows at or after it. Once a row has been emitted the cursor
+    pins that row's id, so subsequent queries seek strictly past it.
+    """
+
+    at: datetime
+    id: UUID | None = None
+
+    def advance(self, at: datetime, row_id: UUID) -> KeysetCursor:
+        """Return the cursor positioned on the given (already emitted) row."""
+        return KeysetCursor(at=at, id=row_id)
+
+
+def after_cursor(
+    cursor: KeysetCursor,
+    *,
+    at_column: Mapped[Any] | ColumnElement[Any],
+    id_column: Mapped[Any] | ColumnElement[Any],
+) -> ColumnElement[bool]:
+    """Build the seek predicate for rows strictly after `cursor`.
+
+    Uses a row-value comparison so Postgres can satisfy it with a single range scan over
+    a composite `(at, id)` index.
+    """
+    if cursor.id is None:
+        return at_column >= cursor.at
+    return tuple_(at_column, id_column) > tuple_(literal(cursor.at), literal(cursor.id))
+
+
+def keyset_order(
+    *,
+    at_column: Mapped[Any] | ColumnElement[Any],
+    id_column: Mapped[Any] | ColumnElement[Any],
+) -> tuple[UnaryExpression[Any], UnaryExpression[Any]]:
+    """Return the ascending ordering that matches `after_cursor`."""
+    return asc(at_column), asc(id_column)
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetOrder:
+    """Uniform-direction sort key used to page list queries by seeking past a cursor.
+
+    The last column must be unique (normally the primary key) so every row has a distinct
+    position. Pages are addressed by opaque tokens that encode the sort-key values of the
+    last row returned.
+    """
+
+    columns: tuple[Mapped[Any], ...]
+    descending: bool = True
+
+    @classmethod
+    def desc(cls, *columns: Mapped[Any]) -> KeysetOrder:
+        """Build a newest-first order over `columns`."""
+        return cls(columns=columns, descending=True)
+
+    @classmethod
+    def asc(cls, *columns: Mapped[Any]) -> KeysetOrder:
+        """Build an oldest-first order over `columns`."""
+        return cls(columns=columns, descending=False)
+
+    def clauses(self) -> tuple[UnaryExpression[Any], ...]:
+        """Return the ORDER BY clauses matching `after`."""
+        direction = desc if self.descending else asc
+        return tuple(direction(column) for column in self.columns)
+
+    def after(self, values: Sequence[Any]) -> ColumnElement[bool]:
+        """Build the seek predicate for rows strictly past `values` in this order."""
+        keys = tuple_(*self.columns)
+        bounds = tuple_(*(literal(value) for value in values))
+        return keys < bounds if self.descending else keys > bounds
+
+    def apply(
+        self,
+        statement: StatementT,
+        *,
+        after: Sequence[Any] | None = None,
+    ) -> StatementT:
+        """Order `statement` by this key and, when given, seek past the `after` position."""
+        ordered = statement.order_by(*self.clauses())
+        if after is not None:
+            ordered = ordered.where(self.after(after))
+        return cast("StatementT", ordered)
+
+    def values_of(self, row: Any) -> tuple[Any, ...]:
+        """Read the sort-key values from a result row (a model or a tuple of models)."""
+        return tuple(_row_value(row, column) for column in self.columns)
+
+    def encode(self, row: Any) -> str:
+        """Return the opaque cursor token positioned on `row`."""
+        payload = json.dumps([_encode_value(value) for value in self.values_of(row)])
+        return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, token: str) -> tuple[Any, ...]:
+        """Decode a cursor token produced by `encode`.
+
+        Raises `ValueError` when the token is malformed or was issued for a different key.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            msg = "Malformed cursor"
+            raise ValueError(msg) from exc
+        if not isinstance(raw, list) or len(raw) != len(self.columns):
+            msg = "Cursor does not match the requested ordering"
+            raise ValueError(msg)
+        return tuple(_decode_value(value) for value in raw)
+
+
+def _row_value(row: Any, column: Mapped[Any]) -> Any:
+    attribute = cast("InstrumentedAttribute[Any]", column)
+    owner = cast("type[Any]", attribute.class_)
+    if isinstance(row, owner):
+        return getattr(row, attribute.key)
+    for entity in row:
+        if isinstance(entity, owner):
+            return getattr(entity, attribute.key)
+    msg = f"Result row has no {owner.__name__} entity for keyset column {attribute.key!r}"
+    raise TypeError(msg)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    try:
+        if isinstance(value, dict) and "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if isinstance(value, dict) and "uuid" in value:
+            return UUID(value["uuid"])
+    except (TypeError, ValueError) as exc:
+        msg = "Malformed cursor"
+        raise ValueError(msg) from exc
+    if isinstance(value, str | int | float):
+        return value
+    msg = "Malformed cursor"
+    raise ValueError(msg)
@@ -0,0 +1,138 @@
+"""Session-scoped entity loader that memoizes hot lookups for one request.
+
+API requests get one `AsyncSession` each, so hanging the loader off the session makes it
+request-scoped without extra wiring. Lookups by primary key go through the session
+identity map: a row already loaded by an auth dependency or earlier helper is returned
+without another `SELECT`, and `load_many` fetches every missing id in one `IN` query.
+
+The loader also pins loaded rows (the identity map only holds them weakly) and memoizes
+misses and relation lookups (`related`). All three are dropped whenever the session
+flushes, commits or rolls back, so rows written in the same request are never hidden
+behind a stale entry.
+
+An `AsyncSession` cannot run statements concurrently, so batching is explicit: callers
+that need several rows of one model should ask for them through `load_many`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import SQLModel, col, select
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+T = TypeVar("T")
+
+_LOADER_INFO_KEY = "entity_loader"
+
+
+class EntityLoader:
+    """Memoize primary-key and relation lookups for the lifetime of one session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        # The identity map holds rows weakly; keep loaded rows alive for the request.
+        self._loaded: dict[tuple[type[SQLModel], Any], SQLModel] = {}
+        self._missing: set[tuple[type[SQLModel], Any]] = set()
+        self._related: dict[Hashable, Any] = {}
+
+    def clear(self) -> None:
+        """Forget memoized rows, misses and relation lookups."""
+        self._loaded.clear()
+        self._missing.clear()
+        self._related.clear()
+
+    async def load(self, model: type[ModelT], obj_id: object) -> ModelT | None:
+        """Return the row of `model` with primary key `obj_id`, or `None`."""
+        key = _coerce_primary_key(model, obj_id)
+        if key is None or (model, key) in self._missing:
+            return None
+        obj = await self._session.get(model, key)
+        if obj is None:
+            self._missing.add((model, key))
+        else:
+            self._loaded[(model, key)] = obj
+        return obj
+
+    async def load_many(
+        self,
+        model: type[ModelT],
+        obj_ids: Iterable[object],
+    ) -> dict[Any, ModelT]:
+        """Return rows of `model` keyed by primary key, fetching unseen ids in one query."""
+        identity_map = self._session.sync_session.identity_map
+        found: dict[Any, ModelT] = {}
+        pending: set[Any] = set()
+        for obj_id in obj_ids:
+            key = _coerce_primary_key(model, obj_id)
+            if key is None or key in found or (model, key) in self._missing:
+                continue
+            cached = identity_map.get(identity_key(model, key))
+            if isinstance(cached, model):
+                found[key] = cached
+            else:
+                pending.add(key)
+        if pending:
+            pk_column = col(_primary_key_attr(model))
+            for obj in await self._session.exec(select(model).where(pk_column.in_(pending))):
+                key = getattr(obj, _primary_key_name(model))
+                found[key] = obj
+                self._loaded[(model, key)] = obj
+            self._missing.update((model, key) for key in pending - found.keys())
+        return found
+
+    async def related(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the memoized result for `key`, calling `fetch` on first use."""
+        if key in self._related:
+            return self._related[key]  # type: ignore[no-any-return]
+        value = await fetch()
+        self._related[key] = value
+        return value
+
+
+def entity_loader(session: AsyncSession) -> EntityLoader:
+    """Return the loader bound to `session`, creating it on first use."""
+    loader = session.info.get(_LOADER_INFO_KEY)
+    if isinstance(loader, EntityLoader):
+        return loader
+    loader = EntityLoader(session)
+    session.info[_LOADER_INFO_KEY] = loader
+    sync_session = session.sync_session
+    for name in ("after_flush", "after_commit", "after_soft_rollback"):
+        event.listen(sync_session, name, _clear_session_loader)
+    return loader
+
+
+def _clear_session_loader(session: Session, *_args: object) -> None:
+    loader = session.info.get(_LOADER_INFO_KEY)
+    if isinstance(loader, EntityLoader):
+        loader.clear()
+
+
+def _primary_key_name(model: type[SQLModel]) -> str:
+    return str(class_mapper(model).primary_key[0].key)
+
+
+def _primary_key_attr(model: type[SQLModel]) -> Any:
+    return getattr(model, _primary_key_name(model))
+
+
+def _coerce_primary_key(model: type[SQLModel], obj_id: object) -> Any:
+    # Path parameters often arrive as strings; identity-map keys use the column type.
+    if obj_id is None:
+        return None
+    if isinstance(obj_id, str) and class_mapper(model).primary_key[0].type.python_type is UUID:
+        try:
+            return UUID(obj_id)
+        except ValueError:
+            return None
+    return obj_id
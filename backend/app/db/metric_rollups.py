@@ -0,0 +1,193 @@
+"""Hourly dashboard metric rollups derived from ORM writes.
+
+Dashboard metrics used to aggregate `tasks` and `activity_events` on every request, so
+long ranges scanned months of rows. Instead, every transaction that creates a task,
+records a task status transition or records an activity event adds its deltas to
+`board_hourly_metrics`. The dashboard then sums a handful of rollup rows per bucket.
+
+Deltas are collected at flush time and written through `app.db.after_commit` once the
+transaction commits, as one batched upsert in a short transaction of its own. The busy
+(board, hour) row is therefore never locked while a writer's transaction is open, and
+rolled-back transactions contribute nothing.
+
+Status counters follow `task_status_transitions`: a task moved to review and later to
+done is counted once in each column, which is what throughput and WIP-flow charts want.
+Bulk `UPDATE`/`INSERT` statements bypass the ORM and are not counted, and deltas are lost
+if the process dies between a commit and its rollup write.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import col
+
+from app.db.after_commit import install_after_commit_hooks, queued_after_commit
+from app.models.activity_events import ActivityEvent
+from app.models.board_metrics import BoardHourlyMetrics
+from app.models.task_status_transitions import TaskStatusTransition
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, Table
+    from sqlalchemy.orm import UOWTransaction
+
+_AFTER_COMMIT_KEY = "metric_rollups"
+ERROR_EVENT_SUFFIX = "failed"
+_STATUS_COLUMNS = {
+    "in_progress": "moved_to_in_progress",
+    "review": "moved_to_review",
+    "done": "moved_to_done",
+}
+METRIC_COLUMNS = (
+    "tasks_created",
+    "moved_to_in_progress",
+    "moved_to_review",
+    "moved_to_done",
+    "cycle_time_count",
+    "cycle_time_hours_sum",
+    "events_total",
+    "events_failed",
+)
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """Truncate `value` to the start of its hour."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class _PendingRollups:
+    """Metric deltas collected at flush time and written once the transaction commits."""
+
+    def __init__(self) -> None:
+        self.metrics: defaultdict[tuple[UUID, datetime], dict[str, float]] = defaultdict(dict)
+        # Events whose task is not loaded in the session; their board is looked up later.
+        self.unresolved_events: list[tuple[UUID, datetime, bool]] = []
+
+    def add(self, board_id: UUID, at: datetime, column: str, amount: float = 1) -> None:
+        deltas = self.metrics[(board_id, hour_bucket(at))]
+        deltas[column] = deltas.get(column, 0) + amount
+
+    def add_event(self, board_id: UUID, at: datetime, *, failed: bool) -> None:
+        self.add(board_id, at, "events_total")
+        if failed:
+            self.add(board_id, at, "events_failed")
+
+    def __call__(self, connection: Connection) -> None:
+        if self.unresolved_events:
+            task_ids = {task_id for task_id, _at, _failed in self.unresolved_events}
+            board_by_task: dict[UUID, UUID | None] = {
+                task_id: board_id
+                for task_id, board_id in connection.execute(
+                    select(col(Task.id), col(Task.board_id)).where(col(Task.id).in_(task_ids)),
+                )
+            }
+            for task_id, at, failed in self.unresolved_events:
+                board_id = board_by_task.get(task_id)
+                if board_id is not None:
+                    self.add_event(board_id, at, failed=failed)
+        # Sorted rows keep lock order stable across concurrent multi-board upserts.
+        metric_rows = [
+            {
+                "board_id": board_id,
+                "bucket_start": bucket_start,
+                **{column: deltas.get(column, 0) for column in METRIC_COLUMNS},
+            }
+            for (board_id, bucket_start), deltas in sorted(self.metrics.items())
+        ]
+        _increment(
+            connection,
+            BoardHourlyMetrics.__table__,  # type: ignore[attr-defined]
+            metric_rows,
+            keys=("board_id", "bucket_start"),
+            counters=METRIC_COLUMNS,
+        )
+
+
+def _collect_task(pending: _PendingRollups, task: Task) -> None:
+    if task.board_id is None:
+        return
+    pending.add(task.board_id, task.created_at, "tasks_created")
+    if task.status in _STATUS_COLUMNS:
+        pending.add(task.board_id, task.created_at, _STATUS_COLUMNS[task.status])
+
+
+def _collect_transition(pending: _PendingRollups, transition: TaskStatusTransition) -> None:
+    column = _STATUS_COLUMNS.get(transition.to_status)
+    if column is None:
+        return
+    pending.add(transition.board_id, transition.at, column)
+    if transition.cycle_time_hours is not None:
+        pending.add(transition.board_id, transition.at, "cycle_time_count")
+        pending.add(
+            transition.board_id,
+            transition.at,
+            "cycle_time_hours_sum",
+            transition.cycle_time_hours,
+        )
+
+
+def _collect_event(session: Session, pending: _PendingRollups, item: ActivityEvent) -> None:
+    if item.task_id is None:
+        return
+    failed = item.event_type.endswith(ERROR_EVENT_SUFFIX)
+    task = session.identity_map.get(identity_key(Task, item.task_id))
+    if isinstance(task, Task) and task.board_id is not None:
+        pending.add_event(task.board_id, item.created_at, failed=failed)
+    else:
+        pending.unresolved_events.append((item.task_id, item.created_at, failed))
+
+
+def _collect_rollups(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: object,
+) -> None:
+    new_rows = [
+        obj for obj in session.new if isinstance(obj, (Task, TaskStatusTransition, ActivityEvent))
+    ]
+    if not new_rows:
+        return
+    pending = queued_after_commit(session, _AFTER_COMMIT_KEY, _PendingRollups)
+    for obj in new_rows:
+        if isinstance(obj, Task):
+            _collect_task(pending, obj)
+        elif isinstance(obj, TaskStatusTransition):
+            _collect_transition(pending, obj)
+        else:
+            _collect_event(session, pending, obj)
+
+
+def _increment(
+    connection: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    *,
+    keys: tuple[str, ...],
+    counters: tuple[str, ...],
+) -> None:
+    """Insert rollup rows, adding to the counters of rows that already exist."""
+    if not rows:
+        return
+    dialect_insert = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+    statement = dialect_insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: table.c[name] + statement.excluded[name] for name in counters},
+    )
+    connection.execute(statement)
+
+
+def install_metric_rollups() -> None:
+    """Register the flush hook that queues rollups on every ORM session (idempotent)."""
+    install_after_commit_hooks()
+    if event.contains(Session, "before_flush", _collect_rollups):
+        return
+    event.listen(Session, "before_flush", _collect_rollups)
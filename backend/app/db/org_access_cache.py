@@ -0,0 +1,171 @@
+"""Per-process cache of organization membership and board grants.
+
+Nearly every user request resolves the caller's membership, its organization and, for
+board routes, the member's explicit board grants. `MemberAccess` snapshots those rows per
+`(user_id, organization_id)` so warm requests skip the queries; the snapshots are
+detached copies that callers attach to their own session before use.
+
+Entries are discarded when a session commits changes to memberships, board grants,
+invites, boards or organizations: ORM writes invalidate the affected organization (or
+member), and bulk `DELETE`/`UPDATE` statements on those tables, whose rows are unknown,
+drop the whole cache. Other processes converge within the TTL, so keep it short.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_invites import OrganizationInvite
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import ORMExecuteState, UOWTransaction
+    from sqlmodel import SQLModel
+
+_PENDING_INFO_KEY = "org_access_pending"
+_TRACKED_MODELS: tuple[type[SQLModel], ...] = (
+    Board,
+    Organization,
+    OrganizationBoardAccess,
+    OrganizationInvite,
+    OrganizationMember,
+)
+
+
+@dataclass(frozen=True)
+class MemberAccess:
+    """Membership, organization and explicit board grants for one user in one org."""
+
+    member: OrganizationMember
+    organization: Organization
+    readable_board_ids: frozenset[UUID]
+    writable_board_ids: frozenset[UUID]
+
+
+org_access_cache: TTLCache[tuple[UUID, UUID], MemberAccess] = TTLCache(
+    ttl_seconds=settings.org_access_cache_ttl_seconds,
+    max_entries=settings.org_access_cache_max_entries,
+)
+
+
+@dataclass
+class _Generation:
+    value: int = 0
+
+
+_generation = _Generation()
+
+
+def current_generation() -> int:
+    """Counter bumped by every invalidation; see `remember`."""
+    return _generation.value
+
+
+def remember(key: tuple[UUID, UUID], access: MemberAccess, *, generation: int) -> None:
+    """Cache `access` unless an invalidation happened since `generation` was read.
+
+    Skipping the store keeps a request that loaded rows just before another request
+    committed a change from caching the old rows after that change's invalidation.
+    """
+    if generation == _generation.value:
+        org_access_cache.set(key, access)
+
+
+@dataclass
+class _PendingInvalidation:
+    organization_ids: set[UUID]
+    member_ids: set[UUID]
+    everything: bool = False
+
+    def apply(self) -> None:
+        _generation.value += 1
+        if self.everything:
+            org_access_cache.clear()
+            return
+        org_access_cache.discard_values(
+            lambda access: access.member.organization_id in self.organization_ids
+            or access.member.id in self.member_ids,
+        )
+
+
+def _pending(session: Session) -> _PendingInvalidation:
+    pending = session.info.get(_PENDING_INFO_KEY)
+    if not isinstance(pending, _PendingInvalidation):
+        pending = _PendingInvalidation(organization_ids=set(), member_ids=set())
+        session.info[_PENDING_INFO_KEY] = pending
+    return pending
+
+
+def _record(pending: _PendingInvalidation, obj: object) -> None:
+    if isinstance(obj, Organization):
+        pending.organization_ids.add(obj.id)
+    elif isinstance(obj, (Board, OrganizationInvite, OrganizationMember)):
+        pending.organization_ids.add(obj.organization_id)
+    elif isinstance(obj, OrganizationBoardAccess):
+        pending.member_ids.add(obj.organization_member_id)
+
+
+def _collect_access_writes(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: object,
+) -> None:
+    # Edited boards do not change anyone's access; only created and deleted ones do.
+    tracked = [obj for obj in (*session.new, *session.deleted) if isinstance(obj, _TRACKED_MODELS)]
+    tracked.extend(
+        obj
+        for obj in session.dirty
+        if isinstance(obj, _TRACKED_MODELS) and not isinstance(obj, Board)
+    )
+    if not tracked:
+        return
+    pending = _pending(session)
+    for obj in tracked:
+        _record(pending, obj)
+
+
+def _collect_bulk_writes(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, _TRACKED_MODELS):
+        return
+    if orm_execute_state.is_delete or not issubclass(mapper.class_, Board):
+        pending = _pending(orm_execute_state.session)
+        pending.everything = True
+        pending.apply()
+
+
+def _invalidate_pending(session: Session, *_args: Any) -> None:
+    # Invalidate after the flush (so later reads in this session see the change) and
+    # again at commit/rollback, dropping anything cached in between from uncommitted rows.
+    pending = session.info.get(_PENDING_INFO_KEY)
+    if isinstance(pending, _PendingInvalidation):
+        pending.apply()
+
+
+def _finish_pending(session: Session, *_args: Any) -> None:
+    pending = session.info.pop(_PENDING_INFO_KEY, None)
+    if isinstance(pending, _PendingInvalidation):
+        pending.apply()
+
+
+def install_org_access_invalidation() -> None:
+    """Register the session hooks that invalidate `org_access_cache` (idempotent)."""
+    if event.contains(Session, "before_flush", _collect_access_writes):
+        return
+    event.listen(Session, "before_flush", _collect_access_writes)
+    event.listen(Session, "do_orm_execute", _collect_bulk_writes)
+    event.listen(Session, "after_flush", _invalidate_pending)
+    event.listen(Session, "after_commit", _finish_pending)
+    event.listen(Session, "after_soft_rollback", _finish_pending)
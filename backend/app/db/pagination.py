@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any, TypeVar
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
+from fastapi import HTTPException, status
+from fastapi_pagination.api import resolve_params
+from fastapi_pagination.bases import AbstractParams
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
 
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.db.counts import EXACT_COUNT, NO_COUNT, CountStrategy, count_rows
+from app.schemas.pagination import (
+    DefaultEstimatedCountKeysetPage,
+    DefaultKeysetPage,
+    DefaultLimitOffsetPage,
+)
 
 if TYPE_CHECKING:
+    from fastapi_pagination.bases import RawParams
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import Select, SelectOfScalar
 
+    from app.db.keyset import KeysetOrder
+    from app.schemas.pagination import KeysetPage
+
 T = TypeVar("T")
 
 Transformer = Callable[
@@ -22,12 +36,158 @@ Transformer = Callable[
 ]
 
 
+@dataclass(frozen=True)
+class _UncountedParams(AbstractParams):
+    """Request params with fastapi-pagination's own `COUNT(*)` switched off."""
+
+    raw: RawParams
+
+    def to_raw_params(self) -> RawParams:
+        return replace(self.raw, include_total=False)
+
+
+@overload
+async def paginate(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    *,
+    transformer: Transformer | None = None,
+    keyset: None = None,
+) -> LimitOffsetPage[T]: ...
+
+
+@overload
+async def paginate(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    *,
+    transformer: Transformer | None = None,
+    count: CountStrategy = EXACT_COUNT,
+    keyset: KeysetOrder,
+) -> KeysetPage[T]: ...
+
+
 async def paginate(
     session: AsyncSession,
     statement: Select[Any] | SelectOfScalar[Any],
     *,
     transformer: Transformer | None = None,
-) -> LimitOffsetPage[T]:
-    """Execute a paginated query and cast to the project page type alias."""
-    page = await _paginate(session, statement, transformer=transformer)
-    return DefaultLimitOffsetPage[T].model_validate(page)
+    count: CountStrategy = EXACT_COUNT,
+    keyset: KeysetOrder | None = None,
+) -> LimitOffsetPage[T] | KeysetPage[T]:
+    """Execute a paginated query and cast to the project page type alias.
+
+    Passing `keyset` orders the statement by that key and opts the endpoint into cursor
+    pagination (pair it with a `DefaultKeysetPage` response model). Requests that send a
+    `cursor` seek past it without `COUNT(*)` or `OFFSET`; requests without one get the
+    regular limit/offset page plus a `next_cursor` to continue from.
+
+    Keyset endpoints may also pass a non-exact `count` (see `app.db.counts`) and declare a
+    `DefaultEstimatedCountKeysetPage` response model, which adds `total_is_approximate`
+    and lets clients skip the count with `include_total=false`.
+    """
+    if keyset is None:
+        if count.mode != "exact":
+            msg = "non-exact count strategies require keyset pagination"
+            raise ValueError(msg)
+        page = await _paginate(session, statement, transformer=transformer)
+        return DefaultLimitOffsetPage[T].model_validate(page)
+
+    statement = keyset.apply(statement)
+    estimated = count.mode != "exact"
+    params: AbstractParams = resolve_params()
+    raw_params = params.to_raw_params().as_limit_offset()
+    limit = raw_params.limit or 0
+    offset = raw_params.offset or 0
+    token = getattr(params, "cursor", None)
+    if token:
+        if offset:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="cursor and offset cannot be combined",
+            )
+        return await _paginate_after_cursor(
+            session,
+            statement,
+            keyset=keyset,
+            token=token,
+            limit=limit,
+            transformer=transformer,
+            estimated=estimated,
+        )
+
+    last_row: list[Any] = []
+
+    async def _capture_last_row(items: Sequence[Any]) -> Sequence[Any]:
+        last_row[:] = items[-1:]
+        return await _apply_transformer(items, transformer)
+
+    page = await _paginate(
+        session,
+        statement,
+        params=_UncountedParams(raw_params),
+        transformer=_capture_last_row,
+    )
+    counted = await count_rows(session, statement, count if raw_params.include_total else NO_COUNT)
+    # Without a total a full page is the best signal that more rows may follow.
+    has_more = (
+        offset + len(page.items) < counted.total
+        if counted.total is not None and not counted.approximate
+        else len(page.items) >= limit
+    )
+    fields: dict[str, Any] = {
+        "items": page.items,
+        "total": counted.total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": keyset.encode(last_row[0]) if last_row and has_more else None,
+    }
+    if estimated:
+        return DefaultEstimatedCountKeysetPage[T].model_validate(
+            {**fields, "total_is_approximate": counted.approximate},
+        )
+    return DefaultKeysetPage[T].model_validate(fields)
+
+
+async def _paginate_after_cursor(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    *,
+    keyset: KeysetOrder,
+    token: str,
+    limit: int,
+    transformer: Transformer | None,
+    estimated: bool,
+) -> KeysetPage[T]:
+    try:
+        position = keyset.decode(token)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        ) from exc
+    # Fetch one extra row to learn whether another page exists without counting.
+    rows = list(await session.exec(statement.where(keyset.after(position)).limit(limit + 1)))
+    rows, has_more = rows[:limit], len(rows) > limit
+    fields: dict[str, Any] = {
+        "items": await _apply_transformer(rows, transformer),
+        "total": None,
+        "limit": limit,
+        "offset": 0,
+        "next_cursor": keyset.encode(rows[-1]) if has_more else None,
+    }
+    if estimated:
+        return DefaultEstimatedCountKeysetPage[T].model_validate(fields)
+    return DefaultKeysetPage[T].model_validate(fields)
+
+
+async def _apply_transformer(
+    items: Sequence[Any],
+    transformer: Transformer | None,
+) -> Sequence[Any]:
+    if transformer is None:
+        return items
+    result = transformer(items)
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -0,0 +1,189 @@
+"""Connection pool sizing per engine role and pool usage telemetry."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.schemas.metrics import DatabasePoolStats
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+# Replica engines get their own roles so their usage is not reported as primary traffic.
+PoolRole = Literal["api", "streams", "worker", "replica", "replica_streams"]
+
+
+@dataclass(frozen=True, slots=True)
+class PoolSizing:
+    """Queue-pool limits applied to one engine."""
+
+    pool_size: int
+    max_overflow: int
+    timeout_seconds: float
+    recycle_seconds: int
+
+
+def pool_sizing(role: PoolRole) -> PoolSizing:
+    """Return the configured pool limits for an engine role."""
+    sizes = {
+        "api": (settings.db_pool_size, settings.db_max_overflow),
+        "streams": (settings.db_stream_pool_size, settings.db_stream_max_overflow),
+        "worker": (settings.db_worker_pool_size, settings.db_worker_max_overflow),
+        "replica": (settings.db_pool_size, settings.db_max_overflow),
+        "replica_streams": (settings.db_stream_pool_size, settings.db_stream_max_overflow),
+    }
+    pool_size, max_overflow = sizes[role]
+    return PoolSizing(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        timeout_seconds=settings.db_pool_timeout_seconds,
+        recycle_seconds=settings.db_pool_recycle_seconds,
+    )
+
+
+@dataclass
+class PoolTelemetry:
+    """Running counters for one engine's connection pool."""
+
+    name: str
+    role: PoolRole
+    sizing: PoolSizing | None
+    checkouts: int = 0
+    checkout_timeouts: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+    connections_opened: int = 0
+    connections_closed: int = 0
+    connections_invalidated: int = 0
+    overflow_checkouts: int = 0
+    engine: AsyncEngine | None = None
+    connected_at: dict[int, float] = field(default_factory=dict)
+
+    def record_wait(self, seconds: float, *, timed_out: bool) -> None:
+        """Record how long a checkout waited for a free connection."""
+        if timed_out:
+            self.checkout_timeouts += 1
+            return
+        self.checkout_wait_seconds_total += seconds
+        self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, seconds)
+
+    def pool_gauge(self, name: str) -> int | None:
+        """Read a live gauge (`checkedout`, `overflow`) from the engine's current pool."""
+        if self.engine is None:
+            return None
+        # `engine.dispose()` swaps in a new pool, so always read through the engine.
+        gauge = getattr(self.engine.sync_engine.pool, name, None)
+        return None if gauge is None else int(gauge())
+
+    def snapshot(self) -> DatabasePoolStats:
+        """Return current counters plus live pool gauges."""
+        now = time.monotonic()
+        ages = [now - opened for opened in self.connected_at.values()]
+        return DatabasePoolStats(
+            name=self.name,
+            role=self.role,
+            pool_size=self.sizing.pool_size if self.sizing else None,
+            max_overflow=self.sizing.max_overflow if self.sizing else None,
+            checked_out=self.pool_gauge("checkedout"),
+            overflow=self.pool_gauge("overflow"),
+            checkouts_total=self.checkouts,
+            overflow_checkouts_total=self.overflow_checkouts,
+            checkout_timeouts_total=self.checkout_timeouts,
+            checkout_wait_seconds_total=round(self.checkout_wait_seconds_total, 6),
+            checkout_wait_seconds_max=round(self.checkout_wait_seconds_max, 6),
+            connections_open=len(ages),
+            connections_opened_total=self.connections_opened,
+            connections_closed_total=self.connections_closed,
+            connections_invalidated_total=self.connections_invalidated,
+            connection_age_seconds_max=round(max(ages), 3) if ages else 0.0,
+            connection_age_seconds_avg=round(sum(ages) / len(ages), 3) if ages else 0.0,
+        )
+
+
+_registry: dict[str, PoolTelemetry] = {}
+
+
+def pool_telemetry() -> list[PoolTelemetry]:
+    """Return telemetry for every engine created through `create_role_engine`."""
+    return list(_registry.values())
+
+
+def _timed_pool_class(telemetry: PoolTelemetry) -> type[AsyncAdaptedQueuePool]:
+    # Pool events fire only after a connection is handed out, so time the wait inside the
+    # pool itself. A per-engine subclass survives `Pool.recreate()` on invalidation.
+    class _TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        def _do_get(self) -> ConnectionPoolEntry:
+            started = time.perf_counter()
+            try:
+                entry = super()._do_get()
+            except PoolTimeoutError:
+                telemetry.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            telemetry.record_wait(time.perf_counter() - started, timed_out=False)
+            return entry
+
+    return _TimedAsyncAdaptedQueuePool
+
+
+def _attach_pool_events(engine: AsyncEngine, telemetry: PoolTelemetry) -> None:
+    sync_engine = engine.sync_engine
+
+    def _on_connect(_dbapi_conn: Any, record: ConnectionPoolEntry) -> None:
+        telemetry.connections_opened += 1
+        telemetry.connected_at[id(record)] = time.monotonic()
+
+    def _on_close(_dbapi_conn: Any, record: ConnectionPoolEntry) -> None:
+        telemetry.connections_closed += 1
+        telemetry.connected_at.pop(id(record), None)
+
+    def _on_invalidate(_dbapi_conn: Any, _record: ConnectionPoolEntry, _exc: Any) -> None:
+        telemetry.connections_invalidated += 1
+
+    def _on_checkout(
+        _dbapi_conn: Any,
+        _record: ConnectionPoolEntry,
+        _proxy: PoolProxiedConnection,
+    ) -> None:
+        telemetry.checkouts += 1
+        if (telemetry.pool_gauge("overflow") or 0) > 0:
+            telemetry.overflow_checkouts += 1
+
+    event.listen(sync_engine, "connect", _on_connect)
+    event.listen(sync_engine, "close", _on_close)
+    event.listen(sync_engine, "invalidate", _on_invalidate)
+    event.listen(sync_engine, "checkout", _on_checkout)
+
+
+def create_role_engine(url: str, *, name: str, role: PoolRole) -> AsyncEngine:
+    """Create an async engine sized for `role` with pool telemetry attached.
+
+    SQLite URLs (tests, local experiments) keep SQLAlchemy's default pool because queue
+    sizing does not apply to them.
+    """
+    sizing = None if url.startswith("sqlite") else pool_sizing(role)
+    telemetry = PoolTelemetry(name=name, role=role, sizing=sizing)
+    if sizing is None:
+        engine = create_async_engine(url, pool_pre_ping=True)
+    else:
+        engine = create_async_engine(
+            url,
+            pool_pre_ping=True,
+            poolclass=_timed_pool_class(telemetry),
+            pool_size=sizing.pool_size,
+            max_overflow=sizing.max_overflow,
+            pool_timeout=sizing.timeout_seconds,
+            pool_recycle=sizing.recycle_seconds,
+        )
+    telemetry.engine = engine
+    _attach_pool_events(engine, telemetry)
+    _registry[name] = telemetry
+    return engine
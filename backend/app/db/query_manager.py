@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from sqlalchemy import false
 from sqlmodel import SQLModel, col
 
+from app.db.loader import entity_loader
 from app.db.queryset import QuerySet, qs
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
 ModelT = TypeVar("ModelT", bound=SQLModel)
 
@@ -80,6 +82,27 @@ class ModelManager(Generic[ModelT]):
             return self.none()
         return self.filter(col(getattr(self.model, field_name)).in_(seq))
 
+    async def load(self, session: AsyncSession, obj_id: object) -> ModelT | None:
+        """Return the row with primary key `obj_id`, memoized for the session."""
+        return await entity_loader(session).load(self.model, obj_id)
+
+    async def load_many(
+        self,
+        session: AsyncSession,
+        obj_ids: Iterable[object],
+    ) -> dict[Any, ModelT]:
+        """Return rows keyed by primary key, batching unseen ids into one query."""
+        return await entity_loader(session).load_many(self.model, obj_ids)
+
+    async def load_related(self, session: AsyncSession, **kwargs: object) -> list[ModelT]:
+        """Return rows matching field equality values, memoized until the session writes."""
+        key = (self.model, tuple(sorted(kwargs.items())))
+        rows = await entity_loader(session).related(
+            key,
+            lambda: self.filter_by(**kwargs).all(session),
+        )
+        return list(rows)
+
 
 class ManagerDescriptor(Generic[ModelT]):
     """Descriptor that exposes a model-bound `ModelManager` as `.objects`."""
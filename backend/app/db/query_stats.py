@@ -0,0 +1,177 @@
+"""Per-request SQL statement counters and N+1 detection.
+
+`track_queries()` binds a `QueryStats` collector to the current context (the request-id
+middleware opens one per HTTP request). Engine-level cursor hooks then count every
+statement, time it, and group it by a normalized fingerprint so a request that runs the
+same query shape many times (the usual N+1 signature) can be flagged in logs.
+
+A query budget can also be set; with `db_query_budget_enforce` enabled (dev and test
+environments) the statement that exceeds it raises `QueryBudgetExceededError` instead
+of only logging. A closed collector ignores further statements: the middleware closes it
+when the response starts, so a streaming body (SSE pollers, which inherit the context)
+is neither counted nor held to the request's budget.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Connection, ExecutionContext
+
+_QUERY_STATS_CONTEXT: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_STARTED_AT_ATTR = "_query_stats_started_at"
+_FINGERPRINT_MAX_LENGTH = 300
+_REPEATED_STATEMENTS_IN_SUMMARY = 3
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised when a tracked scope runs more statements than its enforced budget."""
+
+
+def statement_fingerprint(statement: str) -> str:
+    """Normalize SQL so statements differing only in bound values compare equal."""
+    normalized = _PLACEHOLDER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    # Expanded `IN (...)` lists vary in length with their input; collapse them.
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    return normalized[:_FINGERPRINT_MAX_LENGTH]
+
+
+@dataclass
+class QueryStats:
+    """Statement count, database time and repeated fingerprints for one scope."""
+
+    budget: int | None = None
+    enforce_budget: bool = False
+    n_plus_one_threshold: int = 0
+    query_count: int = 0
+    db_time_seconds: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    closed: bool = False
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether more statements ran than the configured budget allows."""
+        return self.budget is not None and self.query_count > self.budget
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        """Return fingerprints executed more than once, most frequent first."""
+        return [(sql, count) for sql, count in self.fingerprints.most_common() if count > 1]
+
+    def n_plus_one_suspects(self) -> list[tuple[str, int]]:
+        """Return repeated fingerprints at or above the N+1 threshold."""
+        if self.n_plus_one_threshold <= 0:
+            return []
+        return [
+            (sql, count)
+            for sql, count in self.repeated_statements()
+            if count >= self.n_plus_one_threshold
+        ]
+
+    def summary(self) -> dict[str, object]:
+        """Return log fields describing the statements seen so far."""
+        return {
+            "db_query_count": self.query_count,
+            "db_time_ms": round(self.db_time_seconds * 1000, 1),
+            "db_repeated_statements": [
+                {"count": count, "statement": sql}
+                for sql, count in self.repeated_statements()[:_REPEATED_STATEMENTS_IN_SUMMARY]
+            ],
+            "db_n_plus_one": bool(self.n_plus_one_suspects()),
+        }
+
+    def close(self) -> None:
+        """Stop counting; statements run afterwards in this context are ignored."""
+        self.closed = True
+
+    def _record_start(self, statement: str) -> None:
+        self.query_count += 1
+        self.fingerprints[statement_fingerprint(statement)] += 1
+        if self.enforce_budget and self.over_budget:
+            raise QueryBudgetExceededError(
+                f"query budget of {self.budget} exceeded: {statement_fingerprint(statement)}",
+            )
+
+
+@contextmanager
+def track_queries(
+    *,
+    budget: int | None = None,
+    enforce_budget: bool | None = None,
+) -> Iterator[QueryStats]:
+    """Collect statement stats for everything executed inside the block.
+
+    `budget` defaults to `db_query_budget_per_request` (0 means unlimited) and
+    `enforce_budget` to `db_query_budget_enforce`.
+    """
+    install_query_instrumentation()
+    if budget is None:
+        budget = settings.db_query_budget_per_request
+    stats = QueryStats(
+        budget=budget or None,
+        enforce_budget=(
+            settings.db_query_budget_enforce if enforce_budget is None else enforce_budget
+        ),
+        n_plus_one_threshold=settings.db_n_plus_one_threshold,
+    )
+    token = _QUERY_STATS_CONTEXT.set(stats)
+    try:
+        yield stats
+    finally:
+        _QUERY_STATS_CONTEXT.reset(token)
+
+
+def _before_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,
+    statement: str,
+    _parameters: Any,
+    context: ExecutionContext | None,
+    _executemany: bool,
+) -> None:
+    stats = _QUERY_STATS_CONTEXT.get()
+    if stats is None or stats.closed:
+        return
+    if context is not None:
+        setattr(context, _STARTED_AT_ATTR, time.perf_counter())
+    stats._record_start(statement)
+
+
+def _after_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: ExecutionContext | None,
+    _executemany: bool,
+) -> None:
+    stats = _QUERY_STATS_CONTEXT.get()
+    started_at = getattr(context, _STARTED_AT_ATTR, None)
+    if stats is None or stats.closed or started_at is None:
+        return
+    stats.db_time_seconds += time.perf_counter() - started_at
+
+
+def install_query_instrumentation() -> None:
+    """Attach the cursor hooks to every engine (idempotent)."""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
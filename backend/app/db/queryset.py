@@ -13,6 +13,8 @@ if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import SelectOfScalar
 
+    from app.db.keyset import KeysetOrder
+
 ModelT = TypeVar("ModelT")
 
 
@@ -50,6 +52,16 @@ class QuerySet(Generic[ModelT]):
         statement = self.statement.order_by(*ordering)
         return replace(self, statement=statement)
 
+    def keyset(
+        self,
+        order: KeysetOrder,
+        *,
+        after: str | None = None,
+    ) -> QuerySet[ModelT]:
+        """Return a new queryset in keyset `order`, seeking past an opaque `after` cursor."""
+        position = order.decode(after) if after else None
+        return replace(self, statement=order.apply(self.statement, after=position))
+
     def limit(self, value: int) -> QuerySet[ModelT]:
         """Return a new queryset with a SQL row limit."""
         return replace(self, statement=self.statement.limit(value))
@@ -0,0 +1,335 @@
+"""Read-replica routing for safe-method requests and stream pollers.
+
+When `DATABASE_REPLICA_URLS` is set, read-only endpoints and SSE pollers can take their
+session from a replica instead of the primary. Routing falls back to the primary when:
+
+- no replica is configured;
+- the request uses an unsafe method (writes always go to the primary);
+- the same actor wrote recently (read-your-writes stickiness);
+- the request carries credentials whose actor has not been resolved yet;
+- every replica is lagging beyond `database_replica_max_lag_seconds` or unreachable.
+
+Stickiness is keyed on the authenticated user or agent id, which auth dependencies record
+with `note_request_actor`, so it survives credential rotation (Clerk session JWTs are
+re-issued about every minute). Endpoints using `get_read_session` must declare their auth
+dependency first.
+
+Replica health is tracked per process. Stickiness is shared through Redis when
+`database_read_your_writes_redis_url` is set: the process that served the write stores a
+key that expires after `database_read_your_writes_seconds`, and every process checks it
+before routing a read to a replica. If Redis cannot be reached, reads go to the primary.
+Without that URL, stickiness is tracked per process and read-your-writes only holds for
+follow-up reads served by the same process.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+import redis
+import redis.asyncio as redis_asyncio
+from fastapi import Depends, Request
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.pool_telemetry import create_role_engine
+from app.db.session import get_session, normalize_database_url, stream_session_maker
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+REPLICA_HEALTH_CHECK_SECONDS = 5.0
+_STICKY_PRUNE_THRESHOLD = 4096
+_REDIS_STICKY_KEY_PREFIX = "mission_control:read_your_writes:"
+# `request.state` (scope["state"]) attribute holding the resolved actor key.
+_ACTOR_KEY_STATE = "replica_actor_key"
+_CREDENTIAL_HEADERS = ("x-agent-token", "authorization")
+# A replica that has replayed everything it received is current even when the primary is
+# idle, so only measure replay age while WAL is still outstanding.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END",
+)
+
+logger = get_logger(__name__)
+SESSION_DEP = Depends(get_session)
+
+
+def note_request_actor(
+    request: Request,
+    actor_type: Literal["user", "agent"],
+    actor_id: UUID,
+) -> None:
+    """Record the authenticated actor so replica stickiness follows it, not its token."""
+    setattr(request.state, _ACTOR_KEY_STATE, f"{actor_type}:{actor_id}")
+
+
+def request_actor_key(request: Request) -> str | None:
+    """Return the actor key recorded by auth for this request, if any."""
+    key = getattr(request.state, _ACTOR_KEY_STATE, None)
+    return key if isinstance(key, str) else None
+
+
+def _scope_actor_key(scope: Scope) -> str | None:
+    key = scope.get("state", {}).get(_ACTOR_KEY_STATE)
+    return key if isinstance(key, str) else None
+
+
+def _session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@dataclass
+class _Replica:
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    stream_session_maker: async_sessionmaker[AsyncSession]
+    checked_at: float = -math.inf
+    healthy: bool = True
+
+
+class ReadReplicaRouter:
+    """Choose between replica and primary session makers for read traffic."""
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        max_lag_seconds: float,
+        sticky_seconds: float,
+        stream_engines: Sequence[AsyncEngine] | None = None,
+        health_check_seconds: float = REPLICA_HEALTH_CHECK_SECONDS,
+        redis_url: str = "",
+    ) -> None:
+        """Route over `engines`; `stream_engines[i]` is the stream pool for `engines[i]`.
+
+        Without `stream_engines`, stream pollers share each replica's request pool. With
+        `redis_url`, stickiness is shared with every router using the same Redis.
+        """
+        if stream_engines is None:
+            stream_engines = engines
+        if len(stream_engines) != len(engines):
+            msg = "stream_engines must pair one-to-one with engines"
+            raise ValueError(msg)
+        self._replicas = [
+            _Replica(
+                engine=engine,
+                session_maker=_session_maker(engine),
+                stream_session_maker=_session_maker(stream_engine),
+            )
+            for engine, stream_engine in zip(engines, stream_engines, strict=True)
+        ]
+        self._max_lag_seconds = max_lag_seconds
+        self._sticky_seconds = sticky_seconds
+        self._health_check_seconds = health_check_seconds
+        self._sticky_until: dict[str, float] = {}
+        self._next_index = 0
+        self._redis_url = redis_url
+        self._redis: redis_asyncio.Redis | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any replica is configured."""
+        return bool(self._replicas)
+
+    def _redis_client(self) -> redis_asyncio.Redis:
+        if self._redis is None:
+            self._redis = redis_asyncio.Redis.from_url(self._redis_url)
+        return self._redis
+
+    async def note_write(self, actor_key: str | None) -> None:
+        """Pin `actor_key` to the primary for the stickiness window."""
+        if actor_key is None or not self.enabled:
+            return
+        now = time.monotonic()
+        if len(self._sticky_until) >= _STICKY_PRUNE_THRESHOLD:
+            self._sticky_until = {
+                key: until for key, until in self._sticky_until.items() if until > now
+            }
+        self._sticky_until[actor_key] = now + self._sticky_seconds
+        if not self._redis_url:
+            return
+        sticky_ms = max(1, math.ceil(self._sticky_seconds * 1000))
+        try:
+            await self._redis_client().set(
+                f"{_REDIS_STICKY_KEY_PREFIX}{actor_key}",
+                "1",
+                px=sticky_ms,
+            )
+        except redis.RedisError as exc:
+            # Only this process knows about the write; others may serve stale reads.
+            logger.warning("db.replica.sticky_write_failed", extra={"error": str(exc)})
+
+    async def is_sticky(self, actor_key: str | None) -> bool:
+        """Whether `actor_key` wrote recently enough to need primary reads."""
+        if actor_key is None:
+            return False
+        if self._sticky_until.get(actor_key, 0.0) > time.monotonic():
+            return True
+        if not self._redis_url:
+            return False
+        try:
+            return bool(await self._redis_client().exists(f"{_REDIS_STICKY_KEY_PREFIX}{actor_key}"))
+        except redis.RedisError as exc:
+            # A write from another process cannot be ruled out; the primary is always fresh.
+            logger.warning("db.replica.sticky_check_failed", extra={"error": str(exc)})
+            return True
+
+    async def close(self) -> None:
+        """Release the shared stickiness Redis client, if one was opened."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def replica_for(
+        self,
+        actor_key: str | None,
+        *,
+        stream: bool = False,
+    ) -> async_sessionmaker[AsyncSession] | None:
+        """Return a healthy replica session maker, or `None` to use the primary.
+
+        `stream=True` selects the replica's stream-poller pool.
+        """
+        if not self.enabled or await self.is_sticky(actor_key):
+            return None
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[self._next_index % len(self._replicas)]
+            self._next_index += 1
+            if await self._is_usable(replica):
+                return replica.stream_session_maker if stream else replica.session_maker
+        return None
+
+    def mark_failed(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        """Take a replica out of rotation until its next health check."""
+        for replica in self._replicas:
+            if session_maker in (replica.session_maker, replica.stream_session_maker):
+                replica.healthy = False
+                replica.checked_at = time.monotonic()
+
+    async def _is_usable(self, replica: _Replica) -> bool:
+        now = time.monotonic()
+        if now - replica.checked_at < self._health_check_seconds:
+            return replica.healthy
+        replica.checked_at = now
+        try:
+            async with replica.engine.connect() as conn:
+                if conn.dialect.name != "postgresql":
+                    await conn.execute(text("SELECT 1"))
+                    lag = 0.0
+                else:
+                    lag = float((await conn.execute(_REPLICA_LAG_SQL)).scalar_one() or 0)
+        except (SQLAlchemyError, OSError) as exc:
+            replica.healthy = False
+            logger.warning("db.replica.unavailable", extra={"error": str(exc)})
+            return False
+        replica.healthy = lag <= self._max_lag_seconds
+        if not replica.healthy:
+            logger.warning("db.replica.lagging", extra={"lag_seconds": lag})
+        return replica.healthy
+
+
+def _replica_urls() -> list[str]:
+    return [url.strip() for url in settings.database_replica_urls.split(",") if url.strip()]
+
+
+replica_engines: list[AsyncEngine] = [
+    create_role_engine(normalize_database_url(url), name=f"replica-{index}", role="replica")
+    for index, url in enumerate(_replica_urls())
+]
+# Stream pollers get a separate pool per replica, mirroring the primary's stream engine.
+replica_stream_engines: list[AsyncEngine] = [
+    create_role_engine(
+        normalize_database_url(url),
+        name=f"replica-{index}-streams",
+        role="replica_streams",
+    )
+    for index, url in enumerate(_replica_urls())
+]
+read_router = ReadReplicaRouter(
+    replica_engines,
+    stream_engines=replica_stream_engines,
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    sticky_seconds=settings.database_read_your_writes_seconds,
+    redis_url=settings.database_read_your_writes_redis_url,
+)
+
+
+@asynccontextmanager
+async def read_session(actor_key: str | None = None) -> AsyncIterator[AsyncSession]:
+    """Open a stream-poller session, preferring a replica when one is usable."""
+    replica_maker = await read_router.replica_for(actor_key, stream=True)
+    async with (replica_maker or stream_session_maker)() as session:
+        try:
+            yield session
+        except DBAPIError as exc:
+            if replica_maker is not None and exc.connection_invalidated:
+                read_router.mark_failed(replica_maker)
+            raise
+
+
+async def get_read_session(
+    request: Request,
+    session: AsyncSession = SESSION_DEP,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a replica session for safe-method requests, or the primary request session.
+
+    Only use this on endpoints that never write: the primary `session` is shared with
+    auth dependencies and stays in place for any writes they make.
+    """
+    actor_key = request_actor_key(request)
+    unresolved = actor_key is None and any(request.headers.get(h) for h in _CREDENTIAL_HEADERS)
+    if request.method not in SAFE_METHODS or unresolved:
+        # Without a resolved actor, stickiness cannot be checked; the primary is always safe.
+        yield session
+        return
+    replica_maker = await read_router.replica_for(actor_key)
+    if replica_maker is None:
+        yield session
+        return
+    async with replica_maker() as replica_session:
+        try:
+            yield replica_session
+        except DBAPIError as exc:
+            if exc.connection_invalidated:
+                read_router.mark_failed(replica_maker)
+            raise
+
+
+class ReadYourWritesMiddleware:
+    """Pin actors to the primary after they send a write request."""
+
+    def __init__(self, app: ASGIApp, *, router: ReadReplicaRouter = read_router) -> None:
+        self._app = app
+        self._router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Record unsafe-method requests before their response is sent."""
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or not self._router.enabled:
+            await self._app(scope, receive, send)
+            return
+
+        # Share one state dict with inner layers even if they copy the scope.
+        scope.setdefault("state", {})
+
+        async def send_after_noting_write(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # The write has committed by the time the response starts, and auth has
+                # recorded the actor; pin before the client can issue a follow-up read.
+                await self._router.note_write(_scope_actor_key(scope))
+            await send(message)
+
+        await self._app(scope, receive, send_after_noting_write)
@@ -8,22 +8,30 @@ from typing import TYPE_CHECKING
 
 from alembic.config import Config
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import models as _models
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.db.board_versions import install_board_version_tracking
+from app.db.metric_rollups import install_metric_rollups
+from app.db.org_access_cache import install_org_access_invalidation
+from app.db.pool_telemetry import create_role_engine
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 # Import model modules so SQLModel metadata is fully registered at startup.
 _MODEL_REGISTRY = _models
+install_board_version_tracking()
+install_metric_rollups()
+install_org_access_invalidation()
 
 
-def _normalize_database_url(database_url: str) -> str:
+def normalize_database_url(database_url: str) -> str:
+    """Select the psycopg driver for bare `postgresql://` URLs."""
     if "://" not in database_url:
         return database_url
     scheme, rest = database_url.split("://", 1)
@@ -32,15 +40,39 @@ def _normalize_database_url(database_url: str) -> str:
     return database_url
 
 
-async_engine: AsyncEngine = create_async_engine(
-    _normalize_database_url(settings.database_url),
-    pool_pre_ping=True,
+async_engine: AsyncEngine = create_role_engine(
+    normalize_database_url(settings.database_url),
+    name="primary",
+    role="api",
 )
 async_session_maker = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+# SSE pollers hold a session for every poll of every open stream; give them their own pool
+# so a burst of streams cannot exhaust connections for regular requests.
+stream_engine: AsyncEngine = create_role_engine(
+    normalize_database_url(settings.database_url),
+    name="primary-streams",
+    role="streams",
+)
+stream_session_maker = async_sessionmaker(
+    stream_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+# Queue workers (webhook delivery, lifecycle reconcile) run in their own process.
+worker_engine: AsyncEngine = create_role_engine(
+    normalize_database_url(settings.database_url),
+    name="primary-worker",
+    role="worker",
+)
+worker_session_maker = async_sessionmaker(
+    worker_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 logger = get_logger(__name__)
 
 
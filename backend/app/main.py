@@ -25,6 +25,7 @@ from app.api.gateway import router as gateway_router
 from app.api.gateways import router as gateways_router
 from app.api.metrics import router as metrics_router
 from app.api.organizations import router as organizations_router
+from app.api.search import router as search_router
 from app.api.skills_marketplace import router as skills_marketplace_router
 from app.api.souls_directory import router as souls_directory_router
 from app.api.tags import router as tags_router
@@ -35,6 +36,8 @@ from app.core.config import settings
 from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
 from app.core.security_headers import SecurityHeadersMiddleware
+from app.db.agent_presence import agent_presence
+from app.db.replicas import ReadYourWritesMiddleware, read_router
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
 
@@ -128,6 +131,13 @@ OPENAPI_TAGS = [
         "name": "users",
         "description": "User profile read/update operations and user-centric settings endpoints.",
     },
+    {
+        "name": "search",
+        "description": (
+            "Ranked keyword search over tasks, task comments and board memory, scoped to a "
+            "board, board group or organization."
+        ),
+    },
     {
         "name": "agent",
         "description": (
@@ -178,6 +188,7 @@ _OPENAPI_EXAMPLE_TAGS = {
     "custom-fields",
     "tags",
     "users",
+    "search",
 }
 _GENERIC_RESPONSE_DESCRIPTIONS = {"Successful Response", "Validation Error"}
 _HTTP_RESPONSE_DESCRIPTIONS = {
@@ -437,10 +448,13 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    agent_presence.start()
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        await agent_presence.stop()
+        await read_router.close()
         logger.info("app.lifecycle.stopped")
 
 
@@ -459,7 +473,13 @@ if origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["X-Total-Count", "X-Limit", "X-Offset"],
+        expose_headers=[
+            "X-Total-Count",
+            "X-Total-Count-Approximate",
+            "X-Limit",
+            "X-Offset",
+            "ETag",
+        ],
     )
     logger.info("app.cors.enabled origins_count=%s", len(origins))
 else:
@@ -472,6 +492,7 @@ app.add_middleware(
     referrer_policy=settings.security_header_referrer_policy,
     permissions_policy=settings.security_header_permissions_policy,
 )
+app.add_middleware(ReadYourWritesMiddleware)
 install_error_handling(app)
 
 
@@ -551,6 +572,7 @@ api_v1.include_router(tasks_router)
 api_v1.include_router(task_custom_fields_router)
 api_v1.include_router(tags_router)
 api_v1.include_router(users_router)
+api_v1.include_router(search_router)
 app.include_router(api_v1)
 
 add_pagination(app)
@@ -7,7 +7,9 @@ from app.models.approvals import Approval
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
 from app.models.board_memory import BoardMemory
+from app.models.board_metrics import BoardHourlyMetrics
 from app.models.board_onboarding import BoardOnboardingSession
+from app.models.board_versions import BoardVersion
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
@@ -27,6 +29,7 @@ from app.models.task_custom_fields import (
 )
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.models.users import User
 
@@ -39,7 +42,9 @@ __all__ = [
     "BoardWebhook",
     "BoardWebhookPayload",
     "BoardMemory",
+    "BoardHourlyMetrics",
     "BoardOnboardingSession",
+    "BoardVersion",
     "BoardGroup",
     "Board",
     "Gateway",
@@ -57,6 +62,7 @@ __all__ = [
     "TaskDependency",
     "Task",
     "TaskFingerprint",
+    "TaskStatusTransition",
     "Tag",
     "TagAssignment",
     "User",
@@ -14,7 +14,13 @@ RUNTIME_ANNOTATION_TYPES = (datetime,)
 
 
 class ActivityEvent(QueryModel, table=True):
-    """Discrete activity event tied to tasks and agents."""
+    """Discrete activity event tied to tasks and agents.
+
+    On PostgreSQL the table is range-partitioned by month on `created_at`, so its primary
+    key there is `(id, created_at)`; see `app.services.activity_partitions`. It also has a
+    generated `search_vector` column, unmapped here, that `app.services.search` queries for
+    task comments.
+    """
 
     __tablename__ = "activity_events"  # pyright: ignore[reportAssignmentType]
 
@@ -0,0 +1,30 @@
+"""Hourly per-board metric rollups read by the dashboard metrics endpoint."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field
+
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class BoardHourlyMetrics(QueryModel, table=True):
+    """Task transition and activity counters for one board and one UTC hour."""
+
+    __tablename__ = "board_hourly_metrics"  # pyright: ignore[reportAssignmentType]
+
+    board_id: UUID = Field(foreign_key="boards.id", primary_key=True)
+    bucket_start: datetime = Field(primary_key=True)
+    tasks_created: int = Field(default=0)
+    moved_to_in_progress: int = Field(default=0)
+    moved_to_review: int = Field(default=0)
+    moved_to_done: int = Field(default=0)
+    # Cycle time is in-progress start to review, in hours; sum/count give the average.
+    cycle_time_count: int = Field(default=0)
+    cycle_time_hours_sum: float = Field(default=0.0)
+    events_total: int = Field(default=0)
+    events_failed: int = Field(default=0)
@@ -0,0 +1,18 @@
+"""Per-board snapshot version counters, kept off the `boards` row."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlmodel import Field
+
+from app.models.base import QueryModel
+
+
+class BoardVersion(QueryModel, table=True):
+    """Counter bumped after commits that change rows shown in a board snapshot."""
+
+    __tablename__ = "board_versions"  # pyright: ignore[reportAssignmentType]
+
+    board_id: UUID = Field(foreign_key="boards.id", primary_key=True)
+    version: int = Field(default=0)
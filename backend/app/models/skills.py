@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import JSON, Column, Computed, String, UniqueConstraint
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -14,9 +14,23 @@ from app.models.tenancy import TenantScoped
 
 RUNTIME_ANNOTATION_TYPES = (datetime,)
 
+# Generated-column expressions; the migration that adds the columns repeats them verbatim.
+MARKETPLACE_CATEGORY_KEY_SQL = "lower(trim(coalesce(category, '')))"
+MARKETPLACE_RISK_KEY_SQL = "lower(trim(coalesce(risk, '')))"
+MARKETPLACE_SEARCH_TEXT_SQL = (
+    "lower(coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || "
+    "coalesce(category, '') || ' ' || coalesce(risk, '') || ' ' || coalesce(source, ''))"
+)
+
 
 class MarketplaceSkill(TenantScoped, table=True):
-    """A marketplace skill entry that can be installed onto one or more gateways."""
+    """A marketplace skill entry that can be installed onto one or more gateways.
+
+    `category_key`, `risk_key` and `search_text` are stored generated columns the database
+    derives from the descriptive fields, so list filters and keyword search hit plain
+    indexes instead of wrapping every row in `lower(trim(...))`. An empty key means
+    uncategorized. Never assign them.
+    """
 
     __tablename__ = "marketplace_skills"  # pyright: ignore[reportAssignmentType]
     __table_args__ = (
@@ -39,6 +53,18 @@ class MarketplaceSkill(TenantScoped, table=True):
         default_factory=dict,
         sa_column=Column("metadata", JSON, nullable=False),
     )
+    category_key: str | None = Field(
+        default=None,
+        sa_column=Column(String, Computed(MARKETPLACE_CATEGORY_KEY_SQL, persisted=True)),
+    )
+    risk_key: str | None = Field(
+        default=None,
+        sa_column=Column(String, Computed(MARKETPLACE_RISK_KEY_SQL, persisted=True)),
+    )
+    search_text: str | None = Field(
+        default=None,
+        sa_column=Column(String, Computed(MARKETPLACE_SEARCH_TEXT_SQL, persisted=True)),
+    )
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
 
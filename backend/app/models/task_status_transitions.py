@@ -0,0 +1,29 @@
+"""Append-only history of task status changes."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class TaskStatusTransition(QueryModel, table=True):
+    """One task moving from one status to another, with the acting agent if any."""
+
+    __tablename__ = "task_status_transitions"  # pyright: ignore[reportAssignmentType]
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(foreign_key="boards.id")
+    task_id: UUID = Field(foreign_key="tasks.id", index=True)
+    from_status: str | None = None
+    to_status: str
+    agent_id: UUID | None = Field(default=None, foreign_key="agents.id")
+    # Hours since the task entered in-progress, set on transitions into review.
+    cycle_time_hours: float | None = None
+    at: datetime = Field(default_factory=utcnow)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import JSON, Column
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -14,7 +15,11 @@ RUNTIME_ANNOTATION_TYPES = (datetime,)
 
 
 class Task(TenantScoped, table=True):
-    """Board-scoped task entity with ownership, status, and timing fields."""
+    """Board-scoped task entity with ownership, status, and timing fields.
+
+    On PostgreSQL the table also has a generated `search_vector` column used by
+    `app.services.search`; it is not mapped here.
+    """
 
     __tablename__ = "tasks"  # pyright: ignore[reportAssignmentType]
 
@@ -41,6 +46,13 @@ class Task(TenantScoped, table=True):
     )
     auto_created: bool = Field(default=False)
     auto_reason: str | None = None
+    # Unresolved dependency ids, kept current by dependency and status writes so reads
+    # and "unblocked" filters never recompute them; see `task_dependencies`.
+    blocked_by_task_ids: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON, nullable=False),
+    )
+    blocked_by_count: int = Field(default=0)
 
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
@@ -48,7 +48,15 @@ from app.schemas.souls_directory import (
     SoulsDirectorySoulRef,
 )
 from app.schemas.tags import TagCreate, TagRead, TagRef, TagUpdate
-from app.schemas.tasks import TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkCreate,
+    TaskBulkRead,
+    TaskBulkUpdate,
+    TaskBulkUpdateItem,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.schemas.users import UserCreate, UserRead, UserUpdate
 
 __all__ = [
@@ -103,6 +111,10 @@ __all__ = [
     "TagRead",
     "TagRef",
     "TagUpdate",
+    "TaskBulkCreate",
+    "TaskBulkRead",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateItem",
     "TaskCreate",
     "TaskRead",
     "TaskUpdate",
@@ -78,3 +78,31 @@ class DashboardMetrics(SQLModel):
     cycle_time: DashboardSeriesSet
     error_rate: DashboardSeriesSet
     wip: DashboardWipSeriesSet
+
+
+class DatabasePoolStats(SQLModel):
+    """Connection pool gauges and counters for one database engine."""
+
+    name: str
+    role: Literal["api", "streams", "worker", "replica", "replica_streams"]
+    pool_size: int | None
+    max_overflow: int | None
+    checked_out: int | None
+    overflow: int | None
+    checkouts_total: int
+    overflow_checkouts_total: int
+    checkout_timeouts_total: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+    connections_open: int
+    connections_opened_total: int
+    connections_closed_total: int
+    connections_invalidated_total: int
+    connection_age_seconds_max: float
+    connection_age_seconds_avg: float
+
+
+class DatabasePoolMetrics(SQLModel):
+    """Pool telemetry for every engine in this API process."""
+
+    pools: list[DatabasePoolStats]
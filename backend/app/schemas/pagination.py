@@ -2,21 +2,74 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from fastapi import Query
+from fastapi_pagination.bases import RawParams
 from fastapi_pagination.customization import CustomizedPage, UseParamsFields
-from fastapi_pagination.limit_offset import LimitOffsetPage
+from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
+from fastapi_pagination.types import GreaterEqualZero
+from pydantic import Field
 
 T = TypeVar("T")
 
 
+class KeysetParams(LimitOffsetParams):
+    """Limit/offset params extended with an opaque keyset `cursor`."""
+
+    cursor: str | None = Query(
+        None,
+        description="Opaque `next_cursor` from a previous page; replaces `offset` when set.",
+    )
+
+
+class KeysetPage(LimitOffsetPage[T], Generic[T]):
+    """Limit/offset page that also supports cursor (keyset) navigation.
+
+    Without `cursor` the page behaves exactly like `LimitOffsetPage`. With `cursor` the
+    query seeks past the encoded position instead of scanning `offset` rows, and `total`
+    is omitted because counting would cost as much as the scan it replaces.
+    """
+
+    total: GreaterEqualZero | None = None  # type: ignore[assignment]
+    next_cursor: str | None = Field(None, description="Cursor for the next page, if any")
+
+    __params_type__ = KeysetParams
+
+
+class EstimatedCountKeysetParams(KeysetParams):
+    """Keyset params that also let clients skip the `total` count."""
+
+    include_total: bool = Query(
+        True,
+        description="Set to false to skip computing `total` (returned as null).",
+    )
+
+    def to_raw_params(self) -> RawParams:
+        """Return raw params carrying the client's `include_total` choice."""
+        return RawParams(limit=self.limit, offset=self.offset, include_total=self.include_total)
+
+
+class EstimatedCountKeysetPage(KeysetPage[T], Generic[T]):
+    """Keyset page for endpoints whose `total` may come from an estimate or a cache.
+
+    Only endpoints that pass a non-exact `CountStrategy` to `paginate` use this page;
+    `total_is_approximate` is set when the total is a planner estimate or cached reuse.
+    """
+
+    total_is_approximate: bool = Field(False, description="Whether `total` is an estimate")
+
+    __params_type__ = EstimatedCountKeysetParams
+
+
 # Project-wide default pagination response model.
 # - Keep `limit` / `offset` naming (matches existing API conventions).
 # - Cap list endpoints to 200 items per request (matches prior route-level constraints).
 if TYPE_CHECKING:
     # Type checkers treat this as a normal generic page type.
     DefaultLimitOffsetPage = LimitOffsetPage
+    DefaultKeysetPage = KeysetPage
+    DefaultEstimatedCountKeysetPage = EstimatedCountKeysetPage
 else:
     # Runtime uses project-default query param bounds for all list endpoints.
     DefaultLimitOffsetPage = CustomizedPage[
@@ -26,3 +79,19 @@ else:
             offset=Query(0, ge=0),
         ),
     ]
+    # Opt-in variant for large, append-heavy lists: same params plus `cursor`.
+    DefaultKeysetPage = CustomizedPage[
+        KeysetPage[T],
+        UseParamsFields(
+            limit=Query(200, ge=1, le=200),
+            offset=Query(0, ge=0),
+        ),
+    ]
+    # Keyset variant for endpoints that opt in to estimated or cached totals.
+    DefaultEstimatedCountKeysetPage = CustomizedPage[
+        EstimatedCountKeysetPage[T],
+        UseParamsFields(
+            limit=Query(200, ge=1, le=200),
+            offset=Query(0, ge=0),
+        ),
+    ]
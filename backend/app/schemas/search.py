@@ -0,0 +1,27 @@
+"""Schemas for full-text search results across tasks, comments and board memory."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime, UUID)
+SearchKind = Literal["task", "comment", "memory"]
+
+
+class SearchHit(SQLModel):
+    """One ranked search match with a highlighted snippet."""
+
+    kind: SearchKind
+    id: UUID
+    board_id: UUID
+    # Set for task and comment hits; the comment's task for comments.
+    task_id: UUID | None = None
+    task_title: str | None = None
+    # Matched terms are wrapped in `**`.
+    snippet: str
+    rank: float
+    created_at: datetime
@@ -15,6 +15,7 @@ from app.schemas.task_custom_fields import TaskCustomFieldValues
 
 TaskStatus = Literal["inbox", "in_progress", "review", "done"]
 STATUS_REQUIRED_ERROR = "status is required"
+TASK_BULK_MAX_ITEMS = 100
 # Keep these symbols as runtime globals so Pydantic can resolve
 # deferred annotations reliably.
 RUNTIME_ANNOTATION_TYPES = (datetime, UUID, NonEmptyStr, TagRef)
@@ -72,6 +73,24 @@ class TaskUpdate(SQLModel):
         return self
 
 
+class TaskBulkCreate(SQLModel):
+    """Payload for creating several tasks in one transaction."""
+
+    items: list[TaskCreate] = Field(min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """One entry of a bulk update: the task id plus its partial update."""
+
+    id: UUID
+
+
+class TaskBulkUpdate(SQLModel):
+    """Payload for updating several tasks on one board in one transaction."""
+
+    items: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+
 class TaskRead(TaskBase):
     """Task payload returned from read endpoints."""
 
@@ -87,6 +106,12 @@ class TaskRead(TaskBase):
     custom_field_values: TaskCustomFieldValues | None = None
 
 
+class TaskBulkRead(SQLModel):
+    """Tasks written by a bulk request, in request order."""
+
+    items: list[TaskRead]
+
+
 class TaskCommentCreate(SQLModel):
     """Payload for creating a task comment."""
 
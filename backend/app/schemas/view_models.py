@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
@@ -35,6 +36,20 @@ class TaskCardRead(TaskRead):
     approvals_pending_count: int = 0
 
 
+BoardSnapshotSection = Literal["tasks", "agents", "approvals", "chat"]
+
+
+class BoardSnapshotTaskColumn(SQLModel):
+    """Per-status task totals for a paginated board snapshot."""
+
+    status: str
+    total: int = 0
+    loaded: int = 0
+    has_more: bool = False
+    # Pass to the column endpoint to load the rest of the column.
+    next_cursor: str | None = None
+
+
 class BoardSnapshot(SQLModel):
     """Aggregated board payload used by board snapshot endpoints."""
 
@@ -44,6 +59,16 @@ class BoardSnapshot(SQLModel):
     approvals: list[ApprovalRead]
     chat_messages: list[BoardMemoryRead]
     pending_approvals_count: int = 0
+    # Set only when tasks are paginated per status column.
+    task_columns: list[BoardSnapshotTaskColumn] | None = None
+
+
+class BoardSnapshotTaskPage(SQLModel):
+    """One page of a board snapshot status column."""
+
+    status: str
+    items: list[TaskCardRead] = Field(default_factory=list)
+    next_cursor: str | None = None
 
 
 class BoardGroupTaskSummary(SQLModel):
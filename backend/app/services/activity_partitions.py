@@ -0,0 +1,347 @@
+"""Partition upkeep, retention and archival for `activity_events`.
+
+On PostgreSQL `activity_events` is range-partitioned by month on `created_at`
+(`activity_events_pYYYY_MM`, plus a DEFAULT partition for stray rows). Maintenance:
+
+- creates the partitions for the next few months before rows arrive for them;
+- deletes events past their per-`event_type` retention (for example heartbeats after a
+  week), in bounded batches so no single statement holds locks for long;
+- exports partitions older than the archive horizon to gzip-compressed NDJSON in
+  `activity_events_archive_dir`, then detaches and drops them. Event types users still
+  see (`activity_events_archive_keep_types`, task comments by default) are not archived:
+  they are re-inserted in the same transaction and land in the DEFAULT partition.
+
+Dashboard metrics are served from hourly rollups, so pruning events does not change
+historical charts. Partition steps are no-ops on other databases; retention runs anywhere.
+Each step takes a transaction-scoped advisory lock so concurrent workers skip instead of
+racing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlmodel import col
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db import crud
+from app.models.activity_events import ActivityEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Mapping
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+PARENT_TABLE = "activity_events"
+DEFAULT_PARTITION = "activity_events_default"
+_PARTITION_NAME = re.compile(r"^activity_events_p(\d{4})_(\d{2})$")
+# Arbitrary constant shared by every worker for pg_try_advisory_xact_lock.
+_ADVISORY_LOCK_KEY = 0x61637469
+_COLUMNS = ("id", "event_type", "message", "agent_id", "task_id", "created_at")
+# Rows serialized per worker-thread write while exporting an archive.
+_ARCHIVE_WRITE_BATCH = 1000
+
+
+@dataclass
+class MaintenanceResult:
+    """What one maintenance run changed."""
+
+    partitions_created: list[str] = field(default_factory=list)
+    events_deleted: dict[str, int] = field(default_factory=dict)
+    archived: list[Path] = field(default_factory=list)
+
+
+def parse_retention_policy(raw: str) -> dict[str, int]:
+    """Parse `event_type=days` pairs separated by commas into a mapping."""
+    policy: dict[str, int] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        event_type, sep, days = item.partition("=")
+        event_type = event_type.strip()
+        if not sep or not event_type or not days.strip().isdigit():
+            msg = f"Invalid activity retention entry {item.strip()!r}; expected event_type=days."
+            raise ValueError(msg)
+        policy[event_type] = int(days)
+    return policy
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Return the first day of the month `months` after `value`'s month."""
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the partition holding rows created during `month`."""
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """Inverse of `partition_name`; `None` for other tables (e.g. the default partition)."""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def parse_event_types(raw: str) -> frozenset[str]:
+    """Parse a comma-separated list of event types."""
+    return frozenset(item.strip() for item in raw.split(",") if item.strip())
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _close_durably(handle: IO[str], partial: Path, path: Path) -> None:
+    handle.close()
+    with partial.open("rb") as written:
+        os.fsync(written.fileno())
+    partial.replace(path)
+
+
+async def write_ndjson_archive(path: Path, rows: AsyncIterable[Mapping[str, Any]]) -> int:
+    """Write `rows` as gzip-compressed NDJSON, atomically replacing `path`.
+
+    File I/O runs in worker threads so compression never blocks the event loop; the file
+    is fsynced before it replaces `path`. Returns the number of rows written.
+    """
+    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.partial")
+    handle = await asyncio.to_thread(gzip.open, partial, "wt", encoding="utf-8")
+    count = 0
+    try:
+        lines: list[str] = []
+        async for row in rows:
+            lines.append(json.dumps(dict(row), default=_json_default, separators=(",", ":")))
+            lines.append("\n")
+            count += 1
+            if count % _ARCHIVE_WRITE_BATCH == 0:
+                await asyncio.to_thread(handle.writelines, lines)
+                lines = []
+        if lines:
+            await asyncio.to_thread(handle.writelines, lines)
+    except BaseException:
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(partial.unlink, missing_ok=True)
+        raise
+    await asyncio.to_thread(_close_durably, handle, partial, path)
+    return count
+
+
+async def _is_postgres(session: AsyncSession) -> bool:
+    connection = await session.connection()
+    return connection.dialect.name == "postgresql"
+
+
+async def _try_lock(session: AsyncSession) -> bool:
+    if not await _is_postgres(session):
+        return True
+    acquired = await session.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"),
+        {"key": _ADVISORY_LOCK_KEY},
+    )
+    return bool(acquired)
+
+
+async def _attached_partitions(session: AsyncSession) -> set[str]:
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent",
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return set(result.scalars())
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    months_ahead: int,
+) -> list[str]:
+    """Create monthly partitions from the current month through `months_ahead` months."""
+    if not await _is_postgres(session):
+        return []
+    # No attached partitions means the table is not partitioned (migration not applied).
+    if not await _try_lock(session) or not (existing := await _attached_partitions(session)):
+        await session.rollback()
+        return []
+    created: list[str] = []
+    for offset in range(months_ahead + 1):
+        lower = add_months(now, offset)
+        upper = add_months(now, offset + 1)
+        name = partition_name(lower)
+        if name in existing:
+            continue
+        # A new range cannot be attached while the default partition holds rows in it.
+        stray = await session.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :lower AND created_at < :upper)",
+            ),
+            {"lower": lower, "upper": upper},
+        )
+        if stray:
+            logger.warning(
+                "activity_partitions.default_has_rows",
+                extra={"partition": name},
+            )
+            continue
+        await session.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')",
+            ),
+        )
+        created.append(name)
+    await session.commit()
+    return created
+
+
+async def apply_retention(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    policy: Mapping[str, int],
+    batch_size: int,
+) -> dict[str, int]:
+    """Delete events older than their type's retention; returns deletions per type."""
+    deleted: dict[str, int] = {}
+    for event_type, days in sorted(policy.items()):
+        cutoff = now - timedelta(days=days)
+        total = 0
+        while True:
+            if not await _try_lock(session):
+                await session.rollback()
+                break
+            batch = (
+                select(col(ActivityEvent.id))
+                .where(col(ActivityEvent.event_type) == event_type)
+                .where(col(ActivityEvent.created_at) < cutoff)
+                .limit(batch_size)
+            )
+            count = await crud.delete_where(
+                session,
+                ActivityEvent,
+                col(ActivityEvent.id).in_(batch),
+                commit=True,
+            )
+            total += count
+            if count < batch_size:
+                break
+        if total:
+            deleted[event_type] = total
+    return deleted
+
+
+async def archive_partitions(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    after_months: int,
+    archive_dir: Path,
+    keep_event_types: frozenset[str] = frozenset(),
+) -> list[Path]:
+    """Export, detach and drop partitions wholly older than `after_months` months.
+
+    Rows whose `event_type` is in `keep_event_types` are not exported; they are copied out
+    before the drop and re-inserted, so they move to the DEFAULT partition instead.
+    """
+    if after_months <= 0 or not await _is_postgres(session):
+        return []
+    horizon = add_months(now, -after_months)
+    keep = sorted(keep_event_types)
+    archived: list[Path] = []
+    for name in sorted(await _attached_partitions(session)):
+        month = partition_month(name)
+        if month is None or add_months(month, 1) > horizon:
+            continue
+        if not await _try_lock(session) or name not in await _attached_partitions(session):
+            await session.rollback()
+            continue
+        columns = ", ".join(_COLUMNS)
+        export = f"SELECT {columns} FROM {name}"
+        if keep:
+            export += " WHERE NOT (event_type = ANY(:keep))"
+        rows = await session.stream(text(f"{export} ORDER BY created_at, id"), {"keep": keep})
+        path = archive_dir / f"{name}.ndjson.gz"
+        count = await write_ndjson_archive(path, (row._asdict() async for row in rows))
+        kept_table = f"{name}_kept"
+        if keep:
+            await session.execute(
+                text(
+                    f"CREATE TEMPORARY TABLE {kept_table} ON COMMIT DROP AS "
+                    f"SELECT {columns} FROM {name} WHERE event_type = ANY(:keep)",
+                ),
+                {"keep": keep},
+            )
+        await session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        await session.execute(text(f"DROP TABLE {name}"))
+        if keep:
+            # The month's range is gone, so these rows route to the DEFAULT partition.
+            # Columns are named because the parent's generated `search_vector` rejects
+            # explicit values and is recomputed on insert.
+            await session.execute(
+                text(
+                    f"INSERT INTO {PARENT_TABLE} ({columns}) "
+                    f"SELECT {columns} FROM {kept_table}",
+                ),
+            )
+        await session.commit()
+        logger.info(
+            "activity_partitions.archived",
+            extra={"partition": name, "rows": count, "path": str(path)},
+        )
+        archived.append(path)
+    return archived
+
+
+async def run_maintenance(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+) -> MaintenanceResult:
+    """Run every maintenance step with the configured settings."""
+    now = now or utcnow()
+    result = MaintenanceResult()
+    result.partitions_created = await ensure_partitions(
+        session,
+        now=now,
+        months_ahead=settings.activity_events_partition_months_ahead,
+    )
+    result.events_deleted = await apply_retention(
+        session,
+        now=now,
+        policy=parse_retention_policy(settings.activity_events_retention_days),
+        batch_size=settings.activity_events_retention_batch_size,
+    )
+    result.archived = await archive_partitions(
+        session,
+        now=now,
+        after_months=settings.activity_events_archive_after_months,
+        archive_dir=Path(settings.activity_events_archive_dir),
+        keep_event_types=parse_event_types(settings.activity_events_archive_keep_types),
+    )
+    return result
@@ -9,6 +9,7 @@ from uuid import UUID
 from sqlalchemy import case, delete, exists, func
 from sqlmodel import col, select
 
+from app.db.board_versions import mark_tasks_changed
 from app.models.approval_task_links import ApprovalTaskLink
 from app.models.approvals import Approval
 from app.models.tasks import Task
@@ -113,11 +114,13 @@ async def replace_approval_task_links(
     task_ids: Sequence[UUID],
 ) -> None:
     """Replace approval-task link rows for an approval id."""
-    await session.exec(
-        delete(ApprovalTaskLink).where(
-            col(ApprovalTaskLink.approval_id) == approval_id,
-        ),
+    removed = await session.exec(
+        delete(ApprovalTaskLink)
+        .where(col(ApprovalTaskLink.approval_id) == approval_id)
+        .returning(col(ApprovalTaskLink.task_id)),
     )
+    # The bulk delete bypasses the flush hook; bump boards of unlinked and linked tasks.
+    mark_tasks_changed(session, [*removed.scalars().all(), *task_ids])
     for task_id in task_ids:
         session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task_id))
 
@@ -1,8 +1,17 @@
-"""Helpers for assembling board-group snapshot view models."""
+"""Helpers for assembling board-group snapshot view models.
+
+Group dashboards span many boards, so per-board task limits are applied in SQL with a
+window function, independent reads run concurrently on separate pooled connections, and
+finished snapshots are cached per process under a fingerprint of the group's board
+versions: any write to a board in the group (or boards joining or leaving it) changes the
+fingerprint.
+"""
 
 from __future__ import annotations
 
+import hashlib
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -10,8 +19,12 @@ from sqlalchemy import case, func
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
+from app.core.ttl_cache import SingleFlight, TTLCache
+from app.db.concurrency import gather_reads
 from app.models.agents import Agent
 from app.models.board_groups import BoardGroup
+from app.models.board_versions import BoardVersion
 from app.models.boards import Board
 from app.models.tasks import Task
 from app.schemas.board_groups import BoardGroupRead
@@ -24,6 +37,8 @@ from app.schemas.view_models import (
 from app.services.tags import TagState, load_tag_state
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from sqlalchemy.sql.elements import ColumnElement
 
 _STATUS_ORDER = {"in_progress": 0, "review": 1, "inbox": 2, "done": 3}
@@ -48,16 +63,18 @@ async def _boards_for_group(
     *,
     group_id: UUID,
     exclude_board_id: UUID | None = None,
-) -> list[Board]:
-    """Return boards belonging to a board group with optional exclusion."""
-    statement = Board.objects.filter_by(board_group_id=group_id).statement
+) -> list[tuple[Board, int]]:
+    """Return boards belonging to a board group, with their versions, minus an exclusion."""
+    version = func.coalesce(col(BoardVersion.version), 0)
+    statement = (
+        select(Board, version)
+        .outerjoin(BoardVersion, col(BoardVersion.board_id) == col(Board.id))
+        .where(col(Board.board_group_id) == group_id)
+    )
     if exclude_board_id is not None:
         statement = statement.where(col(Board.id) != exclude_board_id)
-    return list(
-        await session.exec(
-            statement.order_by(func.lower(col(Board.name)).asc()),
-        ),
-    )
+    rows = await session.exec(statement.order_by(func.lower(col(Board.name)).asc()))
+    return [(board, int(board_version)) for board, board_version in rows]
 
 
 async def _task_counts_by_board(
@@ -84,18 +101,32 @@ async def _ordered_tasks_for_boards(
     board_ids: list[UUID],
     *,
     include_done: bool,
+    per_board_task_limit: int,
 ) -> list[Task]:
-    """Return sorted tasks for boards, optionally excluding completed tasks."""
-    task_statement = select(Task).where(col(Task.board_id).in_(board_ids))
-    if not include_done:
-        task_statement = task_statement.where(col(Task.status) != "done")
-    task_statement = task_statement.order_by(
-        col(Task.board_id).asc(),
+    """Return the first `per_board_task_limit` sorted tasks of each board."""
+    if per_board_task_limit <= 0:
+        return []
+    ordering = (
         _status_weight_expr().asc(),
         _priority_weight_expr().asc(),
         col(Task.updated_at).desc(),
         col(Task.created_at).desc(),
     )
+    ranked = select(
+        col(Task.id),
+        func.row_number()
+        .over(partition_by=col(Task.board_id), order_by=ordering)
+        .label("board_rank"),
+    ).where(col(Task.board_id).in_(board_ids))
+    if not include_done:
+        ranked = ranked.where(col(Task.status) != "done")
+    ranked_subquery = ranked.subquery()
+    task_statement = (
+        select(Task)
+        .join(ranked_subquery, col(Task.id) == ranked_subquery.c.id)
+        .where(ranked_subquery.c.board_rank <= per_board_task_limit)
+        .order_by(col(Task.board_id).asc(), ranked_subquery.c.board_rank.asc())
+    )
     return list(await session.exec(task_statement))
 
 
@@ -164,6 +195,77 @@ def _task_summaries_by_board(
     return tasks_by_board
 
 
+def _boards_fingerprint(group: BoardGroup, versioned_boards: list[tuple[Board, int]]) -> str:
+    """Return a digest of the group row and the id/version of every board in it."""
+    digest = hashlib.sha256(f"{group.id}:{group.updated_at.isoformat()}".encode())
+    for board, version in sorted(versioned_boards, key=lambda item: item[0].id):
+        digest.update(f"|{board.id}:{version}".encode())
+    return digest.hexdigest()
+
+
+_GroupSnapshotKey = tuple[UUID, UUID | None, bool, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedGroupSnapshot:
+    fingerprint: str
+    snapshot: BoardGroupSnapshot
+
+
+class GroupSnapshotCache:
+    """Per-process cache of group snapshots keyed by request shape and board versions."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._entries: TTLCache[_GroupSnapshotKey, _CachedGroupSnapshot] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+        self._builds: SingleFlight[_GroupSnapshotKey] = SingleFlight()
+
+    def clear(self) -> None:
+        """Drop every cached snapshot."""
+        self._entries.clear()
+
+    def _matching(self, key: _GroupSnapshotKey, fingerprint: str) -> _CachedGroupSnapshot | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        return entry
+
+    async def get_or_build(
+        self,
+        key: _GroupSnapshotKey,
+        fingerprint: str,
+        build: Callable[[], Awaitable[BoardGroupSnapshot]],
+    ) -> BoardGroupSnapshot:
+        """Return the snapshot cached for `key` at `fingerprint`, building once on a miss."""
+        if not self._entries.enabled:
+            return await build()
+        entry = await self._builds.run(
+            key,
+            lambda: self._matching(key, fingerprint),
+            lambda: self._build(key, fingerprint, build),
+        )
+        # Callers filter `boards` per member; hand out a copy so the entry stays intact.
+        return entry.snapshot.model_copy()
+
+    async def _build(
+        self,
+        key: _GroupSnapshotKey,
+        fingerprint: str,
+        build: Callable[[], Awaitable[BoardGroupSnapshot]],
+    ) -> _CachedGroupSnapshot:
+        entry = _CachedGroupSnapshot(fingerprint=fingerprint, snapshot=await build())
+        self._entries.set(key, entry)
+        return entry
+
+
+group_snapshot_cache = GroupSnapshotCache(
+    ttl_seconds=settings.board_group_snapshot_cache_ttl_seconds,
+    max_entries=settings.board_group_snapshot_cache_max_entries,
+)
+
+
 async def build_group_snapshot(
     session: AsyncSession,
     *,
@@ -173,27 +275,53 @@ async def build_group_snapshot(
     per_board_task_limit: int = 5,
 ) -> BoardGroupSnapshot:
     """Build a board-group snapshot with board/task summaries."""
-    boards = await _boards_for_group(
+    versioned_boards = await _boards_for_group(
         session,
         group_id=group.id,
         exclude_board_id=exclude_board_id,
     )
-    if not boards:
+    if not versioned_boards:
         return BoardGroupSnapshot(
             group=BoardGroupRead.model_validate(group, from_attributes=True),
         )
+    key = (group.id, exclude_board_id, include_done, per_board_task_limit)
+    return await group_snapshot_cache.get_or_build(
+        key,
+        _boards_fingerprint(group, versioned_boards),
+        lambda: _assemble_group_snapshot(
+            session,
+            group=group,
+            boards=[board for board, _version in versioned_boards],
+            include_done=include_done,
+            per_board_task_limit=per_board_task_limit,
+        ),
+    )
+
+
+async def _assemble_group_snapshot(
+    session: AsyncSession,
+    *,
+    group: BoardGroup,
+    boards: list[Board],
+    include_done: bool,
+    per_board_task_limit: int,
+) -> BoardGroupSnapshot:
     boards_by_id = {board.id: board for board in boards}
     board_ids = list(boards_by_id.keys())
-    task_counts = await _task_counts_by_board(session, board_ids)
-    tasks = await _ordered_tasks_for_boards(
+    task_counts, tasks = await gather_reads(
         session,
-        board_ids,
-        include_done=include_done,
+        lambda forked: _task_counts_by_board(forked, board_ids),
+        lambda forked: _ordered_tasks_for_boards(
+            forked,
+            board_ids,
+            include_done=include_done,
+            per_board_task_limit=per_board_task_limit,
+        ),
     )
-    agent_name_by_id = await _agent_names(session, tasks)
-    tag_state_by_task_id = await load_tag_state(
+    agent_name_by_id, tag_state_by_task_id = await gather_reads(
         session,
-        task_ids=[task.id for task in tasks],
+        lambda forked: _agent_names(forked, tasks),
+        lambda forked: load_tag_state(forked, task_ids=[task.id for task in tasks]),
     )
     tasks_by_board = _task_summaries_by_board(
         boards_by_id=boards_by_id,
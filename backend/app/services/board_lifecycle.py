@@ -17,7 +17,9 @@ from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
 from app.models.approvals import Approval
 from app.models.board_memory import BoardMemory
+from app.models.board_metrics import BoardHourlyMetrics
 from app.models.board_onboarding import BoardOnboardingSession
+from app.models.board_versions import BoardVersion
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
 from app.models.organization_board_access import OrganizationBoardAccess
@@ -26,6 +28,7 @@ from app.models.tag_assignments import TagAssignment
 from app.models.task_custom_fields import BoardTaskCustomField, TaskCustomFieldValue
 from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.common import OkResponse
 from app.services.openclaw.gateway_resolver import gateway_client_config, require_gateway_for_board
@@ -121,6 +124,17 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
         col(BoardWebhookPayload.board_id) == board.id,
     )
     await crud.delete_where(session, BoardWebhook, col(BoardWebhook.board_id) == board.id)
+    await crud.delete_where(
+        session,
+        BoardHourlyMetrics,
+        col(BoardHourlyMetrics.board_id) == board.id,
+    )
+    await crud.delete_where(session, BoardVersion, col(BoardVersion.board_id) == board.id)
+    await crud.delete_where(
+        session,
+        TaskStatusTransition,
+        col(TaskStatusTransition.board_id) == board.id,
+    )
     await crud.delete_where(
         session,
         BoardOnboardingSession,
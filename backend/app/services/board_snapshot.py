@@ -1,12 +1,29 @@
-"""Helpers for assembling denormalized board snapshot response payloads."""
+"""Helpers for assembling denormalized board snapshot response payloads.
+
+Dashboards poll `GET /boards/{id}/snapshot` constantly, so serialized snapshots are cached
+per process and keyed by the board's version counter (see `app.db.board_versions`).
+Concurrent misses for one board share a single build, and the body hash doubles as the
+response `ETag` so unchanged snapshots can be answered with `304 Not Modified`.
+
+Large boards can ask for only some sections and for the head of each task status column
+(`SnapshotOptions`); the remaining cards are paged in per column with
+`build_task_column_page`.
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, get_args
+from uuid import UUID
 
 from sqlalchemy import func
 from sqlmodel import col, select
 
+from app.core.config import settings
+from app.core.ttl_cache import SingleFlight, TTLCache
+from app.db.board_versions import board_version
+from app.db.keyset import KeysetOrder
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.board_memory import BoardMemory
@@ -14,23 +31,49 @@ from app.models.tasks import Task
 from app.schemas.approvals import ApprovalRead
 from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
-from app.schemas.view_models import BoardSnapshot, TaskCardRead
+from app.schemas.tasks import TaskStatus
+from app.schemas.view_models import (
+    BoardSnapshot,
+    BoardSnapshotSection,
+    BoardSnapshotTaskColumn,
+    BoardSnapshotTaskPage,
+    TaskCardRead,
+)
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
-from app.services.task_dependencies import (
-    blocked_by_dependency_ids,
-    dependency_ids_by_task_id,
-    dependency_status_by_id,
-)
+from app.services.task_dependencies import dependency_ids_by_task_id, stored_blocked_by_ids
 
 if TYPE_CHECKING:
-    from uuid import UUID
+    from collections.abc import Awaitable, Callable
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
 
+ALL_SNAPSHOT_SECTIONS: frozenset[BoardSnapshotSection] = frozenset(get_args(BoardSnapshotSection))
+TASK_STATUS_COLUMNS: tuple[str, ...] = get_args(TaskStatus)
+SNAPSHOT_TASK_ORDER = KeysetOrder.desc(col(Task.created_at), col(Task.id))
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotOptions:
+    """Which parts of a board snapshot to build; hashable so it can key the cache."""
+
+    sections: frozenset[BoardSnapshotSection] = ALL_SNAPSHOT_SECTIONS
+    # Load at most this many tasks per status column; `None` loads whole columns.
+    tasks_per_status: int | None = None
+    # Skip done cards (their column still reports a total) so first paint stays cheap.
+    include_done: bool = True
+
+    @property
+    def paginated(self) -> bool:
+        """Whether tasks are returned per status column instead of all at once."""
+        return self.tasks_per_status is not None or not self.include_done
+
+
+FULL_SNAPSHOT = SnapshotOptions()
+
 
 def _memory_to_read(memory: BoardMemory) -> BoardMemoryRead:
     return BoardMemoryRead.model_validate(memory, from_attributes=True)
@@ -59,22 +102,18 @@ def _task_to_card(
     agent_name_by_id: dict[UUID, str],
     counts_by_task_id: dict[UUID, tuple[int, int]],
     deps_by_task_id: dict[UUID, list[UUID]],
-    dependency_status_by_id_map: dict[UUID, str],
     tag_state_by_task_id: dict[UUID, TagState],
 ) -> TaskCardRead:
-    card = TaskCardRead.model_validate(task, from_attributes=True)
     approvals_count, approvals_pending_count = counts_by_task_id.get(task.id, (0, 0))
     assignee = agent_name_by_id.get(task.assigned_agent_id) if task.assigned_agent_id else None
     depends_on_task_ids = deps_by_task_id.get(task.id, [])
     tag_state = tag_state_by_task_id.get(task.id, TagState())
-    blocked_by_task_ids = blocked_by_dependency_ids(
-        dependency_ids=depends_on_task_ids,
-        status_by_id=dependency_status_by_id_map,
-    )
-    if task.status == "done":
-        blocked_by_task_ids = []
-    return card.model_copy(
-        update={
+    blocked_by_task_ids = stored_blocked_by_ids(task)
+    # One validation pass over the row dump is several times cheaper than validating from
+    # attributes and then copying the model with the computed fields.
+    return TaskCardRead.model_validate(
+        {
+            **task.model_dump(),
             "assignee": assignee,
             "approvals_count": approvals_count,
             "approvals_pending_count": approvals_pending_count,
@@ -87,16 +126,18 @@ def _task_to_card(
     )
 
 
-async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnapshot:
-    """Build a board snapshot with tasks, agents, approvals, and chat history."""
-    board_read = BoardRead.model_validate(board, from_attributes=True)
-
-    tasks = list(
-        await Task.objects.filter_by(board_id=board.id)
-        .order_by(col(Task.created_at).desc())
-        .all(session),
-    )
+async def _task_cards(
+    session: AsyncSession,
+    board: Board,
+    tasks: list[Task],
+    *,
+    agent_name_by_id: dict[UUID, str],
+    whole_board: bool = False,
+) -> list[TaskCardRead]:
+    """Build cards for `tasks`; `whole_board` says they are every task on the board."""
     task_ids = [task.id for task in tasks]
+    if not task_ids:
+        return []
     tag_state_by_task_id = await load_tag_state(
         session,
         task_ids=task_ids,
@@ -107,94 +148,215 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         board_id=board.id,
         task_ids=task_ids,
     )
-    all_dependency_ids: list[UUID] = []
-    for values in deps_by_task_id.values():
-        all_dependency_ids.extend(values)
-    dependency_status_by_id_map = await dependency_status_by_id(
+    counts_by_task_id = await task_counts_for_board(
         session,
         board_id=board.id,
-        dependency_ids=list({*all_dependency_ids}),
-    )
-
-    agents = (
-        await Agent.objects.filter_by(board_id=board.id)
-        .order_by(col(Agent.created_at).desc())
-        .all(session)
-    )
-    agent_reads = [
-        AgentLifecycleService.to_agent_read(AgentLifecycleService.with_computed_status(agent))
-        for agent in agents
-    ]
-    agent_name_by_id = {agent.id: agent.name for agent in agents}
-
-    pending_approvals_count = int(
-        (
-            await session.exec(
-                select(func.count(col(Approval.id)))
-                .where(col(Approval.board_id) == board.id)
-                .where(col(Approval.status) == "pending"),
-            )
-        ).one(),
-    )
-
-    approvals = (
-        await Approval.objects.filter_by(board_id=board.id)
-        .order_by(col(Approval.created_at).desc())
-        .limit(200)
-        .all(session)
+        # A full board needs no id list; an `IN` over every task only slows the plan down.
+        task_ids=None if whole_board else set(task_ids),
     )
-    approval_ids = [approval.id for approval in approvals]
-    task_ids_by_approval = await load_task_ids_by_approval(
-        session,
-        approval_ids=approval_ids,
-    )
-    task_title_by_id = {task.id: task.title for task in tasks}
-    # Hydrate each approval with linked task metadata, falling back to legacy
-    # single-task fields so older rows still render complete approval cards.
-    approval_reads = [
-        _approval_to_read(
-            approval,
-            task_ids=(
-                linked_task_ids := task_ids_by_approval.get(
-                    approval.id,
-                    [approval.task_id] if approval.task_id is not None else [],
-                )
-            ),
-            task_titles=[
-                task_title_by_id[task_id]
-                for task_id in linked_task_ids
-                if task_id in task_title_by_id
-            ],
-        )
-        for approval in approvals
-    ]
-
-    counts_by_task_id = await task_counts_for_board(session, board_id=board.id)
-
-    task_cards = [
+    return [
         _task_to_card(
             task,
             agent_name_by_id=agent_name_by_id,
             counts_by_task_id=counts_by_task_id,
             deps_by_task_id=deps_by_task_id,
-            dependency_status_by_id_map=dependency_status_by_id_map,
             tag_state_by_task_id=tag_state_by_task_id,
         )
         for task in tasks
     ]
 
-    chat_messages = (
-        await BoardMemory.objects.filter_by(board_id=board.id)
-        .filter(col(BoardMemory.is_chat).is_(True))
-        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
-        # satisfy the NonEmptyStr response schema.
-        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
-        .order_by(col(BoardMemory.created_at).desc())
-        .limit(200)
-        .all(session)
+
+async def _load_task_columns(
+    session: AsyncSession,
+    board: Board,
+    options: SnapshotOptions,
+) -> tuple[list[Task], list[BoardSnapshotTaskColumn]]:
+    counts = {
+        status: int(total)
+        for status, total in await session.exec(
+            select(col(Task.status), func.count())
+            .where(col(Task.board_id) == board.id)
+            .group_by(col(Task.status)),
+        )
+    }
+    statuses = [
+        status for status in TASK_STATUS_COLUMNS if options.include_done or status != "done"
+    ]
+    statement = select(Task).where(col(Task.board_id) == board.id)
+    if options.tasks_per_status is not None:
+        # Rank rows inside each status column so one query returns the head of every column.
+        status_rank = (
+            func.row_number()
+            .over(partition_by=col(Task.status), order_by=SNAPSHOT_TASK_ORDER.clauses())
+            .label("status_rank")
+        )
+        ranked = (
+            select(col(Task.id), status_rank)
+            .where(col(Task.board_id) == board.id)
+            .where(col(Task.status).in_(statuses))
+            .subquery()
+        )
+        statement = statement.join(ranked, col(Task.id) == ranked.c.id).where(
+            ranked.c.status_rank <= options.tasks_per_status,
+        )
+    else:
+        statement = statement.where(col(Task.status).in_(statuses))
+    tasks = list(await session.exec(SNAPSHOT_TASK_ORDER.apply(statement)))
+
+    columns: list[BoardSnapshotTaskColumn] = []
+    for status in TASK_STATUS_COLUMNS:
+        loaded = [task for task in tasks if task.status == status]
+        total = counts.get(status, 0)
+        has_more = len(loaded) < total
+        columns.append(
+            BoardSnapshotTaskColumn(
+                status=status,
+                total=total,
+                loaded=len(loaded),
+                has_more=has_more,
+                next_cursor=SNAPSHOT_TASK_ORDER.encode(loaded[-1]) if loaded and has_more else None,
+            ),
+        )
+    return tasks, columns
+
+
+async def _approval_task_titles(
+    session: AsyncSession,
+    board: Board,
+    task_ids: set[UUID],
+    known: dict[UUID, str],
+) -> dict[UUID, str]:
+    missing = task_ids - known.keys()
+    if not missing:
+        return known
+    rows = await session.exec(
+        select(col(Task.id), col(Task.title))
+        .where(col(Task.board_id) == board.id)
+        .where(col(Task.id).in_(missing)),
+    )
+    return {**known, **dict(rows.all())}
+
+
+async def build_board_snapshot(
+    session: AsyncSession,
+    board: Board,
+    options: SnapshotOptions = FULL_SNAPSHOT,
+) -> BoardSnapshot:
+    """Build a board snapshot with the sections selected in `options`."""
+    # Computed agent statuses are written onto the loaded rows; never flush them.
+    with session.no_autoflush:
+        return await _build_board_snapshot(session, board, options)
+
+
+async def _build_board_snapshot(
+    session: AsyncSession,
+    board: Board,
+    options: SnapshotOptions,
+) -> BoardSnapshot:
+    board_read = BoardRead.model_validate(board, from_attributes=True)
+    sections = options.sections
+
+    tasks: list[Task] = []
+    task_columns: list[BoardSnapshotTaskColumn] | None = None
+    if "tasks" in sections:
+        if options.paginated:
+            tasks, task_columns = await _load_task_columns(session, board, options)
+        else:
+            tasks = list(
+                await Task.objects.filter_by(board_id=board.id)
+                .order_by(col(Task.created_at).desc())
+                .all(session),
+            )
+
+    agents: list[Agent] = []
+    if "tasks" in sections or "agents" in sections:
+        agents = (
+            await Agent.objects.filter_by(board_id=board.id)
+            .order_by(col(Agent.created_at).desc())
+            .all(session)
+        )
+    agent_reads = (
+        [
+            AgentLifecycleService.to_agent_read(AgentLifecycleService.with_computed_status(agent))
+            for agent in agents
+        ]
+        if "agents" in sections
+        else []
+    )
+    task_cards = await _task_cards(
+        session,
+        board,
+        tasks,
+        agent_name_by_id={agent.id: agent.name for agent in agents},
+        whole_board="tasks" in sections and not options.paginated,
     )
-    chat_messages.sort(key=lambda item: item.created_at)
-    chat_reads = [_memory_to_read(memory) for memory in chat_messages]
+
+    pending_approvals_count = 0
+    approval_reads: list[ApprovalRead] = []
+    if "approvals" in sections:
+        pending_approvals_count = int(
+            (
+                await session.exec(
+                    select(func.count(col(Approval.id)))
+                    .where(col(Approval.board_id) == board.id)
+                    .where(col(Approval.status) == "pending"),
+                )
+            ).one(),
+        )
+        approvals = (
+            await Approval.objects.filter_by(board_id=board.id)
+            .order_by(col(Approval.created_at).desc())
+            .limit(200)
+            .all(session)
+        )
+        approval_ids = [approval.id for approval in approvals]
+        task_ids_by_approval = await load_task_ids_by_approval(
+            session,
+            approval_ids=approval_ids,
+        )
+        linked_ids_by_approval = {
+            approval.id: task_ids_by_approval.get(
+                approval.id,
+                [approval.task_id] if approval.task_id is not None else [],
+            )
+            for approval in approvals
+        }
+        # Paginated or task-less snapshots may not have loaded every linked task.
+        task_title_by_id = await _approval_task_titles(
+            session,
+            board,
+            {task_id for ids in linked_ids_by_approval.values() for task_id in ids},
+            {task.id: task.title for task in tasks},
+        )
+        # Hydrate each approval with linked task metadata, falling back to legacy
+        # single-task fields so older rows still render complete approval cards.
+        approval_reads = [
+            _approval_to_read(
+                approval,
+                task_ids=(linked_task_ids := linked_ids_by_approval[approval.id]),
+                task_titles=[
+                    task_title_by_id[task_id]
+                    for task_id in linked_task_ids
+                    if task_id in task_title_by_id
+                ],
+            )
+            for approval in approvals
+        ]
+
+    chat_reads: list[BoardMemoryRead] = []
+    if "chat" in sections:
+        chat_messages = (
+            await BoardMemory.objects.filter_by(board_id=board.id)
+            .filter(col(BoardMemory.is_chat).is_(True))
+            # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
+            # satisfy the NonEmptyStr response schema.
+            .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
+            .order_by(col(BoardMemory.created_at).desc())
+            .limit(200)
+            .all(session)
+        )
+        chat_messages.sort(key=lambda item: item.created_at)
+        chat_reads = [_memory_to_read(memory) for memory in chat_messages]
 
     return BoardSnapshot(
         board=board_read,
@@ -203,4 +365,142 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         approvals=approval_reads,
         chat_messages=chat_reads,
         pending_approvals_count=pending_approvals_count,
+        task_columns=task_columns,
+    )
+
+
+async def build_task_column_page(
+    session: AsyncSession,
+    board: Board,
+    *,
+    status: str,
+    limit: int,
+    cursor: str | None = None,
+) -> BoardSnapshotTaskPage:
+    """Return the next page of one status column, continuing from `cursor`.
+
+    Raises `ValueError` for a malformed cursor.
+    """
+    position = SNAPSHOT_TASK_ORDER.decode(cursor) if cursor else None
+    statement = SNAPSHOT_TASK_ORDER.apply(
+        Task.objects.filter_by(board_id=board.id, status=status).statement,
+        after=position,
+    )
+    rows = list(await session.exec(statement.limit(limit + 1)))
+    tasks, has_more = rows[:limit], len(rows) > limit
+    agents = await Agent.objects.load_many(
+        session,
+        {task.assigned_agent_id for task in tasks if task.assigned_agent_id is not None},
+    )
+    return BoardSnapshotTaskPage(
+        status=status,
+        items=await _task_cards(
+            session,
+            board,
+            tasks,
+            agent_name_by_id={agent_id: agent.name for agent_id, agent in agents.items()},
+        ),
+        next_cursor=SNAPSHOT_TASK_ORDER.encode(tasks[-1]) if has_more else None,
+    )
+
+
+_CacheKey = tuple[UUID, SnapshotOptions]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedBoardSnapshot:
+    """Serialized snapshot body with the board version it was built from."""
+
+    version: int
+    body: bytes
+    etag: str
+
+
+class BoardSnapshotCache:
+    """Per-process cache of serialized board snapshots with single-flight rebuilds."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        # Keyed by board and snapshot options: each section/page shape is cached separately.
+        self._entries: TTLCache[_CacheKey, CachedBoardSnapshot] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+        self._builds: SingleFlight[_CacheKey] = SingleFlight()
+
+    def clear(self) -> None:
+        """Drop every cached snapshot."""
+        self._entries.clear()
+
+    def _fresh(self, key: _CacheKey, version: int) -> CachedBoardSnapshot | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.version < version:
+            return None
+        return entry
+
+    async def get_or_build(
+        self,
+        board: Board,
+        version: int,
+        build: Callable[[], Awaitable[BoardSnapshot]],
+        options: SnapshotOptions = FULL_SNAPSHOT,
+    ) -> CachedBoardSnapshot:
+        """Return a cached snapshot at least as new as `version`, building on a miss."""
+        if not self._entries.enabled:
+            return _serialize(version, await build())
+        key = (board.id, options)
+        return await self._builds.run(
+            key,
+            lambda: self._fresh(key, version),
+            lambda: self._build(key, version, build),
+        )
+
+    async def _build(
+        self,
+        key: _CacheKey,
+        version: int,
+        build: Callable[[], Awaitable[BoardSnapshot]],
+    ) -> CachedBoardSnapshot:
+        entry = _serialize(version, await build())
+        self._entries.set(key, entry)
+        return entry
+
+
+def _serialize(version: int, snapshot: BoardSnapshot) -> CachedBoardSnapshot:
+    body = snapshot.model_dump_json(by_alias=True).encode()
+    return CachedBoardSnapshot(
+        version=version,
+        body=body,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an `If-None-Match` header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+board_snapshot_cache = BoardSnapshotCache(
+    ttl_seconds=settings.board_snapshot_cache_ttl_seconds,
+    max_entries=settings.board_snapshot_cache_max_entries,
+)
+
+
+async def cached_board_snapshot(
+    session: AsyncSession,
+    board: Board,
+    options: SnapshotOptions = FULL_SNAPSHOT,
+) -> CachedBoardSnapshot:
+    """Return the serialized snapshot for `board`, reusing a cached build when current.
+
+    The version is read before the snapshot on the same session, so a build is never
+    older than the version it is cached under, replicas included.
+    """
+    return await board_snapshot_cache.get_or_build(
+        board,
+        await board_version(session, board.id),
+        lambda: build_board_snapshot(session, board, options),
+        options,
     )
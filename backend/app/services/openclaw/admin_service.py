@@ -18,6 +18,7 @@ from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.board_webhooks import BoardWebhook
 from app.models.gateways import Gateway
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.gateways import GatewayTemplatesSyncResult
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
@@ -33,6 +34,7 @@ from app.services.openclaw.provisioning_db import (
 )
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 from app.services.openclaw.shared import GatewayAgentIdentity
+from app.services.task_status_transitions import return_agent_tasks_to_inbox
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -289,30 +291,26 @@ class GatewayAdminLifecycleService(OpenClawDBService):
 
     async def clear_agent_foreign_keys(self, *, agent_id: UUID) -> None:
         now = utcnow()
+        await return_agent_tasks_to_inbox(self.session, agent_id=agent_id)
         await crud.update_where(
             self.session,
             Task,
             col(Task.assigned_agent_id) == agent_id,
-            col(Task.status) == "in_progress",
             assigned_agent_id=None,
-            status="inbox",
-            in_progress_at=None,
             updated_at=now,
             commit=False,
         )
         await crud.update_where(
             self.session,
-            Task,
-            col(Task.assigned_agent_id) == agent_id,
-            col(Task.status) != "in_progress",
-            assigned_agent_id=None,
-            updated_at=now,
+            ActivityEvent,
+            col(ActivityEvent.agent_id) == agent_id,
+            agent_id=None,
             commit=False,
         )
         await crud.update_where(
             self.session,
-            ActivityEvent,
-            col(ActivityEvent.agent_id) == agent_id,
+            TaskStatusTransition,
+            col(TaskStatusTransition.agent_id) == agent_id,
             agent_id=None,
             commit=False,
         )
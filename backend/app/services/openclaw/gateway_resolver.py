@@ -74,7 +74,7 @@ async def get_gateway_for_board(
     """Return the gateway for a board when present and valid; otherwise return None."""
     if board.gateway_id is None:
         return None
-    gateway = await Gateway.objects.by_id(board.gateway_id).first(session)
+    gateway = await Gateway.objects.load(session, board.gateway_id)
     if gateway is None:
         return None
     # Defensive guard: boards and gateways are tenant-scoped; reject cross-org mismatches.
@@ -6,7 +6,7 @@ import asyncio
 
 from app.core.logging import get_logger
 from app.core.time import utcnow
-from app.db.session import async_session_maker
+from app.db.session import worker_session_maker
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -32,7 +32,7 @@ async def process_lifecycle_queue_task(task: QueuedTask) -> None:
     payload = decode_lifecycle_task(task)
     now = utcnow()
 
-    async with async_session_maker() as session:
+    async with worker_session_maker() as session:
         agent = await Agent.objects.by_id(payload.agent_id).first(session)
         if agent is None:
             logger.info(
@@ -17,16 +17,19 @@ from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException, Request, status
-from sqlalchemy import asc, func, or_
+from sqlalchemy import func, or_
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_tokens import forget_verified_agent_tokens, verify_agent_token
 from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.db import crud
+from app.db.agent_presence import agent_presence
+from app.db.keyset import STREAM_BATCH_LIMIT, KeysetCursor, after_cursor, keyset_order
 from app.db.pagination import paginate
-from app.db.session import async_session_maker
+from app.db.replicas import read_session, request_actor_key
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approvals import Approval
@@ -35,6 +38,7 @@ from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.models.organizations import Organization
+from app.models.task_status_transitions import TaskStatusTransition
 from app.models.tasks import Task
 from app.schemas.agents import (
     AgentCreate,
@@ -81,13 +85,15 @@ from app.services.openclaw.provisioning import (
 from app.services.openclaw.shared import GatewayAgentIdentity
 from app.services.organizations import (
     OrganizationContext,
+    accessible_board_ids_statement,
     get_active_membership,
     get_org_owner_user,
+    has_access_to_any_board,
     has_board_access,
     is_org_admin,
-    list_accessible_board_ids,
     require_board_access,
 )
+from app.services.task_status_transitions import return_agent_tasks_to_inbox
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -864,15 +870,20 @@ class AgentLifecycleService(OpenClawDBService):
             return None
         return await Gateway.objects.by_id(agent.gateway_id).first(self.session)
 
-    @classmethod
-    def with_computed_status(cls, agent: Agent) -> Agent:
-        now = utcnow()
+    @staticmethod
+    def computed_status(agent: Agent) -> str:
+        """Status shown to clients, accounting for agents that stopped checking in."""
         if agent.status in {"deleting", "updating"}:
-            return agent
+            return agent.status
         if agent.last_seen_at is None:
-            agent.status = "provisioning"
-        elif now - agent.last_seen_at > OFFLINE_AFTER:
-            agent.status = "offline"
+            return "provisioning"
+        if utcnow() - agent.last_seen_at > OFFLINE_AFTER:
+            return "offline"
+        return agent.status
+
+    @classmethod
+    def with_computed_status(cls, agent: Agent) -> Agent:
+        agent.status = cls.computed_status(agent)
         return agent
 
     @classmethod
@@ -882,17 +893,28 @@ class AgentLifecycleService(OpenClawDBService):
     async def fetch_agent_events(
         self,
         board_id: UUID | None,
-        since: datetime,
+        cursor: KeysetCursor,
+        *,
+        board_ids: SelectOfScalar[UUID] | None = None,
     ) -> list[Agent]:
+        # Presence touches, heartbeats and batched presence flushes always set `updated_at`
+        # to the time they write, so `(updated_at, id)` alone is a complete change cursor.
         statement = select(Agent)
         if board_id:
             statement = statement.where(col(Agent.board_id) == board_id)
-        statement = statement.where(
-            or_(
-                col(Agent.updated_at) >= since,
-                col(Agent.last_seen_at) >= since,
-            ),
-        ).order_by(asc(col(Agent.updated_at)))
+        if board_ids is not None:
+            statement = statement.where(col(Agent.board_id).in_(board_ids))
+        statement = (
+            statement.where(
+                after_cursor(
+                    cursor,
+                    at_column=col(Agent.updated_at),
+                    id_column=col(Agent.id),
+                ),
+            )
+            .order_by(*keyset_order(at_column=col(Agent.updated_at), id_column=col(Agent.id)))
+            .limit(STREAM_BATCH_LIMIT)
+        )
         return list(await self.session.exec(statement))
 
     async def require_user_context(self, user: User | None) -> OrganizationContext:
@@ -936,11 +958,11 @@ class AgentLifecycleService(OpenClawDBService):
         OpenClawAuthorizationPolicy.require_board_write_access(allowed=allowed)
 
     @staticmethod
-    def record_heartbeat(session: AsyncSession, agent: Agent) -> None:
+    def record_heartbeat(session: AsyncSession, agent: Agent, *, previous_status: str) -> None:
         record_activity(
             session,
             event_type="agent.heartbeat",
-            message=f"Heartbeat received from {agent.name}.",
+            message=f"Heartbeat received from {agent.name}: {previous_status} -> {agent.status}.",
             agent_id=agent.id,
         )
 
@@ -1426,17 +1448,35 @@ class AgentLifecycleService(OpenClawDBService):
         agent: Agent,
         status_value: str | None,
     ) -> AgentRead:
-        if status_value:
-            agent.status = status_value
-        elif agent.status == "provisioning":
-            agent.status = "online"
-        agent.last_seen_at = utcnow()
+        now = utcnow()
+        previous_status = self.computed_status(agent)
+        next_status = status_value or agent.status
+        if next_status == "provisioning":
+            next_status = "online"
+        lifecycle_pending = (
+            agent.wake_attempts != 0
+            or agent.checkin_deadline_at is not None
+            or agent.last_provision_error is not None
+        )
+        if (
+            agent_presence.enabled
+            and next_status == agent.status == previous_status
+            and not lifecycle_pending
+        ):
+            # Routine check-in: only the timestamp moves, so batch it with other agents'.
+            agent_presence.record(agent.id, now)
+            set_committed_value(agent, "last_seen_at", now)
+            set_committed_value(agent, "updated_at", now)
+            return self.to_agent_read(self.with_computed_status(agent))
+        agent.status = next_status
+        agent.last_seen_at = now
         # Successful check-in ends the current wake escalation cycle.
         agent.wake_attempts = 0
         agent.checkin_deadline_at = None
         agent.last_provision_error = None
-        agent.updated_at = utcnow()
-        self.record_heartbeat(self.session, agent)
+        agent.updated_at = now
+        if agent.status != previous_status:
+            self.record_heartbeat(self.session, agent, previous_status=previous_status)
         self.session.add(agent)
         await self.session.commit()
         await self.session.refresh(agent)
@@ -1449,14 +1489,18 @@ class AgentLifecycleService(OpenClawDBService):
         gateway_id: UUID | None,
         ctx: OrganizationContext,
     ) -> LimitOffsetPage[AgentRead]:
-        board_ids = await list_accessible_board_ids(self.session, member=ctx.member, write=False)
         if board_id is not None:
             OpenClawAuthorizationPolicy.require_board_write_access(
-                allowed=board_id in set(board_ids),
+                allowed=await has_access_to_any_board(
+                    self.session,
+                    member=ctx.member,
+                    board_ids=[board_id],
+                    write=False,
+                ),
             )
-        base_filters: list[ColumnElement[bool]] = []
-        if board_ids:
-            base_filters.append(col(Agent.board_id).in_(board_ids))
+        base_filters: list[ColumnElement[bool]] = [
+            col(Agent.board_id).in_(accessible_board_ids_statement(ctx.member, write=False)),
+        ]
         if is_org_admin(ctx.member):
             gateways = await Gateway.objects.filter_by(
                 organization_id=ctx.organization.id,
@@ -1466,13 +1510,7 @@ class AgentLifecycleService(OpenClawDBService):
                 base_filters.append(
                     (col(Agent.gateway_id).in_(gateway_ids)) & (col(Agent.board_id).is_(None)),
                 )
-        if base_filters:
-            if len(base_filters) == 1:
-                statement = select(Agent).where(base_filters[0])
-            else:
-                statement = select(Agent).where(or_(*base_filters))
-        else:
-            statement = select(Agent).where(col(Agent.id).is_(None))
+        statement = select(Agent).where(or_(*base_filters))
         if board_id is not None:
             statement = statement.where(col(Agent.board_id) == board_id)
         if gateway_id is not None:
@@ -1503,36 +1541,35 @@ class AgentLifecycleService(OpenClawDBService):
         ctx: OrganizationContext,
     ) -> EventSourceResponse:
         since_dt = self.parse_since(since) or utcnow()
-        last_seen = since_dt
-        board_ids = await list_accessible_board_ids(self.session, member=ctx.member, write=False)
-        allowed_ids = set(board_ids)
+        accessible_board_ids = accessible_board_ids_statement(ctx.member, write=False)
         if board_id is not None:
-            OpenClawAuthorizationPolicy.require_board_write_access(allowed=board_id in allowed_ids)
+            allowed = (
+                await self.session.exec(
+                    accessible_board_ids.where(col(Board.id) == board_id),
+                )
+            ).first()
+            OpenClawAuthorizationPolicy.require_board_write_access(allowed=allowed is not None)
 
         async def event_generator() -> AsyncIterator[dict[str, str]]:
-            nonlocal last_seen
+            actor_key = request_actor_key(request)
+            cursor = KeysetCursor(at=since_dt)
             while True:
                 if await request.is_disconnected():
                     break
-                async with async_session_maker() as stream_session:
+                async with read_session(actor_key) as stream_session:
                     stream_service = AgentLifecycleService(stream_session)
                     stream_service.logger = self.logger
-                    if board_id is not None:
-                        agents = await stream_service.fetch_agent_events(
-                            board_id,
-                            last_seen,
-                        )
-                    elif allowed_ids:
-                        agents = await stream_service.fetch_agent_events(None, last_seen)
-                        agents = [agent for agent in agents if agent.board_id in allowed_ids]
-                    else:
-                        agents = []
+                    agents = await stream_service.fetch_agent_events(
+                        board_id,
+                        cursor,
+                        board_ids=accessible_board_ids,
+                    )
                 for agent in agents:
-                    updated_at = agent.updated_at or agent.last_seen_at or utcnow()
-                    last_seen = max(updated_at, last_seen)
+                    cursor = cursor.advance(agent.updated_at, agent.id)
                     payload = {"agent": self.serialize_agent(agent)}
                     yield {"event": "agent", "data": json.dumps(payload)}
-                await asyncio.sleep(2)
+                if len(agents) < STREAM_BATCH_LIMIT:
+                    await asyncio.sleep(2)
 
         return EventSourceResponse(event_generator(), ping=15)
 
@@ -1820,30 +1857,26 @@ class AgentLifecycleService(OpenClawDBService):
             agent_id=None,
         )
         now = utcnow()
+        await return_agent_tasks_to_inbox(self.session, agent_id=agent.id)
         await crud.update_where(
             self.session,
             Task,
             col(Task.assigned_agent_id) == agent.id,
-            col(Task.status) == "in_progress",
             assigned_agent_id=None,
-            status="inbox",
-            in_progress_at=None,
             updated_at=now,
             commit=False,
         )
         await crud.update_where(
             self.session,
-            Task,
-            col(Task.assigned_agent_id) == agent.id,
-            col(Task.status) != "in_progress",
-            assigned_agent_id=None,
-            updated_at=now,
+            ActivityEvent,
+            col(ActivityEvent.agent_id) == agent.id,
+            agent_id=None,
             commit=False,
         )
         await crud.update_where(
             self.session,
-            ActivityEvent,
-            col(ActivityEvent.agent_id) == agent.id,
+            TaskStatusTransition,
+            col(TaskStatusTransition.agent_id) == agent.id,
             agent_id=None,
             commit=False,
         )
@@ -1864,6 +1897,7 @@ class AgentLifecycleService(OpenClawDBService):
         )
         await self.session.delete(agent)
         await self.session.commit()
+        forget_verified_agent_tokens(agent.id)
 
         try:
             # Notify the gateway-main agent about cleanup for board-scoped deletes.
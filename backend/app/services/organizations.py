@@ -5,16 +5,20 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from fastapi import HTTPException, status
 from sqlalchemy import or_
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import col, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.time import utcnow
 from app.db import crud
+from app.db.loader import entity_loader
+from app.db.org_access_cache import MemberAccess, current_generation, org_access_cache, remember
 from app.models.boards import Board
 from app.models.organization_board_access import OrganizationBoardAccess
 from app.models.organization_invite_board_access import OrganizationInviteBoardAccess
@@ -28,6 +32,7 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.sql.expression import SelectOfScalar
 
     from app.schemas.organizations import (
         OrganizationBoardAccessSpec,
@@ -35,6 +40,7 @@ if TYPE_CHECKING:
     )
 
 DEFAULT_ORG_NAME = "Personal"
+ModelT = TypeVar("ModelT", bound=SQLModel)
 
 
 def _normalize_skill_pack_source_url(source_url: str) -> str:
@@ -76,17 +82,89 @@ def is_org_admin(member: OrganizationMember) -> bool:
     return member.role in ADMIN_ROLES
 
 
-async def get_member(
+def _detached_copy(obj: ModelT) -> ModelT:
+    copy = type(obj).model_validate(obj.model_dump())
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def _attach(session: AsyncSession, snapshot: ModelT) -> ModelT:
+    """Return `session`'s instance for a cached snapshot without querying."""
+    existing = session.sync_session.identity_map.get(identity_key(instance=snapshot))
+    if isinstance(existing, type(snapshot)):
+        return existing
+    # `load=False` copies the snapshot's state into the session as an unmodified row.
+    return await session.merge(snapshot, load=False)
+
+
+async def get_member_access(
     session: AsyncSession,
     *,
     user_id: UUID,
     organization_id: UUID,
-) -> OrganizationMember | None:
-    """Fetch a membership by user id and organization id."""
-    return await OrganizationMember.objects.filter_by(
+) -> MemberAccess | None:
+    """Return the cached membership, organization and board grants for a user in an org.
+
+    The returned rows are detached snapshots; use `get_member` and `get_member_organization`
+    for session-bound instances.
+    """
+    key = (user_id, organization_id)
+    cached = org_access_cache.get(key)
+    if cached is not None:
+        return cached
+    generation = current_generation()
+    member = await OrganizationMember.objects.filter_by(
         user_id=user_id,
         organization_id=organization_id,
     ).first(session)
+    if member is None:
+        return None
+    organization = await Organization.objects.load(session, organization_id)
+    if organization is None:
+        return None
+    readable: set[UUID] = set()
+    writable: set[UUID] = set()
+    if not member_all_boards_write(member):
+        grants = await OrganizationBoardAccess.objects.filter_by(
+            organization_member_id=member.id,
+        ).all(session)
+        for grant in grants:
+            if grant.can_read or grant.can_write:
+                readable.add(grant.board_id)
+            if grant.can_write:
+                writable.add(grant.board_id)
+    access = MemberAccess(
+        member=_detached_copy(member),
+        organization=_detached_copy(organization),
+        readable_board_ids=frozenset(readable),
+        writable_board_ids=frozenset(writable),
+    )
+    remember(key, access, generation=generation)
+    return access
+
+
+async def get_member(
+    session: AsyncSession,
+    *,
+    user_id: UUID,
+    organization_id: UUID,
+) -> OrganizationMember | None:
+    """Fetch a membership by user id and organization id (cached across requests)."""
+    access = await get_member_access(session, user_id=user_id, organization_id=organization_id)
+    if access is None:
+        return None
+    return await _attach(session, access.member)
+
+
+async def get_member_organization(
+    session: AsyncSession,
+    member: OrganizationMember,
+) -> Organization | None:
+    """Return the organization of `member`, from the access cache when warm."""
+    access = org_access_cache.get((member.user_id, member.organization_id))
+    if access is not None and access.member.id == member.id:
+        return await _attach(session, access.organization)
+    return await Organization.objects.load(session, member.organization_id)
 
 
 async def get_org_owner_user(
@@ -143,7 +221,7 @@ async def get_active_membership(
     user: User,
 ) -> OrganizationMember | None:
     """Resolve and normalize the user's currently active membership."""
-    db_user = await User.objects.by_id(user.id).first(session)
+    db_user = await User.objects.load(session, user.id)
     if db_user is None:
         db_user = user
     if db_user.active_organization_id:
@@ -378,6 +456,10 @@ async def has_board_access(
             return True
     elif member_all_boards_read(member):
         return True
+    cached = org_access_cache.get((member.user_id, member.organization_id))
+    if cached is not None and cached.member.id == member.id:
+        granted = cached.writable_board_ids if write else cached.readable_board_ids
+        return board.id in granted
     access = await OrganizationBoardAccess.objects.filter_by(
         organization_member_id=member.id,
         board_id=board.id,
@@ -442,13 +524,43 @@ def board_access_filter(
     return col(Board.id).in_(access_stmt)
 
 
+def accessible_board_ids_statement(
+    member: OrganizationMember,
+    *,
+    write: bool,
+) -> SelectOfScalar[UUID]:
+    """Build a subquery selecting board ids visible to a member.
+
+    Prefer this over `list_accessible_board_ids` when the ids only feed an `IN` filter,
+    so access checks stay in SQL instead of round-tripping large literal id lists.
+    """
+    return select(Board.id).where(board_access_filter(member, write=write))
+
+
 async def list_accessible_board_ids(
     session: AsyncSession,
     *,
     member: OrganizationMember,
     write: bool,
 ) -> list[UUID]:
-    """List board ids accessible to a member for read or write mode."""
+    """List board ids accessible to a member for read or write mode.
+
+    For members with organization-wide access this is every board in the organization;
+    when the ids only feed a filter, use `accessible_board_ids_statement` instead.
+    """
+    board_ids = await entity_loader(session).related(
+        ("accessible_board_ids", member.id, write),
+        lambda: _query_accessible_board_ids(session, member=member, write=write),
+    )
+    return list(board_ids)
+
+
+async def _query_accessible_board_ids(
+    session: AsyncSession,
+    *,
+    member: OrganizationMember,
+    write: bool,
+) -> list[UUID]:
     if (write and member_all_boards_write(member)) or (
         not write and member_all_boards_read(member)
     ):
@@ -459,24 +571,42 @@ async def list_accessible_board_ids(
         )
         return list(ids)
 
-    access_stmt = select(OrganizationBoardAccess.board_id).where(
-        col(OrganizationBoardAccess.organization_member_id) == member.id,
-    )
-    if write:
-        access_stmt = access_stmt.where(
-            col(OrganizationBoardAccess.can_write).is_(True),
-        )
-    else:
-        access_stmt = access_stmt.where(
-            or_(
-                col(OrganizationBoardAccess.can_read).is_(True),
-                col(OrganizationBoardAccess.can_write).is_(True),
-            ),
-        )
-    board_ids = await session.exec(access_stmt)
+    cached = org_access_cache.get((member.user_id, member.organization_id))
+    if cached is not None and cached.member.id == member.id:
+        return sorted(cached.writable_board_ids if write else cached.readable_board_ids)
+    board_ids = await session.exec(accessible_board_ids_statement(member, write=write))
     return list(board_ids)
 
 
+async def has_access_to_any_board(
+    session: AsyncSession,
+    *,
+    member: OrganizationMember,
+    board_ids: Iterable[UUID],
+    write: bool,
+) -> bool:
+    """Return whether the member can read (or write) at least one of `board_ids`."""
+    candidates = set(board_ids)
+    if not candidates:
+        return False
+    cached = org_access_cache.get((member.user_id, member.organization_id))
+    if (
+        cached is not None
+        and cached.member.id == member.id
+        and not (member_all_boards_write(member) if write else member_all_boards_read(member))
+    ):
+        granted = cached.writable_board_ids if write else cached.readable_board_ids
+        return not candidates.isdisjoint(granted)
+    allowed = (
+        await session.exec(
+            accessible_board_ids_statement(member, write=write)
+            .where(col(Board.id).in_(candidates))
+            .limit(1),
+        )
+    ).first()
+    return allowed is not None
+
+
 async def apply_member_access_update(
     session: AsyncSession,
     *,
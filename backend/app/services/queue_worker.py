@@ -7,8 +7,12 @@ import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
+from app.core.agent_auth import expire_legacy_agent_tokens
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import worker_session_maker
+from app.services.activity_partitions import run_maintenance as run_activity_maintenance
 from app.services.openclaw.lifecycle_queue import TASK_TYPE as LIFECYCLE_RECONCILE_TASK_TYPE
 from app.services.openclaw.lifecycle_queue import (
     requeue_lifecycle_queue_task,
@@ -124,7 +128,53 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
     return processed
 
 
+async def _run_activity_maintenance_loop(interval_seconds: float) -> None:
+    # Every worker runs this; the maintenance steps take an advisory lock, so only one
+    # worker does the work per interval.
+    while True:
+        try:
+            async with worker_session_maker() as session:
+                result = await run_activity_maintenance(session)
+            logger.info(
+                "queue.worker.activity_maintenance",
+                extra={
+                    "partitions_created": result.partitions_created,
+                    "events_deleted": result.events_deleted,
+                    "archived": [str(path) for path in result.archived],
+                },
+            )
+        except Exception:
+            logger.exception("queue.worker.activity_maintenance_failed")
+        try:
+            async with worker_session_maker() as session:
+                expired = await expire_legacy_agent_tokens(
+                    session,
+                    now=utcnow(),
+                    after_days=settings.agent_legacy_token_expire_after_days,
+                )
+            if expired:
+                logger.info(
+                    "queue.worker.legacy_agent_tokens_expired",
+                    extra={"agent_ids": [str(agent_id) for agent_id in expired]},
+                )
+        except Exception:
+            logger.exception("queue.worker.legacy_agent_token_expiry_failed")
+        await asyncio.sleep(interval_seconds)
+
+
 async def _run_worker_loop() -> None:
+    interval = settings.activity_events_maintenance_interval_seconds
+    maintenance = (
+        asyncio.create_task(_run_activity_maintenance_loop(interval)) if interval > 0 else None
+    )
+    try:
+        await _run_queue_loop()
+    finally:
+        if maintenance is not None:
+            maintenance.cancel()
+
+
+async def _run_queue_loop() -> None:
     while True:
         try:
             await flush_queue(
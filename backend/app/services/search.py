@@ -0,0 +1,263 @@
+"""Keyword search across tasks, task comments and board memory.
+
+On PostgreSQL `tasks`, `activity_events` and `board_memory` each carry a generated
+`search_vector` tsvector column with a GIN index, so the database keeps the vectors current
+on every write and matching and ranking come from the index. Queries go through
+`websearch_to_tsquery`, so callers can use quoted phrases, `or` and `-term`. Snippets are
+built with `ts_headline` for the returned page only.
+
+SQLite, which the test suite runs on, has no text-search types: there every query word must
+appear (case-insensitively) in the text, hits rank equally and newest first, and snippets
+are cut in Python.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+from typing import cast as type_cast
+from uuid import UUID
+
+from sqlalchemy import Float, Uuid, and_, cast, false, func, literal, literal_column, null
+from sqlalchemy import select as sa_select
+from sqlalchemy import union_all
+from sqlmodel import col
+
+from app.models.activity_events import ActivityEvent
+from app.models.board_memory import BoardMemory
+from app.models.tasks import Task
+from app.schemas.search import SearchHit, SearchKind
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import ColumnElement
+    from sqlalchemy.sql.selectable import Select
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import Select as SQLModelSelect
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    BoardIds = Collection[UUID] | SelectOfScalar[UUID]
+
+SEARCH_KINDS: Final[tuple[SearchKind, ...]] = ("task", "comment", "memory")
+TEXT_SEARCH_CONFIG: Final[str] = "english"
+COMMENT_EVENT_TYPE: Final[str] = "task.comment"
+_HIGHLIGHT = "**"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_HIGHLIGHT}, StopSel={_HIGHLIGHT}, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+_FALLBACK_SNIPPET_CHARS = 240
+_FALLBACK_LEAD_CHARS = 60
+
+
+def _text_search_config() -> ColumnElement[Any]:
+    # Inlined as a `regconfig` literal: a bound string parameter would not resolve the
+    # text-search function overloads.
+    return literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """A normalized search string plus the dialect it will run on."""
+
+    text: str
+    postgres: bool
+
+    @property
+    def terms(self) -> list[str]:
+        """Lower-cased words used by the SQLite fallback."""
+        return re.findall(r"\w+", self.text.lower())
+
+    def tsquery(self) -> ColumnElement[Any]:
+        """The PostgreSQL `tsquery` for this search."""
+        return func.websearch_to_tsquery(_text_search_config(), self.text)
+
+
+async def prepare_query(session: AsyncSession, text: str) -> SearchQuery:
+    """Normalize `text` and record which search implementation the session's database uses."""
+    connection = await session.connection()
+    return SearchQuery(
+        text=" ".join(text.split()), postgres=connection.dialect.name == "postgresql"
+    )
+
+
+def _task_text() -> ColumnElement[str]:
+    return func.coalesce(col(Task.title), "") + " " + func.coalesce(col(Task.description), "")
+
+
+def _comment_text() -> ColumnElement[str]:
+    return func.coalesce(col(ActivityEvent.message), "")
+
+
+def _memory_text() -> ColumnElement[str]:
+    return func.coalesce(col(BoardMemory.content), "")
+
+
+def _match_and_rank(
+    query: SearchQuery,
+    *,
+    table: str,
+    text: ColumnElement[str],
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    if query.postgres:
+        vector: ColumnElement[Any] = literal_column(f"{table}.search_vector")
+        tsquery = query.tsquery()
+        return vector.op("@@")(tsquery), func.ts_rank_cd(vector, tsquery)
+    terms = query.terms
+    if not terms:
+        return false(), literal(0.0, Float)
+    lowered = func.lower(text)
+    return and_(*(lowered.contains(term, autoescape=True) for term in terms)), literal(1.0, Float)
+
+
+def _branch(kind: SearchKind, query: SearchQuery, board_ids: BoardIds) -> Select[Any]:
+    if kind == "task":
+        match, rank = _match_and_rank(query, table="tasks", text=_task_text())
+        return sa_select(
+            literal(kind).label("kind"),
+            col(Task.id).label("id"),
+            col(Task.board_id).label("board_id"),
+            col(Task.id).label("task_id"),
+            rank.label("rank"),
+            col(Task.created_at).label("created_at"),
+        ).where(col(Task.board_id).in_(board_ids), match)
+    if kind == "comment":
+        match, rank = _match_and_rank(query, table="activity_events", text=_comment_text())
+        return (
+            sa_select(
+                literal(kind).label("kind"),
+                col(ActivityEvent.id).label("id"),
+                col(Task.board_id).label("board_id"),
+                col(ActivityEvent.task_id).label("task_id"),
+                rank.label("rank"),
+                col(ActivityEvent.created_at).label("created_at"),
+            )
+            .join(Task, col(Task.id) == col(ActivityEvent.task_id))
+            .where(
+                col(ActivityEvent.event_type) == COMMENT_EVENT_TYPE,
+                col(Task.board_id).in_(board_ids),
+                match,
+            )
+        )
+    match, rank = _match_and_rank(query, table="board_memory", text=_memory_text())
+    return sa_select(
+        literal(kind).label("kind"),
+        col(BoardMemory.id).label("id"),
+        col(BoardMemory.board_id).label("board_id"),
+        cast(null(), Uuid).label("task_id"),
+        rank.label("rank"),
+        col(BoardMemory.created_at).label("created_at"),
+    ).where(col(BoardMemory.board_id).in_(board_ids), match)
+
+
+def search_statement(
+    query: SearchQuery,
+    *,
+    board_ids: BoardIds,
+    kinds: Collection[SearchKind] | None = None,
+) -> SQLModelSelect[Any]:
+    """Build the ranked hit query (kind, id, board, task, rank, time) over `board_ids`.
+
+    `board_ids` may be a subquery, such as `accessible_board_ids_statement`, so access
+    filtering stays in SQL.
+    """
+    selected = [kind for kind in SEARCH_KINDS if not kinds or kind in kinds]
+    hits = union_all(*(_branch(kind, query, board_ids) for kind in selected)).subquery("hits")
+    statement = sa_select(hits).order_by(
+        hits.c.rank.desc(),
+        hits.c.created_at.desc(),
+        hits.c.id.desc(),
+    )
+    # sqlmodel's `select` only types up to four columns; the Core select behaves the same.
+    return type_cast("SQLModelSelect[Any]", statement)
+
+
+def _fallback_snippet(text: str, terms: Sequence[str]) -> str:
+    lowered = text.lower()
+    positions = [position for term in terms if (position := lowered.find(term)) >= 0]
+    start = max(0, min(positions, default=0) - _FALLBACK_LEAD_CHARS)
+    end = start + _FALLBACK_SNIPPET_CHARS
+    snippet = text[start:end]
+    if terms:
+        pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        snippet = pattern.sub(lambda match: f"{_HIGHLIGHT}{match.group(0)}{_HIGHLIGHT}", snippet)
+    return f"{'…' if start else ''}{snippet}{'…' if end < len(text) else ''}"
+
+
+def _snippet_column(query: SearchQuery, text: ColumnElement[str]) -> ColumnElement[str]:
+    if query.postgres:
+        return func.ts_headline(_text_search_config(), text, query.tsquery(), _HEADLINE_OPTIONS)
+    return text
+
+
+async def _snippets(
+    session: AsyncSession,
+    query: SearchQuery,
+    ids_by_kind: dict[SearchKind, list[UUID]],
+) -> dict[UUID, tuple[str, str | None]]:
+    """Return `(snippet, task title)` for every hit id on the page."""
+    statements: list[Select[Any]] = []
+    if ids_by_kind.get("task"):
+        statements.append(
+            sa_select(
+                col(Task.id),
+                _snippet_column(query, _task_text()),
+                col(Task.title),
+            ).where(col(Task.id).in_(ids_by_kind["task"])),
+        )
+    if ids_by_kind.get("comment"):
+        statements.append(
+            sa_select(
+                col(ActivityEvent.id),
+                _snippet_column(query, _comment_text()),
+                col(Task.title),
+            )
+            .join(Task, col(Task.id) == col(ActivityEvent.task_id))
+            .where(col(ActivityEvent.id).in_(ids_by_kind["comment"])),
+        )
+    if ids_by_kind.get("memory"):
+        statements.append(
+            sa_select(
+                col(BoardMemory.id),
+                _snippet_column(query, _memory_text()),
+                null(),
+            ).where(col(BoardMemory.id).in_(ids_by_kind["memory"])),
+        )
+    output: dict[UUID, tuple[str, str | None]] = {}
+    terms = query.terms
+    for statement in statements:
+        for hit_id, snippet, task_title in await session.exec(statement):  # type: ignore[call-overload]
+            text = snippet or ""
+            output[hit_id] = (
+                text if query.postgres else _fallback_snippet(text, terms),
+                task_title,
+            )
+    return output
+
+
+async def hits_for_rows(
+    session: AsyncSession,
+    query: SearchQuery,
+    rows: Sequence[Any],
+) -> list[SearchHit]:
+    """Turn one page of `search_statement` rows into `SearchHit`s with snippets."""
+    ids_by_kind: dict[SearchKind, list[UUID]] = {}
+    for row in rows:
+        ids_by_kind.setdefault(row.kind, []).append(row.id)
+    snippets = await _snippets(session, query, ids_by_kind)
+    hits: list[SearchHit] = []
+    for row in rows:
+        snippet, task_title = snippets.get(row.id, ("", None))
+        hits.append(
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                board_id=row.board_id,
+                task_id=row.task_id,
+                task_title=task_title,
+                snippet=snippet,
+                rank=float(row.rank or 0.0),
+                created_at=row.created_at,
+            ),
+        )
+    return hits
@@ -13,6 +13,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import delete, func
 from sqlmodel import col, select
 
+from app.db.board_versions import mark_tasks_changed
 from app.models.tag_assignments import TagAssignment
 from app.models.tags import Tag
 from app.schemas.tags import TagRef
@@ -132,6 +133,8 @@ async def replace_tags(
             col(TagAssignment.task_id) == task_id,
         ),
     )
+    # The bulk delete bypasses the flush hook, which would miss a task losing every tag.
+    mark_tasks_changed(session, [task_id])
     for tag_id in normalized:
         session.add(TagAssignment(task_id=task_id, tag_id=tag_id))
 
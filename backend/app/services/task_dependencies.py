@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from typing import Final
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy.orm import aliased
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -82,6 +83,53 @@ def blocked_by_dependency_ids(
     return [dep_id for dep_id in dependency_ids if status_by_id.get(dep_id) != DONE_STATUS]
 
 
+def stored_blocked_by_ids(task: Task) -> list[UUID]:
+    """Return the task's materialized unresolved dependency ids (none once it is done)."""
+    if task.status == DONE_STATUS:
+        return []
+    return [UUID(value) for value in task.blocked_by_task_ids]
+
+
+def set_blocked_by(task: Task, blocked_by: Sequence[UUID]) -> None:
+    """Store `blocked_by` as the task's materialized blocker list."""
+    values = [str(value) for value in blocked_by]
+    # Leave unchanged tasks clean so they do not count as edits (board versions, flushes);
+    # changes assign a new list because in-place JSON mutations are not tracked.
+    if values != task.blocked_by_task_ids:
+        task.blocked_by_task_ids = values
+    if len(values) != task.blocked_by_count:
+        task.blocked_by_count = len(values)
+
+
+async def refresh_blocked_by(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    tasks: Sequence[Task],
+) -> None:
+    """Recompute the materialized blocker lists of `tasks` from their dependency edges."""
+    if not tasks:
+        return
+    deps_map = await dependency_ids_by_task_id(
+        session,
+        board_id=board_id,
+        task_ids=[task.id for task in tasks],
+    )
+    status_by_id = await dependency_status_by_id(
+        session,
+        board_id=board_id,
+        dependency_ids=list({dep_id for dep_ids in deps_map.values() for dep_id in dep_ids}),
+    )
+    for task in tasks:
+        set_blocked_by(
+            task,
+            blocked_by_dependency_ids(
+                dependency_ids=deps_map.get(task.id, []),
+                status_by_id=status_by_id,
+            ),
+        )
+
+
 async def blocked_by_for_task(
     session: AsyncSession,
     *,
@@ -109,52 +157,100 @@ async def blocked_by_for_task(
 
 
 def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
-    """Detect cycles in a directed dependency graph."""
-    visited: set[UUID] = set()
-    in_stack: set[UUID] = set()
+    """Detect cycles in a directed dependency graph.
 
-    def dfs(current: UUID) -> bool:
-        if current in in_stack:
-            return True
-        if current in visited:
-            return False
-        visited.add(current)
-        in_stack.add(current)
-        for nxt in edges.get(current, set()):
-            if dfs(nxt):
+    Iterative, so long dependency chains cannot hit the interpreter's recursion limit.
+    """
+    finished: set[UUID] = set()
+    in_stack: set[UUID] = set()
+    for start_node in nodes:
+        if start_node in finished:
+            continue
+        in_stack.add(start_node)
+        stack: list[tuple[UUID, Iterator[UUID]]] = [
+            (start_node, iter(edges.get(start_node, ()))),
+        ]
+        while stack:
+            current, successors = stack[-1]
+            nxt = next(successors, None)
+            if nxt is None:
+                stack.pop()
+                in_stack.discard(current)
+                finished.add(current)
+            elif nxt in in_stack:
                 return True
-        in_stack.remove(current)
-        return False
+            elif nxt not in finished:
+                in_stack.add(nxt)
+                stack.append((nxt, iter(edges.get(nxt, ()))))
+    return False
 
-    return any(dfs(start_node) for start_node in nodes)
 
+async def _reachable_edges(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    start_ids: Collection[UUID],
+    replaced_task_ids: Collection[UUID],
+) -> list[tuple[UUID, UUID]]:
+    """Return existing edges reachable from `start_ids`, one recursive query.
 
-async def validate_dependency_update(
+    Tasks in `replaced_task_ids` are not expanded: their edges are being replaced.
+    """
+    base = (
+        select(col(TaskDependency.task_id), col(TaskDependency.depends_on_task_id))
+        .where(col(TaskDependency.board_id) == board_id)
+        .where(col(TaskDependency.task_id).in_(start_ids))
+        .where(col(TaskDependency.task_id).not_in(replaced_task_ids))
+        .cte("reachable_dependencies", recursive=True)
+    )
+    edge = aliased(TaskDependency)
+    reachable = base.union(
+        select(col(edge.task_id), col(edge.depends_on_task_id))
+        .join(base, col(edge.task_id) == base.c.depends_on_task_id)
+        .where(col(edge.board_id) == board_id)
+        .where(col(edge.task_id).not_in(replaced_task_ids)),
+    )
+    rows = await session.exec(
+        select(reachable.c.task_id, reachable.c.depends_on_task_id),
+    )
+    return [(src, dst) for src, dst in rows]
+
+
+async def validate_dependency_updates(
     session: AsyncSession,
     *,
     board_id: UUID,
-    task_id: UUID,
-    depends_on_task_ids: Sequence[UUID],
-) -> list[UUID]:
-    """Validate a dependency update and return normalized dependency ids."""
-    normalized = _dedupe_uuid_list(depends_on_task_ids)
-    if task_id in normalized:
+    updates: Mapping[UUID, Sequence[UUID]],
+) -> dict[UUID, list[UUID]]:
+    """Validate replacing the dependencies of several tasks at once.
+
+    Returns normalized dependency ids keyed by task id. The board's graph is acyclic
+    before the edit, so a new cycle has to run through an edited task: only the edges
+    reachable from the new dependencies are loaded (one recursive query) and checked
+    with the pending edits overlaid, instead of the whole board graph.
+    """
+    normalized = {
+        task_id: _dedupe_uuid_list(depends_on_task_ids)
+        for task_id, depends_on_task_ids in updates.items()
+    }
+    if any(task_id in dep_ids for task_id, dep_ids in normalized.items()):
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail="Task cannot depend on itself.",
         )
-    if not normalized:
-        return []
+    requested = _dedupe_uuid_list([dep_id for dep_ids in normalized.values() for dep_id in dep_ids])
+    if not requested:
+        return normalized
 
     # Ensure all dependency tasks exist on this board.
     existing_ids = set(
         await session.exec(
             select(col(Task.id))
             .where(col(Task.board_id) == board_id)
-            .where(col(Task.id).in_(normalized)),
+            .where(col(Task.id).in_(requested)),
         ),
     )
-    missing = [dep_id for dep_id in normalized if dep_id not in existing_ids]
+    missing = [dep_id for dep_id in requested if dep_id not in existing_ids]
     if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -164,27 +260,18 @@ async def validate_dependency_update(
             },
         )
 
-    # Rebuild the board-wide graph and overlay the pending edit for this task so
-    # validation catches indirect cycles created through existing edges.
-    task_ids = list(
-        await session.exec(
-            select(col(Task.id)).where(col(Task.board_id) == board_id),
-        ),
-    )
-    rows = list(
-        await session.exec(
-            select(
-                col(TaskDependency.task_id),
-                col(TaskDependency.depends_on_task_id),
-            ).where(col(TaskDependency.board_id) == board_id),
-        ),
-    )
     edges: dict[UUID, set[UUID]] = defaultdict(set)
-    for src, dst in rows:
+    for src, dst in await _reachable_edges(
+        session,
+        board_id=board_id,
+        start_ids=requested,
+        replaced_task_ids=list(normalized),
+    ):
         edges[src].add(dst)
-    edges[task_id] = set(normalized)
+    for task_id, dep_ids in normalized.items():
+        edges[task_id] = set(dep_ids)
 
-    if _has_cycle(task_ids, edges):
+    if _has_cycle(list(normalized), edges):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Dependency cycle detected. Remove the cycle before saving.",
@@ -193,6 +280,22 @@ async def validate_dependency_update(
     return normalized
 
 
+async def validate_dependency_update(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_id: UUID,
+    depends_on_task_ids: Sequence[UUID],
+) -> list[UUID]:
+    """Validate a dependency update and return normalized dependency ids."""
+    validated = await validate_dependency_updates(
+        session,
+        board_id=board_id,
+        updates={task_id: depends_on_task_ids},
+    )
+    return validated[task_id]
+
+
 async def replace_task_dependencies(
     session: AsyncSession,
     *,
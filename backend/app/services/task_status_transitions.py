@@ -0,0 +1,68 @@
+"""Helpers for recording task status transitions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.core.time import utcnow
+from app.models.task_status_transitions import TaskStatusTransition
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def record_status_transition(
+    session: AsyncSession,
+    *,
+    task: Task,
+    from_status: str | None,
+    agent_id: UUID | None = None,
+    in_progress_since: datetime | None = None,
+) -> TaskStatusTransition | None:
+    """Attach a transition row for `task` entering its current status.
+
+    Returns `None` (and records nothing) when the status did not change or the task has no
+    board. `in_progress_since` is used to compute cycle time for moves into review.
+    """
+    if task.board_id is None or task.status == from_status:
+        return None
+    at = utcnow()
+    cycle_time_hours = None
+    if task.status == "review" and in_progress_since is not None:
+        cycle_time_hours = max((at - in_progress_since).total_seconds() / 3600.0, 0.0)
+    transition = TaskStatusTransition(
+        board_id=task.board_id,
+        task_id=task.id,
+        from_status=from_status,
+        to_status=task.status,
+        agent_id=agent_id,
+        cycle_time_hours=cycle_time_hours,
+        at=at,
+    )
+    session.add(transition)
+    return transition
+
+
+async def return_agent_tasks_to_inbox(session: AsyncSession, *, agent_id: UUID) -> list[Task]:
+    """Unassign the in-progress tasks of `agent_id` and move them back to the inbox.
+
+    Tasks are reset through the ORM rather than a bulk `UPDATE` so each one records a
+    status transition and the metric rollup and board version hooks see the change.
+    Nothing is committed.
+    """
+    tasks = await Task.objects.filter_by(assigned_agent_id=agent_id, status="in_progress").all(
+        session,
+    )
+    now = utcnow()
+    for task in tasks:
+        task.status = "inbox"
+        task.assigned_agent_id = None
+        task.in_progress_at = None
+        task.updated_at = now
+        session.add(task)
+        record_status_transition(session, task=task, from_status="in_progress")
+    return tasks
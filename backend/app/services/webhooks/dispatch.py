@@ -11,7 +11,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.db.session import async_session_maker
+from app.db.session import worker_session_maker
 from app.models.agents import Agent
 from app.models.board_webhook_payloads import BoardWebhookPayload
 from app.models.board_webhooks import BoardWebhook
@@ -157,7 +157,7 @@ async def _load_webhook_payload(
 
 
 async def _process_single_item(item: QueuedInboundDelivery) -> None:
-    async with async_session_maker() as session:
+    async with worker_session_maker() as session:
         loaded = await _load_webhook_payload(
             session=session,
             payload_id=item.payload_id,
@@ -0,0 +1,75 @@
+"""add composite (created_at, id) indexes for keyset stream cursors
+
+Revision ID: a3c5e7f9b1d2
+Revises: f1b2c3d4e5a6
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a3c5e7f9b1d2"
+down_revision = "f1b2c3d4e5a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stream pollers seek past a `(created_at, id)` cursor and order by the same pair.
+    # Each index below matches one poller's equality filters followed by the cursor key,
+    # so a poll is a short forward range scan instead of re-reading rows at `last_seen`.
+    op.create_index(
+        "ix_activity_events_created_at_id",
+        "activity_events",
+        ["created_at", "id"],
+    )
+    # Supersedes ix_activity_events_event_type_created_at (same leading columns).
+    op.create_index(
+        "ix_activity_events_event_type_created_at_id",
+        "activity_events",
+        ["event_type", "created_at", "id"],
+    )
+    op.drop_index("ix_activity_events_event_type_created_at", table_name="activity_events")
+    # Approval streams key on the last state change: resolved_at, falling back to created_at.
+    op.create_index(
+        "ix_approvals_board_id_updated_at_id",
+        "approvals",
+        ["board_id", sa.text("coalesce(resolved_at, created_at)"), "id"],
+    )
+    op.create_index(
+        "ix_agents_board_id_updated_at_id",
+        "agents",
+        ["board_id", "updated_at", "id"],
+    )
+    op.create_index(
+        "ix_board_memory_board_id_created_at_id",
+        "board_memory",
+        ["board_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_board_group_memory_board_group_id_created_at_id",
+        "board_group_memory",
+        ["board_group_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_board_group_memory_board_group_id_created_at_id",
+        table_name="board_group_memory",
+    )
+    op.drop_index("ix_board_memory_board_id_created_at_id", table_name="board_memory")
+    op.drop_index("ix_agents_board_id_updated_at_id", table_name="agents")
+    op.drop_index("ix_approvals_board_id_updated_at_id", table_name="approvals")
+    op.create_index(
+        "ix_activity_events_event_type_created_at",
+        "activity_events",
+        ["event_type", "created_at"],
+    )
+    op.drop_index("ix_activity_events_event_type_created_at_id", table_name="activity_events")
+    op.drop_index("ix_activity_events_created_at_id", table_name="activity_events")
@@ -0,0 +1,137 @@
+"""partition activity_events by month
+
+Revision ID: a8b0c2d4e6f9
+Revises: e6f8a0b2c4d7
+Create Date: 2026-03-07 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a8b0c2d4e6f9"
+down_revision = "e6f8a0b2c4d7"
+branch_labels = None
+depends_on = None
+
+# Kept in sync with app.services.activity_partitions; migrations must not import app code.
+_MONTHS_AHEAD = 2
+_COLUMNS = "id, event_type, message, agent_id, task_id, created_at"
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(value: datetime) -> datetime:
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_activity_events_agent_id", "activity_events", ["agent_id"])
+    op.create_index("ix_activity_events_event_type", "activity_events", ["event_type"])
+    op.create_index("ix_activity_events_task_id", "activity_events", ["task_id"])
+    op.create_index(
+        "ix_activity_events_task_comment_task_id_created_at",
+        "activity_events",
+        ["task_id", "created_at"],
+        postgresql_where=sa.text("event_type = 'task.comment'"),
+    )
+    op.create_index("ix_activity_events_created_at_id", "activity_events", ["created_at", "id"])
+    op.create_index(
+        "ix_activity_events_event_type_created_at_id",
+        "activity_events",
+        ["event_type", "created_at", "id"],
+    )
+
+
+def _add_constraints(primary_key: str) -> None:
+    op.execute(
+        f"ALTER TABLE activity_events ADD CONSTRAINT activity_events_pkey PRIMARY KEY ({primary_key})",
+    )
+    op.create_foreign_key(
+        "activity_events_agent_id_fkey",
+        "activity_events",
+        "agents",
+        ["agent_id"],
+        ["id"],
+    )
+    op.create_foreign_key(
+        "activity_events_task_id_fkey",
+        "activity_events",
+        "tasks",
+        ["task_id"],
+        ["id"],
+    )
+
+
+def upgrade() -> None:
+    # Native range partitioning requires the partition key in every unique constraint, so
+    # the primary key becomes (id, created_at). Ids remain uuid4 and unique in practice.
+    op.execute(
+        """
+        CREATE TABLE activity_events_partitioned (
+            id UUID NOT NULL,
+            event_type VARCHAR NOT NULL,
+            message VARCHAR,
+            agent_id UUID,
+            task_id UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        ) PARTITION BY RANGE (created_at)
+        """,
+    )
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM activity_events")).scalar()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    month = _month_start(oldest if oldest is not None else now)
+    last = _month_start(now)
+    for _ in range(_MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE activity_events_p{month:%Y_%m} "
+            "PARTITION OF activity_events_partitioned "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')",
+        )
+        month = upper
+    # Catches rows outside the prepared months until maintenance creates their partition.
+    op.execute("CREATE TABLE activity_events_default PARTITION OF activity_events_partitioned DEFAULT")
+    op.execute(
+        f"INSERT INTO activity_events_partitioned ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM activity_events",
+    )
+    op.drop_table("activity_events")
+    op.rename_table("activity_events_partitioned", "activity_events")
+    _add_constraints("id, created_at")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE activity_events_unpartitioned (
+            id UUID NOT NULL,
+            event_type VARCHAR NOT NULL,
+            message VARCHAR,
+            agent_id UUID,
+            task_id UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+        """,
+    )
+    op.execute(
+        f"INSERT INTO activity_events_unpartitioned ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM activity_events",
+    )
+    # Dropping the parent drops every attached partition with it.
+    op.drop_table("activity_events")
+    op.rename_table("activity_events_unpartitioned", "activity_events")
+    _add_constraints("id")
+    _create_indexes()
@@ -0,0 +1,36 @@
+"""add agent token fingerprints
+
+Revision ID: b9c1d3e5f7a0
+Revises: a8b0c2d4e6f9
+Create Date: 2026-03-08 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b9c1d3e5f7a0"
+down_revision = "a8b0c2d4e6f9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing tokens are only stored as salted hashes; their fingerprints are filled in
+    # by agent auth the next time each token is used.
+    op.add_column("agents", sa.Column("agent_token_fingerprint", sa.String(), nullable=True))
+    op.create_index(
+        op.f("ix_agents_agent_token_fingerprint"),
+        "agents",
+        ["agent_token_fingerprint"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_agents_agent_token_fingerprint"), table_name="agents")
+    op.drop_column("agents", "agent_token_fingerprint")
@@ -0,0 +1,73 @@
+"""add materialized task blocked state
+
+Revision ID: c0d2e4f6a8b1
+Revises: b9c1d3e5f7a0
+Create Date: 2026-03-09 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c0d2e4f6a8b1"
+down_revision = "b9c1d3e5f7a0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "blocked_by_task_ids",
+            sa.JSON(),
+            nullable=False,
+            server_default=sa.text("'[]'"),
+        ),
+    )
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "blocked_by_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    # Backfill from the dependency edges: a dependency blocks until it is done.
+    op.execute(
+        """
+        UPDATE tasks
+        SET blocked_by_task_ids = blockers.ids,
+            blocked_by_count = blockers.total
+        FROM (
+            SELECT dep.task_id,
+                   json_agg(dep.depends_on_task_id::text ORDER BY dep.created_at) AS ids,
+                   count(*) AS total
+            FROM task_dependencies AS dep
+            JOIN tasks AS blocker ON blocker.id = dep.depends_on_task_id
+            WHERE blocker.status <> 'done'
+            GROUP BY dep.task_id
+        ) AS blockers
+        WHERE tasks.id = blockers.task_id
+        """,
+    )
+    # Agents poll for unblocked work per board and status (usually inbox), newest first.
+    op.create_index(
+        "ix_tasks_board_id_status_blocked_by_count_created_at",
+        "tasks",
+        ["board_id", "status", "blocked_by_count", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_tasks_board_id_status_blocked_by_count_created_at",
+        table_name="tasks",
+    )
+    op.drop_column("tasks", "blocked_by_count")
+    op.drop_column("tasks", "blocked_by_task_ids")
@@ -0,0 +1,39 @@
+"""add (board_id, created_at, id) index for keyset task listing
+
+Revision ID: c4d6e8f0a2b3
+Revises: a3c5e7f9b1d2
+Create Date: 2026-03-03 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c4d6e8f0a2b3"
+down_revision = "a3c5e7f9b1d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cursor pages of a board's tasks order by `(created_at, id) desc` and seek past the
+    # previous page's last row. Appending `id` lets the seek predicate and the tie-breaker
+    # be served by one backward index scan. Supersedes ix_tasks_board_id_created_at.
+    op.create_index(
+        "ix_tasks_board_id_created_at_id",
+        "tasks",
+        ["board_id", "created_at", "id"],
+    )
+    op.drop_index("ix_tasks_board_id_created_at", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_tasks_board_id_created_at",
+        "tasks",
+        ["board_id", "created_at"],
+    )
+    op.drop_index("ix_tasks_board_id_created_at_id", table_name="tasks")
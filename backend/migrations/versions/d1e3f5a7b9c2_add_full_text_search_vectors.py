@@ -0,0 +1,70 @@
+"""add full-text search vectors for tasks, comments and board memory
+
+Revision ID: d1e3f5a7b9c2
+Revises: c0d2e4f6a8b1
+Create Date: 2026-03-10 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d1e3f5a7b9c2"
+down_revision = "c0d2e4f6a8b1"
+branch_labels = None
+depends_on = None
+
+# Kept in sync with app.services.search.TEXT_SEARCH_CONFIG.
+_VECTORS = {
+    "tasks": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ),
+    "activity_events": "to_tsvector('english', coalesce(message, ''))",
+    "board_memory": "to_tsvector('english', coalesce(content, ''))",
+}
+
+
+def upgrade() -> None:
+    # Stored generated columns: PostgreSQL recomputes them on every insert and update, so
+    # no application write path has to maintain them. Adding one rewrites the table.
+    for table, expression in _VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED",
+        )
+    op.create_index(
+        "ix_tasks_search_vector",
+        "tasks",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    # Only comments are searched among activity events; partitions inherit the index.
+    op.create_index(
+        "ix_activity_events_task_comment_search_vector",
+        "activity_events",
+        ["search_vector"],
+        postgresql_using="gin",
+        postgresql_where=sa.text("event_type = 'task.comment'"),
+    )
+    op.create_index(
+        "ix_board_memory_search_vector",
+        "board_memory",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_memory_search_vector", table_name="board_memory")
+    op.drop_index(
+        "ix_activity_events_task_comment_search_vector",
+        table_name="activity_events",
+    )
+    op.drop_index("ix_tasks_search_vector", table_name="tasks")
+    for table in reversed(_VECTORS):
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,35 @@
+"""add per-board version counters for snapshot caching
+
+Revision ID: d5e7f9a1b3c4
+Revises: c4d6e8f0a2b3
+Create Date: 2026-03-04 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d5e7f9a1b3c4"
+down_revision = "c4d6e8f0a2b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A table of its own rather than a `boards` column, so bumping a version never locks
+    # the board row that task and agent writes reference.
+    op.create_table(
+        "board_versions",
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("board_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("board_versions")
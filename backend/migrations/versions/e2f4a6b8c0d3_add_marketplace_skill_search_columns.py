@@ -0,0 +1,70 @@
+"""add normalized filter keys and trigram search text to marketplace skills
+
+Revision ID: e2f4a6b8c0d3
+Revises: d1e3f5a7b9c2
+Create Date: 2026-03-11 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e2f4a6b8c0d3"
+down_revision = "d1e3f5a7b9c2"
+branch_labels = None
+depends_on = None
+
+# Kept in sync with the MARKETPLACE_*_SQL expressions in app.models.skills.
+_GENERATED = {
+    "category_key": "lower(trim(coalesce(category, '')))",
+    "risk_key": "lower(trim(coalesce(risk, '')))",
+    "search_text": (
+        "lower(coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || "
+        "coalesce(category, '') || ' ' || coalesce(risk, '') || ' ' || coalesce(source, ''))"
+    ),
+}
+
+
+def upgrade() -> None:
+    for column, expression in _GENERATED.items():
+        op.add_column(
+            "marketplace_skills",
+            sa.Column(column, sa.String(), sa.Computed(expression, persisted=True)),
+        )
+    op.create_index(
+        "ix_marketplace_skills_organization_id_category_key",
+        "marketplace_skills",
+        ["organization_id", "category_key"],
+    )
+    op.create_index(
+        "ix_marketplace_skills_organization_id_risk_key",
+        "marketplace_skills",
+        ["organization_id", "risk_key"],
+    )
+    # Trigram GIN index: serves the `LIKE '%term%'` keyword filter without a sequential scan.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_marketplace_skills_search_text_trgm",
+        "marketplace_skills",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marketplace_skills_search_text_trgm", table_name="marketplace_skills")
+    op.drop_index(
+        "ix_marketplace_skills_organization_id_risk_key",
+        table_name="marketplace_skills",
+    )
+    op.drop_index(
+        "ix_marketplace_skills_organization_id_category_key",
+        table_name="marketplace_skills",
+    )
+    for column in reversed(_GENERATED):
+        op.drop_column("marketplace_skills", column)
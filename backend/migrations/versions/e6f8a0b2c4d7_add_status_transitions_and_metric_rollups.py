@@ -0,0 +1,166 @@
+"""add task status transitions and hourly board metric rollups
+
+Revision ID: e6f8a0b2c4d7
+Revises: d5e7f9a1b3c4
+Create Date: 2026-03-05 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e6f8a0b2c4d7"
+down_revision = "d5e7f9a1b3c4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_status_transitions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=False),
+        sa.Column("agent_id", sa.Uuid(), nullable=True),
+        sa.Column("cycle_time_hours", sa.Float(), nullable=True),
+        sa.Column("at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"]),
+        sa.ForeignKeyConstraint(["agent_id"], ["agents.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Metrics filter by board and target status over a time range.
+    op.create_index(
+        "ix_task_status_transitions_board_id_to_status_at",
+        "task_status_transitions",
+        ["board_id", "to_status", "at"],
+    )
+    op.create_index(
+        "ix_task_status_transitions_task_id",
+        "task_status_transitions",
+        ["task_id"],
+    )
+    # Recover history from status-change activity messages ("Task moved to <status>: ..."
+    # and dependency resets "Task returned to inbox: ..."). The previous status and cycle
+    # time were never recorded, so both stay NULL for backfilled rows.
+    op.execute(
+        """
+        INSERT INTO task_status_transitions (id, board_id, task_id, to_status, agent_id, at)
+        SELECT
+            activity_events.id,
+            tasks.board_id,
+            activity_events.task_id,
+            CASE
+                WHEN left(activity_events.message, 23) = 'Task returned to inbox:' THEN 'inbox'
+                ELSE split_part(substring(activity_events.message FROM 15), ':', 1)
+            END,
+            activity_events.agent_id,
+            activity_events.created_at
+        FROM activity_events
+        JOIN tasks ON tasks.id = activity_events.task_id
+        WHERE activity_events.event_type = 'task.status_changed'
+          AND tasks.board_id IS NOT NULL
+          AND (
+              (
+                  left(activity_events.message, 14) = 'Task moved to '
+                  AND position(':' IN activity_events.message) > 0
+              )
+              OR left(activity_events.message, 23) = 'Task returned to inbox:'
+          )
+        """,
+    )
+    op.create_table(
+        "board_hourly_metrics",
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("tasks_created", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("moved_to_in_progress", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("moved_to_review", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("moved_to_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cycle_time_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cycle_time_hours_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("events_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("events_failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("board_id", "bucket_start"),
+    )
+    # Seed rollups from current task rows, as the old on-the-fly queries did: each task
+    # counts under its present status at its last update. Backfilled transitions carry
+    # no cycle times, so they are not replayed here.
+    op.execute(
+        """
+        INSERT INTO board_hourly_metrics (
+            board_id, bucket_start, tasks_created, moved_to_in_progress, moved_to_review,
+            moved_to_done, cycle_time_count, cycle_time_hours_sum
+        )
+        SELECT
+            board_id,
+            bucket_start,
+            SUM(created),
+            SUM(in_progress),
+            SUM(review),
+            SUM(done),
+            SUM(cycle_count),
+            SUM(cycle_hours)
+        FROM (
+            SELECT
+                board_id,
+                date_trunc('hour', created_at) AS bucket_start,
+                1 AS created, 0 AS in_progress, 0 AS review, 0 AS done,
+                0 AS cycle_count, 0.0 AS cycle_hours
+            FROM tasks
+            WHERE board_id IS NOT NULL
+            UNION ALL
+            SELECT
+                board_id,
+                date_trunc('hour', updated_at),
+                0,
+                CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END,
+                CASE WHEN status = 'review' THEN 1 ELSE 0 END,
+                CASE WHEN status = 'done' THEN 1 ELSE 0 END,
+                CASE WHEN status = 'review' AND in_progress_at IS NOT NULL THEN 1 ELSE 0 END,
+                CASE WHEN status = 'review' AND in_progress_at IS NOT NULL
+                    THEN EXTRACT(EPOCH FROM updated_at - in_progress_at) / 3600.0
+                    ELSE 0.0 END
+            FROM tasks
+            WHERE board_id IS NOT NULL AND status <> 'inbox'
+        ) AS seeded
+        GROUP BY board_id, bucket_start
+        """,
+    )
+    op.execute(
+        """
+        INSERT INTO board_hourly_metrics (board_id, bucket_start, events_total, events_failed)
+        SELECT
+            tasks.board_id,
+            date_trunc('hour', activity_events.created_at),
+            COUNT(*),
+            SUM(CASE WHEN right(activity_events.event_type, 6) = 'failed' THEN 1 ELSE 0 END)
+        FROM activity_events
+        JOIN tasks ON tasks.id = activity_events.task_id
+        WHERE tasks.board_id IS NOT NULL
+        GROUP BY tasks.board_id, date_trunc('hour', activity_events.created_at)
+        ON CONFLICT (board_id, bucket_start) DO UPDATE SET
+            events_total = board_hourly_metrics.events_total + EXCLUDED.events_total,
+            events_failed = board_hourly_metrics.events_failed + EXCLUDED.events_failed
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("board_hourly_metrics")
+    op.drop_index(
+        "ix_task_status_transitions_task_id",
+        table_name="task_status_transitions",
+    )
+    op.drop_index(
+        "ix_task_status_transitions_board_id_to_status_at",
+        table_name="task_status_transitions",
+    )
+    op.drop_table("task_status_transitions")
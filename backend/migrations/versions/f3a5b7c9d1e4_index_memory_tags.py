@@ -0,0 +1,41 @@
+"""store memory tags as jsonb and index them for containment filters
+
+Revision ID: f3a5b7c9d1e4
+Revises: e2f4a6b8c0d3
+Create Date: 2026-03-12 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f3a5b7c9d1e4"
+down_revision = "e2f4a6b8c0d3"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("board_memory", "board_group_memory")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        # `json` has no containment operator or GIN support; converting rewrites the table.
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN tags TYPE jsonb USING tags::jsonb")
+        # jsonb_path_ops only serves `@>`, which is all app.db.json_tags emits, and is
+        # smaller and faster than the default operator class.
+        op.create_index(
+            f"ix_{table}_tags",
+            table,
+            ["tags"],
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.drop_index(f"ix_{table}_tags", table_name=table)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN tags TYPE json USING tags::json")
@@ -0,0 +1,46 @@
+"""CLI script to run activity_events partition upkeep, retention and archival once."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create upcoming activity_events partitions, prune events past their retention "
+            "and archive old partitions, using the ACTIVITY_EVENTS_* settings."
+        ),
+    )
+    return parser.parse_args()
+
+
+async def _run() -> int:
+    from app.db.session import worker_session_maker
+    from app.services.activity_partitions import run_maintenance
+
+    _parse_args()
+    async with worker_session_maker() as session:
+        result = await run_maintenance(session)
+
+    sys.stdout.write(f"partitions_created={','.join(result.partitions_created) or '-'}\n")
+    for event_type, count in sorted(result.events_deleted.items()):
+        sys.stdout.write(f"deleted event_type={event_type} count={count}\n")
+    for path in result.archived:
+        sys.stdout.write(f"archived path={path}\n")
+    return 0
+
+
+def main() -> None:
+    """Run the async CLI workflow and exit with its return code."""
+    raise SystemExit(asyncio.run(_run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,6 @@ if str(ROOT) not in sys.path:
 # defaults during import-time settings initialization, regardless of shell env.
 os.environ["AUTH_MODE"] = "local"
 os.environ["LOCAL_AUTH_TOKEN"] = "test-local-token-0123456789-0123456789-0123456789x"
+# Dev-mode query budget: requests that run more statements than this fail loudly.
+os.environ.setdefault("DB_QUERY_BUDGET_PER_REQUEST", "100")
+os.environ.setdefault("DB_QUERY_BUDGET_ENFORCE", "true")
@@ -0,0 +1,200 @@
+# ruff: noqa: INP001
+"""Tests for activity_events retention, partition naming and NDJSON archives."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import AsyncIterator, Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.auth_mode import AuthMode
+from app.core.config import Settings
+from app.models.activity_events import ActivityEvent
+from app.services.activity_partitions import (
+    add_months,
+    apply_retention,
+    archive_partitions,
+    ensure_partitions,
+    parse_event_types,
+    parse_retention_policy,
+    partition_month,
+    partition_name,
+    write_ndjson_archive,
+)
+
+
+def test_retention_policy_parsing_and_partition_names() -> None:
+    assert parse_retention_policy(" agent.heartbeat=7, task.comment=365 ,") == {
+        "agent.heartbeat": 7,
+        "task.comment": 365,
+    }
+    with pytest.raises(ValueError, match="event_type=days"):
+        parse_retention_policy("agent.heartbeat")
+
+    december = datetime(2025, 12, 17, 9, 30)
+    assert add_months(december, 1) == datetime(2026, 1, 1)
+    assert add_months(december, -12) == datetime(2024, 12, 1)
+    assert partition_name(december) == "activity_events_p2025_12"
+    assert partition_month("activity_events_p2025_12") == datetime(2025, 12, 1)
+    assert partition_month("activity_events_default") is None
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_only_expired_events_of_listed_types() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    now = datetime(2026, 3, 10, 12, 0)
+    try:
+        async with AsyncSession(engine) as session:
+            session.add_all(
+                [
+                    ActivityEvent(event_type="agent.heartbeat", created_at=now - timedelta(days=9)),
+                    ActivityEvent(event_type="agent.heartbeat", created_at=now - timedelta(days=8)),
+                    ActivityEvent(event_type="agent.heartbeat", created_at=now - timedelta(days=1)),
+                    ActivityEvent(event_type="task.comment", created_at=now - timedelta(days=90)),
+                ],
+            )
+            await session.commit()
+
+            # Partition upkeep is PostgreSQL-only and does nothing elsewhere.
+            assert await ensure_partitions(session, now=now, months_ahead=2) == []
+            deleted = await apply_retention(
+                session,
+                now=now,
+                policy={"agent.heartbeat": 7},
+                batch_size=1,
+            )
+            assert deleted == {"agent.heartbeat": 2}
+
+            remaining = await session.exec(
+                select(col(ActivityEvent.event_type)).order_by(col(ActivityEvent.event_type)),
+            )
+            assert list(remaining) == ["agent.heartbeat", "task.comment"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ndjson_archive_is_gzipped_one_object_per_line(tmp_path: Path) -> None:
+    event_id = uuid4()
+    created_at = datetime(2025, 1, 5, 8, 0)
+
+    async def rows() -> AsyncIterator[Mapping[str, Any]]:
+        yield {"id": event_id, "event_type": "task.comment", "created_at": created_at}
+        yield {"id": uuid4(), "event_type": "agent.heartbeat", "created_at": created_at}
+
+    path = tmp_path / "archive" / "activity_events_p2025_01.ndjson.gz"
+    assert await write_ndjson_archive(path, rows()) == 2
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        lines = [json.loads(line) for line in handle]
+    assert lines[0] == {
+        "id": str(event_id),
+        "event_type": "task.comment",
+        "created_at": "2025-01-05T08:00:00",
+    }
+    assert [line["event_type"] for line in lines] == ["task.comment", "agent.heartbeat"]
+    assert [child.name for child in path.parent.iterdir()] == [path.name]
+
+
+class _FakePostgresSession:
+    """Just enough of an AsyncSession to drive `archive_partitions` without PostgreSQL."""
+
+    def __init__(self, partitions: set[str], rows: list[dict[str, Any]]) -> None:
+        self.partitions = partitions
+        self.rows = rows
+        self.statements: list[str] = []
+        self.dialect = type("Dialect", (), {"name": "postgresql"})()
+
+    async def connection(self) -> _FakePostgresSession:
+        return self
+
+    async def scalar(self, _statement: object, _params: object = None) -> bool:
+        return True
+
+    async def execute(self, statement: object, _params: object = None) -> Any:
+        sql = str(statement)
+        self.statements.append(sql)
+        if "DROP TABLE" in sql:
+            self.partitions.discard(sql.split()[-1])
+        partitions = set(self.partitions)
+        return type("Result", (), {"scalars": lambda _self: partitions})()
+
+    async def stream(self, statement: object, params: Mapping[str, Any]) -> AsyncIterator[Any]:
+        self.statements.append(str(statement))
+        keep = set(params["keep"])
+
+        async def rows() -> AsyncIterator[Any]:
+            for row in self.rows:
+                if row["event_type"] not in keep:
+                    yield type("Row", (), {"_asdict": lambda _self, row=row: row})()
+
+        return rows()
+
+    async def commit(self) -> None:
+        self.statements.append("COMMIT")
+
+    async def rollback(self) -> None:
+        self.statements.append("ROLLBACK")
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_comment_events_out_of_dropped_partitions(tmp_path: Path) -> None:
+    created_at = datetime(2025, 1, 5, 8, 0)
+    session: Any = _FakePostgresSession(
+        {"activity_events_p2025_01", "activity_events_p2026_03", "activity_events_default"},
+        [
+            {"id": uuid4(), "event_type": "task.comment", "created_at": created_at},
+            {"id": uuid4(), "event_type": "task.updated", "created_at": created_at},
+        ],
+    )
+
+    archived = await archive_partitions(
+        session,
+        now=datetime(2026, 3, 10),
+        after_months=12,
+        archive_dir=tmp_path,
+        keep_event_types=parse_event_types(" task.comment ,,"),
+    )
+
+    assert archived == [tmp_path / "activity_events_p2025_01.ndjson.gz"]
+    with gzip.open(archived[0], "rt", encoding="utf-8") as handle:
+        assert [json.loads(line)["event_type"] for line in handle] == ["task.updated"]
+    statements = session.statements
+    copy = next(i for i, sql in enumerate(statements) if "CREATE TEMPORARY TABLE" in sql)
+    drop = statements.index("DROP TABLE activity_events_p2025_01")
+    restore = next(i for i, sql in enumerate(statements) if sql.startswith("INSERT INTO"))
+    assert copy < drop < restore < statements.index("COMMIT")
+    assert "activity_events_p2026_03" in session.partitions
+    # The generated `search_vector` column must be neither copied nor inserted.
+    columns = "id, event_type, message, agent_id, task_id, created_at"
+    assert f"SELECT {columns} FROM activity_events_p2025_01 WHERE" in statements[copy]
+    assert statements[restore] == (
+        f"INSERT INTO activity_events ({columns}) "
+        f"SELECT {columns} FROM activity_events_p2025_01_kept"
+    )
+    assert not any("SELECT *" in sql for sql in statements)
+
+
+def test_archiving_requires_an_absolute_archive_dir() -> None:
+    base: dict[str, Any] = {
+        "_env_file": None,
+        "auth_mode": AuthMode.LOCAL,
+        "local_auth_token": "a" * 50,
+        "activity_events_archive_after_months": 12,
+    }
+    with pytest.raises(ValidationError, match="ACTIVITY_EVENTS_ARCHIVE_DIR must be an absolute"):
+        Settings(**base, activity_events_archive_dir="archives/activity_events")
+    configured = Settings(**base, activity_events_archive_dir="/var/lib/archives")
+    assert configured.activity_events_archive_keep_types == "task.comment"
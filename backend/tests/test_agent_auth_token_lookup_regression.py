@@ -1,56 +1,247 @@
 # ruff: noqa: INP001
-"""Regression test sketch for agent-token lookup complexity.
+"""Regression tests for agent-token lookup complexity.
 
-Context:
-- Current implementation performs PBKDF2 verification in a loop over *all* agents
-  that have a token hash (`agent_auth._find_agent_for_token`).
-- This is O(N_agents) *and* each verify is expensive (PBKDF2 200k iterations).
-
-This test is marked xfail to document the desired behavior after a hardening
-refactor: O(1) lookup + single hash verify.
-
-Once token lookup is refactored, flip this to a normal passing test.
+Token verification is PBKDF2 with 200k iterations, so authentication must look the
+candidate agent up by its indexed token fingerprint and verify at most once instead of
+verifying against every agent.
 """
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+from datetime import timedelta
+from uuid import uuid4
 
 import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import agent_auth
+from app.core.agent_tokens import (
+    agent_token_fingerprint,
+    forget_verified_agent_tokens,
+    generate_agent_token,
+    hash_agent_token,
+    verified_agent_tokens,
+    verify_agent_token,
+)
+from app.core.time import utcnow
+from app.models.agents import Agent
+from app.services.openclaw.db_agent_state import mint_agent_token
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _count_verifications(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    verified_agent_tokens.clear()
+    agent_auth._rejected_legacy_tokens.clear()
+    monkeypatch.setattr(agent_auth, "_legacy_scan_budget", agent_auth._LegacyScanBudget(100))
+    calls = {"n": 0}
+
+    def _counting_verify(token: str, stored_hash: str) -> bool:
+        calls["n"] += 1
+        return verify_agent_token(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
 
 
 @pytest.mark.asyncio
-@pytest.mark.xfail(
-    reason="Known DoS risk: agent token verification is currently O(N_agents)."
-    " Refactor token scheme/lookup to O(1) and make this pass.",
-    strict=False,
-)
 async def test_agent_token_lookup_should_not_verify_more_than_once(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Fake a session that returns many agents with token hashes.
-    class _FakeSession:
-        async def exec(self, _stmt: object) -> list[object]:
-            agents = []
-            for i in range(50):
-                agents.append(
-                    SimpleNamespace(agent_token_hash=f"pbkdf2_sha256$1$salt{i}$digest{i}")
-                )
-            return agents
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agents = [Agent(name=f"agent-{i}", gateway_id=uuid4()) for i in range(20)]
+            tokens = [mint_agent_token(agent) for agent in agents]
+            session.add_all(agents)
+            await session.commit()
+            calls = _count_verifications(monkeypatch)
 
-    calls = {"n": 0}
+            found = await agent_auth._find_agent_for_token(session, tokens[7])
+            assert found is not None and found.id == agents[7].id
+            assert calls["n"] == 1
 
-    def _fake_verify(_token: str, _stored_hash: str) -> bool:
-        calls["n"] += 1
-        # Always invalid
-        return False
+            assert await agent_auth._find_agent_for_token(session, generate_agent_token()) is None
+            assert await agent_auth._find_agent_for_token(session, "legacy-invalid") is None
+            assert calls["n"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_tokens_gain_a_fingerprint_on_first_use(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    legacy_token = "pre-fingerprint-token"
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(
+                name="legacy",
+                gateway_id=uuid4(),
+                agent_token_hash=hash_agent_token(legacy_token),
+            )
+            session.add(agent)
+            await session.commit()
 
-    monkeypatch.setattr(agent_auth, "verify_agent_token", _fake_verify)
+            found = await agent_auth._find_agent_for_token(session, legacy_token)
+            assert found is not None
+            assert found.agent_token_fingerprint == agent_token_fingerprint(legacy_token)
 
-    out = await agent_auth._find_agent_for_token(_FakeSession(), "invalid")  # type: ignore[arg-type]
-    assert out is None
+            calls = _count_verifications(monkeypatch)
+            assert await agent_auth._find_agent_for_token(session, legacy_token) is not None
+            # Once every agent is fingerprinted, unknown legacy-style tokens verify nothing.
+            assert await agent_auth._find_agent_for_token(session, "other-legacy") is None
+            assert calls["n"] == 1
+    finally:
+        await engine.dispose()
 
-    # Desired behavior after refactor: avoid linear scan.
-    assert calls["n"] <= 1
+
+@pytest.mark.asyncio
+async def test_verified_tokens_are_cached_until_rotation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="worker", gateway_id=uuid4())
+            token = mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+            calls = _count_verifications(monkeypatch)
+
+            for _ in range(3):
+                assert await agent_auth._find_agent_for_token(session, token) is not None
+            assert calls["n"] == 1
+
+            forget_verified_agent_tokens(agent.id)
+            assert await agent_auth._find_agent_for_token(session, token) is not None
+            assert calls["n"] == 2
+
+            rotated = mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+            assert await agent_auth._find_agent_for_token(session, token) is None
+            assert await agent_auth._find_agent_for_token(session, rotated) is not None
+            assert calls["n"] == 3
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_scans_page_through_every_agent_and_rate_limit_misses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all(
+                [
+                    Agent(
+                        name=f"legacy-{i}",
+                        gateway_id=uuid4(),
+                        agent_token_hash=hash_agent_token(f"legacy-token-{i}"),
+                    )
+                    for i in range(5)
+                ],
+            )
+            await session.commit()
+            calls = _count_verifications(monkeypatch)
+            monkeypatch.setattr(agent_auth, "_legacy_scan_budget", agent_auth._LegacyScanBudget(1))
+            monkeypatch.setattr(agent_auth.settings, "agent_legacy_token_scan_limit", 2)
+
+            # Matches are found on any page and never use up the miss budget.
+            for i in range(5):
+                assert await agent_auth._find_agent_for_token(session, f"legacy-token-{i}")
+            assert agent_auth._legacy_scan_budget.retry_after() is None
+
+            session.add_all(
+                [
+                    Agent(
+                        name=f"late-{i}",
+                        gateway_id=uuid4(),
+                        agent_token_hash=hash_agent_token(f"late-token-{i}"),
+                    )
+                    for i in range(3)
+                ],
+            )
+            await session.commit()
+            calls["n"] = 0
+            assert await agent_auth._find_agent_for_token(session, "unknown-legacy") is None
+            assert calls["n"] == 3
+            # A miss from a complete scan is remembered and does not scan again.
+            assert await agent_auth._find_agent_for_token(session, "unknown-legacy") is None
+            assert calls["n"] == 3
+
+            # With the miss budget spent, legacy tokens are deferred rather than refused.
+            with pytest.raises(HTTPException) as exc:
+                await agent_auth._find_agent_for_token(session, "late-token-2")
+            assert exc.value.status_code == 429
+            assert exc.value.headers is not None
+            assert 1 <= int(exc.value.headers["Retry-After"]) <= 60
+            assert calls["n"] == 3
+            assert not agent_auth._rejected_legacy_tokens.get(
+                agent_token_fingerprint("late-token-2"),
+            )
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dormant_legacy_tokens_expire_so_agents_must_be_rekeyed() -> None:
+    engine = await _make_engine()
+    now = utcnow()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            dormant = Agent(
+                name="dormant",
+                gateway_id=uuid4(),
+                agent_token_hash=hash_agent_token("dormant-token"),
+                last_seen_at=now - timedelta(days=45),
+            )
+            recent = Agent(
+                name="recent",
+                gateway_id=uuid4(),
+                agent_token_hash=hash_agent_token("recent-token"),
+                last_seen_at=now - timedelta(days=1),
+            )
+            migrated = Agent(
+                name="migrated",
+                gateway_id=uuid4(),
+                last_seen_at=now - timedelta(days=90),
+            )
+            mint_agent_token(migrated)
+            session.add_all([dormant, recent, migrated])
+            await session.commit()
+
+            assert (
+                await agent_auth.expire_legacy_agent_tokens(
+                    session,
+                    now=now,
+                    after_days=0,
+                )
+                == []
+            )
+            expired = await agent_auth.expire_legacy_agent_tokens(
+                session,
+                now=now,
+                after_days=30,
+            )
+            assert expired == [dormant.id]
+            hashes = {
+                agent.name: agent.agent_token_hash
+                for agent in await Agent.objects.all().all(session)
+            }
+            assert hashes["dormant"] is None
+            assert hashes["recent"] is not None
+            assert hashes["migrated"] is not None
+    finally:
+        await engine.dispose()
@@ -128,6 +128,19 @@ async def test_delete_agent_as_lead_removes_board_agent(
     )
     monkeypatch.setattr(agent_service.crud, "update_where", _fake_update_where)
     monkeypatch.setattr(agent_service, "record_activity", lambda *_a, **_k: None)
+    returned_for: list[UUID] = []
+
+    async def _fake_return_agent_tasks_to_inbox(
+        _session: object, *, agent_id: UUID
+    ) -> list[object]:
+        returned_for.append(agent_id)
+        return []
+
+    monkeypatch.setattr(
+        agent_service,
+        "return_agent_tasks_to_inbox",
+        _fake_return_agent_tasks_to_inbox,
+    )
 
     result = await service.delete_agent_as_lead(
         agent_id=str(target.id),
@@ -137,6 +150,7 @@ async def test_delete_agent_as_lead_removes_board_agent(
     assert result.ok is True
     assert session.deleted and session.deleted[0] == target
     assert BoardWebhook in update_models
+    assert returned_for == [target.id]
 
 
 @pytest.mark.asyncio
@@ -126,10 +126,24 @@ async def test_delete_gateway_main_agent_does_not_require_board_id(
     )
     monkeypatch.setattr(agent_service.crud, "update_where", _fake_update_where)
     monkeypatch.setattr(agent_service, "record_activity", lambda *_a, **_k: None)
+    returned_for: list[UUID] = []
+
+    async def _fake_return_agent_tasks_to_inbox(
+        _session: object, *, agent_id: UUID
+    ) -> list[object]:
+        returned_for.append(agent_id)
+        return []
+
+    monkeypatch.setattr(
+        agent_service,
+        "return_agent_tasks_to_inbox",
+        _fake_return_agent_tasks_to_inbox,
+    )
 
     result = await service.delete_agent(agent_id=str(agent.id), ctx=ctx)  # type: ignore[arg-type]
 
     assert result.ok is True
     assert called["delete_lifecycle"] == 1
     assert Approval in updated_models
+    assert returned_for == [agent.id]
     assert session.deleted and session.deleted[0] == agent
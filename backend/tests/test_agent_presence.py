@@ -0,0 +1,101 @@
+# ruff: noqa: INP001
+"""Tests for coalesced agent presence writes and heartbeat activity recording."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.db.agent_presence import AgentPresenceStore
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.services.openclaw.provisioning_db import AgentLifecycleService
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _stored_agent(engine: AsyncEngine, agent_id: object) -> Agent:
+    async with AsyncSession(engine) as session:
+        agent = await Agent.objects.by_id(agent_id).first(session)
+        assert agent is not None
+        return agent
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_latest_check_ins_in_one_batch_without_going_backwards() -> None:
+    engine = await _make_engine()
+    store = AgentPresenceStore(flush_interval_seconds=5)
+    now = utcnow()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            stale = Agent(name="stale", gateway_id=uuid4(), last_seen_at=now - timedelta(hours=1))
+            fresh = Agent(name="fresh", gateway_id=uuid4(), last_seen_at=now)
+            session.add_all([stale, fresh])
+            await session.commit()
+
+            store.record(stale.id, now - timedelta(seconds=20))
+            store.record(stale.id, now - timedelta(seconds=30))
+            # Older than the value a write-through check-in already stored.
+            store.record(fresh.id, now - timedelta(minutes=5))
+            flushed_at = utcnow()
+            assert await store.flush(session) == 2
+            assert await store.flush(session) == 0
+
+        stored_stale = await _stored_agent(engine, stale.id)
+        assert stored_stale.last_seen_at == now - timedelta(seconds=20)
+        # `updated_at` is the write time so change-stream cursors past the check-in see it.
+        assert stored_stale.updated_at >= flushed_at
+        assert (await _stored_agent(engine, fresh.id)).last_seen_at == now
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_heartbeats_record_activity_only_for_status_transitions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    store = AgentPresenceStore(flush_interval_seconds=5)
+    monkeypatch.setattr("app.services.openclaw.provisioning_db.agent_presence", store)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="worker", gateway_id=uuid4(), status="provisioning")
+            session.add(agent)
+            await session.commit()
+            service = AgentLifecycleService(session)
+
+            first = await service.commit_heartbeat(agent=agent, status_value=None)
+            assert first.status == "online"
+            first_seen = (await _stored_agent(engine, agent.id)).last_seen_at
+            assert first_seen is not None
+
+            routine = await service.commit_heartbeat(agent=agent, status_value=None)
+            assert routine.status == "online"
+            assert (await _stored_agent(engine, agent.id)).last_seen_at == first_seen
+
+            assert await store.flush(session) == 1
+            flushed = await _stored_agent(engine, agent.id)
+            assert flushed.last_seen_at is not None
+            assert flushed.last_seen_at >= first_seen
+
+            events = list(
+                await session.exec(
+                    select(col(ActivityEvent.message)).where(
+                        col(ActivityEvent.event_type) == "agent.heartbeat",
+                    ),
+                ),
+            )
+            assert events == ["Heartbeat received from worker: provisioning -> online."]
+    finally:
+        await engine.dispose()
@@ -81,11 +81,13 @@ def test_extract_clerk_profile_prefers_primary_email() -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_or_sync_user_updates_email_and_name(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_get_or_sync_user_fetches_profile_on_first_sign_in(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     existing = User(clerk_user_id="user_123", email="old@example.com", name=None)
 
     async def _fake_get_or_create(*_args: Any, **_kwargs: Any) -> tuple[User, bool]:
-        return existing, False
+        return existing, True
 
     async def _fake_fetch(_clerk_user_id: str) -> tuple[str | None, str | None]:
         return "new@example.com", "New Name"
@@ -114,7 +116,7 @@ async def test_get_or_sync_user_uses_clerk_profile_when_claims_are_minimal(
     existing = User(clerk_user_id="user_123", email=None, name=None)
 
     async def _fake_get_or_create(*_args: Any, **_kwargs: Any) -> tuple[User, bool]:
-        return existing, False
+        return existing, True
 
     async def _fake_fetch(_clerk_user_id: str) -> tuple[str | None, str | None]:
         return "from-clerk@example.com", "From Clerk"
@@ -163,3 +165,33 @@ async def test_get_or_sync_user_skips_commit_when_unchanged(
     assert existing.name == "Name"
     assert session.committed == 0
     assert session.refreshed == []
+
+
+@pytest.mark.asyncio
+async def test_get_or_sync_user_refreshes_existing_profile_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    existing = User(clerk_user_id="user_123", email="same@example.com", name=None)
+    scheduled: list[str] = []
+
+    async def _fake_get_or_create(*_args: Any, **_kwargs: Any) -> tuple[User, bool]:
+        return existing, False
+
+    async def _boom(_clerk_user_id: str) -> tuple[str | None, str | None]:  # pragma: no cover
+        raise AssertionError("existing users must not wait on the Clerk API")
+
+    monkeypatch.setattr(auth.crud, "get_or_create", _fake_get_or_create)
+    monkeypatch.setattr(auth, "_fetch_clerk_profile", _boom)
+    monkeypatch.setattr(auth, "_schedule_profile_refresh", scheduled.append)
+
+    session = _FakeSession()
+    out = await auth._get_or_sync_user(
+        session,  # type: ignore[arg-type]
+        clerk_user_id="user_123",
+        claims={"given_name": "Claim", "family_name": "Name"},
+    )
+
+    assert out is existing
+    assert scheduled == ["user_123"]
+    assert existing.name == "Claim Name"
+    assert session.committed == 1
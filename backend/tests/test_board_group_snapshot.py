@@ -0,0 +1,126 @@
+# ruff: noqa: INP001
+"""Tests for per-board limits, concurrent reads and caching in group snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.board_versions import install_board_version_tracking
+from app.db.query_stats import track_queries
+from app.models.board_groups import BoardGroup
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.board_groups import BoardGroupRead
+from app.schemas.view_models import BoardGroupSnapshot
+from app.services.board_group_snapshot import (
+    GroupSnapshotCache,
+    build_group_snapshot,
+    group_snapshot_cache,
+)
+
+
+async def _make_engine(tmp_path: Path) -> AsyncEngine:
+    install_board_version_tracking()
+    # A file database gets a queue pool, so the builder forks one connection per read.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'groups.db'}")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> tuple[BoardGroup, list[Board]]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(id=uuid4(), name="Org One")
+        group = BoardGroup(organization_id=organization.id, name="g", slug="g")
+        boards = [
+            Board(
+                id=uuid4(),
+                organization_id=organization.id,
+                board_group_id=group.id,
+                name=f"b{index}",
+                slug=f"b{index}",
+            )
+            for index in range(3)
+        ]
+        session.add_all([organization, group, *boards])
+        for board in boards:
+            session.add(Task(board_id=board.id, title="low", priority="low"))
+            session.add(Task(board_id=board.id, title="high", priority="high"))
+            session.add(Task(board_id=board.id, title="active", status="in_progress"))
+            session.add(Task(board_id=board.id, title="finished", status="done"))
+        await session.commit()
+        return group, boards
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_limits_tasks_per_board_in_sql(tmp_path: Path) -> None:
+    group_snapshot_cache.clear()
+    engine = await _make_engine(tmp_path)
+    try:
+        group, boards = await _seed(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            snapshot = await build_group_snapshot(session, group=group, per_board_task_limit=2)
+        assert [item.board.id for item in snapshot.boards] == [board.id for board in boards]
+        for item in snapshot.boards:
+            assert [task.title for task in item.tasks] == ["active", "high"]
+            assert item.task_counts == {"inbox": 2, "in_progress": 1, "done": 1}
+    finally:
+        group_snapshot_cache.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_is_cached_until_a_board_version_changes(tmp_path: Path) -> None:
+    group_snapshot_cache.clear()
+    engine = await _make_engine(tmp_path)
+    try:
+        group, boards = await _seed(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            first = await build_group_snapshot(session, group=group, include_done=True)
+            first.boards = []
+            with track_queries() as stats:
+                cached = await build_group_snapshot(session, group=group, include_done=True)
+            # Only the board list is read to compute the version fingerprint.
+            assert stats.query_count == 1
+            assert len(cached.boards) == 3
+
+            session.add(Task(board_id=boards[0].id, title="new", status="in_progress"))
+            await session.commit()
+            refreshed = await build_group_snapshot(session, group=group, include_done=True)
+        assert refreshed.boards[0].task_counts["in_progress"] == 2
+    finally:
+        group_snapshot_cache.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_group_misses_share_one_build_per_fingerprint() -> None:
+    cache = GroupSnapshotCache(ttl_seconds=60, max_entries=8)
+    group = BoardGroup(id=uuid4(), organization_id=uuid4(), name="g", slug="g")
+    key = (group.id, None, False, 5)
+    builds = 0
+
+    async def build() -> BoardGroupSnapshot:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return BoardGroupSnapshot(group=BoardGroupRead.model_validate(group, from_attributes=True))
+
+    first, second = await asyncio.gather(
+        cache.get_or_build(key, "v1", build),
+        cache.get_or_build(key, "v1", build),
+    )
+    assert builds == 1
+    # Each caller gets its own copy to filter.
+    assert first is not second
+
+    await cache.get_or_build(key, "v2", build)
+    assert builds == 2
@@ -0,0 +1,222 @@
+# ruff: noqa: INP001
+"""Tests for board version tracking and the cached board snapshot endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.boards import router as boards_router
+from app.api.deps import get_board_for_actor_read
+from app.core.time import utcnow
+from app.db.board_versions import board_version, install_board_version_tracking
+from app.db.session import get_session
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.task_custom_fields import TaskCustomFieldDefinition, TaskCustomFieldValue
+from app.models.tasks import Task
+from app.schemas.boards import BoardRead
+from app.schemas.view_models import BoardSnapshot
+from app.services.approval_task_links import replace_approval_task_links
+from app.services.board_snapshot import BoardSnapshotCache, board_snapshot_cache
+from app.services.tags import replace_tags
+
+
+async def _make_engine() -> AsyncEngine:
+    install_board_version_tracking()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(engine: AsyncEngine) -> Board:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(id=uuid4(), name="Org One")
+        board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+        session.add_all([organization, board])
+        await session.commit()
+        return board
+
+
+async def _board_version(engine: AsyncEngine, board_id: UUID) -> int:
+    async with AsyncSession(engine) as session:
+        return await board_version(session, board_id)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_writes_bump_board_version_but_presence_touches_do_not() -> None:
+    engine = await _make_engine()
+    try:
+        board = await _seed_board(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(board_id=board.id, name="Worker", gateway_id=uuid4())
+            session.add(agent)
+            session.add(Task(board_id=board.id, title="First"))
+            await session.commit()
+            assert await _board_version(engine, board.id) == 1
+
+            agent.last_seen_at = utcnow()
+            agent.updated_at = utcnow()
+            session.add(agent)
+            await session.commit()
+            assert await _board_version(engine, board.id) == 1
+
+            agent.status = "offline"
+            session.add(agent)
+            await session.commit()
+            assert await _board_version(engine, board.id) == 2
+
+            session.add(Task(board_id=board.id, title="Rolled back"))
+            await session.flush()
+            await session.rollback()
+            assert await _board_version(engine, board.id) == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_tag_approval_link_and_custom_field_writes_bump_board_version() -> None:
+    engine = await _make_engine()
+    try:
+        board = await _seed_board(engine)
+        other_board = await _seed_board(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            task = Task(board_id=board.id, title="Tagged")
+            tag = Tag(organization_id=board.organization_id, name="Bug", slug="bug")
+            session.add_all([task, tag])
+            await session.commit()
+            assert await _board_version(engine, board.id) == 1
+
+            session.add(TagAssignment(task_id=task.id, tag_id=tag.id))
+            await session.commit()
+            assert await _board_version(engine, board.id) == 2
+
+            # Renaming a tag changes every task card that shows it, on any board of its org.
+            tag.name = "Defect"
+            session.add(tag)
+            await session.commit()
+            assert await _board_version(engine, board.id) == 3
+            assert await _board_version(engine, other_board.id) == 0
+
+            # Clearing every tag is a bulk delete the flush hook never sees.
+            await replace_tags(session, task_id=task.id, tag_ids=[])
+            await session.commit()
+            assert await _board_version(engine, board.id) == 4
+
+            approval = Approval(board_id=board.id, action_type="deploy", confidence=0.9)
+            session.add(approval)
+            await session.commit()
+            assert await _board_version(engine, board.id) == 5
+            await replace_approval_task_links(session, approval_id=approval.id, task_ids=[task.id])
+            await session.commit()
+            assert await _board_version(engine, board.id) == 6
+
+            definition = TaskCustomFieldDefinition(
+                organization_id=board.organization_id,
+                field_key="severity",
+                label="Severity",
+            )
+            value = TaskCustomFieldValue(
+                task_id=task.id,
+                task_custom_field_definition_id=definition.id,
+                value="high",
+            )
+            session.add_all([definition, value])
+            await session.commit()
+            assert await _board_version(engine, board.id) == 7
+
+            value.value = "low"
+            session.add(value)
+            await session.commit()
+            assert await _board_version(engine, board.id) == 8
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_build_until_the_version_changes() -> None:
+    cache = BoardSnapshotCache(ttl_seconds=60, max_entries=8)
+    board = Board(id=uuid4(), organization_id=uuid4(), name="b", slug="b")
+    builds = 0
+
+    async def build() -> BoardSnapshot:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return BoardSnapshot(
+            board=BoardRead.model_validate(board, from_attributes=True),
+            tasks=[],
+            agents=[],
+            approvals=[],
+            chat_messages=[],
+            pending_approvals_count=0,
+        )
+
+    first, second = await asyncio.gather(
+        cache.get_or_build(board, 1, build),
+        cache.get_or_build(board, 1, build),
+    )
+    assert builds == 1
+    assert first is second
+
+    assert (await cache.get_or_build(board, 2, build)).version == 2
+    assert builds == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_endpoint_answers_matching_etag_with_not_modified() -> None:
+    board_snapshot_cache.clear()
+    engine = await _make_engine()
+    board = await _seed_board(engine)
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(boards_router)
+    app.include_router(api_v1)
+
+    async def _override_get_session() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    async def _override_board() -> Board:
+        async with AsyncSession(engine) as session:
+            loaded = await Board.objects.by_id(board.id).first(session)
+            assert loaded is not None
+            return loaded
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = _override_board
+    url = f"/api/v1/boards/{board.id}/snapshot"
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get(url)
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+            assert first.json()["board"]["id"] == str(board.id)
+
+            unchanged = await client.get(url, headers={"If-None-Match": etag})
+            assert unchanged.status_code == 304
+
+            async with AsyncSession(engine) as session:
+                session.add(Task(board_id=board.id, title="New"))
+                await session.commit()
+
+            changed = await client.get(url, headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert [task["title"] for task in changed.json()["tasks"]] == ["New"]
+    finally:
+        board_snapshot_cache.clear()
+        await engine.dispose()
@@ -0,0 +1,174 @@
+# ruff: noqa: INP001
+"""Tests for sectioned and per-status paginated board snapshots."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.boards import router as boards_router
+from app.api.deps import get_board_for_actor_read
+from app.core.time import utcnow
+from app.db.replicas import get_read_session
+from app.db.session import get_session
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import board_snapshot
+from app.services.board_snapshot import (
+    SnapshotOptions,
+    board_snapshot_cache,
+    build_board_snapshot,
+    build_task_column_page,
+)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> Board:
+    now = utcnow()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(id=uuid4(), name="Org One")
+        board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+        session.add_all([organization, board])
+        for index in range(5):
+            session.add(
+                Task(
+                    board_id=board.id,
+                    title=f"inbox-{index}",
+                    created_at=now + timedelta(seconds=index),
+                ),
+            )
+        for index in range(3):
+            session.add(Task(board_id=board.id, title=f"done-{index}", status="done"))
+        await session.commit()
+        return board
+
+
+@pytest.mark.asyncio
+async def test_paginated_snapshot_loads_column_heads_with_totals_and_cursors() -> None:
+    engine = await _make_engine()
+    try:
+        board = await _seed(engine)
+        async with AsyncSession(engine) as session:
+            snapshot = await build_board_snapshot(
+                session,
+                board,
+                SnapshotOptions(tasks_per_status=2, include_done=False),
+            )
+            assert [task.title for task in snapshot.tasks] == ["inbox-4", "inbox-3"]
+            columns = {column.status: column for column in snapshot.task_columns or []}
+            assert (columns["inbox"].total, columns["inbox"].loaded) == (5, 2)
+            assert columns["inbox"].has_more
+            assert (columns["done"].total, columns["done"].loaded) == (3, 0)
+            assert columns["done"].next_cursor is None
+
+            page = await build_task_column_page(
+                session,
+                board,
+                status="inbox",
+                limit=2,
+                cursor=columns["inbox"].next_cursor,
+            )
+            assert [task.title for task in page.items] == ["inbox-2", "inbox-1"]
+            rest = await build_task_column_page(
+                session,
+                board,
+                status="inbox",
+                limit=2,
+                cursor=page.next_cursor,
+            )
+            assert [task.title for task in rest.items] == ["inbox-0"]
+            assert rest.next_cursor is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_sections_and_column_endpoint() -> None:
+    board_snapshot_cache.clear()
+    engine = await _make_engine()
+    board = await _seed(engine)
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(boards_router)
+    app.include_router(api_v1)
+
+    async def _override_get_session() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    async def _override_board() -> Board:
+        return board
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_read_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = _override_board
+    base = f"/api/v1/boards/{board.id}/snapshot"
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            full = (await client.get(base)).json()
+            assert len(full["tasks"]) == 8
+            assert full["task_columns"] is None
+
+            tasks_only = (await client.get(base, params={"sections": "tasks"})).json()
+            assert len(tasks_only["tasks"]) == 8
+            assert tasks_only["chat_messages"] == []
+
+            invalid = await client.get(
+                f"{base}/tasks",
+                params={"status": "inbox", "cursor": "not-a-cursor"},
+            )
+            assert invalid.status_code == 422
+
+            done = await client.get(f"{base}/tasks", params={"status": "done", "limit": 2})
+            assert done.status_code == 200
+            assert len(done.json()["items"]) == 2
+            assert done.json()["next_cursor"]
+    finally:
+        board_snapshot_cache.clear()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_counts_approvals_without_a_task_id_filter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    requested: list[set[UUID] | None] = []
+    original = board_snapshot.task_counts_for_board
+
+    async def _recording_counts(
+        session: AsyncSession,
+        *,
+        board_id: UUID,
+        task_ids: set[UUID] | None = None,
+    ) -> Any:
+        requested.append(task_ids)
+        return await original(session, board_id=board_id, task_ids=task_ids)
+
+    monkeypatch.setattr(board_snapshot, "task_counts_for_board", _recording_counts)
+    try:
+        board = await _seed(engine)
+        async with AsyncSession(engine) as session:
+            await build_board_snapshot(session, board)
+            await build_board_snapshot(session, board, SnapshotOptions(tasks_per_status=2))
+        assert requested[0] is None
+        assert requested[1] is not None
+        assert len(requested[1]) == 4
+    finally:
+        await engine.dispose()
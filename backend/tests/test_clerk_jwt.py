@@ -0,0 +1,135 @@
+# ruff: noqa: INP001
+"""Local Clerk session-token verification against a cached JWKS."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+import jwt
+import pytest
+from clerk_backend_api.security.types import TokenVerificationErrorReason
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.core import clerk_jwt
+from app.core.clerk_jwt import ClerkJWKS, ClerkTokenError, verify_session_token
+
+
+def _private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwk(key: rsa.RSAPrivateKey, kid: str) -> dict[str, Any]:
+    entry: dict[str, Any] = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+    entry.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return entry
+
+
+def _token(key: rsa.RSAPrivateKey, kid: str, *, expires_in: int = 60, sub: str = "user_1") -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": sub, "iat": now, "nbf": now, "exp": now + expires_in},
+        key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+class _FakeJWKSEndpoint:
+    def __init__(self, *entries: dict[str, Any]) -> None:
+        self.entries = list(entries)
+        self.calls = 0
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        return {"keys": list(self.entries)}
+
+
+@pytest.fixture(autouse=True)
+def _reset_claims_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(clerk_jwt.settings, "clerk_jwt_key", "")
+    clerk_jwt.verified_claims.clear()
+
+
+@pytest.mark.asyncio
+async def test_valid_token_fetches_jwks_once() -> None:
+    key = _private_key()
+    endpoint = _FakeJWKSEndpoint(_jwk(key, "k1"))
+    jwks = ClerkJWKS(fetch=endpoint, refresh_seconds=3600)
+
+    claims = await verify_session_token(_token(key, "k1"), jwks=jwks)
+    await verify_session_token(_token(key, "k1", sub="user_2"), jwks=jwks)
+
+    assert claims["sub"] == "user_1"
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rejects_expired_and_forged_tokens() -> None:
+    key = _private_key()
+    jwks = ClerkJWKS(fetch=_FakeJWKSEndpoint(_jwk(key, "k1")), refresh_seconds=3600)
+
+    with pytest.raises(ClerkTokenError) as expired:
+        await verify_session_token(_token(key, "k1", expires_in=-600), jwks=jwks)
+    with pytest.raises(ClerkTokenError) as forged:
+        await verify_session_token(_token(_private_key(), "k1"), jwks=jwks)
+
+    assert expired.value.reason == TokenVerificationErrorReason.TOKEN_EXPIRED
+    assert forged.value.reason == TokenVerificationErrorReason.TOKEN_INVALID_SIGNATURE
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetches_after_rotation(monkeypatch: pytest.MonkeyPatch) -> None:
+    old_key, new_key = _private_key(), _private_key()
+    endpoint = _FakeJWKSEndpoint(_jwk(old_key, "old"))
+    jwks = ClerkJWKS(fetch=endpoint, refresh_seconds=3600)
+    await verify_session_token(_token(old_key, "old"), jwks=jwks)
+
+    endpoint.entries.append(_jwk(new_key, "new"))
+    # Within the refetch backoff an unknown kid is rejected without another fetch.
+    with pytest.raises(ClerkTokenError) as mismatch:
+        await verify_session_token(_token(new_key, "new"), jwks=jwks)
+    assert mismatch.value.reason == TokenVerificationErrorReason.JWK_KID_MISMATCH
+    assert endpoint.calls == 1
+
+    monkeypatch.setattr(clerk_jwt, "_UNKNOWN_KID_REFETCH_SECONDS", 0.0)
+    claims = await verify_session_token(_token(new_key, "new"), jwks=jwks)
+
+    assert claims["sub"] == "user_1"
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_verified_claims_are_cached_per_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = _private_key()
+    jwks = ClerkJWKS(fetch=_FakeJWKSEndpoint(_jwk(key, "k1")), refresh_seconds=3600)
+    token = _token(key, "k1")
+    await verify_session_token(token, jwks=jwks)
+
+    def _boom(*_args: Any, **_kwargs: Any) -> dict[str, Any]:  # pragma: no cover
+        raise AssertionError("cached tokens must not be decoded again")
+
+    monkeypatch.setattr(clerk_jwt.jwt, "decode", _boom)
+    claims = await verify_session_token(token, jwks=jwks)
+
+    assert claims["sub"] == "user_1"
+
+
+@pytest.mark.asyncio
+async def test_pem_key_skips_jwks(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = _private_key()
+    pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    monkeypatch.setattr(clerk_jwt.settings, "clerk_jwt_key", pem.decode())
+    endpoint = _FakeJWKSEndpoint()
+    jwks = ClerkJWKS(fetch=endpoint, refresh_seconds=3600)
+
+    claims = await verify_session_token(_token(key, "unused"), jwks=jwks)
+
+    assert claims["sub"] == "user_1"
+    assert endpoint.calls == 0
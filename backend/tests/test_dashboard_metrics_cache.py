@@ -0,0 +1,88 @@
+# ruff: noqa: INP001
+"""Tests for the single-flight TTL cache behind dashboard metrics."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.api import metrics as metrics_api
+from app.core.ttl_cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=60, max_entries=4)
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+    assert results == [42] * 5
+    assert calls == 1
+    assert await cache.get_or_compute("k", compute) == 42
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_is_retried_by_a_waiter() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=60, max_entries=4)
+    attempts = 0
+
+    async def flaky() -> int:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise RuntimeError("boom")
+        return 7
+
+    first, second = await asyncio.gather(
+        cache.get_or_compute("k", flaky),
+        cache.get_or_compute("k", flaky),
+        return_exceptions=True,
+    )
+    assert isinstance(first, RuntimeError)
+    assert second == 7
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_reuses_cached_result_for_same_board_set(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    metrics_api.dashboard_metrics_cache.clear()
+    board_ids = [uuid4(), uuid4()]
+    computed = 0
+
+    async def _resolve(*_args: object, **_kwargs: object) -> list[object]:
+        return list(board_ids)
+
+    async def _compute(*_args: object) -> Any:
+        nonlocal computed
+        computed += 1
+        return SimpleNamespace(call=computed)
+
+    monkeypatch.setattr(metrics_api, "_resolve_dashboard_board_ids", _resolve)
+    monkeypatch.setattr(metrics_api, "_compute_dashboard_metrics", _compute)
+    ctx: Any = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
+    session: Any = object()
+    try:
+        first = await metrics_api.dashboard_metrics("7d", None, None, ctx, session)
+        board_ids.reverse()
+        second = await metrics_api.dashboard_metrics("7d", None, None, ctx, session)
+        other_range = await metrics_api.dashboard_metrics("24h", None, None, ctx, session)
+    finally:
+        metrics_api.dashboard_metrics_cache.clear()
+
+    assert first is second
+    assert other_range is not first
+    assert computed == 2
@@ -0,0 +1,95 @@
+# ruff: noqa: INP001
+"""Tests for the session-scoped entity loader behind `Model.objects.load*`."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.query_stats import track_queries
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.organizations import Organization
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_boards(engine: AsyncEngine, count: int) -> list[Board]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(id=uuid4(), name="Org One")
+        boards = [
+            Board(id=uuid4(), organization_id=organization.id, name=f"b{i}", slug=f"b{i}")
+            for i in range(count)
+        ]
+        session.add(organization)
+        session.add_all(boards)
+        await session.commit()
+        return boards
+
+
+@pytest.mark.asyncio
+async def test_load_memoizes_rows_and_misses_for_the_session() -> None:
+    engine = await _make_engine()
+    try:
+        (board,) = await _seed_boards(engine, 1)
+        missing_id = uuid4()
+        async with AsyncSession(engine) as session:
+            with track_queries() as stats:
+                assert (await Board.objects.load(session, str(board.id))) is not None
+                assert (await Board.objects.load(session, board.id)) is not None
+                assert await Board.objects.load(session, missing_id) is None
+                assert await Board.objects.load(session, missing_id) is None
+                assert await Board.objects.load(session, "not-a-uuid") is None
+
+            assert stats.query_count == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_load_many_batches_unseen_ids_into_one_query() -> None:
+    engine = await _make_engine()
+    try:
+        boards = await _seed_boards(engine, 3)
+        async with AsyncSession(engine) as session:
+            first = await Board.objects.load(session, boards[0].id)
+            with track_queries() as stats:
+                loaded = await Board.objects.load_many(
+                    session,
+                    [board.id for board in boards] + [uuid4()],
+                )
+
+            assert stats.query_count == 1
+            assert set(loaded) == {board.id for board in boards}
+            assert loaded[boards[0].id] is first
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_related_lookups_are_dropped_when_the_session_flushes() -> None:
+    engine = await _make_engine()
+    try:
+        (board,) = await _seed_boards(engine, 1)
+        async with AsyncSession(engine) as session:
+            with track_queries() as stats:
+                assert await Agent.objects.load_related(session, board_id=board.id) == []
+                assert await Agent.objects.load_related(session, board_id=board.id) == []
+            assert stats.query_count == 1
+
+            session.add(Agent(board_id=board.id, name="Worker", gateway_id=uuid4()))
+            await session.flush()
+
+            agents = await Agent.objects.load_related(session, board_id=board.id)
+            assert [agent.name for agent in agents] == ["Worker"]
+    finally:
+        await engine.dispose()
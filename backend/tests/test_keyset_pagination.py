@@ -0,0 +1,145 @@
+# ruff: noqa: INP001
+"""Integration tests for opt-in keyset (cursor) pagination on list endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.board_memory import BOARD_MEMORY_LIST_ORDER
+from app.api.board_memory import router as board_memory_router
+from app.api.deps import ActorContext, get_board_for_actor_read, require_admin_or_agent
+from app.db.session import get_session
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+
+T0 = datetime(2026, 3, 1, 12, 0, 0)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _build_test_app(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    board: Board,
+) -> FastAPI:
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(board_memory_router)
+    app.include_router(api_v1)
+    add_pagination(app)
+
+    async def _override_get_session() -> AsyncSession:
+        async with session_maker() as session:
+            yield session
+
+    async def _override_board() -> Board:
+        return board
+
+    async def _override_actor() -> ActorContext:
+        return ActorContext(actor_type="user")
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = _override_board
+    app.dependency_overrides[require_admin_or_agent] = _override_actor
+    return app
+
+
+async def _seed_memory(session: AsyncSession) -> tuple[Board, list[BoardMemory]]:
+    organization = Organization(id=uuid4(), name="Org One")
+    board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+    # Three rows share a timestamp so pages must break ties on id.
+    created = [T0, T0, T0, T0 + timedelta(seconds=1), T0 + timedelta(seconds=2)]
+    memories = [
+        BoardMemory(board_id=board.id, content=f"note {index}", created_at=at)
+        for index, at in enumerate(created)
+    ]
+    session.add_all([organization, board, *memories])
+    await session.commit()
+    expected = sorted(memories, key=lambda row: (row.created_at, row.id), reverse=True)
+    return board, expected
+
+
+@pytest.mark.asyncio
+async def test_board_memory_pages_follow_next_cursor_without_gaps() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board, expected = await _seed_memory(session)
+        app = _build_test_app(session_maker, board=board)
+        url = f"/api/v1/boards/{board.id}/memory"
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get(url, params={"limit": 2})
+            assert first.status_code == 200
+            body = first.json()
+            # Offset pages keep their shape and count, and add a cursor to continue from.
+            assert body["total"] == 5
+            assert body["offset"] == 0
+            seen = [item["id"] for item in body["items"]]
+            cursor = body["next_cursor"]
+            while cursor is not None:
+                response = await client.get(url, params={"limit": 2, "cursor": cursor})
+                assert response.status_code == 200
+                body = response.json()
+                assert body["total"] is None
+                seen.extend(item["id"] for item in body["items"])
+                cursor = body["next_cursor"]
+
+            assert seen == [str(row.id) for row in expected]
+
+            last_offset_page = (await client.get(url, params={"limit": 2, "offset": 4})).json()
+            assert last_offset_page["next_cursor"] is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_board_memory_rejects_invalid_or_mixed_cursor_params() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board, expected = await _seed_memory(session)
+        app = _build_test_app(session_maker, board=board)
+        url = f"/api/v1/boards/{board.id}/memory"
+        cursor = BOARD_MEMORY_LIST_ORDER.encode(expected[0])
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            malformed = await client.get(url, params={"cursor": "not-a-cursor"})
+            assert malformed.status_code == 422
+            mixed = await client.get(url, params={"cursor": cursor, "offset": 2})
+            assert mixed.status_code == 422
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_queryset_keyset_seeks_past_cursor() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, expected = await _seed_memory(session)
+            queryset = BoardMemory.objects.filter(col(BoardMemory.board_id) == board.id)
+
+            cursor = BOARD_MEMORY_LIST_ORDER.encode(expected[1])
+            rows = await queryset.keyset(BOARD_MEMORY_LIST_ORDER, after=cursor).all(session)
+
+            assert [row.id for row in rows] == [row.id for row in expected[2:]]
+    finally:
+        await engine.dispose()
@@ -0,0 +1,144 @@
+# ruff: noqa: INP001
+"""Tag filters on board and board-group memory lists."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import board_group_memory
+from app.api.board_memory import router as board_memory_router
+from app.api.deps import ActorContext, get_board_for_actor_read, require_admin_or_agent
+from app.db.json_tags import _has_tags, normalize_tags
+from app.db.keyset import KeysetCursor
+from app.db.session import get_session
+from app.models.board_group_memory import BoardGroupMemory
+from app.models.board_groups import BoardGroup
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _build_test_app(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    board: Board,
+) -> FastAPI:
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(board_memory_router)
+    app.include_router(api_v1)
+    add_pagination(app)
+
+    async def _override_get_session() -> AsyncSession:
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = lambda: board
+    app.dependency_overrides[require_admin_or_agent] = lambda: ActorContext(actor_type="user")
+    return app
+
+
+@pytest.mark.asyncio
+async def test_board_memory_list_filters_by_all_and_any_tags() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            organization = Organization(id=uuid4(), name="Org")
+            board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+            session.add_all(
+                [
+                    organization,
+                    board,
+                    BoardMemory(
+                        board_id=board.id,
+                        content="delivery one",
+                        tags=["webhook", "webhook:w1", "payload:p1"],
+                    ),
+                    BoardMemory(
+                        board_id=board.id,
+                        content="delivery two",
+                        tags=["webhook", "webhook:w1", "payload:p2"],
+                    ),
+                    BoardMemory(board_id=board.id, content="plan", tags=["plan"]),
+                    BoardMemory(board_id=board.id, content="untagged"),
+                ],
+            )
+            await session.commit()
+        app = _build_test_app(session_maker, board=board)
+        url = f"/api/v1/boards/{board.id}/memory"
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+
+            async def _contents(params: list[tuple[str, str]]) -> list[str]:
+                response = await client.get(url, params=params)
+                assert response.status_code == 200
+                return sorted(item["content"] for item in response.json()["items"])
+
+            by_payload = await _contents([("tags", "payload:p2")])
+            by_all = await _contents([("tags", "webhook:w1"), ("tags", "payload:p1")])
+            by_any = await _contents([("any_tags", "payload:p1"), ("any_tags", "plan")])
+            blank = await _contents([("tags", " ")])
+
+        assert by_payload == ["delivery two"]
+        assert by_all == ["delivery one"]
+        assert by_any == ["delivery one", "plan"]
+        assert blank == ["delivery one", "delivery two", "plan", "untagged"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_group_memory_stream_fetch_applies_tag_filters() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            organization = Organization(id=uuid4(), name="Org")
+            group = BoardGroup(organization_id=organization.id, name="g", slug="g")
+            session.add_all([organization, group])
+            await session.flush()
+            session.add_all(
+                [
+                    BoardGroupMemory(board_group_id=group.id, content="a", tags=["broadcast"]),
+                    BoardGroupMemory(board_group_id=group.id, content="b", tags=["chat"]),
+                ],
+            )
+            await session.commit()
+
+            memories = await board_group_memory._fetch_memory_events(
+                session,
+                group.id,
+                KeysetCursor(at=datetime(2000, 1, 1)),
+                tags=["broadcast"],
+            )
+
+        assert [memory.content for memory in memories] == ["a"]
+    finally:
+        await engine.dispose()
+
+
+def test_postgres_filters_use_indexed_containment() -> None:
+    clause = _has_tags(col(BoardMemory.tags), ["payload:p1", "webhook"], postgres=True)
+    compiled = str(clause.compile(dialect=postgresql.dialect()))
+
+    assert "board_memory.tags @> " in compiled
+    assert normalize_tags([" chat ", "chat", "", "plan"]) == ["chat", "plan"]
@@ -0,0 +1,170 @@
+# ruff: noqa: INP001
+"""Tests for task status transitions and the hourly metric rollups they feed."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.time import utcnow
+from app.db.metric_rollups import install_metric_rollups
+from app.models.activity_events import ActivityEvent
+from app.models.board_metrics import BoardHourlyMetrics
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.task_status_transitions import TaskStatusTransition
+from app.models.tasks import Task
+from app.services.task_status_transitions import (
+    record_status_transition,
+    return_agent_tasks_to_inbox,
+)
+
+
+async def _make_engine() -> AsyncEngine:
+    install_metric_rollups()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_task_transitions_and_events_increment_hourly_rollups() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization = Organization(id=uuid4(), name="Org One")
+            board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+            task = Task(board_id=board.id, title="First")
+            session.add_all([organization, board, task])
+            await session.commit()
+
+            task.status = "in_progress"
+            task.in_progress_at = utcnow() - timedelta(hours=3)
+            session.add(task)
+            record_status_transition(session, task=task, from_status="inbox")
+            await session.commit()
+
+            task.status = "review"
+            task.previous_in_progress_at = task.in_progress_at
+            task.in_progress_at = None
+            session.add(task)
+            record_status_transition(
+                session,
+                task=task,
+                from_status="in_progress",
+                in_progress_since=task.previous_in_progress_at,
+            )
+            # Unchanged status records nothing.
+            assert record_status_transition(session, task=task, from_status="review") is None
+            session.add(ActivityEvent(event_type="task.updated", task_id=task.id))
+            session.add(ActivityEvent(event_type="task.dispatch_failed", task_id=task.id))
+            await session.commit()
+
+        async with AsyncSession(engine) as session:
+            rows = list(
+                await session.exec(
+                    select(BoardHourlyMetrics).where(
+                        col(BoardHourlyMetrics.board_id) == board.id,
+                    ),
+                ),
+            )
+            assert sum(row.tasks_created for row in rows) == 1
+            assert sum(row.moved_to_in_progress for row in rows) == 1
+            assert sum(row.moved_to_review for row in rows) == 1
+            assert sum(row.events_total for row in rows) == 2
+            assert sum(row.events_failed for row in rows) == 1
+            assert sum(row.cycle_time_count for row in rows) == 1
+            assert 2.9 < sum(row.cycle_time_hours_sum for row in rows) < 3.1
+
+            transitions = list(
+                await session.exec(
+                    select(TaskStatusTransition).order_by(col(TaskStatusTransition.at)),
+                ),
+            )
+            assert [(item.from_status, item.to_status) for item in transitions] == [
+                ("inbox", "in_progress"),
+                ("in_progress", "review"),
+            ]
+            assert transitions[0].cycle_time_hours is None
+            assert transitions[1].cycle_time_hours is not None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rollups_are_written_after_commit_and_dropped_on_rollback() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            organization = Organization(id=uuid4(), name="Org One")
+            board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+            session.add_all([organization, board])
+            await session.commit()
+            board_id = board.id
+
+            session.add(Task(board_id=board_id, title="Discarded"))
+            await session.flush()
+            # Nothing touches the rollup row inside the writer's transaction.
+            assert list(await session.exec(select(BoardHourlyMetrics))) == []
+            await session.rollback()
+
+            session.add(Task(board_id=board_id, title="Kept"))
+            await session.commit()
+
+        async with AsyncSession(engine) as session:
+            rows = list(await session.exec(select(BoardHourlyMetrics)))
+            assert sum(row.tasks_created for row in rows) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_returning_agent_tasks_to_inbox_records_each_transition() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent_id = uuid4()
+            organization = Organization(id=uuid4(), name="Org One")
+            board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+            working = [
+                Task(
+                    board_id=board.id,
+                    title=f"Working {index}",
+                    status="in_progress",
+                    assigned_agent_id=agent_id,
+                    in_progress_at=utcnow(),
+                )
+                for index in range(2)
+            ]
+            reviewing = Task(
+                board_id=board.id,
+                title="Reviewing",
+                status="review",
+                assigned_agent_id=agent_id,
+            )
+            session.add_all([organization, board, *working, reviewing])
+            await session.commit()
+
+            returned = await return_agent_tasks_to_inbox(session, agent_id=agent_id)
+            await session.commit()
+
+            assert {task.id for task in returned} == {task.id for task in working}
+            assert all(
+                task.status == "inbox" and task.assigned_agent_id is None for task in returned
+            )
+            transitions = list(await session.exec(select(TaskStatusTransition)))
+            assert sorted(item.task_id for item in transitions) == sorted(
+                task.id for task in working
+            )
+            assert {(item.from_status, item.to_status) for item in transitions} == {
+                ("in_progress", "inbox"),
+            }
+            assert reviewing.status == "review"
+    finally:
+        await engine.dispose()
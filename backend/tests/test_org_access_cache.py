@@ -0,0 +1,153 @@
+# ruff: noqa: INP001
+"""Tests for the cross-request membership and board-grant cache."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import crud
+from app.db.org_access_cache import install_org_access_invalidation, org_access_cache
+from app.db.query_stats import track_queries
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.users import User
+from app.schemas.organizations import OrganizationBoardAccessSpec, OrganizationMemberAccessUpdate
+from app.services import organizations
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> tuple[User, OrganizationMember, Board, Board]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        org = Organization(name="Org")
+        user = User(clerk_user_id="user_1")
+        session.add_all([org, user])
+        await session.flush()
+        member = OrganizationMember(organization_id=org.id, user_id=user.id, role="member")
+        granted = Board(organization_id=org.id, name="Granted", slug="granted")
+        other = Board(organization_id=org.id, name="Other", slug="other")
+        session.add_all([member, granted, other])
+        await session.flush()
+        session.add(OrganizationBoardAccess(organization_member_id=member.id, board_id=granted.id))
+        await session.commit()
+        return user, member, granted, other
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    install_org_access_invalidation()
+    org_access_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_resolves_membership_and_grants_without_queries() -> None:
+    engine = await _make_engine()
+    try:
+        user, member, granted, other = await _seed(engine)
+        async with AsyncSession(engine) as session:
+            assert await organizations.get_member(
+                session,
+                user_id=user.id,
+                organization_id=member.organization_id,
+            )
+
+        async with AsyncSession(engine) as session:
+            with track_queries() as stats:
+                loaded = await organizations.get_member(
+                    session,
+                    user_id=user.id,
+                    organization_id=member.organization_id,
+                )
+                assert loaded is not None
+                organization = await organizations.get_member_organization(session, loaded)
+                can_read = await organizations.has_board_access(
+                    session,
+                    member=loaded,
+                    board=granted,
+                    write=False,
+                )
+                can_write = await organizations.has_board_access(
+                    session,
+                    member=loaded,
+                    board=granted,
+                    write=True,
+                )
+                can_read_other = await organizations.has_access_to_any_board(
+                    session,
+                    member=loaded,
+                    board_ids=[other.id],
+                    write=False,
+                )
+
+            assert stats.query_count == 0
+            assert loaded in session
+            assert organization is not None and organization.name == "Org"
+            assert (can_read, can_write, can_read_other) == (True, False, False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_access_writes_invalidate_cached_grants() -> None:
+    engine = await _make_engine()
+    try:
+        user, member, granted, other = await _seed(engine)
+        key = (user.id, member.organization_id)
+        async with AsyncSession(engine) as session:
+            loaded = await organizations.get_member(
+                session,
+                user_id=user.id,
+                organization_id=member.organization_id,
+            )
+            assert loaded is not None
+            assert org_access_cache.get(key) is not None
+
+            await organizations.apply_member_access_update(
+                session,
+                member=loaded,
+                update=OrganizationMemberAccessUpdate(
+                    board_access=[OrganizationBoardAccessSpec(board_id=other.id, can_write=True)],
+                ),
+            )
+            await session.commit()
+        assert org_access_cache.get(key) is None
+
+        async with AsyncSession(engine) as session:
+            loaded = await organizations.get_member(
+                session,
+                user_id=user.id,
+                organization_id=member.organization_id,
+            )
+            assert loaded is not None
+            assert await organizations.has_board_access(
+                session,
+                member=loaded,
+                board=other,
+                write=True,
+            )
+            assert not await organizations.has_board_access(
+                session,
+                member=loaded,
+                board=granted,
+                write=False,
+            )
+
+            await crud.delete_where(
+                session,
+                OrganizationBoardAccess,
+                col(OrganizationBoardAccess.organization_member_id) == loaded.id,
+                commit=True,
+            )
+        assert org_access_cache.get(key) is None
+    finally:
+        await engine.dispose()
@@ -56,6 +56,9 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
         "activity_events",
         "task_dependencies",
         "task_fingerprints",
+        "task_status_transitions",
+        "board_hourly_metrics",
+        "board_versions",
         "approval_task_links",
         "approvals",
         "board_memory",
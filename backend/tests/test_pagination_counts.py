@@ -0,0 +1,200 @@
+# ruff: noqa: INP001
+"""Tests for paginated total count strategies."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.board_memory import router as board_memory_router
+from app.api.deps import ActorContext, get_board_for_actor_read, require_admin_or_agent
+from app.db.counts import (
+    ESTIMATE_EXACT_THRESHOLD,
+    ESTIMATED_COUNT,
+    CountStrategy,
+    clear_count_cache,
+    count_rows,
+    count_scope,
+    invalidate_count_scope,
+)
+from app.db.session import get_session
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.schemas.pagination import EstimatedCountKeysetPage, KeysetPage
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession, *, memories: int) -> Board:
+    organization = Organization(id=uuid4(), name="Org One")
+    board = Board(id=uuid4(), organization_id=organization.id, name="b", slug="b")
+    session.add_all([organization, board])
+    session.add_all(
+        [BoardMemory(board_id=board.id, content=f"note {index}") for index in range(memories)],
+    )
+    await session.commit()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_cached_count_is_reused_until_scope_is_invalidated() -> None:
+    clear_count_cache()
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session, memories=2)
+            scope = count_scope("board_memory", board.id)
+            strategy = CountStrategy.cached(scope)
+            statement = BoardMemory.objects.filter(col(BoardMemory.board_id) == board.id).statement
+
+            first = await count_rows(session, statement, strategy)
+            assert (first.total, first.approximate) == (2, False)
+
+            session.add(BoardMemory(board_id=board.id, content="late"))
+            await session.commit()
+            reused = await count_rows(session, statement, strategy)
+            assert (reused.total, reused.approximate) == (2, True)
+
+            invalidate_count_scope(scope)
+            fresh = await count_rows(session, statement, strategy)
+            assert (fresh.total, fresh.approximate) == (3, False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_falls_back_to_exact_without_postgres_planner() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session, memories=3)
+            statement = BoardMemory.objects.filter(col(BoardMemory.board_id) == board.id).statement
+
+            result = await count_rows(session, statement, ESTIMATED_COUNT)
+
+            assert (result.total, result.approximate) == (3, False)
+    finally:
+        await engine.dispose()
+
+
+class _FakePlannerResult:
+    def __init__(self, plan_rows: int) -> None:
+        self._plan = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": plan_rows}}])
+
+    def scalar_one(self) -> str:
+        return self._plan
+
+
+class _FakePostgresConnection:
+    dialect = postgresql.dialect()
+
+    def __init__(self, plan_rows: int) -> None:
+        self.plan_rows = plan_rows
+        self.statements: list[str] = []
+
+    async def exec_driver_sql(self, sql: str, _params: Any) -> _FakePlannerResult:
+        self.statements.append(sql)
+        return _FakePlannerResult(self.plan_rows)
+
+
+class _FakePostgresSession:
+    def __init__(self, connection: _FakePostgresConnection) -> None:
+        self._connection = connection
+        self.exact_counts = 0
+
+    async def connection(self) -> _FakePostgresConnection:
+        return self._connection
+
+    async def exec(self, _statement: Any) -> Any:
+        self.exact_counts += 1
+
+        class _Rows:
+            def one(self) -> int:
+                return 7
+
+        return _Rows()
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_uses_postgres_planner_rows_above_threshold() -> None:
+    statement = BoardMemory.objects.filter(col(BoardMemory.board_id) == uuid4()).statement
+    connection = _FakePostgresConnection(plan_rows=ESTIMATE_EXACT_THRESHOLD + 1)
+    session = _FakePostgresSession(connection)
+
+    estimated = await count_rows(session, statement, ESTIMATED_COUNT)  # type: ignore[arg-type]
+
+    assert (estimated.total, estimated.approximate) == (ESTIMATE_EXACT_THRESHOLD + 1, True)
+    assert session.exact_counts == 0
+    assert connection.statements[0].startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "ORDER BY" not in connection.statements[0]
+
+    # Small estimates are replaced with an exact count.
+    connection.plan_rows = 5
+    small = await count_rows(session, statement, ESTIMATED_COUNT)  # type: ignore[arg-type]
+    assert (small.total, small.approximate) == (7, False)
+    assert session.exact_counts == 1
+
+
+def test_only_estimated_count_pages_expose_approximate_totals() -> None:
+    assert "total_is_approximate" not in KeysetPage.model_fields
+    assert "total_is_approximate" in EstimatedCountKeysetPage.model_fields
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_omits_total_when_client_opts_out() -> None:
+    clear_count_cache()
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board = await _seed_board(session, memories=3)
+
+        app = FastAPI()
+        api_v1 = APIRouter(prefix="/api/v1")
+        api_v1.include_router(board_memory_router)
+        app.include_router(api_v1)
+        add_pagination(app)
+
+        async def _override_get_session() -> AsyncSession:
+            async with session_maker() as session:
+                yield session
+
+        async def _override_board() -> Board:
+            return board
+
+        async def _override_actor() -> ActorContext:
+            return ActorContext(actor_type="user")
+
+        app.dependency_overrides[get_session] = _override_get_session
+        app.dependency_overrides[get_board_for_actor_read] = _override_board
+        app.dependency_overrides[require_admin_or_agent] = _override_actor
+        url = f"/api/v1/boards/{board.id}/memory"
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            counted = (await client.get(url, params={"limit": 2})).json()
+            skipped = (await client.get(url, params={"limit": 2, "include_total": False})).json()
+
+        assert counted["total"] == 3
+        assert counted["total_is_approximate"] is False
+        assert skipped["total"] is None
+        assert len(skipped["items"]) == 2
+        # A full page without a total still advertises a cursor to continue from.
+        assert skipped["next_cursor"] is not None
+    finally:
+        await engine.dispose()
@@ -0,0 +1,94 @@
+# ruff: noqa: INP001
+"""Tests for per-role pool sizing and connection pool telemetry."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.deps import require_super_admin
+from app.core.auth import AuthContext
+from app.core.config import settings
+from app.db import pool_telemetry
+from app.db.pool_telemetry import PoolTelemetry, create_role_engine, pool_sizing
+from app.models.users import User
+
+
+def test_pool_sizing_reads_role_specific_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "db_pool_size", 7)
+    monkeypatch.setattr(settings, "db_stream_pool_size", 3)
+    monkeypatch.setattr(settings, "db_worker_max_overflow", 1)
+
+    assert pool_sizing("api").pool_size == 7
+    assert pool_sizing("streams").pool_size == 3
+    assert pool_sizing("worker").max_overflow == 1
+    # Replica pools follow the matching primary pool sizes.
+    assert pool_sizing("replica").pool_size == 7
+    assert pool_sizing("replica_streams").pool_size == 3
+
+
+def test_pool_metrics_require_a_super_admin() -> None:
+    org_admin = User(clerk_user_id="org-admin", is_super_admin=False)
+    operator = User(clerk_user_id="operator", is_super_admin=True)
+
+    with pytest.raises(HTTPException) as exc:
+        require_super_admin(AuthContext(actor_type="user", user=org_admin))
+    assert exc.value.status_code == 403
+    assert require_super_admin(AuthContext(actor_type="user", user=operator)).user is operator
+
+
+@pytest.mark.asyncio
+async def test_role_engine_records_checkouts_and_open_connections(tmp_path: Path) -> None:
+    engine = create_role_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        name="test-telemetry",
+        role="worker",
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        stats = next(
+            telemetry.snapshot()
+            for telemetry in pool_telemetry.pool_telemetry()
+            if telemetry.name == "test-telemetry"
+        )
+        assert stats.role == "worker"
+        assert stats.checkouts_total == 2
+        assert stats.connections_opened_total >= 1
+        assert stats.connections_open >= 1
+        assert stats.checked_out == 0
+    finally:
+        await engine.dispose()
+        pool_telemetry._registry.pop("test-telemetry", None)
+
+
+@pytest.mark.asyncio
+async def test_timed_pool_counts_checkout_timeouts(tmp_path: Path) -> None:
+    telemetry = PoolTelemetry(name="test-timeouts", role="api", sizing=None)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'timeouts.db'}",
+        poolclass=pool_telemetry._timed_pool_class(telemetry),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert telemetry.checkout_timeouts == 1
+        assert telemetry.checkout_wait_seconds_max >= 0.0
+    finally:
+        await engine.dispose()
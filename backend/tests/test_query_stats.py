@@ -0,0 +1,167 @@
+# ruff: noqa: INP001
+"""Tests for per-request SQL statement counting and N+1 detection."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import error_handling as error_handling_module
+from app.core.config import settings
+from app.core.error_handling import RequestIdMiddleware
+from app.db.query_stats import (
+    QueryBudgetExceededError,
+    QueryStats,
+    statement_fingerprint,
+    track_queries,
+)
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_statement_fingerprint_ignores_bound_values_and_in_list_length() -> None:
+    assert statement_fingerprint("SELECT * FROM tasks WHERE id = $1") == statement_fingerprint(
+        "SELECT *\n  FROM tasks WHERE id = $7",
+    )
+    assert statement_fingerprint(
+        "SELECT * FROM tasks WHERE id IN ($1, $2, $3)",
+    ) == statement_fingerprint("SELECT * FROM tasks WHERE id IN (?)")
+    assert "::text" in statement_fingerprint("SELECT :name::text")
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements_and_flags_repeats(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "db_n_plus_one_threshold", 3)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        with track_queries(budget=10, enforce_budget=True) as stats:
+            async with engine.connect() as conn:
+                for value in range(3):
+                    await conn.execute(text("SELECT :value"), {"value": value})
+                await conn.execute(text("SELECT 1"))
+
+        assert stats.query_count == 4
+        assert stats.db_time_seconds > 0
+        assert stats.over_budget is False
+        assert stats.n_plus_one_suspects() == [("SELECT ?", 3)]
+        summary = stats.summary()
+        assert summary["db_query_count"] == 4
+        assert summary["db_n_plus_one"] is True
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_enforced_budget_fails_the_statement_that_exceeds_it() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        with track_queries(budget=1, enforce_budget=True) as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                with pytest.raises(QueryBudgetExceededError):
+                    await conn.execute(text("SELECT 2"))
+
+        assert stats.over_budget is True
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_logs_n_plus_one_and_slow_query_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "db_n_plus_one_threshold", 2)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    capture = _CaptureHandler()
+    logger = error_handling_module.logger
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(capture)
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        async with engine.connect() as conn:
+            for value in range(2):
+                await conn.execute(text("SELECT :value"), {"value": value})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(_message: Any) -> None:
+        return None
+
+    middleware = RequestIdMiddleware(app)
+    # The slow threshold is read at construction; force every request to count as slow.
+    middleware._slow_request_ms = 1
+    monkeypatch.setattr(error_handling_module, "perf_counter", iter([0.0, 5.0, 5.0]).__next__)
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/tasks", "headers": []}
+    try:
+        await middleware(scope, lambda: None, send)
+    finally:
+        logger.removeHandler(capture)
+        capture.close()
+        await engine.dispose()
+
+    n_plus_one = next(r for r in capture.records if r.getMessage() == "db.request.n_plus_one")
+    assert getattr(n_plus_one, "repeat_count") == 2
+    slow = next(r for r in capture.records if r.getMessage() == "http.request.slow")
+    assert getattr(slow, "db_query_count") == 2
+    assert getattr(slow, "db_n_plus_one") is True
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_is_not_held_to_the_request_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "db_query_budget_per_request", 2)
+    monkeypatch.setattr(settings, "db_query_budget_enforce", True)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    seen: list[QueryStats] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+            async def poll() -> None:
+                # Like sse-starlette, poll in a task that inherits the request context.
+                for value in range(5):
+                    await conn.execute(text("SELECT :value"), {"value": value})
+                    await send({"type": "http.response.body", "body": b".", "more_body": True})
+
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await asyncio.create_task(poll())
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(_message: Any) -> None:
+        return None
+
+    original_track_queries = error_handling_module.track_queries
+
+    @contextmanager
+    def _capturing_track_queries() -> Iterator[QueryStats]:
+        with original_track_queries() as stats:
+            seen.append(stats)
+            yield stats
+
+    monkeypatch.setattr(error_handling_module, "track_queries", _capturing_track_queries)
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/activity/stream", "headers": []}
+    try:
+        await RequestIdMiddleware(app)(scope, lambda: None, send)
+    finally:
+        await engine.dispose()
+
+    assert seen[0].closed is True
+    assert seen[0].query_count == 1
@@ -0,0 +1,185 @@
+# ruff: noqa: INP001
+"""Tests for read-replica routing and read-your-writes stickiness."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+import redis
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import replicas
+from app.db.replicas import (
+    ReadReplicaRouter,
+    ReadYourWritesMiddleware,
+    get_read_session,
+    note_request_actor,
+)
+from app.db.session import get_session
+
+
+def _router(*engines: AsyncEngine, redis_url: str = "") -> ReadReplicaRouter:
+    return ReadReplicaRouter(engines, max_lag_seconds=1.0, sticky_seconds=60.0, redis_url=redis_url)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.expiry_ms: dict[str, int] = {}
+        self.available = True
+
+    def _check(self) -> None:
+        if not self.available:
+            raise redis.ConnectionError("redis is down")
+
+    async def set(self, key: str, value: str, *, px: int) -> None:
+        del value
+        self._check()
+        self.expiry_ms[key] = px
+
+    async def exists(self, key: str) -> int:
+        self._check()
+        return int(key in self.expiry_ms)
+
+
+@pytest.mark.asyncio
+async def test_router_prefers_replica_until_actor_writes() -> None:
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        router = _router(replica)
+
+        assert await router.replica_for("actor-a") is not None
+        await router.note_write("actor-a")
+        assert await router.replica_for("actor-a") is None
+        # Stickiness is per actor; anonymous reads are never pinned.
+        assert await router.replica_for("actor-b") is not None
+        assert await router.replica_for(None) is not None
+    finally:
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_write_in_one_process_pins_reads_in_another_through_redis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeRedis()
+    monkeypatch.setattr(replicas.redis_asyncio.Redis, "from_url", lambda _url: fake)
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        # Two routers stand in for two API worker processes.
+        writer = _router(replica, redis_url="redis://shared")
+        reader = _router(replica, redis_url="redis://shared")
+
+        await writer.note_write("actor-a")
+        assert fake.expiry_ms == {"mission_control:read_your_writes:actor-a": 60_000}
+        assert await reader.replica_for("actor-a") is None
+        assert await reader.replica_for("actor-b") is not None
+        # When Redis is unreachable a write elsewhere cannot be ruled out.
+        fake.available = False
+        assert await reader.replica_for("actor-b") is None
+        assert await reader.replica_for(None) is not None
+    finally:
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_router_falls_back_to_primary_when_replica_is_unreachable() -> None:
+    replica = create_async_engine("sqlite+aiosqlite:////nonexistent-dir/replica.db")
+    try:
+        router = _router(replica)
+
+        assert await router.replica_for("actor-a") is None
+    finally:
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_session_dependency_routes_safe_methods_and_honors_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    primary = create_async_engine("sqlite+aiosqlite:///:memory:")
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    router = _router(replica)
+    monkeypatch.setattr(replicas, "read_router", router)
+    user_ids = {"alice": uuid4(), "bob": uuid4()}
+    try:
+        app = FastAPI()
+        app.add_middleware(ReadYourWritesMiddleware, router=router)
+
+        async def _override_get_session() -> AsyncIterator[AsyncSession]:
+            async with AsyncSession(primary) as session:
+                yield session
+
+        async def _fake_auth(request: Request) -> None:
+            # Session tokens rotate ("alice-1", "alice-2", ...); the user behind them does not.
+            token = request.headers["authorization"].removeprefix("Bearer ")
+            note_request_actor(request, "user", user_ids[token.split("-")[0]])
+
+        app.dependency_overrides[get_session] = _override_get_session
+        auth = Depends(_fake_auth)
+
+        def _target(session: AsyncSession) -> str:
+            return "replica" if session.bind is replica else "primary"
+
+        @app.get("/read")
+        async def read(
+            _auth: None = auth, session: AsyncSession = Depends(get_read_session)
+        ) -> str:
+            return _target(session)
+
+        @app.post("/write")
+        async def write(
+            _auth: None = auth, session: AsyncSession = Depends(get_read_session)
+        ) -> str:
+            return _target(session)
+
+        @app.get("/unauthenticated-read")
+        async def unauthenticated_read(session: AsyncSession = Depends(get_read_session)) -> str:
+            return _target(session)
+
+        def _bearer(token: str) -> dict[str, str]:
+            return {"Authorization": f"Bearer {token}"}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/read", headers=_bearer("alice-1"))).json() == "replica"
+            assert (await client.post("/write", headers=_bearer("alice-1"))).json() == "primary"
+            # A re-issued token for the same user is still pinned to the primary.
+            assert (await client.get("/read", headers=_bearer("alice-2"))).json() == "primary"
+            assert (await client.get("/read", headers=_bearer("bob-1"))).json() == "replica"
+            # Credentials that no dependency resolved cannot be checked, so use the primary.
+            unresolved = await client.get("/unauthenticated-read", headers=_bearer("bob-1"))
+            assert unresolved.json() == "primary"
+            assert (await client.get("/unauthenticated-read")).json() == "replica"
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+@pytest.mark.asyncio
+async def test_router_hands_stream_pollers_the_replica_stream_pool() -> None:
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    replica_streams = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        router = ReadReplicaRouter(
+            [replica],
+            stream_engines=[replica_streams],
+            max_lag_seconds=1.0,
+            sticky_seconds=60.0,
+        )
+
+        request_maker = await router.replica_for(None)
+        stream_maker = await router.replica_for(None, stream=True)
+        assert request_maker is not None
+        assert stream_maker is not None
+        assert request_maker.kw["bind"] is replica
+        assert stream_maker.kw["bind"] is replica_streams
+        # A failure seen on either pool takes the whole replica out of rotation.
+        router.mark_failed(stream_maker)
+        assert await router.replica_for(None) is None
+    finally:
+        await replica.dispose()
+        await replica_streams.dispose()
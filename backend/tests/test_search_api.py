@@ -0,0 +1,129 @@
+# ruff: noqa: INP001
+"""Full-text search endpoints on the SQLite fallback."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import get_board_for_actor_read, require_org_member
+from app.api.search import router as search_router
+from app.db.session import get_session
+from app.models.activity_events import ActivityEvent
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.models.users import User
+from app.services.organizations import OrganizationContext
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> tuple[OrganizationContext, Board, Board, Task]:
+    organization = Organization(name="Org")
+    user = User(clerk_user_id="user_1")
+    session.add_all([organization, user])
+    await session.flush()
+    member = OrganizationMember(organization_id=organization.id, user_id=user.id, role="member")
+    visible = Board(organization_id=organization.id, name="Visible", slug="visible")
+    hidden = Board(organization_id=organization.id, name="Hidden", slug="hidden")
+    session.add_all([member, visible, hidden])
+    await session.flush()
+    task = Task(board_id=visible.id, title="Rotate webhook secrets", description="Quarterly.")
+    session.add_all(
+        [
+            OrganizationBoardAccess(organization_member_id=member.id, board_id=visible.id),
+            task,
+            Task(board_id=visible.id, title="Unrelated chore"),
+            Task(board_id=hidden.id, title="Webhook audit on a board the member cannot read"),
+        ],
+    )
+    await session.flush()
+    session.add_all(
+        [
+            ActivityEvent(
+                event_type="task.comment",
+                message="The old WEBHOOK secret still works for staging.",
+                task_id=task.id,
+            ),
+            ActivityEvent(event_type="task.updated", message="webhook", task_id=task.id),
+            BoardMemory(board_id=visible.id, content="Webhook secrets live in the vault."),
+        ],
+    )
+    await session.commit()
+    return OrganizationContext(organization=organization, member=member), visible, hidden, task
+
+
+def _build_app(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    ctx: OrganizationContext,
+    board: Board,
+) -> FastAPI:
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(search_router)
+    app.include_router(api_v1)
+    add_pagination(app)
+
+    async def _override_get_session() -> AsyncSession:
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_board_for_actor_read] = lambda: board
+    app.dependency_overrides[require_org_member] = lambda: ctx
+    return app
+
+
+@pytest.mark.asyncio
+async def test_search_matches_tasks_comments_and_memory_within_scope() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            ctx, visible, _hidden, task = await _seed(session)
+        app = _build_app(session_maker, ctx=ctx, board=visible)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            board_page = (
+                await client.get(f"/api/v1/boards/{visible.id}/search", params={"q": "webhook"})
+            ).json()
+            comments_only = (
+                await client.get(
+                    f"/api/v1/boards/{visible.id}/search",
+                    params={"q": "webhook secret", "kind": "comment"},
+                )
+            ).json()
+            org_page = (
+                await client.get("/api/v1/organizations/me/search", params={"q": "webhook"})
+            ).json()
+            empty = await client.get("/api/v1/organizations/me/search", params={"q": ""})
+
+        assert board_page["total"] == 3
+        assert {hit["kind"] for hit in board_page["items"]} == {"task", "comment", "memory"}
+        comment = next(hit for hit in board_page["items"] if hit["kind"] == "comment")
+        assert comment["task_id"] == str(task.id)
+        assert comment["task_title"] == "Rotate webhook secrets"
+        assert "**WEBHOOK**" in comment["snippet"]
+
+        assert [hit["kind"] for hit in comments_only["items"]] == ["comment"]
+        # The hidden board's task is outside the member's grants.
+        assert {hit["board_id"] for hit in org_page["items"]} == {str(visible.id)}
+        assert org_page["total"] == 3
+        assert empty.status_code == 422
+    finally:
+        await engine.dispose()
@@ -281,6 +281,78 @@ async def test_list_marketplace_skills_marks_installed_cards() -> None:
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_list_marketplace_skills_filters_by_keys_and_ranks_name_matches() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_maker() as session:
+            organization, gateway = await _seed_base(session)
+            session.add_all(
+                [
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Deploy Helper",
+                        description="Ships builds.",
+                        category=" Ops ",
+                        risk="High",
+                        source_url="https://example.com/skills/helper",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Release notes",
+                        description="Summarizes each deploy.",
+                        category="ops",
+                        source_url="https://example.com/skills/notes",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="Deploy",
+                        category="  ",
+                        source_url="https://example.com/skills/deploy",
+                    ),
+                    MarketplaceSkill(
+                        organization_id=organization.id,
+                        name="100% coverage",
+                        source_url="https://example.com/skills/coverage",
+                    ),
+                ],
+            )
+            await session.commit()
+
+        app = _build_test_app(session_maker, organization=organization)
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+
+            async def _names(**params: str) -> list[str]:
+                response = await client.get(
+                    "/api/v1/skills/marketplace",
+                    params={"gateway_id": str(gateway.id), **params},
+                )
+                assert response.status_code == 200
+                return [card["name"] for card in response.json()]
+
+            ranked = await _names(search="DEPLOY")
+            ops = await _names(category="OPS")
+            uncategorized = await _names(category="uncategorized")
+            high_risk = await _names(risk=" high")
+            literal_percent = await _names(search="0%")
+
+        assert ranked == ["Deploy", "Deploy Helper", "Release notes"]
+        assert sorted(ops) == ["Deploy Helper", "Release notes"]
+        assert sorted(uncategorized) == ["100% coverage", "Deploy"]
+        assert high_risk == ["Deploy Helper"]
+        assert literal_percent == ["100% coverage"]
+    finally:
+        await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_sync_pack_clones_and_upserts_skills(monkeypatch: pytest.MonkeyPatch) -> None:
     engine = await _make_engine()
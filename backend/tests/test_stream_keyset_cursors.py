@@ -0,0 +1,141 @@
+# ruff: noqa
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.approvals import _fetch_approval_events
+from app.api.tasks import _fetch_task_events
+from app.db.keyset import KeysetCursor
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.boards import Board
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services.openclaw.provisioning_db import AgentLifecycleService
+from app.services.organizations import accessible_board_ids_statement
+
+T0 = datetime(2026, 3, 1, 12, 0, 0)
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    await session.commit()
+    return board
+
+
+@pytest.mark.asyncio
+async def test_task_event_cursor_skips_emitted_rows_sharing_a_timestamp() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            other_board = await _seed_board(session)
+            task = Task(board_id=board.id, title="t")
+            other_task = Task(board_id=other_board.id, title="other")
+            session.add_all([task, other_task])
+            events = [
+                ActivityEvent(event_type="task.updated", task_id=task.id, created_at=T0)
+                for _ in range(3)
+            ]
+            session.add_all(events)
+            session.add(
+                ActivityEvent(event_type="task.updated", task_id=other_task.id, created_at=T0),
+            )
+            await session.commit()
+
+            first = await _fetch_task_events(session, board.id, KeysetCursor(at=T0))
+            assert sorted(event.id for event, _ in first) == sorted(e.id for e in events)
+
+            last_event = first[-1][0]
+            cursor = KeysetCursor(at=T0).advance(last_event.created_at, last_event.id)
+            assert await _fetch_task_events(session, board.id, cursor) == []
+
+            late = ActivityEvent(
+                event_type="task.comment",
+                task_id=task.id,
+                message="hi",
+                created_at=T0 + timedelta(seconds=1),
+            )
+            session.add(late)
+            await session.commit()
+            again = await _fetch_task_events(session, board.id, cursor)
+            assert [event.id for event, _ in again] == [late.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_approval_cursor_reemits_only_after_resolution() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            approval = Approval(
+                board_id=board.id,
+                action_type="task.execute",
+                confidence=80,
+                created_at=T0,
+            )
+            session.add(approval)
+            await session.commit()
+
+            rows = await _fetch_approval_events(session, board.id, KeysetCursor(at=T0))
+            assert [row.id for row in rows] == [approval.id]
+            cursor = KeysetCursor(at=T0).advance(T0, approval.id)
+            assert await _fetch_approval_events(session, board.id, cursor) == []
+
+            approval.status = "approved"
+            approval.resolved_at = T0 + timedelta(minutes=1)
+            session.add(approval)
+            await session.commit()
+            rows = await _fetch_approval_events(session, board.id, cursor)
+            assert [row.id for row in rows] == [approval.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_agent_events_filter_by_accessible_boards_in_sql() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            foreign_board = await _seed_board(session)
+            member = OrganizationMember(
+                organization_id=board.organization_id,
+                user_id=uuid4(),
+                all_boards_read=True,
+            )
+            visible = Agent(board_id=board.id, gateway_id=uuid4(), name="a", updated_at=T0)
+            hidden = Agent(board_id=foreign_board.id, gateway_id=uuid4(), name="b", updated_at=T0)
+            session.add_all([member, visible, hidden])
+            await session.commit()
+
+            service = AgentLifecycleService(session)
+            agents = await service.fetch_agent_events(
+                None,
+                KeysetCursor(at=T0),
+                board_ids=accessible_board_ids_statement(member, write=False),
+            )
+            assert [agent.id for agent in agents] == [visible.id]
+    finally:
+        await engine.dispose()
@@ -16,6 +16,12 @@ class _FakeSession:
     exec_results: list[object]
     executed: list[object] = field(default_factory=list)
     added: list[object] = field(default_factory=list)
+    info: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def sync_session(self):
+        # Board version bumps are queued on the sync session's `info`.
+        return self
 
     async def exec(self, query):
         self.executed.append(query)
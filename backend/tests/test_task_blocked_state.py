@@ -0,0 +1,119 @@
+# ruff: noqa: INP001
+"""Materialized task blocked state and the unblocked list filter."""
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+from app.schemas.tasks import TaskUpdate
+from app.services.task_dependencies import refresh_blocked_by, stored_blocked_by_ids
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> tuple[Board, Agent, Task, Task]:
+    organization_id = uuid4()
+    gateway = Gateway(
+        organization_id=organization_id,
+        name="gateway",
+        url="https://gateway.local",
+        workspace_root="/tmp/workspace",
+    )
+    board = Board(
+        organization_id=organization_id,
+        gateway_id=gateway.id,
+        name="board",
+        slug="board",
+        require_approval_for_done=False,
+    )
+    agent = Agent(board_id=board.id, gateway_id=gateway.id, name="agent", status="online")
+    dependency = Task(
+        board_id=board.id,
+        title="Dependency",
+        status="in_progress",
+        assigned_agent_id=agent.id,
+    )
+    dependent = Task(board_id=board.id, title="Dependent")
+    session.add(Organization(id=organization_id, name="org"))
+    session.add_all([gateway, board, agent, dependency, dependent])
+    await session.flush()
+    session.add(
+        TaskDependency(board_id=board.id, task_id=dependent.id, depends_on_task_id=dependency.id),
+    )
+    await session.flush()
+    await refresh_blocked_by(session, board_id=board.id, tasks=[dependency, dependent])
+    await session.commit()
+    return board, agent, dependency, dependent
+
+
+async def _inbox_ids(session: AsyncSession, board: Board, *, unblocked: bool) -> list[str]:
+    statement = tasks_api._task_list_statement(
+        board_id=board.id,
+        status_filter="inbox",
+        assigned_agent_id=None,
+        unassigned=None,
+        unblocked=unblocked,
+    )
+    return [task.title for task in await session.exec(statement)]
+
+
+async def _set_status(
+    session: AsyncSession,
+    *,
+    task: Task,
+    agent: Agent,
+    status: Literal["inbox", "in_progress", "done"],
+) -> None:
+    await tasks_api.update_task(
+        payload=TaskUpdate(status=status),
+        task=task,
+        session=session,
+        actor=ActorContext(actor_type="agent", agent=agent),
+    )
+
+
+@pytest.mark.asyncio
+async def test_blocked_state_follows_dependency_status_and_deletion() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, agent, dependency, dependent = await _seed(session)
+            assert stored_blocked_by_ids(dependent) == [dependency.id]
+            assert dependent.blocked_by_count == 1
+            assert await _inbox_ids(session, board, unblocked=True) == []
+            assert await _inbox_ids(session, board, unblocked=False) == ["Dependent"]
+
+            await _set_status(session, task=dependency, agent=agent, status="done")
+            await session.refresh(dependent)
+            assert dependent.blocked_by_count == 0
+            assert await _inbox_ids(session, board, unblocked=True) == ["Dependent"]
+
+            await _set_status(session, task=dependency, agent=agent, status="inbox")
+            await session.refresh(dependent)
+            assert stored_blocked_by_ids(dependent) == [dependency.id]
+
+            await tasks_api.delete_task_and_related_records(session, task=dependency)
+            await session.refresh(dependent)
+            assert stored_blocked_by_ids(dependent) == []
+            assert dependent.blocked_by_count == 0
+    finally:
+        await engine.dispose()
@@ -0,0 +1,199 @@
+# ruff: noqa: INP001
+"""Bulk task create/update: one transaction, one notification per agent."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.core.auth import AuthContext
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.tasks import TaskBulkCreate, TaskBulkUpdate, TaskBulkUpdateItem, TaskCreate
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(session: AsyncSession) -> tuple[Board, Agent, Agent]:
+    organization = Organization(id=uuid4(), name="org")
+    gateway = Gateway(
+        id=uuid4(),
+        organization_id=organization.id,
+        name="gateway",
+        url="https://gateway.local",
+        workspace_root="/tmp/workspace",
+    )
+    board = Board(
+        id=uuid4(),
+        organization_id=organization.id,
+        name="board",
+        slug="board",
+        gateway_id=gateway.id,
+    )
+    worker = Agent(
+        id=uuid4(),
+        name="worker",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        status="online",
+        openclaw_session_id="worker-session",
+    )
+    lead = Agent(
+        id=uuid4(),
+        name="Lead Agent",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        status="online",
+        is_board_lead=True,
+        openclaw_session_id="lead-session",
+    )
+    session.add_all([organization, gateway, board, worker, lead])
+    await session.commit()
+    return board, worker, lead
+
+
+def _capture_sends(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    sent: list[tuple[str, str]] = []
+
+    class _FakeDispatch:
+        def __init__(self, _session: AsyncSession) -> None:
+            pass
+
+        async def optional_gateway_config_for_board(self, _board: Board) -> object:
+            return object()
+
+    async def _fake_send(*, session_key: str, message: str, **_kwargs: Any) -> None:
+        sent.append((session_key, message))
+
+    monkeypatch.setattr(tasks_api, "GatewayDispatchService", _FakeDispatch)
+    monkeypatch.setattr(tasks_api, "_send_agent_task_message", _fake_send)
+    monkeypatch.setattr(tasks_api, "_send_lead_task_message", _fake_send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_writes_all_tasks_and_groups_notifications(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, worker, _lead = await _seed(session)
+            sent = _capture_sends(monkeypatch)
+
+            created = await tasks_api.bulk_create_tasks(
+                payload=TaskBulkCreate(
+                    items=[
+                        TaskCreate(title="one", assigned_agent_id=worker.id),
+                        TaskCreate(title="two", assigned_agent_id=worker.id),
+                        TaskCreate(title="three"),
+                    ],
+                ),
+                board=board,
+                session=session,
+                auth=AuthContext(actor_type="user"),
+            )
+
+            assert [task.title for task in created.items] == ["one", "two", "three"]
+            messages = dict(sent)
+            assert len(sent) == 2
+            assert messages["lead-session"].startswith("TASK UPDATES (3)")
+            assert messages["worker-session"].startswith("TASK UPDATES (2)")
+            notified = list(
+                await session.exec(
+                    select(ActivityEvent.event_type).where(
+                        col(ActivityEvent.event_type).in_(
+                            ["task.created", "task.lead_notified", "task.assignee_notified"],
+                        ),
+                    ),
+                ),
+            )
+            assert sorted(notified) == sorted(
+                ["task.created"] * 3 + ["task.lead_notified"] * 3 + ["task.assignee_notified"] * 2,
+            )
+
+            # One invalid item rejects the whole batch.
+            with pytest.raises(HTTPException) as exc:
+                await tasks_api.bulk_create_tasks(
+                    payload=TaskBulkCreate(
+                        items=[
+                            TaskCreate(title="four"),
+                            TaskCreate(title="five", depends_on_task_ids=[uuid4()]),
+                        ],
+                    ),
+                    board=board,
+                    session=session,
+                    auth=AuthContext(actor_type="user"),
+                )
+            assert exc.value.status_code == 404
+            await session.rollback()
+            titles = set(await session.exec(select(Task.title)))
+            assert titles == {"one", "two", "three"}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reassigns_tasks_with_one_message_per_assignee(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, worker, _lead = await _seed(session)
+            first = Task(board_id=board.id, title="first")
+            second = Task(board_id=board.id, title="second")
+            session.add_all([first, second])
+            await session.commit()
+            sent = _capture_sends(monkeypatch)
+            actor = ActorContext(actor_type="user")
+
+            updated = await tasks_api.bulk_update_tasks(
+                payload=TaskBulkUpdate(
+                    items=[
+                        TaskBulkUpdateItem(id=first.id, assigned_agent_id=worker.id),
+                        TaskBulkUpdateItem(id=second.id, assigned_agent_id=worker.id),
+                    ],
+                ),
+                board=board,
+                session=session,
+                actor=actor,
+            )
+
+            assert [task.assigned_agent_id for task in updated.items] == [worker.id] * 2
+            assert len(sent) == 1
+            assert sent[0][0] == "worker-session"
+            assert "Task: first" in sent[0][1]
+            assert "Task: second" in sent[0][1]
+
+            for items, expected_status in (
+                ([TaskBulkUpdateItem(id=first.id), TaskBulkUpdateItem(id=first.id)], 422),
+                ([TaskBulkUpdateItem(id=uuid4(), title="missing")], 404),
+            ):
+                with pytest.raises(HTTPException) as exc:
+                    await tasks_api.bulk_update_tasks(
+                        payload=TaskBulkUpdate(items=items),
+                        board=board,
+                        session=session,
+                        actor=actor,
+                    )
+                assert exc.value.status_code == expected_status
+    finally:
+        await engine.dispose()
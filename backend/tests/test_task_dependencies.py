@@ -63,6 +63,15 @@ def test_has_cycle(nodes, edges, expected):
     assert task_dependencies._has_cycle(nodes, edges) is expected
 
 
+def test_has_cycle_handles_chains_deeper_than_the_recursion_limit():
+    chain = [UUID(int=i) for i in range(5000)]
+    edges = {src: {dst} for src, dst in zip(chain, chain[1:])}
+    assert task_dependencies._has_cycle(chain, edges) is False
+
+    edges[chain[-1]] = {chain[0]}
+    assert task_dependencies._has_cycle(chain, edges) is True
+
+
 @dataclass
 class _FakeSession:
     exec_results: list[object]
@@ -244,13 +253,10 @@ async def test_validate_dependency_update_rejects_cycles(monkeypatch):
     # existing_ids contains dependency
     existing_ids = {task_b}
 
-    # task_ids list on board
-    all_task_ids = [task_a, task_b]
-
-    # existing edges: B depends on A, then set A depends on B => cycle
-    existing_edges = [(task_b, task_a)]
+    # edges reachable from the new dependency: B depends on A, then set A depends on B
+    reachable_edges = [(task_b, task_a)]
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids, reachable_edges])
 
     with pytest.raises(task_dependencies.HTTPException) as exc:
         await task_dependencies.validate_dependency_update(
@@ -271,10 +277,9 @@ async def test_validate_dependency_update_returns_deduped_ids_when_ok():
     dep2 = uuid4()
 
     existing_ids = {dep1, dep2}
-    all_task_ids = [task_id, dep1, dep2]
-    existing_edges: list[tuple[UUID, UUID]] = []
+    reachable_edges: list[tuple[UUID, UUID]] = []
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids, reachable_edges])
 
     normalized = await task_dependencies.validate_dependency_update(
         session,
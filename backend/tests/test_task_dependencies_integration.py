@@ -112,6 +112,67 @@ async def test_validate_dependency_update_detects_cycle() -> None:
         await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_validate_dependency_update_detects_indirect_cycle_on_long_chain() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id = uuid4()
+            chain = [uuid4() for _ in range(50)]
+            unrelated = uuid4()
+            await _seed_board_and_tasks(session, board_id=board_id, task_ids=[*chain, unrelated])
+            # chain[i] depends on chain[i + 1]
+            for src, dst in zip(chain, chain[1:]):
+                session.add(TaskDependency(board_id=board_id, task_id=src, depends_on_task_id=dst))
+            await session.commit()
+
+            with pytest.raises(HTTPException) as exc:
+                await td.validate_dependency_update(
+                    session,
+                    board_id=board_id,
+                    task_id=chain[-1],
+                    depends_on_task_ids=[chain[0]],
+                )
+            assert exc.value.status_code == 409
+
+            # Replacing an edge inside the chain is fine: the old edge goes away.
+            assert await td.validate_dependency_update(
+                session,
+                board_id=board_id,
+                task_id=chain[10],
+                depends_on_task_ids=[unrelated, chain[20]],
+            ) == [unrelated, chain[20]]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_validate_dependency_updates_checks_edits_together() -> None:
+    engine = await _make_engine()
+    try:
+        async with await _make_session(engine) as session:
+            board_id = uuid4()
+            a, b, c = uuid4(), uuid4(), uuid4()
+            await _seed_board_and_tasks(session, board_id=board_id, task_ids=[a, b, c])
+
+            # Each edit alone is acyclic; together a -> b -> c -> a is a cycle.
+            with pytest.raises(HTTPException) as exc:
+                await td.validate_dependency_updates(
+                    session,
+                    board_id=board_id,
+                    updates={a: [b], b: [c], c: [a]},
+                )
+            assert exc.value.status_code == 409
+
+            assert await td.validate_dependency_updates(
+                session,
+                board_id=board_id,
+                updates={a: [b, b], b: [c], c: []},
+            ) == {a: [b], b: [c], c: []}
+    finally:
+        await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_dependency_queries_and_replace_and_dependents() -> None:
     engine = await _make_engine()
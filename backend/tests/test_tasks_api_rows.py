@@ -66,7 +66,6 @@ def test_task_event_payload_includes_activity_for_comment_event() -> None:
         event,
         task,
         deps_map={},
-        dep_status={},
         tag_state_by_task_id={},
     )
 
@@ -98,7 +97,6 @@ def test_task_event_payload_includes_activity_for_non_comment_event() -> None:
         event,
         task,
         deps_map={},
-        dep_status={},
         tag_state_by_task_id={},
     )
 
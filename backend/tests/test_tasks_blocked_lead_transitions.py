@@ -11,7 +11,7 @@ from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import ActorContext
-from app.api.tasks import _apply_lead_task_update, _TaskUpdateInput
+from app.api.tasks import _stage_lead_task_update, _TaskUpdateInput
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.organizations import Organization
@@ -105,7 +105,7 @@ async def test_lead_update_rejects_assignment_change_when_task_blocked() -> None
             )
 
             with pytest.raises(HTTPException) as exc:
-                await _apply_lead_task_update(session, update=update)
+                await _stage_lead_task_update(session, update=update)
 
             assert exc.value.status_code == 409
             detail = exc.value.detail
@@ -186,7 +186,7 @@ async def test_lead_update_rejects_status_change_when_task_blocked() -> None:
             )
 
             with pytest.raises(HTTPException) as exc:
-                await _apply_lead_task_update(session, update=update)
+                await _stage_lead_task_update(session, update=update)
 
             assert exc.value.status_code == 409
             detail = exc.value.detail